@@ -1,5 +1,12 @@
 /**
  * Debugger support for skulpt module
+ *
+ * check_breakpoints is meant to be passed as the breakpoints option of
+ * Sk.configure, with debugging on.  The debugger also keeps the breakpoint
+ * tables (see Sk.breakpointTable) up to date, so with the breakpointTables
+ * option on as well it is only called for lines with a breakpoint, or for
+ * every line in step mode, and code without breakpoints runs at close to
+ * full speed.
  */
 
 var Sk = Sk || {}; //jshint ignore:line
@@ -54,10 +61,12 @@ Sk.Debugger.prototype.move_down_the_stack = function() {
 
 Sk.Debugger.prototype.enable_step_mode = function() {
     this.step_mode = true;
+    Sk.setDebugStep(true);
 };
 
 Sk.Debugger.prototype.disable_step_mode = function() {
     this.step_mode = false;
+    Sk.setDebugStep(false);
 };
 
 Sk.Debugger.prototype.get_suspension_stack = function() {
@@ -91,6 +100,7 @@ Sk.Debugger.prototype.check_breakpoints = function(filename, lineno, colno, glob
         if (hasOwnProperty(this.tmp_breakpoints, key)) {
             delete this.dbg_breakpoints[key];
             delete this.tmp_breakpoints[key];
+            this.update_breakpoint_table(filename, lineno);
             return true;
         }
         
@@ -116,6 +126,7 @@ Sk.Debugger.prototype.disable_breakpoint = function(filename, lineno, colno) {
     
     if (hasOwnProperty(this.dbg_breakpoints, key)) {
         this.dbg_breakpoints[key].enabled = false;
+        this.update_breakpoint_table(filename, lineno);
     }
 };
 
@@ -124,6 +135,7 @@ Sk.Debugger.prototype.enable_breakpoint = function(filename, lineno, colno) {
     
     if (hasOwnProperty(this.dbg_breakpoints, key)) {
         this.dbg_breakpoints[key].enabled = true;
+        this.update_breakpoint_table(filename, lineno);
     }
 };
 
@@ -131,15 +143,33 @@ Sk.Debugger.prototype.clear_breakpoint = function(filename, lineno, colno) {
     var key = this.generate_breakpoint_key(filename, lineno, colno);
     if (hasOwnProperty(this.dbg_breakpoints, key)) {
         delete this.dbg_breakpoints[key];
+        this.update_breakpoint_table(filename, lineno);
         return null;
     } else {
         return "Invalid breakpoint specified: " + filename + " line: " + lineno;
     }
 };
 
+// The breakpoint tables hold lines, not breakpoints: a line stays enabled
+// while any enabled breakpoint is left on it, in whichever column.
+Sk.Debugger.prototype.update_breakpoint_table = function(filename, lineno) {
+    var key, bp;
+    for (key in this.dbg_breakpoints) {
+        if (hasOwnProperty(this.dbg_breakpoints, key)) {
+            bp = this.dbg_breakpoints[key];
+            if (bp.filename === filename && bp.lineno === lineno && bp.enabled === true) {
+                Sk.setBreakpoint(filename, lineno, true);
+                return;
+            }
+        }
+    }
+    Sk.setBreakpoint(filename, lineno, false);
+};
+
 Sk.Debugger.prototype.clear_all_breakpoints = function() {
     this.dbg_breakpoints = {};
     this.tmp_breakpoints = {};
+    Sk.clearBreakpoints();
 };
 
 Sk.Debugger.prototype.set_ignore_count = function(filename, lineno, colno, count) {
@@ -162,6 +192,7 @@ Sk.Debugger.prototype.set_condition = function(filename, lineno, colno, lhs, con
     
     bp.condition = new Sk.Condition(lhs, cond, rhs);
     this.dbg_breakpoints[key] = bp;
+    this.update_breakpoint_table(filename, lineno);
 };
 
 Sk.Debugger.prototype.print_suspension_info = function(suspension) {
@@ -202,6 +233,7 @@ Sk.Debugger.prototype.set_suspension = function(suspension) {
 Sk.Debugger.prototype.add_breakpoint = function(filename, lineno, colno, temporary) {
     var key = this.generate_breakpoint_key(filename, lineno, colno);
     this.dbg_breakpoints[key] = new Sk.Breakpoint(filename, lineno, colno);
+    this.update_breakpoint_table(filename, lineno);
     if (temporary) {
         this.tmp_breakpoints[key] = true;
     }
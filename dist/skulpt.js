@@ -0,0 +1,2 @@
+global.Sk = require('/tmp/h/skulpt.js');
+module.exports = Sk;
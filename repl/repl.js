@@ -21,24 +21,18 @@ Sk.configure({
         inputfun: readline
 });
 
-var compilableLines = [],
-    //finds lines starting with "print"
-    re = new RegExp("\\s*print"),
-    //finds import statements
-    importre = new RegExp("\\s*import"),
-    //finds multuline string constants
-    mls = new RegExp("'''"),
-    //finds defining statements
-    defre = new RegExp("def.*|class.*"),
-    //test for empty line.
-    emptyline = new RegExp("^\\s*$"),
-    comment = new RegExp("^#.*"),
-    //a regex to check if a line is an assignment
-    //this regex checks whether or not a line starts with
-    //an identifier followed with some whitspace and then an = and then some more white space.
-    //it also checks if the identifier is a tuple.
-    assignment = /^((\s*\(\s*(\s*((\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*)|(\s*\(\s*(\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*,)*\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*\)\s*))\s*,)*\s*((\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*)|(\s*\(\s*(\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*,)*\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*\)\s*))\s*\)\s*)|(\s*\s*(\s*((\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*)|(\s*\(\s*(\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*,)*\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*\)\s*))\s*,)*\s*((\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*)|(\s*\(\s*(\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*,)*\s*((\s*[_a-zA-Z]\w*\s*)|(\s*\(\s*(\s*[_a-zA-Z]\w*\s*,)*\s*[_a-zA-Z]\w*\s*\)\s*))\s*\)\s*))\s*\s*))([+-/*%&\^\|]?|[/<>*]{2})=/,
-    lines = [],
+// every input runs in the namespace of one __main__ module, compiled in
+// "single" mode so the values of expression statements are shown
+var main = new Sk.builtin.module();
+main["$d"] = {
+    "__name__": new Sk.builtin.str("__main__"),
+    "__doc__": Sk.builtin.none.none$,
+    "__package__": Sk.builtin.none.none$
+};
+Sk.importSetUpPath(false);
+Sk.sysmodules.mp$ass_subscript("__main__", main);
+
+var lines = [],
     origLines;
 
 console.log("Python 2.6(ish) (skulpt, " + new Date() + ")");
@@ -83,29 +77,12 @@ while (true) {
 
     origLines = lines.slice();
 
-    //it's a one-liner
-    if (lines.length === 1) {
-        //if it's a statement that should be printed (not containing an = or def or class or an empty line)
-        if (!assignment.test(lines[0]) && !defre.test(lines[0]) && !importre.test(lines[0]) && !comment.test(lines[0]) && lines[0].length > 0) {
-            //if it doesn't contain print make sure it doesn't print None
-            if (!re.test(lines[0])) {
-                                //remove the statement
-                //evaluate it if nessecary
-                lines.push("evaluationresult = " + lines.pop());
-                //print the result if not None
-                lines.push("if not evaluationresult == None: print repr(evaluationresult)");
-            }
-        }
-    }
-
     try {
         //Evaluate
-        if (!lines || /^\s*$/.test(lines)) {
-            continue
-        }
-        else {
-            Sk.importMainWithBody("repl", false, lines.join('\n'));
+        if (/^\s*$/.test(lines.join(""))) {
+            continue;
         }
+        Sk.execInNamespace(lines.join("\n") + "\n", "<stdin>", "single", main["$d"]);
     } catch (err) {
         if (err instanceof Sk.builtin.SystemExit) {
             process.exit();
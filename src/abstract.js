@@ -484,7 +484,7 @@ Sk.abstr.sequenceContains = function (seq, ob, canSuspend) {
     var r;
 
     if (seq.sq$contains) {
-        return seq.sq$contains(ob);
+        return seq.sq$contains(ob, canSuspend);
     }
 
     /**
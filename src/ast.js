@@ -3117,9 +3117,26 @@ Sk.astFromParse = function (n, filename, c_flags) {
             }
             return new Sk.astnodes.Module(stmts);
         case SYM.eval_input:
-            Sk.asserts.fail("todo;");
+            // testlist NEWLINE* ENDMARKER
+            return new Sk.astnodes.Expression(ast_for_testlist(c, CHILD(n, 0)));
         case SYM.single_input:
-            Sk.asserts.fail("todo;");
+            // NEWLINE | simple_stmt | compound_stmt NEWLINE
+            if (CHILD(n, 0).type === TOK.T_NEWLINE) {
+                stmts[0] = new Sk.astnodes.Pass(n.lineno, n.col_offset);
+            } else {
+                ch = CHILD(n, 0);
+                num = numStmts(n);
+                if (num === 1) {
+                    stmts[0] = astForStmt(c, ch);
+                } else {
+                    // only a simple_stmt can hold several statements
+                    REQ(ch, SYM.simple_stmt);
+                    for (j = 0; j < num; ++j) {
+                        stmts[j] = astForStmt(c, CHILD(ch, j * 2));
+                    }
+                }
+            }
+            return new Sk.astnodes.Interactive(stmts);
         default:
             Sk.asserts.fail("todo;");
     }
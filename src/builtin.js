@@ -664,6 +664,14 @@ Sk.builtin.dir = function dir (x) {
             }
         }
 
+        // Add the __slots__ of user classes, see Sk.builtin.type.makeShape_
+        prop = x.sk$klass ? x.prototype.$shape : x.$shape;
+        if (prop) {
+            for (i = 0; i < prop.slots.length; i++) {
+                names.push(new Sk.builtin.str(Sk.unfixReserved(prop.slots[i])));
+            }
+        }
+
         // Add all class attributes
         mro = x.tp$mro;
         if(!mro && x.ob$type) {
@@ -710,6 +718,7 @@ Sk.builtin.repr = function repr (x) {
 };
 
 Sk.builtin.open = function open (filename, mode, bufsize) {
+    var f;
     Sk.builtin.pyCheckArgsLen("open", arguments.length, 1, 3);
     if (mode === undefined) {
         mode = new Sk.builtin.str("r");
@@ -721,7 +730,15 @@ Sk.builtin.open = function open (filename, mode, bufsize) {
         throw "todo; haven't implemented non-read opens";
     }
 
-    return new Sk.builtin.file(filename, mode, bufsize);
+    f = new Sk.builtin.file(filename, mode, bufsize);
+    if (f.streaming$) {
+        // read the first chunk, so that a file that cannot be read fails to
+        // open, as it does when it is read whole through Sk.read
+        return Sk.misceval.chain(Sk.builtin.file.$fill(f, 1), function () {
+            return f;
+        });
+    }
+    return f;
 };
 
 Sk.builtin.isinstance = function isinstance (obj, type) {
@@ -1350,10 +1367,6 @@ Sk.builtin.execfile = function execfile () {
     throw new Sk.builtin.NotImplementedError("execfile is not yet implemented");
 };
 
-Sk.builtin.frozenset = function frozenset () {
-    throw new Sk.builtin.NotImplementedError("frozenset is not yet implemented");
-};
-
 Sk.builtin.help = function help () {
     throw new Sk.builtin.NotImplementedError("help is not yet implemented");
 };
@@ -70,5 +70,22 @@ var $builtinmodule = function (name) {
     sys.stdout = sys.__stdout__;
     sys.stdin = sys.__stdin__;
 
+    // called with the value of each expression statement compiled in
+    // "single" mode (see Sk.misceval.displayhook)
+    sys.displayhook = new Sk.builtin.func(function (value) {
+        var s;
+        Sk.builtin.pyCheckArgsLen("displayhook", arguments.length, 1, 1);
+        if (value === Sk.builtin.none.none$) {
+            return Sk.builtin.none.none$;
+        }
+        Sk.builtins["_"] = Sk.builtin.none.none$;
+        s = new Sk.builtin.str(Sk.misceval.objectRepr(value).v + "\n");
+        return Sk.misceval.chain(Sk.misceval.apply(sys["stdout"]["write"], undefined, undefined, undefined, [sys["stdout"], s]), function () {
+            Sk.builtins["_"] = value;
+            return Sk.builtin.none.none$;
+        });
+    });
+    sys.__displayhook__ = sys.displayhook;
+
     return sys;
 };
@@ -18,6 +18,11 @@ function Compiler (filename, st, flags, canSuspend, sourceCodeForAnnotation) {
     this.canSuspend = canSuspend;
     this.interactive = false;
     this.nestlevel = 0;
+    // the highest line checked against the breakpoint table, see
+    // outputDebugCheck
+    this.breakpointLines = 0;
+    // the lines with statements counted, with Sk.lineCounts
+    this.countedLines = {};
 
     this.u = null;
     this.stack = [];
@@ -60,12 +65,18 @@ function CompilerUnit () {
     this.curblock = 0;
 
     this.consts = {};
+    // constant name by value, so makeConstant can reuse one without a scan
+    this.constNames = {};
 
     this.scopename = null;
+    // dotted name of the function or class, as in __qualname__
+    this.qualname = null;
 
     this.prefixCode = "";
     this.varDeclsCode = "";
     this.switchCode = "";
+    // closes the block loop, the suspension of the frame goes after it
+    this.frameEndCode = "";
     this.suffixCode = "";
 
     // stack of where to go on a break
@@ -94,7 +105,39 @@ CompilerUnit.prototype.activateScope = function () {
 
 Compiler.prototype.getSourceLine = function (lineno) {
     Sk.asserts.assert(this.source);
-    return this.source[lineno - 1];
+    // the listing must not contain source map marks, see sourceMark
+    return this.source[lineno - 1].replace(/\u0001/g, "");
+};
+
+/**
+ * With Sk.sourceMaps, a mark in the generated code for the Python position
+ * the code from here on comes from.  Sk.compile removes the marks and
+ * records their positions in the source map.  Compiled string literals
+ * never contain the \u0001 the marks are made of, as they are escaped.
+ *
+ * @param {number} lineno
+ * @param {number} col_offset
+ * @returns {string}
+ */
+Compiler.prototype.sourceMark = function (lineno, col_offset) {
+    if (!Sk.sourceMaps) {
+        return "";
+    }
+    return "\u0001" + lineno + ":" + col_offset + "\u0001";
+};
+
+/**
+ * A JavaScript function name for the code of unit u, made from its
+ * qualified Python name so that JS profilers and stack traces show which
+ * Python function is running; e.g. $Spam$eggs$ for the method eggs of the
+ * class Spam.  Python names cannot contain "$", so these names cannot
+ * clash with the other names in the generated code.
+ *
+ * @param {CompilerUnit} u
+ * @returns {string}
+ */
+Compiler.prototype.jsName = function (u) {
+    return "$" + u.qualname.replace(/\.<locals>/g, "").replace(/[<>]/g, "").split(".").join("$");
 };
 
 Compiler.prototype.annotateSource = function (ast) {
@@ -111,7 +154,7 @@ Compiler.prototype.annotateSource = function (ast) {
         out("^\n//\n");
 
         Sk.asserts.assert(ast.lineno !== undefined && ast.col_offset !== undefined);
-        out("$currLineNo = ", lineno, ";\n$currColNo = ", col_offset, ";\n\n");
+        out(this.sourceMark(lineno, col_offset), "$currLineNo = ", lineno, ";\n$currColNo = ", col_offset, ";\n\n");
     }
 };
 
@@ -122,10 +165,6 @@ Compiler.prototype.gensym = function (hint) {
     return hint;
 };
 
-Compiler.prototype.niceName = function (roughName) {
-    return this.gensym(roughName.replace("<", "").replace(">", "").replace(" ", "_"));
-};
-
 var reservedWords_ = {
     "abstract": true,
     "as": true,
@@ -269,7 +308,6 @@ Compiler.prototype.makeConstant = function (rest) {
     var i;
     var v;
     var val = "";
-    var cval;
 
     // Construct constant value
     for (i = 0; i < arguments.length; ++i) {
@@ -277,19 +315,14 @@ Compiler.prototype.makeConstant = function (rest) {
     }
 
     // Check if we've already defined this exact constant
-    for (var constant in this.u.consts) {
-        if (this.u.consts.hasOwnProperty(constant)) {
-            cval = this.u.consts[constant];
-            if (cval == val) {
-                // We have, just use it
-                return constant;
-            }
-        }
+    if (this.u.constNames.hasOwnProperty(val)) {
+        return this.u.constNames[val];
     }
 
     // We have not, build new one
     v = this.u.scopename + "." + this.gensym("const");
     this.u.consts[v] = val;
+    this.u.constNames[val] = v;
     return v;
 }
 
@@ -309,23 +342,36 @@ Compiler.prototype._gr = function (hint, rest) {
     return v;
 };
 
+// Whether the generated code checks Sk.execLimit and Sk.yieldLimit. Only
+// null turns a limit off: an infinite one is checked like any other, since
+// sys.setExecutionLimit can lower it while the program runs. The code is
+// the same for every limit that is not null, see Sk.compileSettings.
+function checksExecLimit () {
+    return Sk.execLimit !== null;
+}
+
+function checksYieldLimit () {
+    return Sk.yieldLimit !== null;
+}
+
 /**
  * Function to test if an interrupt should occur if the program has been running for too long.
  * This function is executed at every test/branch operation.
  */
 Compiler.prototype.outputInterruptTest = function () { // Added by RNL
     var output = "";
-    if (Sk.execLimit !== null || Sk.yieldLimit !== null && this.u.canSuspend) {
+    if (checksExecLimit() || checksYieldLimit() && this.u.canSuspend) {
             output += "var $dateNow = Date.now();";
-        if (Sk.execLimit !== null) {
+        if (checksExecLimit()) {
             output += "if ($dateNow - Sk.execStart > Sk.execLimit) {throw new Sk.builtin.TimeLimitError(Sk.timeoutMsg())}";
         }
-        if (Sk.yieldLimit !== null && this.u.canSuspend) {
+        if (checksYieldLimit() && this.u.canSuspend) {
             output += "if ($dateNow - Sk.lastYield > Sk.yieldLimit) {";
-            output += "var $susp = $saveSuspension({data: {type: 'Sk.yield'}, resume: function() {}}, '"+this.filename+"',$currLineNo,$currColNo);";
-            output += "$susp.$blk = $blk;";
-            output += "$susp.optional = true;";
-            output += "return $susp;";
+            // $ret can hold what a child that was just woken returned,
+            // resuming the yield gives it back
+            output += "$ret = {data: {type: 'Sk.yield'}, optional: true, $ret: $ret, resume: function() {return this.$ret;}};";
+            output += "$suspBlk = $blk; $suspLine = $currLineNo; $suspCol = $currColNo;";
+            output += "break $frame;";
             output += "}";
             this.u.doesSuspend = true;
         }
@@ -371,7 +417,7 @@ Compiler.prototype._checkSuspension = function(e) {
 
         e = e || {lineno: "$currLineNo", col_offset: "$currColNo"};
 
-        out ("if ($ret && $ret.$isSuspension) { return $saveSuspension($ret,'"+this.filename+"',"+e.lineno+","+e.col_offset+"); }");
+        out ("if ($ret && $ret.$isSuspension) { $suspBlk=", retblk, "; $suspLine=", e.lineno, "; $suspCol=", e.col_offset, "; break $frame; }");
 
         this.u.doesSuspend = true;
         this.u.tempsToSave = this.u.tempsToSave.concat(this.u.localtemps);
@@ -455,7 +501,8 @@ Compiler.prototype.ctuplelistorset = function(e, data, tuporlist) {
                 // this requires seeing if "$const" is contained
                 // within it.  A better solution would require a
                 // change to vexpr, which would be more invasive.
-                if (allconsts && (item.indexOf('$const') == -1)) {
+                if (allconsts && (item.indexOf('$const') == -1) &&
+                    e.elts[i].constructor !== Sk.astnodes.NameConstant) {
                     allconsts = false;
                 }
                 items.push(item);
@@ -469,6 +516,14 @@ Compiler.prototype.ctuplelistorset = function(e, data, tuporlist) {
                 }
                 return this._gr("load" + tuporlist, "new Sk.builtins['", tuporlist, "']([", items, "])");
             }
+        } else if (e.$lookup) {
+            // a constant set only searched by 'in' is never mutated, so it
+            // can be built once, see optimize.js
+            items = [];
+            for (i = 0; i < e.elts.length; ++i) {
+                items.push(this.vexpr(e.elts[i]));
+            }
+            return this.makeConstant("new Sk.builtin.set(new Sk.builtin.tuple([" + items + "]))");
         } else {
             items = [];
             for (i = 0; i < e.elts.length; ++i) {
@@ -561,7 +616,7 @@ Compiler.prototype.ccompgen = function (type, tmpname, generators, genIndex, val
             out(tmpname, ".v.push(", lvalue, ");"); // todo;
         }
         else if (type === "set") {
-            out(tmpname, ".v.mp$ass_subscript(", lvalue, ", true);");
+            out(tmpname, ".set$add(", lvalue, ");");
         }
         this._jump(skip);
         this.setBlock(skip);
@@ -607,8 +662,20 @@ Compiler.prototype.ccompare = function (e) {
 
     for (i = 0; i < n; ++i) {
         rhs = this.vexpr(e.comparators[i]);
-        out("$ret = Sk.builtin.bool(Sk.misceval.richCompareBool(", cur, ",", rhs, ",'", e.ops[i].prototype._astname, "', true));");
-        this._checkSuspension(e);
+        if (e.comparators[i].$keyType !== undefined && rhs.indexOf("$const") !== -1) {
+            // membership in a constant tuple of one hashable type, see optimize.js
+            out("$ret = Sk.misceval.chain(Sk.misceval.constContains(", cur, ",", rhs, ",",
+                this.makeConstant("new Sk.builtin.set(", rhs, ")"), ",",
+                e.comparators[i].$keyType === Sk.builtin.str ? "Sk.builtin.str" : "Sk.builtin.int_", ",",
+                e.ops[i] === Sk.astnodes.NotIn, ", true), Sk.builtin.bool);");
+            this._checkSuspension(e);
+        } else if (e.ops[i] === Sk.astnodes.In || e.ops[i] === Sk.astnodes.NotIn) {
+            // only membership tests can suspend, through __contains__
+            out("$ret = Sk.misceval.chain(Sk.misceval.richCompareBool(", cur, ",", rhs, ",'", e.ops[i].prototype._astname, "', true), Sk.builtin.bool);");
+            this._checkSuspension(e);
+        } else {
+            out("$ret = Sk.builtin.bool(Sk.misceval.richCompareBool(", cur, ",", rhs, ",'", e.ops[i].prototype._astname, "'));");
+        }
         out(fres, "=$ret;");
         this._jumpfalse("$ret", done);
         cur = rhs;
@@ -666,10 +733,10 @@ Compiler.prototype.ccall = function (e) {
     }
     if (keywordArgs !== "undefined") {
         out("$ret = Sk.misceval.applyOrSuspend(",func,",undefined,undefined,",keywordArgs,",",positionalArgs,");");
-    } else if (positionalArgs != "[]") {
-        out ("$ret = Sk.misceval.callsimOrSuspendArray(", func, ", ", positionalArgs, ");");
     } else {
-        out ("$ret = Sk.misceval.callsimOrSuspendArray(", func, ");");
+        // call Python functions straight through their tp$call
+        out("$ret = ", func, " instanceof Sk.builtin.func ? ", func, ".tp$call(", positionalArgs, ") : ",
+            "Sk.misceval.callsimOrSuspendArray(", func, ", ", positionalArgs, ");");
     }
 
     this._checkSuspension(e);
@@ -1028,8 +1095,8 @@ Compiler.prototype.exprConstant = function (e) {
             return Sk.misceval.isTrue(e.n) ? 1 : 0;
         case Sk.astnodes.Str:
             return Sk.misceval.isTrue(e.s) ? 1 : 0;
-        case Sk.astnodes.Name:
-        // todo; do __debug__ test here if opt
+        case Sk.astnodes.NameConstant:
+            return Sk.misceval.isTrue(e.value) ? 1 : 0;
         default:
             return -1;
     }
@@ -1045,6 +1112,12 @@ Compiler.prototype.newBlock = function (name) {
 Compiler.prototype.setBlock = function (n) {
     Sk.asserts.assert(n >= 0 && n < this.u.blocknum);
     this.u.curblock = n;
+    if (this.u.canSuspend && this.u.localtemps.length > 0) {
+        // the interrupt test can suspend at the start of any block, so the
+        // temps of the statement so far must survive that too
+        this.u.tempsToSave = this.u.tempsToSave.concat(this.u.localtemps);
+        this.u.localtemps = [];
+    }
 };
 
 Compiler.prototype.pushBreakBlock = function (n) {
@@ -1116,52 +1189,68 @@ Compiler.prototype.outputLocals = function (unit) {
     return "";
 };
 
+/**
+ * Code for a unit that can suspend. A suspension point stores where to
+ * resume in $suspBlk, $suspLine and $suspCol and breaks out of the block
+ * loop to the code returned by outputSaveSuspension. When the frame is
+ * resumed the code of outputWakeFromSuspension puts it back. Neither is a
+ * closure, so a call that doesn't suspend allocates nothing for them.
+ */
 Compiler.prototype.outputSuspensionHelpers = function (unit) {
+    var localsToSave = unit.localnames.concat(unit.tempsToSave);
+    return (localsToSave.length > 0 ? ("var " + localsToSave.join(",") + ";") : "") +
+        "var $suspBlk,$suspLine,$suspCol;";
+};
+
+Compiler.prototype.uniqueLocalsToSave = function (unit) {
     var i, t;
-    var localSaveCode = [];
     var localsToSave = unit.localnames.concat(unit.tempsToSave);
     var seenTemps = {};
-    var hasCell = unit.ste.blockType === Sk.SYMTAB_CONSTS.FunctionBlock && unit.ste.childHasFree;
-    var output = (localsToSave.length > 0 ? ("var " + localsToSave.join(",") + ";") : "") +
-                 "var $wakeFromSuspension = function() {" +
-                    "var susp = "+unit.scopename+".$wakingSuspension; "+unit.scopename+".$wakingSuspension = undefined;" +
-                    "$blk=susp.$blk; $loc=susp.$loc; $gbl=susp.$gbl; $exc=susp.$exc; $err=susp.$err; $postfinally=susp.$postfinally;" +
-                    "$currLineNo=susp.$lineno; $currColNo=susp.$colno; Sk.lastYield=Date.now();" +
-                    (hasCell?"$cell=susp.$cell;":"");
-
+    var ret = [];
     for (i = 0; i < localsToSave.length; i++) {
         t = localsToSave[i];
-        if (seenTemps[t]===undefined) {
-            output += t + "=susp.$tmps." + t + ";";
+        if (seenTemps[t] === undefined) {
+            ret.push(t);
             seenTemps[t] = true;
         }
     }
+    return ret;
+};
 
-    output +=  "try { $ret=susp.child.resume(); } catch(err) { if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if($exc.length>0) { $err=err; $blk=$exc.pop(); } else { throw err; } }" +
-                "};";
-
-    output += "var $saveSuspension = function($child, $filename, $lineno, $colno) {" +
-                "var susp = new Sk.misceval.Suspension(); susp.child=$child;" +
-                "susp.resume=function(){"+unit.scopename+".$wakingSuspension=susp; return "+unit.scopename+"("+(unit.ste.generator?"$gen":"")+"); };" +
-                "susp.data=susp.child.data;susp.$blk=$blk;susp.$loc=$loc;susp.$gbl=$gbl;susp.$exc=$exc;susp.$err=$err;susp.$postfinally=$postfinally;" +
-                "susp.$filename=$filename;susp.$lineno=$lineno;susp.$colno=$colno;" +
-                "susp.optional=susp.child.optional;" +
-                (hasCell ? "susp.$cell=$cell;" : "");
+Compiler.prototype.outputWakeFromSuspension = function (unit) {
+    var i;
+    var locals = this.uniqueLocalsToSave(unit);
+    var hasCell = unit.ste.blockType === Sk.SYMTAB_CONSTS.FunctionBlock && unit.ste.childHasFree;
+    var output = "var $susp = "+unit.scopename+".$wakingSuspension; "+unit.scopename+".$wakingSuspension = undefined;" +
+                 "$blk=$susp.$blk; $loc=$susp.$loc; $gbl=$susp.$gbl; $exc=$susp.$exc; $err=$susp.$err; $postfinally=$susp.$postfinally;" +
+                 "$currLineNo=$susp.$lineno; $currColNo=$susp.$colno; Sk.lastYield=Date.now();" +
+                 (hasCell?"$cell=$susp.$cell;":"");
 
-    seenTemps = {};
-    for (i = 0; i < localsToSave.length; i++) {
-        t = localsToSave[i];
-        if (seenTemps[t]===undefined) {
-            localSaveCode.push("\"" + t + "\":" + t);
-            seenTemps[t]=true;
-        }
+    for (i = 0; i < locals.length; i++) {
+        output += locals[i] + "=$susp.$tmps." + locals[i] + ";";
     }
-    output +=   "susp.$tmps={" + localSaveCode.join(",") + "};" +
-                "return susp;" +
-              "};";
 
+    output += "try { $ret=$susp.child.resume(); } catch(err) { if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if($exc.length>0) { $err=err; $blk=$exc.pop(); } else { throw err; } }";
     return output;
-}
+};
+
+Compiler.prototype.outputSaveSuspension = function (unit) {
+    var i;
+    var locals = this.uniqueLocalsToSave(unit);
+    var hasCell = unit.ste.blockType === Sk.SYMTAB_CONSTS.FunctionBlock && unit.ste.childHasFree;
+    var localSaveCode = [];
+
+    for (i = 0; i < locals.length; i++) {
+        localSaveCode.push("\"" + locals[i] + "\":" + locals[i]);
+    }
+
+    return "var $susp = Sk.misceval.frameSuspension_($ret, " + unit.scopename + (unit.ste.generator ? ", $gen" : "") + ");" +
+           "$susp.$blk=$suspBlk;$susp.$loc=$loc;$susp.$gbl=$gbl;$susp.$exc=$exc;$susp.$err=$err;$susp.$postfinally=$postfinally;" +
+           "$susp.$filename='" + this.filename + "';$susp.$lineno=$suspLine;$susp.$colno=$suspCol;" +
+           (hasCell ? "$susp.$cell=$cell;" : "") +
+           "$susp.$tmps={" + localSaveCode.join(",") + "};" +
+           "return $susp;";
+};
 
 Compiler.prototype.outputAllUnits = function () {
     var i;
@@ -1177,8 +1266,11 @@ Compiler.prototype.outputAllUnits = function () {
         ret += this.outputLocals(unit);
         if (unit.doesSuspend) {
             ret += this.outputSuspensionHelpers(unit);
+            // the call to $wakeFromSuspension is where the frame wakes up
+            ret += unit.varDeclsCode.replace("$wakeFromSuspension();", this.outputWakeFromSuspension.bind(this, unit));
+        } else {
+            ret += unit.varDeclsCode;
         }
-        ret += unit.varDeclsCode;
         ret += unit.switchCode;
         blocks = unit.blocks;
         generatedBlocks = Object.create(null);
@@ -1208,6 +1300,10 @@ Compiler.prototype.outputAllUnits = function () {
                 }
             }
         }
+        ret += unit.frameEndCode;
+        if (unit.doesSuspend) {
+            ret += this.outputSaveSuspension(unit);
+        }
         ret += unit.suffixCode;
     }
     return ret;
@@ -1275,7 +1371,9 @@ Compiler.prototype.cwhile = function (s) {
         body = this.newBlock("while body");
 
         this.annotateSource(s);
-        this._jumpfalse(this.vexpr(s.test), orelse ? orelse : next);
+        if (constant !== 1) {
+            this._jumpfalse(this.vexpr(s.test), orelse ? orelse : next);
+        }
         this._jump(body);
 
         this.pushBreakBlock(next);
@@ -1283,18 +1381,10 @@ Compiler.prototype.cwhile = function (s) {
 
         this.setBlock(body);
 
-        if ((Sk.debugging || Sk.killableWhile) && this.u.canSuspend) {
-            var suspType = 'Sk.delay';
-            var debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
-            out("if (Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
-                "var $susp = $saveSuspension({data: {type: '"+suspType+"'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
-                "$susp.$blk = "+debugBlock+";",
-                "$susp.optional = true;",
-                "return $susp;",
-                "}");
-            this._jump(debugBlock);
-            this.setBlock(debugBlock);
-            this.u.doesSuspend = true;
+        // with breakpoint tables the statements of the body are checked
+        // already, the loop only needs its own check to be killable
+        if (((Sk.debugging && !Sk.breakpointTables) || Sk.killableWhile) && this.u.canSuspend) {
+            this.outputDebugCheck(s, "Sk.delay", false);
         }
 
         this.vseqstmt(s.body);
@@ -1352,18 +1442,8 @@ Compiler.prototype.cfor = function (s) {
     this._jumpundef(nexti, cleanup); // todo; this should be handled by StopIteration
     target = this.vexpr(s.target, nexti);
 
-    if ((Sk.debugging || Sk.killableFor) && this.u.canSuspend) {
-        var suspType = 'Sk.delay';
-        var debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
-        out("if (Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
-            "var $susp = $saveSuspension({data: {type: '"+suspType+"'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
-            "$susp.$blk = "+debugBlock+";",
-            "$susp.optional = true;",
-            "return $susp;",
-            "}");
-        this._jump(debugBlock);
-        this.setBlock(debugBlock);
-        this.u.doesSuspend = true;
+    if (((Sk.debugging && !Sk.breakpointTables) || Sk.killableFor) && this.u.canSuspend) {
+        this.outputDebugCheck(s, "Sk.delay", false);
     }
 
     // execute body
@@ -1846,7 +1926,7 @@ Compiler.prototype.buildcodeobj = function (n, coname, decorator_list, args, cal
     //
     // the header of the function, and arguments
     //
-    this.u.prefixCode = "var " + scopename + "=(function " + this.niceName(coname.v) + "$(";
+    this.u.prefixCode = this.sourceMark(n.lineno, n.col_offset) + "var " + scopename + "=(function " + this.jsName(this.u) + "$(";
 
     funcArgs = [];
     if (isGenerator) {
@@ -1911,10 +1991,10 @@ Compiler.prototype.buildcodeobj = function (n, coname, decorator_list, args, cal
     // note special usage of 'this' to avoid having to slice globals into
     // all function invocations in call
     this.u.varDeclsCode += "var $blk=" + entryBlock + ",$exc=[],$loc=" + locals + cells + ",$gbl=this,$err=undefined,$ret=undefined,$postfinally=undefined,$currLineNo=undefined,$currColNo=undefined;";
-    if (Sk.execLimit !== null) {
+    if (checksExecLimit()) {
         this.u.varDeclsCode += "if (typeof Sk.execStart === 'undefined') {Sk.execStart = Date.now()}";
     }
-    if (Sk.yieldLimit !== null && this.u.canSuspend) {
+    if (checksYieldLimit() && this.u.canSuspend) {
         this.u.varDeclsCode += "if (typeof Sk.lastYield === 'undefined') {Sk.lastYield = Date.now()}";
     }
 
@@ -1990,10 +2070,14 @@ Compiler.prototype.buildcodeobj = function (n, coname, decorator_list, args, cal
     // this.u.suffixCode = "}break;}});";
 
     // New switch code to catch exceptions
-    this.u.switchCode = "while(true){try{"
+    this.u.switchCode = "$frame: while(true){try{"
     this.u.switchCode += this.outputInterruptTest();
     this.u.switchCode += "switch($blk){";
-    this.u.suffixCode = "} }catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} }});";
+    this.u.frameEndCode = "} }catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} }";
+    this.u.suffixCode = "});";
+    if (Sk.profiling) {
+        this.u.suffixCode += scopename + "=Sk.profiler.wrap(" + scopename + ",'" + this.u.qualname + "','" + this.filename + "'," + n.lineno + ");";
+    }
 
     //
     // jump back to the handler so it can do the main actual work of the
@@ -2253,22 +2337,22 @@ Compiler.prototype.cclass = function (s) {
     scopename = this.enterScope(s.name, s, s.lineno);
     entryBlock = this.newBlock("class entry");
 
-    this.u.prefixCode = "var " + scopename + "=(function $" + s.name.v + "$class_outer($globals,$locals,$cell){var $gbl=$globals,$loc=$locals;$free=$globals;";
-    this.u.switchCode += "(function $" + s.name.v + "$_closure($cell){";
+    this.u.prefixCode = this.sourceMark(s.lineno, s.col_offset) + "var " + scopename + "=(function " + this.jsName(this.u) + "$class_outer($globals,$locals,$cell){var $gbl=$globals,$loc=$locals;$free=$globals;";
+    this.u.switchCode += "(function " + this.jsName(this.u) + "$_closure($cell){";
     this.u.switchCode += "var $blk=" + entryBlock + ",$exc=[],$ret=undefined,$postfinally=undefined,$currLineNo=undefined,$currColNo=undefined;"
 
-    if (Sk.execLimit !== null) {
+    if (checksExecLimit()) {
         this.u.switchCode += "if (typeof Sk.execStart === 'undefined') {Sk.execStart = Date.now()}";
     }
-    if (Sk.yieldLimit !== null && this.u.canSuspend) {
+    if (checksYieldLimit() && this.u.canSuspend) {
         this.u.switchCode += "if (typeof Sk.lastYield === 'undefined') {Sk.lastYield = Date.now()}";
     }
 
-    this.u.switchCode += "while(true){try{";
+    this.u.switchCode += "$frame: while(true){try{";
     this.u.switchCode += this.outputInterruptTest();
     this.u.switchCode += "switch($blk){";
-    this.u.suffixCode = "}}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }}}"
-    this.u.suffixCode += "}).call(null, $cell);});";
+    this.u.frameEndCode = "}}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }}}"
+    this.u.suffixCode = "}).call(null, $cell);});";
 
     this.u.private_ = s.name;
 
@@ -2317,6 +2401,32 @@ Compiler.prototype.cbreak = function (s) {
     }
 };
 
+/**
+ * Output a check before statement s that returns an optional suspension of
+ * type suspType, resuming at s, when Sk.breakpoints says so.
+ *
+ * @param {Object} s the statement
+ * @param {string} suspType
+ * @param {boolean} tabled only call Sk.breakpoints when the line of s is
+ *     enabled in the breakpoint table of the file or Sk.debugStep is set
+ */
+Compiler.prototype.outputDebugCheck = function (s, suspType, tabled) {
+    var debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
+    var test = "Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")";
+    if (tabled) {
+        test = "($bpt["+s.lineno+"]|$bps[0])!==0&&" + test;
+        this.breakpointLines = Math.max(this.breakpointLines, s.lineno);
+    }
+    out("if (", test, ") {",
+        "$ret = {data: {type: '"+suspType+"'}, optional: true, resume: function() {}};",
+        "$suspBlk = " + debugBlock + "; $suspLine = " + s.lineno + "; $suspCol = " + s.col_offset + ";",
+        "break $frame;",
+        "}");
+    this._jump(debugBlock);
+    this.setBlock(debugBlock);
+    this.u.doesSuspend = true;
+};
+
 /**
  * compiles a statement
  * @param {Object} s
@@ -2326,25 +2436,19 @@ Compiler.prototype.vstmt = function (s, class_for_super) {
     var i;
     var val;
     var n;
-    var debugBlock;
     this.u.lineno = s.lineno;
     this.u.linenoSet = false;
     this.u.localtemps = [];
 
     if (Sk.debugging && this.u.canSuspend) {
-        debugBlock = this.newBlock("debug breakpoint for line "+s.lineno);
-        out("if (Sk.breakpoints('"+this.filename+"',"+s.lineno+","+s.col_offset+")) {",
-            "var $susp = $saveSuspension({data: {type: 'Sk.debug'}, resume: function() {}}, '"+this.filename+"',"+s.lineno+","+s.col_offset+");",
-            "$susp.$blk = " + debugBlock + ";",
-            "$susp.optional = true;",
-            "return $susp;",
-            "}");
-        this._jump(debugBlock);
-        this.setBlock(debugBlock);
-        this.u.doesSuspend = true;
+        this.outputDebugCheck(s, "Sk.debug", Sk.breakpointTables);
     }
 
     this.annotateSource(s);
+    if (Sk.lineCounts) {
+        out("$lct[", s.lineno, "]++;");
+        this.countedLines[s.lineno] = true;
+    }
 
     switch (s.constructor) {
         case Sk.astnodes.FunctionDef:
@@ -2406,7 +2510,12 @@ Compiler.prototype.vstmt = function (s, class_for_super) {
         case Sk.astnodes.Global:
             break;
         case Sk.astnodes.Expr:
-            this.vexpr(s.value);
+            val = this.vexpr(s.value);
+            if (this.interactive && this.nestlevel <= 1) {
+                // show the value, as the interactive interpreter does
+                out("$ret = Sk.misceval.displayhook(", val, ", true);");
+                this._checkSuspension(s);
+            }
             break;
         case Sk.astnodes.Pass:
             break;
@@ -2603,6 +2712,13 @@ Compiler.prototype.enterScope = function (name, key, lineno, canSuspend) {
     if (this.u && this.u.private_) {
         u.private_ = this.u.private_;
     }
+    if (!this.u || this.u.ste.blockType === Sk.SYMTAB_CONSTS.ModuleBlock) {
+        u.qualname = name.v;
+    } else if (this.u.ste.blockType === Sk.SYMTAB_CONSTS.FunctionBlock) {
+        u.qualname = this.u.qualname + ".<locals>." + name.v;
+    } else {
+        u.qualname = this.u.qualname + "." + name.v;
+    }
 
     this.stack.push(this.u);
     this.allUnits.push(u);
@@ -2685,18 +2801,19 @@ Compiler.prototype.cmod = function (mod) {
     var modf = this.enterScope(new Sk.builtin.str("<module>"), mod, 0, this.canSuspend);
 
     var entryBlock = this.newBlock("module entry");
-    this.u.prefixCode = "var " + modf + "=(function($forcegbl){";
+    this.u.prefixCode = this.sourceMark(1, 0) + "var " + modf + "=(function " +
+        "$" + this.filename.replace(/^.*\//, "").replace(/\.py$/, "").replace(/[^A-Za-z0-9_]/g, "") + "$module($forcegbl){";
     this.u.varDeclsCode =
         "var $gbl = $forcegbl || {}, $blk=" + entryBlock +
         ",$exc=[],$loc=$gbl,$cell={},$err=undefined;" +
         "$loc.__file__=new Sk.builtins.str('" + this.filename +
         "');var $ret=undefined,$postfinally=undefined,$currLineNo=undefined,$currColNo=undefined;";
 
-    if (Sk.execLimit !== null) {
+    if (checksExecLimit()) {
         this.u.varDeclsCode += "if (typeof Sk.execStart === 'undefined') {Sk.execStart = Date.now()}";
     }
 
-    if (Sk.yieldLimit !== null && this.u.canSuspend) {
+    if (checksYieldLimit() && this.u.canSuspend) {
         this.u.varDeclsCode += "if (typeof Sk.lastYield === 'undefined') {Sk.lastYield = Date.now()}";
     }
 
@@ -2716,11 +2833,12 @@ Compiler.prototype.cmod = function (mod) {
     //this.u.suffixCode = "}}});";
 
     // New Code:
-    this.u.switchCode = "while(true){try{";
+    this.u.switchCode = "$frame: while(true){try{";
     this.u.switchCode += this.outputInterruptTest();
     this.u.switchCode += "switch($blk){";
-    this.u.suffixCode = "}"
-    this.u.suffixCode += "}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} } });";
+    this.u.frameEndCode = "}"
+    this.u.frameEndCode += "}catch(err){ if (!(err instanceof Sk.builtin.BaseException)) { err = new Sk.builtin.ExternalError(err); } err.traceback.push({lineno: $currLineNo, colno: $currColNo, filename: '"+this.filename+"'}); if ($exc.length>0) { $err = err; $blk=$exc.pop(); continue; } else { throw err; }} }";
+    this.u.suffixCode = " });";
 
     // Note - this change may need to be adjusted for all the other instances of
     // switchCode and suffixCode in this file.  Not knowing how to test those
@@ -2740,6 +2858,14 @@ Compiler.prototype.cmod = function (mod) {
             this.cbody(mod.body);
             out("return $loc;");
             break;
+        case Sk.astnodes.Interactive:
+            this.interactive = true;
+            this.cbody(mod.body);
+            out("return $loc;");
+            break;
+        case Sk.astnodes.Expression:
+            out("return ", this.vexpr(mod.body), ";");
+            break;
         default:
             Sk.asserts.fail("todo; unhandled case in compilerMod");
     }
@@ -2763,30 +2889,207 @@ Sk.compile = function (source, filename, mode, canSuspend) {
     var savedFlags = Sk.__future__;
     Sk.__future__ = Object.create(Sk.__future__);
 
-    var parse = Sk.parse(filename, source);
+    var parse = Sk.parse(filename, source, mode);
     var ast = Sk.astFromParse(parse.cst, filename, parse.flags);
     // console.log(JSON.stringify(ast, undefined, 2));
+    Sk.prefetchBuiltinImports(ast);
 
     // compilers flags, later we can add other ones too
     var flags = {};
     flags.cf_flags = parse.flags;
 
     var st = Sk.symboltable(ast, filename);
+    ast = Sk.astOptimize(ast, filename, Sk.optimize);
     var c = new Compiler(filename, st, flags.cf_flags, canSuspend, source); // todo; CO_xxx
     var funcname = c.cmod(ast);
 
     // Restore the global __future__ flags
     Sk.__future__ = savedFlags;
 
-    var ret = "$compiledmod = function() {" + c.result.join("") + "\nreturn " + funcname + ";}();";
+    var prefix = "";
+    if (c.breakpointLines > 0) {
+        prefix = "var $bpt=Sk.breakpointTable('" + filename + "'," + c.breakpointLines + "),$bps=Sk.debugStep;";
+    }
+    if (Sk.lineCounts) {
+        prefix += "var $lct=Sk.lineCountTable('" + filename + "',[" +
+            Object.keys(c.countedLines).sort(function (a, b) {
+                return a - b;
+            }).join(",") + "]);";
+        Sk.lineCountFile_(filename).source = source;
+    }
+    var ret = "$compiledmod = function() {" + prefix + c.result.join("") + "\nreturn " + funcname + ";}();";
+    var sourceMap;
+    if (Sk.sourceMaps) {
+        sourceMap = buildSourceMap(ret, filename, source);
+        ret = sourceMap.code + "\n//# sourceURL=" + filename + ".js" +
+            "\n//# sourceMappingURL=data:application/json;base64," + base64Encode(JSON.stringify(sourceMap.map));
+        sourceMap = sourceMap.map;
+    }
     return {
-        funcname: "$compiledmod",
-        code    : ret
+        funcname : "$compiledmod",
+        code     : ret,
+        sourceMap: sourceMap
     };
 };
 
+var BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+
+/**
+ * A number in the base 64 VLQ encoding of source maps.
+ */
+function vlq (n) {
+    var digit;
+    var ret = "";
+    n = n < 0 ? ((-n) << 1) | 1 : n << 1;
+    do {
+        digit = n & 31;
+        n >>>= 5;
+        if (n > 0) {
+            digit |= 32;
+        }
+        ret += BASE64[digit];
+    } while (n > 0);
+    return ret;
+}
+
+/**
+ * Base 64 of the UTF-8 encoding of a string, for a data: URL.
+ */
+function base64Encode (str) {
+    var bytes = unescape(encodeURIComponent(str));
+    var ret = "";
+    var i;
+    var n;
+    for (i = 0; i < bytes.length; i += 3) {
+        n = (bytes.charCodeAt(i) << 16) | ((bytes.charCodeAt(i + 1) || 0) << 8) | (bytes.charCodeAt(i + 2) || 0);
+        ret += BASE64[(n >> 18) & 63] + BASE64[(n >> 12) & 63] +
+            (i + 1 < bytes.length ? BASE64[(n >> 6) & 63] : "=") +
+            (i + 2 < bytes.length ? BASE64[n & 63] : "=");
+    }
+    return ret;
+}
+
+/**
+ * Remove the marks Compiler.prototype.sourceMark left in code and build a
+ * version 3 source map from their positions. Each mark maps the code after
+ * it, up to the next mark, to its Python line and column; the position
+ * carries over to the start of each following line of generated code.
+ *
+ * @param {string} code generated code with marks
+ * @param {string} filename
+ * @param {string} source the Python source
+ * @returns {{code: string, map: Object}}
+ */
+function buildSourceMap (code, filename, source) {
+    var parts = code.split("\u0001");
+    var lines = [];
+    var segments = [];
+    var out = [];
+    var genCol = 0;
+    var srcLine = -1;
+    var srcCol = 0;
+    var prevSrcLine = 0;
+    var prevSrcCol = 0;
+    var prevGenCol = 0;
+    // the source position still has to be carried over to the start of
+    // the generated line
+    var carry = false;
+    var text;
+    var pos;
+    var nl;
+    var i;
+
+    function segment () {
+        if (srcLine >= 0) {
+            segments.push(vlq(genCol - prevGenCol) + "A" + vlq(srcLine - prevSrcLine) + vlq(srcCol - prevSrcCol));
+            prevGenCol = genCol;
+            prevSrcLine = srcLine;
+            prevSrcCol = srcCol;
+        }
+    }
+
+    for (i = 0; i < parts.length; i++) {
+        text = parts[i];
+        if (i % 2 === 1) {
+            // a mark, "line:col"
+            pos = text.split(":");
+            srcLine = parseInt(pos[0], 10) - 1;
+            srcCol = parseInt(pos[1], 10);
+            // a mark at the start of a line takes the place of the carry
+            carry = false;
+            segment();
+            continue;
+        }
+        out.push(text);
+        while ((nl = text.indexOf("\n")) !== -1) {
+            if (carry && nl > 0) {
+                segment();
+            }
+            lines.push(segments.join(","));
+            segments = [];
+            genCol = prevGenCol = 0;
+            text = text.substring(nl + 1);
+            carry = true;
+        }
+        if (carry && text.length > 0) {
+            segment();
+            carry = false;
+        }
+        genCol += text.length;
+    }
+    lines.push(segments.join(","));
+
+    return {
+        code: out.join(""),
+        map : {
+            version       : 3,
+            file          : filename + ".js",
+            sources       : [filename],
+            sourcesContent: [source],
+            names         : [],
+            mappings      : lines.join(";")
+        }
+    };
+}
+
 Sk.exportSymbol("Sk.compile", Sk.compile);
 
+/**
+ * The settings that change the code Sk.compile generates, as a string.
+ * Compiled code saved at build time (see support/build/snapshot.js) is only
+ * used when these match the settings it was compiled under.
+ *
+ * @returns {string}
+ */
+Sk.compileSettings = function () {
+    var future = {};
+    var keys = [];
+    var k;
+    var i;
+    for (k in Sk.__future__) {
+        keys.push(k);
+    }
+    keys.sort();
+    for (i = 0; i < keys.length; i++) {
+        future[keys[i]] = Sk.__future__[keys[i]];
+    }
+    return JSON.stringify({
+        future       : future,
+        debugging    : Sk.debugging,
+        bpTables     : Sk.breakpointTables,
+        killableWhile: Sk.killableWhile,
+        killableFor  : Sk.killableFor,
+        execLimit    : checksExecLimit(),
+        yieldLimit   : checksYieldLimit(),
+        optimize     : Sk.optimize,
+        sourceMaps   : Sk.sourceMaps,
+        profiling    : Sk.profiling,
+        lineCounts   : Sk.lineCounts
+    });
+};
+
+Sk.exportSymbol("Sk.compileSettings", Sk.compileSettings);
+
 Sk.resetCompiler = function () {
     Sk.gensymcount = 0;
 };
@@ -0,0 +1,303 @@
+/**
+ * Interpreter contexts and the scheduler that runs them, so that one JS
+ * realm can run many Python programs at once.
+ *
+ * The state of a running program (its modules, globals, output and limits)
+ * lives in globals like Sk.sysmodules and Sk.execStart, which compiled code
+ * uses directly. An Sk.Context keeps its own copy of that state and swaps
+ * it in whenever its program runs, from the start until it suspends, much
+ * like a thread switch. Everything else is shared by the contexts of a
+ * realm: the builtins, the compiled builtin files and the __future__ given
+ * to Sk.configure.
+ *
+ *     var scheduler = new Sk.Scheduler({concurrency: 50});
+ *     submissions.forEach(function (src) {
+ *         var context = new Sk.Context({output: ..., execLimit: 5000});
+ *         scheduler.spawn(context, function () {
+ *             return Sk.importMainWithBody("<stdin>", false, src, true);
+ *         }).then(...);
+ *     });
+ */
+
+/**
+ * An isolated interpreter context. Options, all of them optional, are
+ * those of Sk.configure that can differ between programs: output,
+ * inputfun, inputfunTakesPrompt, read, readChunk, fileopen, filewrite,
+ * nonreadopen, urlTransport, sysargv, syspath, execLimit, yieldLimit and
+ * timeoutMsg.
+ * The others are taken from the realm when the context is made.
+ *
+ * execLimit counts only the time the program of the context runs, not the
+ * time it waits for other programs or is suspended.
+ *
+ * @constructor
+ * @param {Object=} options
+ */
+Sk.Context = function (options) {
+    var i, field;
+
+    if (!(this instanceof Sk.Context)) {
+        return new Sk.Context(options);
+    }
+
+    options = options || {};
+    this.state = {};
+    for (i = 0; i < Sk.Context.options_.length; i++) {
+        field = Sk.Context.options_[i];
+        this.state[field] = options[field] !== undefined ? options[field] : Sk[field];
+    }
+    this.state["sysmodules"] = new Sk.builtin.dict([]);
+    this.state["realsyspath"] = undefined;
+    this.state["globals"] = undefined;
+    this.state["dateSet"] = false;
+    this.state["filesLoaded"] = false;
+    this.state["execStart"] = undefined;
+    this.state["lastYield"] = undefined;
+    this.state["sleepDebt"] = 0;
+    this.state["sleepResumed"] = 0;
+    this.softspace = false;
+
+    // the values of the context that was running before enter()
+    this.outer = null;
+    this.outerSoftspace = false;
+    // when the program of the context last stopped running
+    this.stopped = undefined;
+
+    /**
+     * The Sk.Scheduler that runs the program of the context, if any.
+     * @type {Sk.Scheduler}
+     */
+    this.scheduler = null;
+    return this;
+};
+
+Sk.Context.options_ = ["output", "inputfun", "inputfunTakesPrompt", "read", "readChunk", "fileopen", "filewrite",
+                       "nonreadopen", "urlTransport", "sysargv", "syspath", "execLimit", "yieldLimit", "timeoutMsg"];
+
+Sk.Context.fields_ = Sk.Context.options_.concat(["sysmodules", "realsyspath", "globals", "dateSet", "filesLoaded",
+                                                 "execStart", "lastYield", "sleepDebt", "sleepResumed"]);
+
+/**
+ * The context whose program is running, or null.
+ * @type {Sk.Context}
+ */
+Sk.Context.current = null;
+
+/**
+ * Makes this the state of Skulpt until exit(). Contexts can be entered
+ * inside each other, each exit() gives back the state from before.
+ */
+Sk.Context.prototype.enter = function () {
+    var i, field;
+    var now = Date.now();
+    var fields = Sk.Context.fields_;
+    var outer = {};
+
+    for (i = 0; i < fields.length; i++) {
+        field = fields[i];
+        outer[field] = Sk[field];
+        Sk[field] = this.state[field];
+    }
+    outer.context = Sk.Context.current;
+    this.outer = outer;
+    this.outerSoftspace = Sk.misceval.softspace_;
+    Sk.misceval.softspace_ = this.softspace;
+
+    // the time spent not running does not count against the limits
+    if (Sk.execStart !== undefined && this.stopped !== undefined) {
+        Sk.execStart = +Sk.execStart + (now - this.stopped);
+    }
+    Sk.lastYield = now;
+    Sk.Context.current = this;
+};
+
+Sk.Context.prototype.exit = function () {
+    var i, field;
+    var fields = Sk.Context.fields_;
+    var outer = this.outer;
+
+    Sk.asserts.assert(outer !== null, "exit() of a context that was not entered");
+    for (i = 0; i < fields.length; i++) {
+        field = fields[i];
+        this.state[field] = Sk[field];
+        Sk[field] = outer[field];
+    }
+    this.softspace = Sk.misceval.softspace_;
+    Sk.misceval.softspace_ = this.outerSoftspace;
+    Sk.Context.current = outer.context;
+    this.outer = null;
+    this.stopped = Date.now();
+};
+
+/**
+ * Calls fn in this context and returns what it returns.
+ *
+ * @param {function()} fn
+ */
+Sk.Context.prototype.call = function (fn) {
+    this.enter();
+    try {
+        return fn();
+    } finally {
+        this.exit();
+    }
+};
+
+/**
+ * Runs suspendablefn in this context as Sk.misceval.asyncToPromise does,
+ * entering the context each time the program is resumed. Suspension
+ * handlers resume the suspensions they are given in the context too.
+ *
+ * @param {function()} suspendablefn returns either a result or a Suspension
+ * @param {Object=} suspHandlers an object map of suspension handlers
+ */
+Sk.Context.prototype.run = function (suspendablefn, suspHandlers) {
+    var type;
+    var self = this;
+    var handlers;
+
+    var wrap = function (handler) {
+        return function (susp) {
+            var inContext = new Sk.misceval.Suspension();
+            inContext.data = susp.data;
+            inContext.optional = susp.optional;
+            inContext.child = susp;
+            inContext.resume = function () {
+                return self.call(function () {
+                    return susp.resume();
+                });
+            };
+            return handler(inContext);
+        };
+    };
+
+    if (suspHandlers) {
+        handlers = {};
+        for (type in suspHandlers) {
+            if (suspHandlers.hasOwnProperty(type)) {
+                handlers[type] = wrap(suspHandlers[type]);
+            }
+        }
+    }
+    return Sk.misceval.asyncToPromise(suspendablefn, handlers, this);
+};
+
+Sk.exportSymbol("Sk.Context", Sk.Context);
+
+/**
+ * Runs the programs of many contexts at once, giving them turns round
+ * robin: a program runs until it has used its time slice (Sk.yieldSlice)
+ * or waits for something, e.g. time.sleep, and then the next program that
+ * is ready takes its turn. Control goes back to the event loop between
+ * turns. At most options.concurrency programs (all, by default) are
+ * started, the others wait until one of them finishes.
+ *
+ * So that programs that compute without suspending take turns too, the
+ * yield limit of the contexts it runs is lowered to options.slice
+ * milliseconds (Sk.yieldSlice by default).
+ *
+ * @constructor
+ * @param {Object=} options
+ */
+Sk.Scheduler = function (options) {
+    var self = this;
+
+    if (!(this instanceof Sk.Scheduler)) {
+        return new Sk.Scheduler(options);
+    }
+
+    options = options || {};
+    this.concurrency = options["concurrency"] || Number.POSITIVE_INFINITY;
+    this.slice = options["slice"] || Sk.yieldSlice;
+    // the turns of the programs that are ready to run, in order
+    this.ready = [];
+    // the programs waiting to be started
+    this.waiting = [];
+    this.running = 0;
+    this.ticking = false;
+    this.tick = function () {
+        self.runTurn_();
+    };
+
+    /**
+     * How many programs were started and finished, and how many turns they
+     * took.
+     */
+    this.stats = {
+        "started": 0,
+        "finished": 0,
+        "turns": 0
+    };
+    return this;
+};
+
+/**
+ * Runs suspendablefn in context when its turn comes, and returns a Promise
+ * of its result, see Sk.Context.prototype.run.
+ *
+ * @param {Sk.Context} context
+ * @param {function()} suspendablefn returns either a result or a Suspension
+ * @param {Object=} suspHandlers an object map of suspension handlers
+ */
+Sk.Scheduler.prototype.spawn = function (context, suspendablefn, suspHandlers) {
+    var self = this;
+    return new Promise(function (resolve, reject) {
+        context.scheduler = self;
+        if (context.state["yieldLimit"] !== null && context.state["yieldLimit"] > self.slice) {
+            context.state["yieldLimit"] = self.slice;
+        }
+        self.waiting.push(function () {
+            var finished = function () {
+                self.running--;
+                self.stats["finished"]++;
+                self.startWaiting_();
+            };
+            self.stats["started"]++;
+            context.run(suspendablefn, suspHandlers).then(function (r) {
+                finished();
+                resolve(r);
+            }, function (e) {
+                finished();
+                reject(e);
+            });
+        });
+        self.startWaiting_();
+    });
+};
+
+Sk.Scheduler.prototype.startWaiting_ = function () {
+    while (this.running < this.concurrency && this.waiting.length > 0) {
+        // the program starts on its first turn
+        this.running++;
+        this.defer(this.waiting.shift());
+    }
+};
+
+/**
+ * Queues fn, the next turn of a program, behind those of the others.
+ *
+ * @param {function()} fn
+ */
+Sk.Scheduler.prototype.defer = function (fn) {
+    this.ready.push(fn);
+    if (!this.ticking) {
+        this.ticking = true;
+        Sk.global["setImmediate"](this.tick);
+    }
+};
+
+Sk.Scheduler.prototype.runTurn_ = function () {
+    var turn = this.ready.shift();
+    this.stats["turns"]++;
+    try {
+        turn();
+    } finally {
+        if (this.ready.length > 0) {
+            Sk.global["setImmediate"](this.tick);
+        } else {
+            this.ticking = false;
+        }
+    }
+};
+
+Sk.exportSymbol("Sk.Scheduler", Sk.Scheduler);
@@ -17,6 +17,7 @@ Sk.builtin.dict = function dict (L) {
 
     this.size = 0;
     this.buckets = {};
+    this.$hashes = null;
 
     if (Object.prototype.toString.apply(L) === "[object Array]") {
         // Handle dictionary literals
@@ -69,6 +70,13 @@ Sk.builtin.dict.tp$call = function(args, kw) {
 Sk.abstr.setUpInheritance("dict", Sk.builtin.dict, Sk.builtin.object);
 Sk.abstr.markUnhashable(Sk.builtin.dict);
 
+// The iterators of a dict and of its views walk the buckets in place. The
+// hashes of the buckets are listed once and kept in $hashes until a bucket
+// is added, and $version is bumped whenever a key is added or removed so
+// the iterators can tell that the dict changed underneath them.
+Sk.builtin.dict.prototype.$hashes = null;
+Sk.builtin.dict.prototype.$version = 0;
+
 var kf = Sk.builtin.hash;
 
 Sk.builtin.dict.prototype.key$lookup = function (bucket, key) {
@@ -78,7 +86,8 @@ Sk.builtin.dict.prototype.key$lookup = function (bucket, key) {
 
     for (i = 0; i < bucket.items.length; i++) {
         item = bucket.items[i];
-        eq = Sk.misceval.richCompareBool(item.lhs, key, "Eq");
+        // the same object is equal to itself, as in CPython
+        eq = item.lhs === key || Sk.misceval.richCompareBool(item.lhs, key, "Eq");
         if (eq) {
             return item;
         }
@@ -94,10 +103,11 @@ Sk.builtin.dict.prototype.key$pop = function (bucket, key) {
 
     for (i = 0; i < bucket.items.length; i++) {
         item = bucket.items[i];
-        eq = Sk.misceval.richCompareBool(item.lhs, key, "Eq");
+        eq = item.lhs === key || Sk.misceval.richCompareBool(item.lhs, key, "Eq");
         if (eq) {
             bucket.items.splice(i, 1);
             this.size -= 1;
+            this.$version++;
             return item;
         }
     }
@@ -155,7 +165,9 @@ Sk.builtin.dict.prototype.mp$ass_subscript = function (key, w) {
             {lhs: key, rhs: w}
         ]};
         this.buckets[k.v] = bucket;
+        this.$hashes = null;
         this.size += 1;
+        this.$version++;
         return;
     }
 
@@ -168,6 +180,7 @@ Sk.builtin.dict.prototype.mp$ass_subscript = function (key, w) {
     // Not found in dictionary
     bucket.items.push({lhs: key, rhs: w});
     this.size += 1;
+    this.$version++;
 };
 
 Sk.builtin.dict.prototype.mp$del_subscript = function (key) {
@@ -266,64 +279,30 @@ Sk.builtin.dict.prototype["has_key"] = new Sk.builtin.func(function (self, k) {
 
 Sk.builtin.dict.prototype["items"] = new Sk.builtin.func(function (self) {
     Sk.builtin.pyCheckArgsLen("items()", arguments.length, 0, 0, false, true);
-    var v;
-    var iter, k;
-    var ret = [];
-
-    for (iter = Sk.abstr.iter(self), k = iter.tp$iternext();
-        k !== undefined;
-        k = iter.tp$iternext()) {
-        v = self.mp$subscript(k);
-        if (v === undefined) {
-            //print(k, "had undefined v");
-            v = null;
-        }
-        ret.push(new Sk.builtin.tuple([k, v]));
-    }
-    return new Sk.builtin.list(ret);
+    var view = new Sk.builtin.dict_items(self);
+    return Sk.__future__.python3 ? view : new Sk.builtin.list(view);
 });
 
 Sk.builtin.dict.prototype["keys"] = new Sk.builtin.func(function (self) {
     Sk.builtin.pyCheckArgsLen("keys()", arguments.length, 0, 0, false, true);
-    var iter, k;
-    var ret = [];
-
-    for (iter = Sk.abstr.iter(self), k = iter.tp$iternext();
-        k !== undefined;
-        k = iter.tp$iternext()) {
-        ret.push(k);
-    }
-    return new Sk.builtin.list(ret);
+    var view = new Sk.builtin.dict_keys(self);
+    return Sk.__future__.python3 ? view : new Sk.builtin.list(view);
 });
 
 Sk.builtin.dict.prototype["values"] = new Sk.builtin.func(function (self) {
     Sk.builtin.pyCheckArgsLen("values()", arguments.length, 0, 0, false, true);
-    var v;
-    var iter, k;
-    var ret = [];
-
-    for (iter = Sk.abstr.iter(self), k = iter.tp$iternext();
-        k !== undefined;
-        k = iter.tp$iternext()) {
-        v = self.mp$subscript(k);
-        if (v === undefined) {
-            v = null;
-        }
-        ret.push(v);
-    }
-    return new Sk.builtin.list(ret);
+    var view = new Sk.builtin.dict_values(self);
+    return Sk.__future__.python3 ? view : new Sk.builtin.list(view);
 });
 
 Sk.builtin.dict.prototype["clear"] = new Sk.builtin.func(function (self) {
     Sk.builtin.pyCheckArgsLen("clear()", arguments.length, 0, 0, false, true);
-    var k;
-    var iter;
 
-    for (iter = Sk.abstr.iter(self), k = iter.tp$iternext();
-        k !== undefined;
-        k = iter.tp$iternext()) {
-        self.mp$del_subscript(k);
-    }
+    self.buckets = {};
+    self.$hashes = null;
+    self.size = 0;
+    self.$version++;
+    return Sk.builtin.none.none$;
 });
 
 Sk.builtin.dict.prototype["setdefault"] = new Sk.builtin.func(function (self, key, default_) {
@@ -572,15 +551,18 @@ Sk.builtin.dict.$fromkeys = function fromkeys(self, seq, value) {
 
 
 Sk.builtin.dict.prototype["iteritems"] = new Sk.builtin.func(function (self) {
-    throw new Sk.builtin.NotImplementedError("dict.iteritems is not yet implemented in Skulpt");
+    Sk.builtin.pyCheckArgsLen("iteritems()", arguments.length, 0, 0, false, true);
+    return new Sk.builtin.dict_itemiter_(self);
 });
 
 Sk.builtin.dict.prototype["iterkeys"] = new Sk.builtin.func(function (self) {
-    throw new Sk.builtin.NotImplementedError("dict.iterkeys is not yet implemented in Skulpt");
+    Sk.builtin.pyCheckArgsLen("iterkeys()", arguments.length, 0, 0, false, true);
+    return new Sk.builtin.dict_iter_(self);
 });
 
 Sk.builtin.dict.prototype["itervalues"] = new Sk.builtin.func(function (self) {
-    throw new Sk.builtin.NotImplementedError("dict.itervalues is not yet implemented in Skulpt");
+    Sk.builtin.pyCheckArgsLen("itervalues()", arguments.length, 0, 0, false, true);
+    return new Sk.builtin.dict_valueiter_(self);
 });
 
 Sk.builtin.dict.prototype["popitem"] = new Sk.builtin.func(function (self) {
@@ -588,71 +570,352 @@ Sk.builtin.dict.prototype["popitem"] = new Sk.builtin.func(function (self) {
 });
 
 Sk.builtin.dict.prototype["viewitems"] = new Sk.builtin.func(function (self) {
-    throw new Sk.builtin.NotImplementedError("dict.viewitems is not yet implemented in Skulpt");
+    Sk.builtin.pyCheckArgsLen("viewitems()", arguments.length, 0, 0, false, true);
+    return new Sk.builtin.dict_items(self);
 });
 
 Sk.builtin.dict.prototype["viewkeys"] = new Sk.builtin.func(function (self) {
-    throw new Sk.builtin.NotImplementedError("dict.viewkeys is not yet implemented in Skulpt");
+    Sk.builtin.pyCheckArgsLen("viewkeys()", arguments.length, 0, 0, false, true);
+    return new Sk.builtin.dict_keys(self);
 });
 
 Sk.builtin.dict.prototype["viewvalues"] = new Sk.builtin.func(function (self) {
-    throw new Sk.builtin.NotImplementedError("dict.viewvalues is not yet implemented in Skulpt");
+    Sk.builtin.pyCheckArgsLen("viewvalues()", arguments.length, 0, 0, false, true);
+    return new Sk.builtin.dict_values(self);
 });
 
+/**
+ * Start iterator it at the first entry of this dict. Subclasses with an
+ * order of their own (OrderedDict) override this and entries$next.
+ *
+ * @param {Object} it
+ */
+Sk.builtin.dict.prototype.entries$start = function (it) {
+    if (this.$hashes === null) {
+        this.$hashes = Object.keys(this.buckets);
+    }
+    it.$hashes = this.$hashes;
+    it.$bucket = 0;
+    it.$index = 0;
+    it.$size = this.size;
+    it.$version = this.$version;
+};
+
+/**
+ * The next entry ({lhs: key, rhs: value}) for iterator it, or undefined
+ * at the end.
+ *
+ * @param {Object} it
+ */
+Sk.builtin.dict.prototype.entries$next = function (it) {
+    var bucket;
+    var hashes = it.$hashes;
+
+    if (this.$version !== it.$version) {
+        if (this.size !== it.$size) {
+            throw new Sk.builtin.RuntimeError("dictionary changed size during iteration");
+        }
+        throw new Sk.builtin.RuntimeError("dictionary keys changed during iteration");
+    }
+
+    while (it.$bucket < hashes.length) {
+        bucket = this.buckets[hashes[it.$bucket]];
+        if (it.$index < bucket.items.length) {
+            return bucket.items[it.$index++];
+        }
+        it.$bucket++;
+        it.$index = 0;
+    }
+    return undefined;
+};
+
 Sk.exportSymbol("Sk.builtin.dict", Sk.builtin.dict);
 
+/**
+ * Sets up one of the dict iterators below: ctor is the constructor, name
+ * the type name and entry turns an entry of the dict into the item that
+ * is returned.
+ */
+Sk.builtin.dict_iter_setup_ = function (ctor, name, entry) {
+    Sk.abstr.setUpInheritance(name, ctor, Sk.builtin.object);
+
+    ctor.prototype.__class__ = ctor;
+
+    ctor.prototype.tp$iter = function () {
+        return this;
+    };
+
+    ctor.prototype.tp$iternext = function () {
+        var e;
+        if (this.$obj === null) {
+            return undefined;
+        }
+        e = this.$obj.entries$next(this);
+        if (e === undefined) {
+            // exhausted, later changes to the dict no longer matter
+            this.$obj = null;
+            return undefined;
+        }
+        return entry(e);
+    };
+
+    ctor.prototype.$r = function () {
+        return new Sk.builtin.str(name);
+    };
+
+    ctor.prototype.__iter__ = new Sk.builtin.func(function (self) {
+        return self;
+    });
+
+    ctor.prototype.next$ = function (self) {
+        var ret = self.tp$iternext();
+        if (ret === undefined) {
+            throw new Sk.builtin.StopIteration();
+        }
+        return ret;
+    };
+};
+
 /**
  * @constructor
- * @param {Object} obj
+ * @param {Sk.builtin.dict} obj
  */
 Sk.builtin.dict_iter_ = function (obj) {
-    var k, i, bucket, allkeys, buckets;
     if (!(this instanceof Sk.builtin.dict_iter_)) {
         return new Sk.builtin.dict_iter_(obj);
     }
-    this.$index = 0;
     this.$obj = obj;
-    allkeys = [];
-    buckets = obj.buckets;
-    for (k in buckets) {
-        if (buckets.hasOwnProperty(k)) {
-            bucket = buckets[k];
-            if (bucket && bucket.$hash !== undefined && bucket.items !== undefined) {
-                // skip internal stuff. todo; merge pyobj and this
-                for (i = 0; i < bucket.items.length; i++) {
-                    allkeys.push(bucket.items[i].lhs);
-                }
-            }
-        }
+    obj.entries$start(this);
+    return this;
+};
+
+Sk.builtin.dict_iter_setup_(Sk.builtin.dict_iter_, "dictionary-keyiterator", function (e) {
+    return e.lhs;
+});
+
+/**
+ * @constructor
+ * @param {Sk.builtin.dict} obj
+ */
+Sk.builtin.dict_valueiter_ = function (obj) {
+    if (!(this instanceof Sk.builtin.dict_valueiter_)) {
+        return new Sk.builtin.dict_valueiter_(obj);
     }
-    this.$keys = allkeys;
-    this.tp$iter = this;
-    this.tp$iternext = function () {
-        // todo; StopIteration
-        if (this.$index >= this.$keys.length) {
-            return undefined;
+    this.$obj = obj;
+    obj.entries$start(this);
+    return this;
+};
+
+Sk.builtin.dict_iter_setup_(Sk.builtin.dict_valueiter_, "dictionary-valueiterator", function (e) {
+    return e.rhs;
+});
+
+/**
+ * @constructor
+ * @param {Sk.builtin.dict} obj
+ */
+Sk.builtin.dict_itemiter_ = function (obj) {
+    if (!(this instanceof Sk.builtin.dict_itemiter_)) {
+        return new Sk.builtin.dict_itemiter_(obj);
+    }
+    this.$obj = obj;
+    obj.entries$start(this);
+    return this;
+};
+
+Sk.builtin.dict_iter_setup_(Sk.builtin.dict_itemiter_, "dictionary-itemiterator", function (e) {
+    return new Sk.builtin.tuple([e.lhs, e.rhs]);
+});
+
+/**
+ * Sets up one of the dict views below, live views of the keys, values or
+ * items of a dict that iterate with iter.
+ */
+Sk.builtin.dict_view_setup_ = function (ctor, name, iter) {
+    Sk.abstr.setUpInheritance(name, ctor, Sk.builtin.object);
+    Sk.abstr.markUnhashable(ctor);
+
+    ctor.prototype.__class__ = ctor;
+
+    ctor.prototype.tp$iter = function () {
+        return new iter(this.dict);
+    };
+
+    ctor.prototype.__iter__ = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("__iter__", arguments.length, 0, 0, false, true);
+        return new iter(self.dict);
+    });
+
+    ctor.prototype.sq$length = function () {
+        return this.dict.mp$length();
+    };
+
+    ctor.prototype.__len__ = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("__len__", arguments.length, 0, 0, false, true);
+        return new Sk.builtin.int_(self.dict.mp$length());
+    });
+
+    ctor.prototype.$r = function () {
+        var it, x;
+        var ret = [];
+        for (it = this.tp$iter(), x = it.tp$iternext(); x !== undefined; x = it.tp$iternext()) {
+            ret.push(Sk.misceval.objectRepr(x).v);
         }
-        return this.$keys[this.$index++];
-        // return this.$obj[this.$keys[this.$index++]].lhs;
+        return new Sk.builtin.str(name + "([" + ret.join(", ") + "])");
+    };
+};
+
+/**
+ * Adds the set operations and comparisons of keys and items views to ctor.
+ */
+Sk.builtin.dict_view_setops_ = function (ctor) {
+    var isSetLike = function (other) {
+        return Sk.builtin.set.check$(other) ||
+            other instanceof Sk.builtin.dict_keys ||
+            other instanceof Sk.builtin.dict_items;
+    };
+
+    var allContainedIn = function (a, b) {
+        var it, x;
+        for (it = Sk.abstr.iter(a), x = it.tp$iternext(); x !== undefined; x = it.tp$iternext()) {
+            if (!Sk.abstr.sequenceContains(b, x)) {
+                return false;
+            }
+        }
+        return true;
+    };
+
+    var compare = function (test) {
+        return function (other) {
+            if (!isSetLike(other)) {
+                return Sk.builtin.NotImplemented.NotImplemented$;
+            }
+            return new Sk.builtin.bool(test(this, other, this.sq$length(), other.sq$length()));
+        };
     };
-    this.$r = function () {
-        return new Sk.builtin.str("dictionary-keyiterator");
+
+    // the set operations take any iterable on either side and return a set
+    var setop = function (method, reflected) {
+        return function (other) {
+            var a = this;
+            var b = other;
+            if (!Sk.builtin.checkIterable(other)) {
+                return Sk.builtin.NotImplemented.NotImplemented$;
+            }
+            if (reflected) {
+                a = other;
+                b = this;
+            }
+            return Sk.builtin.set.prototype[method].func_code(new Sk.builtin.set(a), b);
+        };
     };
+
+    ctor.prototype.ob$eq = compare(function (a, b, la, lb) {
+        return la === lb && allContainedIn(a, b);
+    });
+    ctor.prototype.ob$ne = compare(function (a, b, la, lb) {
+        return la !== lb || !allContainedIn(a, b);
+    });
+    ctor.prototype.ob$lt = compare(function (a, b, la, lb) {
+        return la < lb && allContainedIn(a, b);
+    });
+    ctor.prototype.ob$le = compare(function (a, b, la, lb) {
+        return la <= lb && allContainedIn(a, b);
+    });
+    ctor.prototype.ob$gt = compare(function (a, b, la, lb) {
+        return la > lb && allContainedIn(b, a);
+    });
+    ctor.prototype.ob$ge = compare(function (a, b, la, lb) {
+        return la >= lb && allContainedIn(b, a);
+    });
+
+    ctor.prototype.nb$and = setop("intersection", false);
+    ctor.prototype.nb$reflected_and = setop("intersection", true);
+    ctor.prototype.nb$or = setop("union", false);
+    ctor.prototype.nb$reflected_or = setop("union", true);
+    ctor.prototype.nb$xor = setop("symmetric_difference", false);
+    ctor.prototype.nb$reflected_xor = setop("symmetric_difference", true);
+    ctor.prototype.nb$subtract = setop("difference", false);
+    ctor.prototype.nb$reflected_subtract = setop("difference", true);
+
+    ctor.prototype.isdisjoint = new Sk.builtin.func(function (self, other) {
+        var it, x;
+        Sk.builtin.pyCheckArgsLen("isdisjoint", arguments.length, 1, 1, false, true);
+        if (!Sk.builtin.checkIterable(other)) {
+            throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(other) + "' object is not iterable");
+        }
+        for (it = Sk.abstr.iter(other), x = it.tp$iternext(); x !== undefined; x = it.tp$iternext()) {
+            if (self.sq$contains(x)) {
+                return Sk.builtin.bool.false$;
+            }
+        }
+        return Sk.builtin.bool.true$;
+    });
+};
+
+/**
+ * @constructor
+ * @param {Sk.builtin.dict} dict
+ */
+Sk.builtin.dict_keys = function (dict) {
+    if (!(this instanceof Sk.builtin.dict_keys)) {
+        return new Sk.builtin.dict_keys(dict);
+    }
+    this.dict = dict;
     return this;
 };
 
-Sk.abstr.setUpInheritance("dictionary-keyiterator", Sk.builtin.dict_iter_, Sk.builtin.object);
+Sk.builtin.dict_view_setup_(Sk.builtin.dict_keys, "dict_keys", Sk.builtin.dict_iter_);
+Sk.builtin.dict_view_setops_(Sk.builtin.dict_keys);
 
-Sk.builtin.dict_iter_.prototype.__class__ = Sk.builtin.dict_iter_;
+Sk.builtin.dict_keys.prototype.sq$contains = function (key) {
+    return this.dict.sq$contains(key);
+};
 
-Sk.builtin.dict_iter_.prototype.__iter__ = new Sk.builtin.func(function (self) {
-    return self;
-});
+/**
+ * @constructor
+ * @param {Sk.builtin.dict} dict
+ */
+Sk.builtin.dict_values = function (dict) {
+    if (!(this instanceof Sk.builtin.dict_values)) {
+        return new Sk.builtin.dict_values(dict);
+    }
+    this.dict = dict;
+    return this;
+};
 
-Sk.builtin.dict_iter_.prototype.next$ = function (self) {
-    var ret = self.tp$iternext();
-    if (ret === undefined) {
-        throw new Sk.builtin.StopIteration();
+Sk.builtin.dict_view_setup_(Sk.builtin.dict_values, "dict_values", Sk.builtin.dict_valueiter_);
+
+Sk.builtin.dict_values.prototype.sq$contains = function (value) {
+    var it, v;
+    for (it = this.tp$iter(), v = it.tp$iternext(); v !== undefined; v = it.tp$iternext()) {
+        if (Sk.misceval.richCompareBool(v, value, "Eq")) {
+            return true;
+        }
     }
-    return ret;
+    return false;
+};
+
+/**
+ * @constructor
+ * @param {Sk.builtin.dict} dict
+ */
+Sk.builtin.dict_items = function (dict) {
+    if (!(this instanceof Sk.builtin.dict_items)) {
+        return new Sk.builtin.dict_items(dict);
+    }
+    this.dict = dict;
+    return this;
+};
+
+Sk.builtin.dict_view_setup_(Sk.builtin.dict_items, "dict_items", Sk.builtin.dict_itemiter_);
+Sk.builtin.dict_view_setops_(Sk.builtin.dict_items);
+
+Sk.builtin.dict_items.prototype.sq$contains = function (item) {
+    var v;
+    if (!(item instanceof Sk.builtin.tuple) || item.v.length !== 2) {
+        return false;
+    }
+    v = this.dict.mp$lookup(item.v[0]);
+    return v !== undefined && Sk.misceval.richCompareBool(v, item.v[1], "Eq");
 };
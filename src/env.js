@@ -17,6 +17,22 @@
  * nonreadopen: Boolean - set to true to allow non-read file operations
  * fileopen: Optional function to call any time a file is opened
  * filewrite: Optional function to call when writing to a file
+ * readChunk: Optional function (filename, offset, size) returning the next
+ * chunk of a file (or a Promise of it) as a string, "" at the end of the
+ * file. When set, open() streams files through it instead of Sk.read, or in a
+ * browser the elements of the page. It throws (or rejects) for a file that
+ * cannot be read, which open() raises as an IOError.
+ * urlTransport: Optional function used by urllib.request.urlopen to fetch a
+ * URL. It is given {url, method, headers, body, timeout} and returns (a
+ * Promise of) {status, reason, url, headers, read}, where read() returns (a
+ * Promise of) the next chunk of the body as a string, "" at the end. By
+ * default fetch is used, or XMLHttpRequest where there is no fetch.
+ * urlCacheSize: Number of GET responses urlopen keeps, by URL, to answer
+ * the same requests again without fetching them. 0 (the default) keeps none.
+ * optimize: Optimization level for compiled code, see Sk.optimize
+ * timeScale: Real milliseconds per millisecond of the clock programs see
+ * through the time module and sleep by, see Sk.timer. 1 (the default) is
+ * real time, smaller values fast-forward it, 0 skips the sleeps entirely.
  *
  * Any variables that aren't set will be left alone.
  */
@@ -96,6 +112,16 @@ Sk.configure = function (options) {
     Sk.filewrite = options["filewrite"] || undefined;
     Sk.asserts.assert(typeof Sk.filewrite === "function" || typeof Sk.filewrite === "undefined");
 
+    Sk.readChunk = options["readChunk"] || undefined;
+    Sk.asserts.assert(typeof Sk.readChunk === "function" || typeof Sk.readChunk === "undefined");
+
+    Sk.urlTransport = options["urlTransport"] || undefined;
+    Sk.asserts.assert(typeof Sk.urlTransport === "function" || typeof Sk.urlTransport === "undefined");
+
+    if ("urlCacheSize" in options) {
+        Sk.urlCacheSize = options["urlCacheSize"];
+    }
+
     Sk.timeoutMsg = options["timeoutMsg"] || Sk.timeoutMsg;
     Sk.asserts.assert(typeof Sk.timeoutMsg === "function");
     Sk.exportSymbol("Sk.timeoutMsg", Sk.timeoutMsg);
@@ -146,6 +172,11 @@ Sk.configure = function (options) {
     Sk.killableFor = options["killableFor"] || false;
     Sk.asserts.assert(typeof Sk.killableFor === "boolean");
 
+    Sk.optimize = options["optimize"] !== undefined ? options["optimize"] : 1;
+    Sk.asserts.assert(typeof Sk.optimize === "number");
+    // what the optimizer folds __debug__ to, for code it leaves alone
+    Sk.builtins["__debug__"] = Sk.optimize >= 2 ? Sk.builtin.bool.false$ : Sk.builtin.bool.true$;
+
     Sk.signals = typeof options["signals"] !== undefined ? options["signals"] : null;
     if (Sk.signals === true) {
         Sk.signals = {
@@ -173,6 +204,18 @@ Sk.configure = function (options) {
     Sk.breakpoints = options["breakpoints"] || function() { return true; };
     Sk.asserts.assert(typeof Sk.breakpoints === "function");
 
+    Sk.breakpointTables = options["breakpointTables"] || false;
+    Sk.asserts.assert(typeof Sk.breakpointTables === "boolean");
+
+    Sk.sourceMaps = options["sourceMaps"] || false;
+    Sk.asserts.assert(typeof Sk.sourceMaps === "boolean");
+
+    Sk.profiling = options["profiling"] || false;
+    Sk.asserts.assert(typeof Sk.profiling === "boolean");
+
+    Sk.lineCounts = options["lineCounts"] || false;
+    Sk.asserts.assert(typeof Sk.lineCounts === "boolean");
+
     Sk.setTimeout = options["setTimeout"];
     if (Sk.setTimeout === undefined) {
         if (typeof setTimeout === "function") {
@@ -191,6 +234,14 @@ Sk.configure = function (options) {
         Sk.yieldLimit = options["yieldLimit"];
     }
 
+    if ("yieldSlice" in options) {
+        Sk.yieldSlice = options["yieldSlice"];
+    }
+
+    if ("timeScale" in options) {
+        Sk.timer.setScale(options["timeScale"]);
+    }
+
     if (options["syspath"]) {
         Sk.syspath = options["syspath"];
         Sk.asserts.assert(Sk.isArrayLike(Sk.syspath));
@@ -248,6 +299,264 @@ Sk.execLimit = Number.POSITIVE_INFINITY;
  */
 Sk.yieldLimit = Number.POSITIVE_INFINITY;
 
+/*
+ *  How many milliseconds Sk.misceval.asyncToPromise keeps resuming a
+ *  program that yields before handing control back to the event loop.
+ */
+Sk.yieldSlice = 10;
+
+/*
+ *  How many GET responses urllib.request.urlopen keeps to answer repeated
+ *  requests from, see Sk.configure.
+ */
+Sk.urlCacheSize = 0;
+
+/*
+ * Optimization level applied by Sk.compile, see optimize.js. 0 compiles
+ * the AST as written; 1 folds constant expressions, drops branches that
+ * can never run and hoists constant membership tests; 2 also makes
+ * __debug__ False and drops assert statements, like python -O.
+ */
+Sk.optimize = 1;
+
+/*
+ * Whether Sk.compile adds a source map to the code it generates, mapping
+ * it back to the lines and columns of the Python source, for browser
+ * developer tools and JS profilers.
+ */
+Sk.sourceMaps = false;
+
+/*
+ * Whether Sk.compile makes the functions it compiles visible to the
+ * profiler of the cProfile module, see profiler.js.
+ */
+Sk.profiling = false;
+
+/*
+ * Whether Sk.compile makes the code it generates count how many times the
+ * statements on each line run, for coverage or to find the hot spots of a
+ * program, see Sk.getLineCounts.
+ */
+Sk.lineCounts = false;
+
+/*
+ * Line count tables and what is known about the files they count, by file
+ * name: {tables: [Uint32Array], lines: [line numbers with statements],
+ * source: string}.
+ */
+Sk.lineCountFiles_ = {};
+
+Sk.lineCountFile_ = function (filename) {
+    var file = Sk.lineCountFiles_[filename];
+    if (file === undefined) {
+        file = Sk.lineCountFiles_[filename] = {tables: [], lines: [], source: undefined};
+    }
+    return file;
+};
+
+/**
+ * A new table of line counts for a file, indexed by line number. Called
+ * once by compiled code when it is loaded; each time a file is compiled
+ * again its counts go to a new table, and Sk.getLineCounts adds them up.
+ *
+ * @param {string} filename
+ * @param {Array<number>} lines the lines that have statements
+ * @returns {Uint32Array}
+ */
+Sk.lineCountTable = function (filename, lines) {
+    var file = Sk.lineCountFile_(filename);
+    var table = new Uint32Array(lines.length === 0 ? 1 : lines[lines.length - 1] + 1);
+    var i;
+    file.tables.push(table);
+    for (i = 0; i < lines.length; i++) {
+        if (file.lines.indexOf(lines[i]) === -1) {
+            file.lines.push(lines[i]);
+        }
+    }
+    file.lines.sort(function (a, b) {
+        return a - b;
+    });
+    return table;
+};
+Sk.exportSymbol("Sk.lineCountTable", Sk.lineCountTable);
+
+/**
+ * How many times the statements on each line of a file have run, indexed
+ * by line number, or undefined if no code counting lines was loaded from
+ * it. Without a filename, an object with the counts of every file.
+ *
+ * @param {string=} filename
+ * @returns {Uint32Array|Object|undefined}
+ */
+Sk.getLineCounts = function (filename) {
+    var file;
+    var counts;
+    var ret;
+    var f;
+    var i;
+    var j;
+    if (filename === undefined) {
+        ret = {};
+        for (f in Sk.lineCountFiles_) {
+            ret[f] = Sk.getLineCounts(f);
+        }
+        return ret;
+    }
+    file = Sk.lineCountFiles_[filename];
+    if (file === undefined) {
+        return undefined;
+    }
+    counts = new Uint32Array(file.lines.length === 0 ? 1 : file.lines[file.lines.length - 1] + 1);
+    for (i = 0; i < file.tables.length; i++) {
+        for (j = 0; j < file.tables[i].length; j++) {
+            counts[j] += file.tables[i][j];
+        }
+    }
+    return counts;
+};
+Sk.exportSymbol("Sk.getLineCounts", Sk.getLineCounts);
+
+/**
+ * The line counts of every file as JSON:
+ * {filename: {"counts": {lineno: count}, "missing": [lineno]}}, where
+ * counts has the lines that ran and missing the lines with statements
+ * that never did.
+ *
+ * @returns {string}
+ */
+Sk.lineCountsJSON = function () {
+    var ret = {};
+    var counts;
+    var lines;
+    var f;
+    var i;
+    for (f in Sk.lineCountFiles_) {
+        counts = Sk.getLineCounts(f);
+        lines = Sk.lineCountFiles_[f].lines;
+        ret[f] = {counts: {}, missing: []};
+        for (i = 0; i < lines.length; i++) {
+            if (counts[lines[i]] > 0) {
+                ret[f].counts[lines[i]] = counts[lines[i]];
+            } else {
+                ret[f].missing.push(lines[i]);
+            }
+        }
+    }
+    return JSON.stringify(ret);
+};
+Sk.exportSymbol("Sk.lineCountsJSON", Sk.lineCountsJSON);
+
+/**
+ * Forget the line counts of one file, or of all of them, with what is known
+ * about the file: its tables, the lines with statements and the source.
+ * Code loaded before counts into tables that are no longer read, so call
+ * this between programs, which load their code again; their counts then
+ * start from 0 and are not merged with those of an earlier program that
+ * had a file of the same name.
+ *
+ * @param {string=} filename
+ */
+Sk.resetLineCounts = function (filename) {
+    var f;
+    for (f in Sk.lineCountFiles_) {
+        if (filename === undefined || f === filename) {
+            delete Sk.lineCountFiles_[f];
+        }
+    }
+};
+Sk.exportSymbol("Sk.resetLineCounts", Sk.resetLineCounts);
+
+/*
+ * Breakpoint tables, used when debugging with the breakpointTables option.
+ * Code compiled that way checks the table of its file before each
+ * statement and only calls Sk.breakpoints when the statement's line is
+ * enabled there, or when Sk.debugStep is set, instead of calling it before
+ * every statement.
+ */
+Sk.breakpointTables_ = {};
+
+/*
+ * Step mode for code compiled with breakpoint tables: while Sk.debugStep[0]
+ * is not 0, Sk.breakpoints is called before every statement.
+ */
+Sk.debugStep = new Uint8Array(1);
+
+/**
+ * The table of enabled breakpoint lines for a file, indexed by line number.
+ * Compiled code looks it up once, when it is loaded, so a table that must
+ * grow is replaced by a bigger copy and the old one is kept up to date for
+ * the code still using it.
+ *
+ * @param {string} filename
+ * @param {number} lines the highest line number the table must hold
+ * @returns {Uint8Array}
+ */
+Sk.breakpointTable = function (filename, lines) {
+    var tables = Sk.breakpointTables_[filename];
+    var table;
+    if (tables === undefined) {
+        tables = Sk.breakpointTables_[filename] = [];
+    }
+    table = tables[tables.length - 1];
+    if (table === undefined || table.length <= lines) {
+        table = new Uint8Array(lines + 1);
+        if (tables.length > 0) {
+            table.set(tables[tables.length - 1]);
+        }
+        tables.push(table);
+    }
+    return table;
+};
+Sk.exportSymbol("Sk.breakpointTable", Sk.breakpointTable);
+
+/**
+ * Enable or disable the breakpoint on a line.
+ *
+ * @param {string} filename
+ * @param {number} lineno
+ * @param {boolean} enabled
+ */
+Sk.setBreakpoint = function (filename, lineno, enabled) {
+    var tables;
+    var i;
+    Sk.breakpointTable(filename, lineno);
+    tables = Sk.breakpointTables_[filename];
+    for (i = 0; i < tables.length; i++) {
+        if (lineno < tables[i].length) {
+            tables[i][lineno] = enabled ? 1 : 0;
+        }
+    }
+};
+Sk.exportSymbol("Sk.setBreakpoint", Sk.setBreakpoint);
+
+/**
+ * Disable every breakpoint, in one file or in all of them.
+ *
+ * @param {string=} filename
+ */
+Sk.clearBreakpoints = function (filename) {
+    var f;
+    var i;
+    for (f in Sk.breakpointTables_) {
+        if (filename === undefined || f === filename) {
+            for (i = 0; i < Sk.breakpointTables_[f].length; i++) {
+                Sk.breakpointTables_[f][i].fill(0);
+            }
+        }
+    }
+};
+Sk.exportSymbol("Sk.clearBreakpoints", Sk.clearBreakpoints);
+
+/**
+ * Turn step mode on or off, see Sk.debugStep.
+ *
+ * @param {boolean} on
+ */
+Sk.setDebugStep = function (on) {
+    Sk.debugStep[0] = on ? 1 : 0;
+};
+Sk.exportSymbol("Sk.setDebugStep", Sk.setDebugStep);
+
 /*
  * Replacable output redirection (called from print, etc).
  */
@@ -340,6 +649,8 @@ Sk.setup_method_mappings = function () {
         },
         "next$": {
             "classes": [Sk.builtin.dict_iter_,
+                        Sk.builtin.dict_valueiter_,
+                        Sk.builtin.dict_itemiter_,
                         Sk.builtin.list_iter_,
                         Sk.builtin.set_iter_,
                         Sk.builtin.str_iter_,
@@ -349,7 +660,8 @@ Sk.setup_method_mappings = function () {
                         Sk.builtin.filter_,
                         Sk.builtin.zip_,
                         Sk.builtin.map_,
-                        Sk.builtin.iterator],
+                        Sk.builtin.iterator,
+                        Sk.ffi.ArrayView.iter_],
             2: "next",
             3: "__next__"
         }
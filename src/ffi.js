@@ -29,7 +29,7 @@ Sk.ffi.remapToPy = function (obj) {
         return obj;
     }
 
-    if (Object.prototype.toString.call(obj) === "[object Array]") {
+    if (Object.prototype.toString.call(obj) === "[object Array]" || ArrayBuffer.isView(obj)) {
         arr = [];
         for (i = 0; i < obj.length; ++i) {
             arr.push(Sk.ffi.remapToPy(obj[i]));
@@ -71,6 +71,8 @@ Sk.exportSymbol("Sk.ffi.remapToPy", Sk.ffi.remapToPy);
 /**
  * Maps from Python dict/list/str/number to Javascript Object/Array/string/number.
  *
+ * Views created by Sk.ffi.proxy map back to the JS object they wrap.
+ *
  * If obj is a
  *
  * @param obj {Object}  Any Python object (except a function)
@@ -82,7 +84,9 @@ Sk.ffi.remapToJs = function (obj) {
     var v;
     var iter, k;
     var ret;
-    if (obj instanceof Sk.builtin.dict) {
+    if (obj instanceof Sk.ffi.ArrayView || obj instanceof Sk.ffi.ObjectView) {
+        return obj.js$;
+    } else if (obj instanceof Sk.builtin.dict) {
         ret = {};
         for (iter = obj.tp$iter(), k = iter.tp$iternext();
             k !== undefined;
@@ -176,3 +180,320 @@ Sk.ffi.unwrapn = function (obj) {
     return obj["v"];
 };
 Sk.exportSymbol("Sk.ffi.unwrapn", Sk.ffi.unwrapn);
+
+/**
+ * Wraps a JS Array/TypedArray or plain object in a Python view without
+ * copying it. Elements are converted when they are accessed, so handing a
+ * large dataset to Python is O(1); nested arrays and objects become views
+ * themselves.
+ *
+ * options:
+ *   writable: assignments (and deletions on objects) go through to obj,
+ *             otherwise the view is read-only
+ *   copy:     return a deep copy as Sk.ffi.remapToPy does instead of a view
+ *
+ * @param {Object} obj
+ * @param {Object=} options
+ */
+Sk.ffi.proxy = function (obj, options) {
+    var writable = !!(options && options["writable"]);
+
+    if (options && options["copy"]) {
+        return Sk.ffi.remapToPy(obj);
+    }
+
+    if (Object.prototype.toString.call(obj) === "[object Array]" || ArrayBuffer.isView(obj)) {
+        return new Sk.ffi.ArrayView(obj, writable);
+    }
+
+    if (obj !== null && typeof obj === "object" && !obj.ob$type && !(obj instanceof Sk.misceval.Suspension)) {
+        return new Sk.ffi.ObjectView(obj, writable);
+    }
+
+    return Sk.ffi.remapToPy(obj);
+};
+Sk.exportSymbol("Sk.ffi.proxy", Sk.ffi.proxy);
+
+/**
+ * Box a single element read through a view.
+ */
+Sk.ffi.proxyItem_ = function (view, item) {
+    if (typeof item === "object" && item !== null) {
+        return Sk.ffi.proxy(item, { writable: view.writable$ });
+    }
+    if (view.float$) {
+        return new Sk.builtin.float_(item);
+    }
+    return Sk.ffi.remapToPy(item);
+};
+
+/**
+ * Python sequence view over a JS Array or TypedArray, see Sk.ffi.proxy.
+ *
+ * @constructor
+ * @param {Object} arr
+ * @param {boolean=} writable
+ * @extends Sk.builtin.object
+ */
+Sk.ffi.ArrayView = function (arr, writable) {
+    if (!(this instanceof Sk.ffi.ArrayView)) {
+        return new Sk.ffi.ArrayView(arr, writable);
+    }
+    this.js$ = arr;
+    this.writable$ = !!writable;
+    this.float$ = arr instanceof Float32Array || arr instanceof Float64Array;
+    this.__class__ = Sk.ffi.ArrayView;
+    return this;
+};
+
+Sk.abstr.setUpInheritance("jsarray", Sk.ffi.ArrayView, Sk.builtin.object);
+
+// the array can change under the view, like a list
+Sk.abstr.markUnhashable(Sk.ffi.ArrayView);
+
+Sk.ffi.ArrayView.prototype.index$ = function (index) {
+    var i = Sk.misceval.asIndex(index);
+    if (i < 0) {
+        i = this.js$.length + i;
+    }
+    if (i < 0 || i >= this.js$.length) {
+        throw new Sk.builtin.IndexError("jsarray index out of range");
+    }
+    return i;
+};
+
+Sk.ffi.ArrayView.prototype.sq$length = function () {
+    return this.js$.length;
+};
+
+Sk.ffi.ArrayView.prototype.mp$subscript = function (index) {
+    var ret;
+    var self = this;
+    if (Sk.misceval.isIndex(index)) {
+        return Sk.ffi.proxyItem_(this, this.js$[this.index$(index)]);
+    } else if (index instanceof Sk.builtin.slice) {
+        ret = [];
+        index.sssiter$(this.js$.length, function (i) {
+            ret.push(Sk.ffi.proxyItem_(self, self.js$[i]));
+        });
+        return new Sk.builtin.list(ret);
+    }
+    throw new Sk.builtin.TypeError("jsarray indices must be integers, not " + Sk.abstr.typeName(index));
+};
+
+Sk.ffi.ArrayView.prototype.mp$ass_subscript = function (index, value) {
+    if (!this.writable$) {
+        throw new Sk.builtin.TypeError("'jsarray' object is read-only");
+    }
+    if (!Sk.misceval.isIndex(index)) {
+        throw new Sk.builtin.TypeError("jsarray indices must be integers, not " + Sk.abstr.typeName(index));
+    }
+    this.js$[this.index$(index)] = Sk.ffi.remapToJs(value);
+};
+
+Sk.ffi.ArrayView.prototype.sq$contains = function (item) {
+    var i;
+    for (i = 0; i < this.js$.length; i++) {
+        if (Sk.misceval.richCompareBool(Sk.ffi.proxyItem_(this, this.js$[i]), item, "Eq")) {
+            return true;
+        }
+    }
+    return false;
+};
+
+Sk.ffi.ArrayView.prototype.tp$iter = function () {
+    return new Sk.ffi.ArrayView.iter_(this);
+};
+
+Sk.ffi.ArrayView.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+    return self.tp$iter();
+});
+
+Sk.ffi.ArrayView.prototype["$r"] = function () {
+    var i;
+    var bits = [];
+    for (i = 0; i < this.js$.length; i++) {
+        bits.push(Sk.misceval.objectRepr(Sk.ffi.proxyItem_(this, this.js$[i])).v);
+    }
+    return new Sk.builtin.str("jsarray([" + bits.join(", ") + "])");
+};
+
+Sk.ffi.ArrayView.prototype["copy"] = new Sk.builtin.func(function (self) {
+    Sk.builtin.pyCheckArgsLen("copy", arguments.length, 1, 1);
+    return Sk.ffi.remapToPy(self.js$);
+});
+
+/**
+ * @constructor
+ * @param {Sk.ffi.ArrayView} view
+ */
+Sk.ffi.ArrayView.iter_ = function (view) {
+    if (!(this instanceof Sk.ffi.ArrayView.iter_)) {
+        return new Sk.ffi.ArrayView.iter_(view);
+    }
+    this.$index = 0;
+    this.$obj = view;
+    return this;
+};
+
+Sk.abstr.setUpInheritance("jsarrayiterator", Sk.ffi.ArrayView.iter_, Sk.builtin.object);
+
+Sk.ffi.ArrayView.iter_.prototype.tp$iter = function () {
+    return this;
+};
+
+Sk.ffi.ArrayView.iter_.prototype.tp$iternext = function () {
+    var arr = this.$obj.js$;
+    if (this.$index >= arr.length) {
+        return undefined;
+    }
+    return Sk.ffi.proxyItem_(this.$obj, arr[this.$index++]);
+};
+
+Sk.ffi.ArrayView.iter_.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+    return self;
+});
+
+Sk.ffi.ArrayView.iter_.prototype.next$ = function (self) {
+    var ret = self.tp$iternext();
+    if (ret === undefined) {
+        throw new Sk.builtin.StopIteration();
+    }
+    return ret;
+};
+
+/**
+ * Python mapping view over the own properties of a plain JS object, see
+ * Sk.ffi.proxy.
+ *
+ * @constructor
+ * @param {Object} obj
+ * @param {boolean=} writable
+ * @extends Sk.builtin.object
+ */
+Sk.ffi.ObjectView = function (obj, writable) {
+    if (!(this instanceof Sk.ffi.ObjectView)) {
+        return new Sk.ffi.ObjectView(obj, writable);
+    }
+    this.js$ = obj;
+    this.writable$ = !!writable;
+    this.__class__ = Sk.ffi.ObjectView;
+    return this;
+};
+
+Sk.abstr.setUpInheritance("jsobject", Sk.ffi.ObjectView, Sk.builtin.object);
+
+// the object can change under the view, like a dict
+Sk.abstr.markUnhashable(Sk.ffi.ObjectView);
+
+Sk.ffi.ObjectView.prototype.key$ = function (key) {
+    if (!Sk.builtin.checkString(key)) {
+        throw new Sk.builtin.KeyError(key);
+    }
+    return key.v;
+};
+
+Sk.ffi.ObjectView.prototype.has$ = function (k) {
+    return Object.prototype.hasOwnProperty.call(this.js$, k);
+};
+
+Sk.ffi.ObjectView.prototype.sq$length = function () {
+    return Object.keys(this.js$).length;
+};
+
+Sk.ffi.ObjectView.prototype.mp$subscript = function (key) {
+    var k = this.key$(key);
+    if (!this.has$(k)) {
+        throw new Sk.builtin.KeyError(key);
+    }
+    return Sk.ffi.proxyItem_(this, this.js$[k]);
+};
+
+Sk.ffi.ObjectView.prototype.mp$ass_subscript = function (key, value) {
+    if (!this.writable$) {
+        throw new Sk.builtin.TypeError("'jsobject' object is read-only");
+    }
+    if (!Sk.builtin.checkString(key)) {
+        throw new Sk.builtin.TypeError("jsobject keys must be strings, not " + Sk.abstr.typeName(key));
+    }
+    this.js$[key.v] = Sk.ffi.remapToJs(value);
+};
+
+Sk.ffi.ObjectView.prototype.mp$del_subscript = function (key) {
+    var k;
+    if (!this.writable$) {
+        throw new Sk.builtin.TypeError("'jsobject' object is read-only");
+    }
+    k = this.key$(key);
+    if (!this.has$(k)) {
+        throw new Sk.builtin.KeyError(key);
+    }
+    delete this.js$[k];
+};
+
+Sk.ffi.ObjectView.prototype.sq$contains = function (key) {
+    return Sk.builtin.checkString(key) && this.has$(key.v);
+};
+
+Sk.ffi.ObjectView.prototype.tp$iter = function () {
+    var keys = Object.keys(this.js$).map(function (k) {
+        return new Sk.builtin.str(k);
+    });
+    return new Sk.builtin.list_iter_(new Sk.builtin.list(keys));
+};
+
+Sk.ffi.ObjectView.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+    return self.tp$iter();
+});
+
+Sk.ffi.ObjectView.prototype["$r"] = function () {
+    var k;
+    var bits = [];
+    for (k in this.js$) {
+        if (this.has$(k)) {
+            bits.push(Sk.misceval.objectRepr(new Sk.builtin.str(k)).v + ": " +
+                      Sk.misceval.objectRepr(Sk.ffi.proxyItem_(this, this.js$[k])).v);
+        }
+    }
+    return new Sk.builtin.str("jsobject({" + bits.join(", ") + "})");
+};
+
+Sk.ffi.ObjectView.prototype["get"] = new Sk.builtin.func(function (self, k, d) {
+    Sk.builtin.pyCheckArgsLen("get", arguments.length, 2, 3);
+    if (d === undefined) {
+        d = Sk.builtin.none.none$;
+    }
+    if (!Sk.builtin.checkString(k) || !self.has$(k.v)) {
+        return d;
+    }
+    return Sk.ffi.proxyItem_(self, self.js$[k.v]);
+});
+
+Sk.ffi.ObjectView.prototype["keys"] = new Sk.builtin.func(function (self) {
+    Sk.builtin.pyCheckArgsLen("keys", arguments.length, 1, 1);
+    return new Sk.builtin.list(Object.keys(self.js$).map(function (k) {
+        return new Sk.builtin.str(k);
+    }));
+});
+
+Sk.ffi.ObjectView.prototype["values"] = new Sk.builtin.func(function (self) {
+    Sk.builtin.pyCheckArgsLen("values", arguments.length, 1, 1);
+    return new Sk.builtin.list(Object.keys(self.js$).map(function (k) {
+        return Sk.ffi.proxyItem_(self, self.js$[k]);
+    }));
+});
+
+Sk.ffi.ObjectView.prototype["items"] = new Sk.builtin.func(function (self) {
+    Sk.builtin.pyCheckArgsLen("items", arguments.length, 1, 1);
+    return new Sk.builtin.list(Object.keys(self.js$).map(function (k) {
+        return new Sk.builtin.tuple([new Sk.builtin.str(k), Sk.ffi.proxyItem_(self, self.js$[k])]);
+    }));
+});
+
+Sk.ffi.ObjectView.prototype["copy"] = new Sk.builtin.func(function (self) {
+    Sk.builtin.pyCheckArgsLen("copy", arguments.length, 1, 1);
+    return Sk.ffi.remapToPy(self.js$);
+});
+
+Sk.exportSymbol("Sk.ffi.ArrayView", Sk.ffi.ArrayView);
+Sk.exportSymbol("Sk.ffi.ObjectView", Sk.ffi.ObjectView);
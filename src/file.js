@@ -5,7 +5,6 @@
  * @param {Object} buffering
  */
 Sk.builtin.file = function (name, mode, buffering) {
-    var i;
     var elem;
 
     if (!(this instanceof Sk.builtin.file)) {
@@ -24,7 +23,21 @@ Sk.builtin.file = function (name, mode, buffering) {
     } else if (this.name === "/dev/stderr") {
         this.fileno = 2;
     } else {
-        if (Sk.inBrowser) {  // todo:  Maybe provide a replaceable function for non-import files
+        // data$ holds the buffered part of the file, starting at the
+        // absolute offset bufStart$. eof$ is set once data$ reaches the
+        // end of the file, which is immediately unless we are streaming.
+        this.bufStart$ = 0;
+        this.eof$ = true;
+        this.streaming$ = false;
+
+        if (Sk.readChunk) {
+            // Contents are fetched lazily through Sk.readChunk, see $fill,
+            // in browsers too
+            this.fileno = 11;
+            this.data$ = "";
+            this.eof$ = false;
+            this.streaming$ = true;
+        } else if (Sk.inBrowser) {  // todo:  Maybe provide a replaceable function for non-import files
             this.fileno = 10;
             elem = document.getElementById(name.v);
             if (elem == null) {
@@ -44,14 +57,6 @@ Sk.builtin.file = function (name, mode, buffering) {
             this.fileno = 11;
             this.data$ = Sk.read(name.v);
         }
-
-        this.lineList = this.data$.split("\n");
-        this.lineList = this.lineList.slice(0, -1);
-
-        for (i in this.lineList) {
-            this.lineList[i] = this.lineList[i] + "\n";
-        }
-        this.currentLine = 0;
     }
     this.pos$ = 0;
 
@@ -66,6 +71,114 @@ Sk.builtin.file = function (name, mode, buffering) {
 
 Sk.abstr.setUpInheritance("file", Sk.builtin.file, Sk.builtin.object);
 
+/**
+ * Number of characters requested from Sk.readChunk at a time.
+ */
+Sk.builtin.file.chunkSize = 65536;
+
+/**
+ * Make sure the buffer covers everything up to the absolute offset upto,
+ * or the end of the file if that comes first.
+ *
+ * Data before the current position is dropped first, so a streamed file
+ * that is read front to back only ever keeps its unread window in memory.
+ *
+ * @param {Sk.builtin.file} self
+ * @param {number} upto
+ * @return {(undefined|Sk.misceval.Suspension)}
+ */
+Sk.builtin.file.$fill = function (self, upto) {
+    var end, chunk;
+
+    if (self.eof$) {
+        return undefined;
+    }
+
+    if (self.pos$ > self.bufStart$) {
+        self.data$ = self.data$.substring(self.pos$ - self.bufStart$);
+        self.bufStart$ = self.pos$;
+    }
+
+    while (!self.eof$ && self.bufStart$ + self.data$.length < upto) {
+        end = self.bufStart$ + self.data$.length;
+        try {
+            chunk = Sk.readChunk(self.name, end, Math.max(Sk.builtin.file.chunkSize, Math.min(upto - end, 0x1000000)));
+        } catch (e) {
+            throw Sk.builtin.file.$readError(self, e);
+        }
+        if (chunk instanceof Promise) {
+            chunk = chunk.catch(function (e) {
+                throw Sk.builtin.file.$readError(self, e);
+            });
+            return Sk.misceval.chain(Sk.misceval.promiseToSuspension(chunk), function (data) {
+                Sk.builtin.file.$append(self, data);
+                return Sk.builtin.file.$fill(self, upto);
+            });
+        }
+        Sk.builtin.file.$append(self, chunk);
+    }
+
+    return undefined;
+};
+
+/**
+ * The exception to raise for an error of Sk.readChunk: Python exceptions
+ * are raised as they are, others as an IOError.
+ *
+ * @param {Sk.builtin.file} self
+ * @param {*} e
+ */
+Sk.builtin.file.$readError = function (self, e) {
+    if (e instanceof Sk.builtin.BaseException) {
+        return e;
+    }
+    return new Sk.builtin.IOError((e && e.message ? e.message : String(e)) + ": '" + self.name + "'");
+};
+
+Sk.builtin.file.$append = function (self, chunk) {
+    if (chunk === null || chunk === undefined || chunk.length === 0) {
+        self.eof$ = true;
+    } else {
+        self.data$ += chunk;
+    }
+};
+
+/**
+ * Read the next line, including its newline, and advance the position
+ * past it. Returns "" at the end of the file.
+ *
+ * The newline search resumes where the previous chunk ended, so a long
+ * line is scanned only once however many chunks it spans.
+ *
+ * @param {Sk.builtin.file} self
+ * @return {(string|Sk.misceval.Suspension)}
+ */
+Sk.builtin.file.$nextLine = function (self) {
+    var searchFrom = self.pos$;
+
+    return (function scan() {
+        var idx, start, end, line, susp;
+
+        while (true) {
+            idx = self.data$.indexOf("\n", Math.max(searchFrom - self.bufStart$, 0));
+            if (idx !== -1 || self.eof$) {
+                break;
+            }
+            searchFrom = self.bufStart$ + self.data$.length;
+            susp = Sk.builtin.file.$fill(self, searchFrom + 1);
+            if (susp !== undefined) {
+                return Sk.misceval.chain(susp, scan);
+            }
+        }
+
+        start = self.pos$ - self.bufStart$;
+        end = idx === -1 ? self.data$.length : idx + 1;
+        line = start < end ? self.data$.substring(start, end) : "";
+        self.pos$ += line.length;
+        return line;
+    })();
+};
+
 Sk.builtin.file.prototype["$r"] = function () {
     return new Sk.builtin.str("<" +
         (this.closed ? "closed" : "open") +
@@ -85,22 +198,20 @@ Sk.builtin.file.prototype["__exit__"] = new Sk.builtin.func(function __exit__(se
 });
 
 Sk.builtin.file.prototype.tp$iter = function () {
-    var allLines = this.lineList;
-    var currentLine = this.currentLine;
-
     var ret =
     {
         tp$iter    : function () {
             return ret;
         },
         $obj       : this,
-        $index     : currentLine,
-        $lines     : allLines,
-        tp$iternext: function () {
-            if (ret.$index >= ret.$lines.length) {
-                return undefined;
-            }
-            return new Sk.builtin.str(ret.$lines[ret.$index++]);
+        tp$iternext: function (canSuspend) {
+            var r = Sk.misceval.chain(Sk.builtin.file.$nextLine(ret.$obj), function (line) {
+                if (line === "") {
+                    return undefined;
+                }
+                return new Sk.builtin.str(line);
+            });
+            return canSuspend ? r : Sk.misceval.retryOptionalSuspensionOrThrow(r);
         }
     };
     return ret;
@@ -123,30 +234,28 @@ Sk.builtin.file.prototype["isatty"] = new Sk.builtin.func(function isatty(self)
 });
 
 Sk.builtin.file.prototype["read"] = new Sk.builtin.func(function read(self, size) {
-    var ret;
-    var len = self.data$.length;
     var l_size;
     if (self.closed) {
         throw new Sk.builtin.ValueError("I/O operation on closed file");
     }
 
     if (size === undefined) {
-        l_size = len;
+        l_size = -1;
     } else {
         l_size = Sk.ffi.remapToJs(size);
     }
 
-    ret = new Sk.builtin.str(self.data$.substr(self.pos$, l_size));
-    if(size === undefined){
-        self.pos$ = len;
-    }else{
-        self.pos$ += Sk.ffi.remapToJs(size);
-    }
-    if (self.pos$ >= len) {
-        self.pos$ = len;
-    }
+    return Sk.misceval.chain(Sk.builtin.file.$fill(self, l_size < 0 ? Infinity : self.pos$ + l_size), function () {
+        var start = self.pos$ - self.bufStart$;
+        var ret = "";
 
-    return ret;
+        if (start < self.data$.length) {
+            ret = l_size < 0 ? self.data$.substring(start) : self.data$.substr(start, l_size);
+        }
+        self.pos$ += ret.length;
+
+        return new Sk.builtin.str(ret);
+    });
 });
 
 Sk.builtin.file.$readline = function (self, size, prompt) {
@@ -180,12 +289,9 @@ Sk.builtin.file.$readline = function (self, size, prompt) {
             return new Sk.builtin.str(x);
         }
     } else {
-        var line = "";
-        if (self.currentLine < self.lineList.length) {
-            line = self.lineList[self.currentLine];
-            self.currentLine++;
-        }
-        return new Sk.builtin.str(line);
+        return Sk.misceval.chain(Sk.builtin.file.$nextLine(self), function (line) {
+            return new Sk.builtin.str(line);
+        });
     }
 };
 
@@ -198,29 +304,46 @@ Sk.builtin.file.prototype["readlines"] = new Sk.builtin.func(function readlines(
         return new Sk.builtin.NotImplementedError("readlines ins't implemented because the web doesn't support Ctrl+D");
     }
 
-    var i;
     var arr = [];
-    for (i = self.currentLine; i < self.lineList.length; i++) {
-        arr.push(new Sk.builtin.str(self.lineList[i]));
-    }
-    return new Sk.builtin.list(arr);
+    return Sk.misceval.chain(Sk.misceval.iterFor(self.tp$iter(), function (line) {
+        arr.push(line);
+    }), function () {
+        return new Sk.builtin.list(arr);
+    });
 });
 
 Sk.builtin.file.prototype["seek"] = new Sk.builtin.func(function seek(self, offset, whence) {
-    var l_offset =  Sk.ffi.remapToJs(offset);
+    var l_offset = Sk.ffi.remapToJs(offset);
+    var l_whence = whence === undefined ? 0 : Sk.ffi.remapToJs(whence);
+    var susp;
 
-    if (whence === undefined) {
-        whence = 0;
-    }
-    if (whence === 0) {
-        self.pos$ = l_offset;
-    } else if (whence == 1) {
-        self.pos$ = self.data$.length + l_offset;
-    } else if (whence == 2) {
-        self.pos$ = self.data$.length + l_offset;
+    if (l_whence === 2) {
+        susp = Sk.builtin.file.$fill(self, Infinity);
     }
 
-    return Sk.builtin.none.none$;
+    return Sk.misceval.chain(susp, function () {
+        if (l_whence === 0) {
+            self.pos$ = l_offset;
+        } else if (l_whence === 1) {
+            self.pos$ = self.pos$ + l_offset;
+        } else if (l_whence === 2) {
+            self.pos$ = self.bufStart$ + self.data$.length + l_offset;
+        }
+        if (self.pos$ < 0) {
+            self.pos$ = 0;
+        }
+
+        // A streamed file only buffers a window of its contents; seeking
+        // outside of it restarts reading at the new offset.
+        if (self.streaming$ &&
+            (self.pos$ < self.bufStart$ || self.pos$ > self.bufStart$ + self.data$.length)) {
+            self.data$ = "";
+            self.bufStart$ = self.pos$;
+            self.eof$ = false;
+        }
+
+        return Sk.builtin.none.none$;
+    });
 });
 
 Sk.builtin.file.prototype["tell"] = new Sk.builtin.func(function tell(self) {
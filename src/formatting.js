@@ -44,7 +44,7 @@ var format = function (kwa) {
 
     if(kwargs.size !== 0){
 
-        var kwItems = Sk.misceval.callsimArray(Sk.builtin.dict.prototype["items"], [kwargs]);
+        var kwItems = new Sk.builtin.list(new Sk.builtin.dict_items(kwargs));
 
         for (var n in kwItems.v){
             arg_dict[kwItems.v[n].v[0].v] = kwItems.v[n].v[1];
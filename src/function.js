@@ -289,17 +289,62 @@ Sk.builtin.func.prototype.tp$getname = function () {
     return (this.func_code && this.func_code["co_name"] && this.func_code["co_name"].v) || this.func_code.name || "<native JS>";
 };
 
+/**
+ * How the arguments of a call to code are bound, worked out on its first
+ * call and kept on the code object as $binding:
+ *
+ * - argcount: the number of positional parameters, -1 for native code
+ *   that takes whatever it is given
+ * - index: parameter name -> position, for keyword arguments
+ * - simple: no *args, **kwargs or keyword-only parameters, so a call with
+ *   exactly argcount positional arguments needs no binding at all
+ *
+ * @param {Function} code
+ */
+Sk.builtin.func.binding$ = function (code) {
+    var i;
+    var varnames = code.co_varnames || [];
+    var b = {
+        argcount: code.co_argcount,
+        kwonlyargcount: code.co_kwonlyargcount || 0,
+        varnames: varnames,
+        index: Object.create(null),
+        simple: false
+    };
+
+    if (b.argcount === undefined) {
+        b.argcount = code.co_varnames ? varnames.length : -1;
+    }
+    for (i = varnames.length - 1; i >= 0; i--) {
+        b.index[varnames[i]] = i;
+    }
+    b.simple = !code.co_varargs && !code.co_kwargs && b.kwonlyargcount === 0;
+
+    code.$binding = b;
+    return b;
+};
+
 Sk.builtin.func.prototype.tp$call = function (posargs, kw) {
     // This function is a logical Javascript port of
     // _PyEval_EvalCodeWithName, and follows its logic.
 
-    let co_argcount = this.func_code.co_argcount;
+    let binding = this.func_code.$binding || Sk.builtin.func.binding$(this.func_code);
 
-    if (co_argcount === undefined) {
-        co_argcount = this.func_code.co_varnames ? this.func_code.co_varnames.length : posargs.length;
+    if (binding.simple && (kw === undefined || kw.length === 0) &&
+        (posargs.length === binding.argcount || binding.argcount < 0)) {
+        // exactly the positional arguments asked for, nothing to bind
+        if (this.func_closure) {
+            for (let i = posargs.length; i < binding.varnames.length; i++) {
+                posargs.push(undefined);
+            }
+            posargs.push(this.func_closure);
+        }
+        return this.func_code.apply(this.func_globals, posargs);
     }
-    let varnames = this.func_code.co_varnames || [];
-    let co_kwonlyargcount = this.func_code.co_kwonlyargcount || 0;
+
+    let co_argcount = binding.argcount < 0 ? posargs.length : binding.argcount;
+    let varnames = binding.varnames;
+    let co_kwonlyargcount = binding.kwonlyargcount;
     let totalArgs = co_argcount + co_kwonlyargcount;
     let kwargs;
 
@@ -330,9 +375,9 @@ Sk.builtin.func.prototype.tp$call = function (posargs, kw) {
         for (let i = 0; i < kw.length; i += 2) {
             let name = kw[i]; // JS string
             let value = kw[i+1]; // Python value
-            let idx = varnames.indexOf(name);
+            let idx = binding.index[name];
 
-            if (idx >= 0) {
+            if (idx !== undefined) {
                 if (args[idx] !== undefined) {
                     throw new Sk.builtin.TypeError(this.tp$getname() + "() got multiple values for argument '" + name + "'");
                 }
@@ -23,7 +23,13 @@ Sk.importSearchPathForName = function (name, ext, searchPath) {
         return Sk.misceval.chain(
             Sk.misceval.tryCatch(function() {
                 return Sk.read(filename);
-            }, function(e) { /* Exceptions signal "not found" */ }),
+            }, function(e) {
+                // Exceptions signal "not found", except an ImportError: the
+                // file is there but could not be loaded, see Sk.builtinRead
+                if (e instanceof Sk.builtin.ImportError) {
+                    throw e;
+                }
+            }),
             function(code) {
                 if (code !== undefined) {
                     // This will cause the iterFor() to return the specified value
@@ -87,11 +93,37 @@ Sk.doOneTimeInitialization = function (canSuspend) {
         child["$d"].mp$ass_subscript(Sk.builtin.type.mroStr_, child.tp$mro);
     };
 
+    // Most programs only ever touch a handful of the builtin types, so
+    // setUpClass is deferred until a type's $d or tp$mro is first used.
+    var lazySetUpClass = function (child) {
+        var init = function () {
+            Object.defineProperty(child, "$d", {configurable: true, enumerable: true, writable: true, value: undefined});
+            Object.defineProperty(child, "tp$mro", {configurable: true, enumerable: true, writable: true, value: undefined});
+            setUpClass(child);
+        };
+        var defer = function (name) {
+            Object.defineProperty(child, name, {
+                configurable: true,
+                enumerable  : true,
+                get         : function () {
+                    init();
+                    return child[name];
+                },
+                set         : function (v) {
+                    init();
+                    child[name] = v;
+                }
+            });
+        };
+        defer("$d");
+        defer("tp$mro");
+    };
+
     for (x in Sk.builtin) {
         func = Sk.builtin[x];
         if ((func.prototype instanceof Sk.builtin.object ||
              func === Sk.builtin.object) && !func.sk$abstract) {
-            setUpClass(func);
+            lazySetUpClass(func);
         }
     }
 
@@ -116,13 +148,47 @@ Sk.doOneTimeInitialization = function (canSuspend) {
     }
 
 
-    for (var file in Sk.internalPy.files) {
-        var fileWithoutExtension = file.split(".")[0].split("/")[1];
-        var mod = Sk.importBuiltinWithBody(fileWithoutExtension, false, Sk.internalPy.files[file], true);
-        mod = Sk.misceval.retryOptionalSuspensionOrThrow(mod);
-        Sk.asserts.assert(mod["$d"][fileWithoutExtension] !== undefined, "Should have imported name " + fileWithoutExtension);
-        Sk.builtins[fileWithoutExtension] = mod["$d"][fileWithoutExtension];
+    // the helpers are part of Skulpt, not of the program, so their lines
+    // are not counted
+    var lineCounts = Sk.lineCounts;
+    Sk.lineCounts = false;
+    try {
+        var compiled = Sk.internalSnapshot_();
+        for (var file in Sk.internalPy.files) {
+            var fileWithoutExtension = file.split(".")[0].split("/")[1];
+            var body = compiled !== undefined && compiled[file] !== undefined ? compiled[file] : Sk.internalPy.files[file];
+            var mod = Sk.importBuiltinWithBody(fileWithoutExtension, false, body, true);
+            mod = Sk.misceval.retryOptionalSuspensionOrThrow(mod);
+            Sk.asserts.assert(mod["$d"][fileWithoutExtension] !== undefined, "Should have imported name " + fileWithoutExtension);
+            Sk.builtins[fileWithoutExtension] = mod["$d"][fileWithoutExtension];
+        }
+    } finally {
+        Sk.lineCounts = lineCounts;
+    }
+};
+
+/**
+ * The internal Python helpers compiled at build time, keyed by file name
+ * like Sk.internalPy.files, if the standard library carries a snapshot
+ * (see support/build/snapshot.js) made by this build of Skulpt under the
+ * current compiler settings.
+ *
+ * @return {Object|undefined}
+ */
+Sk.internalSnapshot_ = function () {
+    var snapshot = Sk.builtinFiles !== undefined ? Sk.builtinFiles["snapshot"] : undefined;
+    var settings;
+    var i;
+    if (snapshot === undefined || snapshot["build"] !== Sk.build.date) {
+        return undefined;
     }
+    settings = Sk.compileSettings();
+    for (i = 0; i < snapshot["internal"].length; i++) {
+        if (snapshot["internal"][i]["settings"] === settings) {
+            return snapshot["internal"][i]["files"];
+        }
+    }
+    return undefined;
 };
 
 /**
@@ -152,8 +218,8 @@ Sk.importSetUpPath = function (canSuspend) {
  * @param {boolean=} dumpJS whether to output the generated js code
  * @param {string=} modname what to call the module after it's imported if
  * it's to be renamed (i.e. __main__)
- * @param {string=} suppliedPyBody use as the body of the text for the module
- * rather than Sk.read'ing it.
+ * @param {string|Object=} suppliedPyBody use as the body of the text for the module
+ * rather than Sk.read'ing it, or the result of Sk.compile'ing that text.
  * @param {Object=} relativeToPackage perform import relative to this package
  * @param {boolean=} returnUndefinedOnTopLevelNotFound return 'undefined' rather than throwing ImportError if the *first* load failed
  * @param {boolean=} canSuspend whether we may return a Suspension object
@@ -236,7 +302,8 @@ Sk.importModuleInternal_ = function (name, dumpJS, modname, suppliedPyBody, rela
 
         if (suppliedPyBody) {
             filename = name + ".py";
-            co = Sk.compile(suppliedPyBody, filename, "exec", canSuspend);
+            // the body may come already compiled, see Sk.internalSnapshot_
+            co = typeof suppliedPyBody === "string" ? Sk.compile(suppliedPyBody, filename, "exec", canSuspend) : suppliedPyBody;
         } else {
             co = Sk.misceval.chain(undefined, function() {
                 // If an onBeforeImport method is supplied, call it and if
@@ -302,7 +369,9 @@ Sk.importModuleInternal_ = function (name, dumpJS, modname, suppliedPyBody, rela
         }
 
         if (Sk.dateSet == null || !Sk.dateSet) {
-            finalcode = "Sk.execStart = Sk.lastYield = new Date();\n" + co.code;
+            // after the code, which only defines the module function, so
+            // that the lines of the code match its source map
+            finalcode = co.code + "\nSk.execStart = Sk.lastYield = new Date();";
             Sk.dateSet = true;
         }
 
@@ -459,6 +528,85 @@ Sk.importBuiltinWithBody = function (name, dumpJS, body, canSuspend) {
     return Sk.importModuleInternal_(name, dumpJS, "__builtin__."+name, body, undefined, false, canSuspend);
 };
 
+/**
+ * Compiles and runs source in an existing namespace, as a REPL does with
+ * each input, without creating a new module or running earlier inputs
+ * again.
+ *
+ * @param source {string} Python Code
+ * @param filename {string} File name to use for messages related to this run
+ * @param mode {string} "exec", "single" (show the value of each expression
+ *     statement with sys.displayhook) or "eval" (a single expression)
+ * @param globals {Object} the namespace, e.g. the $d of the __main__ module
+ * @param canSuspend {boolean}  Use Suspensions for async execution
+ * @returns the value of the expression in "eval" mode, otherwise globals
+ */
+Sk.execInNamespace = function (source, filename, mode, globals, canSuspend) {
+    var co;
+    var modscope;
+    var ret;
+
+    Sk.importSetUpPath(canSuspend);
+
+    co = Sk.compile(source, filename, mode, canSuspend);
+    Sk.execStart = Sk.lastYield = new Date();
+    modscope = Sk.global["eval"](co.code + "\n" + co.funcname + ";");
+
+    ret = modscope(globals);
+    if (!canSuspend) {
+        ret = Sk.misceval.retryOptionalSuspensionOrThrow(ret);
+    }
+    return mode === "eval" ? ret : Sk.misceval.chain(ret, function () {
+        return globals;
+    });
+};
+
+/**
+ * Runs the Python source (a str) as exec does, in the namespace of
+ * __main__, or in globals, a dict, whose items are updated from the
+ * namespace afterwards. Used by the modules that run code for the
+ * program, such as cProfile and trace.
+ *
+ * @param {Sk.builtin.str} source
+ * @param {(Sk.builtin.dict|Sk.builtin.none)=} globals
+ * @returns None, or a Suspension
+ */
+Sk.execInDict = function (source, globals) {
+    var ns;
+    var saved = Sk.globals;
+    var main = Sk.sysmodules.mp$subscript("__main__")["$d"];
+    var it;
+    var k;
+    Sk.builtin.pyCheckType("source", "str", Sk.builtin.checkString(source));
+
+    if (globals === undefined || globals === Sk.builtin.none.none$) {
+        ns = main;
+    } else {
+        if (!(globals instanceof Sk.builtin.dict)) {
+            throw new Sk.builtin.TypeError("globals must be a dict");
+        }
+        ns = {};
+        for (it = Sk.abstr.iter(globals), k = it.tp$iternext(); k !== undefined; k = it.tp$iternext()) {
+            ns[Sk.ffi.remapToJs(k)] = globals.mp$subscript(k);
+        }
+    }
+
+    return Sk.misceval.chain(Sk.misceval.tryCatch(function () {
+        return Sk.execInNamespace(source.v, "<string>", "exec", ns, true);
+    }, function (e) {
+        Sk.globals = saved;
+        throw e;
+    }), function () {
+        Sk.globals = saved;
+        if (ns !== main) {
+            for (k in ns) {
+                globals.mp$ass_subscript(new Sk.builtin.str(k), ns[k]);
+            }
+        }
+        return Sk.builtin.none.none$;
+    });
+};
+
 Sk.builtin.__import__ = function (name, globals, locals, fromlist, level) {
     //print("Importing: ", JSON.stringify(name), JSON.stringify(fromlist), level);
     //if (name == "") { debugger; }
@@ -592,8 +740,174 @@ Sk.importStar = function (module, loc, global) {
     }
 };
 
+/**
+ * A Sk.read for the standard library built as chunks, one per top level
+ * module or package (dist/stdlib, see support/build/wrapmodules.js). Load
+ * dist/stdlib/manifest.js in place of dist/skulpt-stdlib.js and configure
+ * Skulpt with this as its read function; a file whose chunk has not been
+ * loaded yet is then fetched on demand, suspending the import until it
+ * arrives, so the program must be run with suspensions enabled. If the
+ * chunk cannot be loaded, the import raises the ImportError that
+ * Sk.fetchBuiltinChunk rejected with.
+ *
+ * @param {string} path
+ * @return {string|Sk.misceval.Suspension}
+ */
+Sk.builtinRead = function (path) {
+    var builtinFiles = Sk.builtinFiles;
+    var chunk;
+
+    if (builtinFiles !== undefined) {
+        if (builtinFiles["files"][path] !== undefined) {
+            return builtinFiles["files"][path];
+        }
+        chunk = builtinFiles["chunks"] !== undefined ? builtinFiles["chunks"][path] : undefined;
+        if (chunk !== undefined) {
+            return Sk.misceval.promiseToSuspension(Sk.loadBuiltinChunk_(chunk).then(function () {
+                return builtinFiles["files"][path];
+            }));
+        }
+    }
+    throw "File not found: '" + path + "'";
+};
+
+/**
+ * Called by each standard library chunk as it runs, with the files it holds.
+ *
+ * @param {Object} files file contents by path
+ */
+Sk.builtinFilesLoaded = function (files) {
+    var path;
+    for (path in files) {
+        if (files.hasOwnProperty(path)) {
+            Sk.builtinFiles["files"][path] = files[path];
+            delete Sk.builtinFiles["chunks"][path];
+        }
+    }
+};
+
+/**
+ * Replacable function to fetch and run the standard library chunk at url,
+ * returning a promise that resolves once it has called
+ * Sk.builtinFilesLoaded. The default adds a script element to the page;
+ * elsewhere, e.g. under node, replace it with something that runs the file.
+ *
+ * @param {string} url
+ * @return {Promise}
+ */
+Sk.fetchBuiltinChunk = function (url) {
+    return new Promise(function (resolve, reject) {
+        var script = Sk.global["document"]["createElement"]("script");
+        script["src"] = url;
+        script["async"] = true;
+        script["onload"] = function () {
+            resolve();
+        };
+        script["onerror"] = function () {
+            reject(new Sk.builtin.ImportError("Could not load " + url));
+        };
+        Sk.global["document"]["head"]["appendChild"](script);
+    });
+};
+
+// promises for the chunks requested so far, by name
+Sk.builtinChunks_ = {};
+
+/**
+ * Load a standard library chunk, and start loading the chunks of the
+ * modules it imports alongside it.
+ *
+ * @param {string} chunk
+ * @return {Promise}
+ */
+Sk.loadBuiltinChunk_ = function (chunk) {
+    var deps = Sk.builtinFiles["deps"] !== undefined ? Sk.builtinFiles["deps"][chunk] : undefined;
+    var i;
+
+    if (Sk.builtinChunks_[chunk] === undefined) {
+        Sk.builtinChunks_[chunk] = Sk.fetchBuiltinChunk(Sk.builtinFiles["base"] + chunk + ".js").then(undefined, function (e) {
+            // let a later import try again
+            delete Sk.builtinChunks_[chunk];
+            throw e;
+        });
+        if (deps !== undefined) {
+            for (i = 0; i < deps.length; i++) {
+                Sk.loadBuiltinChunk_(deps[i])["catch"](function () {});
+            }
+        }
+    }
+    return Sk.builtinChunks_[chunk];
+};
+
+/**
+ * Start loading the standard library chunks for the modules a module AST
+ * imports, so that they arrive together rather than one import at a time.
+ * Sk.compile calls this; it does nothing unless the standard library is
+ * loaded as chunks.
+ *
+ * @param {Object} mod the module AST
+ */
+Sk.prefetchBuiltinImports = function (mod) {
+    var modules;
+    var prefetch;
+    var visit;
+
+    if (Sk.builtinFiles === undefined || Sk.builtinFiles["modules"] === undefined || Sk.read !== Sk.builtinRead) {
+        return;
+    }
+    modules = Sk.builtinFiles["modules"];
+
+    prefetch = function (name) {
+        var top = name.split(".")[0];
+        if (modules.hasOwnProperty(top)) {
+            Sk.loadBuiltinChunk_(modules[top])["catch"](function () {});
+        }
+    };
+
+    visit = function (node) {
+        var fields = node._fields;
+        var value;
+        var i;
+        var j;
+
+        if (node.constructor === Sk.astnodes.Import) {
+            for (i = 0; i < node.names.length; i++) {
+                prefetch(node.names[i].name.v);
+            }
+            return;
+        }
+        if (node.constructor === Sk.astnodes.ImportFrom) {
+            if (node.level === 0 && node.module) {
+                prefetch(node.module.v);
+            }
+            return;
+        }
+        for (i = 0; i < fields.length; i += 2) {
+            value = node[fields[i]];
+            if (Array.isArray(value)) {
+                for (j = 0; j < value.length; j++) {
+                    if (value[j] !== null && value[j]._fields !== undefined) {
+                        visit(value[j]);
+                    }
+                }
+            } else if (value !== null && value !== undefined && value._fields !== undefined) {
+                visit(value);
+            }
+        }
+    };
+
+    // print and input import sys at runtime
+    prefetch("sys");
+    visit(mod);
+};
+
 Sk.exportSymbol("Sk.importMain", Sk.importMain);
 Sk.exportSymbol("Sk.importMainWithBody", Sk.importMainWithBody);
 Sk.exportSymbol("Sk.importBuiltinWithBody", Sk.importBuiltinWithBody);
+Sk.exportSymbol("Sk.execInNamespace", Sk.execInNamespace);
+Sk.exportSymbol("Sk.execInDict", Sk.execInDict);
 Sk.exportSymbol("Sk.builtin.__import__", Sk.builtin.__import__);
 Sk.exportSymbol("Sk.importStar", Sk.importStar);
+Sk.exportSymbol("Sk.builtinRead", Sk.builtinRead);
+Sk.exportSymbol("Sk.builtinFilesLoaded", Sk.builtinFilesLoaded);
+Sk.exportSymbol("Sk.prefetchBuiltinImports", Sk.prefetchBuiltinImports);
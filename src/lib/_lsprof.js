@@ -0,0 +1,80 @@
+/*
+ * Native profiler used by cProfile, see src/profiler.js. Only functions
+ * compiled with the profiling option of Sk.configure are recorded.
+ */
+var $builtinmodule = function (name) {
+    var mod = {};
+
+    function funcKey (s) {
+        return new Sk.builtin.tuple([new Sk.builtin.str(s.filename), new Sk.builtin.int_(s.lineno), new Sk.builtin.str(s.name)]);
+    }
+
+    mod.Profiler = Sk.misceval.buildClass(mod, function ($gbl, $loc) {
+        $loc.__init__ = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("Profiler", arguments.length, 1, 1);
+            self.profile = new Sk.profiler.Profile();
+            return Sk.builtin.none.none$;
+        });
+
+        $loc.enable = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("enable", arguments.length, 1, 1);
+            if (!Sk.profiling) {
+                throw new Sk.builtin.RuntimeError("profiling is not enabled, see the profiling option of Sk.configure");
+            }
+            Sk.profiler.enable(self.profile);
+            return Sk.builtin.none.none$;
+        });
+
+        $loc.disable = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("disable", arguments.length, 1, 1);
+            if (Sk.profiler.active === self.profile) {
+                Sk.profiler.disable();
+            }
+            return Sk.builtin.none.none$;
+        });
+
+        $loc.clear = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("clear", arguments.length, 1, 1);
+            self.profile.clear();
+            return Sk.builtin.none.none$;
+        });
+
+        // a list of ((filename, lineno, name), ncalls, primitive calls,
+        // tottime, cumtime, callers), callers a list of
+        // ((filename, lineno, name), ncalls, tottime, cumtime)
+        $loc.getstats = new Sk.builtin.func(function (self) {
+            var stats;
+            var ret = [];
+            var callers;
+            var c;
+            var i;
+            var s;
+            Sk.builtin.pyCheckArgsLen("getstats", arguments.length, 1, 1);
+            stats = Sk.profiler.getStats(self.profile);
+            for (i = 0; i < stats.length; i++) {
+                s = stats[i];
+                callers = [];
+                for (c in s.callers) {
+                    callers.push(new Sk.builtin.tuple([funcKey(stats[c]), new Sk.builtin.int_(s.callers[c].calls),
+                        new Sk.builtin.float_(s.callers[c].tottime), new Sk.builtin.float_(s.callers[c].cumtime)]));
+                }
+                ret.push(new Sk.builtin.tuple([funcKey(s), new Sk.builtin.int_(s.calls), new Sk.builtin.int_(s.primcalls),
+                    new Sk.builtin.float_(s.tottime), new Sk.builtin.float_(s.cumtime), new Sk.builtin.list(callers)]));
+            }
+            return new Sk.builtin.list(ret);
+        });
+
+        $loc.flamegraph_json = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("flamegraph_json", arguments.length, 1, 1);
+            return new Sk.builtin.str(JSON.stringify(Sk.profiler.flameGraph(self.profile)));
+        });
+    }, "Profiler", []);
+
+    // run source in the namespace of __main__, or in a dict of globals
+    mod._exec = new Sk.builtin.func(function (source, globals) {
+        Sk.builtin.pyCheckArgsLen("_exec", arguments.length, 1, 2);
+        return Sk.execInDict(source, globals);
+    });
+
+    return mod;
+};
@@ -0,0 +1,67 @@
+/*
+ * Line counts for the trace module, see Sk.getLineCounts. Only code
+ * compiled with the lineCounts option of Sk.configure is counted.
+ */
+var $builtinmodule = function (name) {
+    var mod = {};
+
+    mod.enabled = new Sk.builtin.func(function () {
+        Sk.builtin.pyCheckArgsLen("enabled", arguments.length, 0, 0);
+        return Sk.builtin.bool(Sk.lineCounts);
+    });
+
+    // {(filename, lineno): count} for the lines that ran
+    mod.counts = new Sk.builtin.func(function () {
+        var ret = new Sk.builtin.dict([]);
+        var all;
+        var counts;
+        var f;
+        var i;
+        Sk.builtin.pyCheckArgsLen("counts", arguments.length, 0, 0);
+        all = Sk.getLineCounts();
+        for (f in all) {
+            counts = all[f];
+            for (i = 0; i < counts.length; i++) {
+                if (counts[i] > 0) {
+                    ret.mp$ass_subscript(new Sk.builtin.tuple([new Sk.builtin.str(f), new Sk.builtin.int_(i)]),
+                        new Sk.builtin.int_(counts[i]));
+                }
+            }
+        }
+        return ret;
+    });
+
+    // the lines of a file that have statements
+    mod.lines = new Sk.builtin.func(function (filename) {
+        var file;
+        Sk.builtin.pyCheckArgsLen("lines", arguments.length, 1, 1);
+        Sk.builtin.pyCheckType("filename", "str", Sk.builtin.checkString(filename));
+        file = Sk.lineCountFiles_[filename.v];
+        return Sk.ffi.remapToPy(file === undefined ? [] : file.lines);
+    });
+
+    // the source of a file, as it was compiled
+    mod.source = new Sk.builtin.func(function (filename) {
+        var file;
+        Sk.builtin.pyCheckArgsLen("source", arguments.length, 1, 1);
+        Sk.builtin.pyCheckType("filename", "str", Sk.builtin.checkString(filename));
+        file = Sk.lineCountFiles_[filename.v];
+        if (file === undefined || file.source === undefined) {
+            return Sk.builtin.none.none$;
+        }
+        return new Sk.builtin.str(file.source);
+    });
+
+    mod.json = new Sk.builtin.func(function () {
+        Sk.builtin.pyCheckArgsLen("json", arguments.length, 0, 0);
+        return new Sk.builtin.str(Sk.lineCountsJSON());
+    });
+
+    // run source in the namespace of __main__, or in a dict of globals
+    mod._exec = new Sk.builtin.func(function (source, globals) {
+        Sk.builtin.pyCheckArgsLen("_exec", arguments.length, 1, 2);
+        return Sk.execInDict(source, globals);
+    });
+
+    return mod;
+};
@@ -14,147 +14,757 @@ $builtinmodule = function (name) {
     // 'L'       unsigned long  long              4
     // 'f'       float          float             4
     // 'd'       double         float             8
+    //
+    // Items are stored unboxed in the matching JS typed array and only
+    // turned into Python objects when they are accessed.
 
-    var typecodes = ['c', 'b', 'B', 'u', 'h', 'H', 'i', 'I', 'l', 'L', 'f', 'd'];
-
-    var functions = [
-      '__add__',
-      '__class__',
-      '__contains__',
-      '__copy__',
-      '__deepcopy__',
-      '__delattr__',
-      '__delitem__',
-      '__delslice__',
-      '__doc__',
-      '__eq__',
-      '__format__',
-      '__ge__',
-      '__getattribute__',
-      '__getitem__',
-      '__getslice__',
-      '__gt__',
-      '__hash__',
-      '__iadd__',
-      '__imul__',
-      '__init__',
-      '__iter__',
-      '__le__',
-      '__len__',
-      '__lt__',
-      '__mul__',
-      '__ne__',
-      '__new__',
-      '__reduce__',
-      '__reduce_ex__',
-      '__repr__',
-      '__rmul__',
-      '__setattr__',
-      '__setitem__',
-      '__setslice__',
-      '__sizeof__',
-      '__str__',
-      '__subclasshook__',
-      'append',
-      'buffer_info',
-      'byteswap',
-      'count',
-      'extend',
-      'fromfile',
-      'fromlist',
-      'fromstring',
-      'fromunicode',
-      'index',
-      'insert',
-      'itemsize',
-      'pop',
-      'read',
-      'remove',
-      'reverse',
-      'tofile',
-      'tolist',
-      'tostring',
-      'tounicode',
-      'typecode',
-      'write'];
-
-    var array = function ($gbl, $loc) {
-        $loc.__init__ = new Sk.builtin.func(function (self, typecode, initialiser) {
-            Sk.builtin.pyCheckArgsLen("__init__", arguments.length, 2, 3);
-
-            if (typecodes.indexOf(Sk.ffi.remapToJs(typecode)) == -1) {
-                throw new Sk.builtin.ValueError("bad typecode (must be c, b, B, u, h, H, i, I, l, L, f or d)")
+    var typecodes = {
+        "c": { storage: Uint8Array, kind: "char" },
+        "b": { storage: Int8Array, kind: "int", min: -128, max: 127, cname: "signed char" },
+        "B": { storage: Uint8Array, kind: "int", min: 0, max: 255, cname: "unsigned byte integer" },
+        "u": { storage: Uint16Array, kind: "char" },
+        "h": { storage: Int16Array, kind: "int", min: -32768, max: 32767, cname: "signed short integer" },
+        "H": { storage: Uint16Array, kind: "int", min: 0, max: 65535, cname: "unsigned short" },
+        "i": { storage: Int32Array, kind: "int", min: -2147483648, max: 2147483647, cname: "signed integer" },
+        "I": { storage: Uint32Array, kind: "int", min: 0, max: 4294967295, cname: "unsigned integer" },
+        "l": { storage: Int32Array, kind: "int", min: -2147483648, max: 2147483647, cname: "signed long integer" },
+        "L": { storage: Uint32Array, kind: "int", min: 0, max: 4294967295, cname: "unsigned long" },
+        "f": { storage: Float32Array, kind: "float" },
+        "d": { storage: Float64Array, kind: "float" }
+    };
+
+    var checkArray = function (obj) {
+        return obj instanceof mod.array;
+    };
+
+    /**
+     * Convert a Python object to the JS value stored for typecode tc.
+     */
+    var unbox = function (tc, item) {
+        var v;
+        var info = typecodes[tc];
+
+        if (info.kind === "char") {
+            if (!Sk.builtin.checkString(item) || item.v.length !== 1) {
+                throw new Sk.builtin.TypeError("array item must be char");
             }
+            return item.v.charCodeAt(0);
+        }
 
-            if (initialiser && !Sk.builtin.checkIterable(initialiser)) {
-                throw new Sk.builtin.TypeError("iteration over non-sequence");
+        if (info.kind === "float") {
+            if (!Sk.builtin.checkNumber(item) || item instanceof Sk.builtin.complex) {
+                throw new Sk.builtin.TypeError("a float is required");
             }
+            return Sk.builtin.asnum$(item);
+        }
+
+        if (!Sk.builtin.checkInt(item)) {
+            throw new Sk.builtin.TypeError("an integer is required");
+        }
+        v = Sk.builtin.asnum$(item);
+        if (typeof v === "string") {
+            v = parseFloat(v);
+        }
+        if (v < info.min) {
+            throw new Sk.builtin.OverflowError(info.cname + " is less than minimum");
+        }
+        if (v > info.max) {
+            throw new Sk.builtin.OverflowError(info.cname + " is greater than maximum");
+        }
+        return v;
+    };
+
+    /**
+     * Convert a stored JS value back into a Python object.
+     */
+    var box = function (tc, v) {
+        var kind = typecodes[tc].kind;
+        if (kind === "float") {
+            return new Sk.builtin.float_(v);
+        } else if (kind === "char") {
+            return new Sk.builtin.str(String.fromCharCode(v));
+        }
+        return new Sk.builtin.int_(v);
+    };
 
-            self.$d.mp$ass_subscript(new Sk.builtin.str("typecode"), typecode);
+    var fromData = function (tc, data, len) {
+        var ret = new mod.array(new Sk.builtin.str(tc));
+        ret.v = data;
+        ret.$len = len === undefined ? data.length : len;
+        return ret;
+    };
 
-            self.$d.mp$ass_subscript(new Sk.builtin.str("__module__"), new Sk.builtin.str("array"));
+    /**
+     * Make room for at least n items, growing geometrically so that
+     * repeated appends are amortized O(1).
+     */
+    var reserve = function (self, n) {
+        var data;
+        if (n <= self.v.length) {
+            return;
+        }
+        data = new self.v.constructor(Math.max(n, self.v.length * 2, 8));
+        data.set(self.v.subarray(0, self.$len));
+        self.v = data;
+    };
 
-            self.typecode = typecode;
+    var appendItem = function (self, item) {
+        var v = unbox(self.typecode, item);
+        reserve(self, self.$len + 1);
+        self.v[self.$len++] = v;
+    };
 
-            if (initialiser === undefined) {
-                self.internalIterable = new Sk.builtin.list();
-            } else if (initialiser instanceof Sk.builtin.list) {
-                self.internalIterable = initialiser;
-            } else {
-                self.internalIterable = new Sk.builtin.list();
-                for (iter = Sk.abstr.iter(initialiser), item = iter.tp$iternext();
-                     item !== undefined;
-                     item = iter.tp$iternext()) {
+    var extendFrom = function (self, iterable) {
+        var it, item;
 
-                    Sk.misceval.callsimArray(self.internalIterable.append, [self.internalIterable, item]);
-                }
+        if (checkArray(iterable)) {
+            if (iterable.typecode !== self.typecode) {
+                throw new Sk.builtin.TypeError("can only extend with array of same kind");
             }
-        });
+            reserve(self, self.$len + iterable.$len);
+            self.v.set(iterable.v.subarray(0, iterable.$len), self.$len);
+            self.$len += iterable.$len;
+            return;
+        }
+
+        if (!Sk.builtin.checkIterable(iterable)) {
+            throw new Sk.builtin.TypeError("iteration over non-sequence");
+        }
+        for (it = Sk.abstr.iter(iterable), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
+            appendItem(self, item);
+        }
+    };
+
+    var fromChars = function (self, s) {
+        var i;
+        reserve(self, self.$len + s.length);
+        for (i = 0; i < s.length; i++) {
+            self.v[self.$len++] = s.charCodeAt(i);
+        }
+    };
+
+    var fromBytes = function (self, s) {
+        var i, bytes, data;
+        var itemsize = self.v.BYTES_PER_ELEMENT;
+
+        if (s.length % itemsize !== 0) {
+            throw new Sk.builtin.ValueError("string length not a multiple of item size");
+        }
+        bytes = new Uint8Array(s.length);
+        for (i = 0; i < s.length; i++) {
+            bytes[i] = s.charCodeAt(i);
+        }
+        data = new self.v.constructor(bytes.buffer);
+        reserve(self, self.$len + data.length);
+        self.v.set(data, self.$len);
+        self.$len += data.length;
+    };
+
+    var toBytes = function (self) {
+        var i;
+        var bytes = new Uint8Array(self.v.buffer, self.v.byteOffset, self.$len * self.v.BYTES_PER_ELEMENT);
+        var parts = [];
+        for (i = 0; i < bytes.length; i += 8192) {
+            parts.push(String.fromCharCode.apply(null, bytes.subarray(i, i + 8192)));
+        }
+        return parts.join("");
+    };
+
+    var index$ = function (self, index) {
+        var i = Sk.misceval.asIndex(index);
+        if (i < 0) {
+            i = self.$len + i;
+        }
+        if (i < 0 || i >= self.$len) {
+            throw new Sk.builtin.IndexError("array index out of range");
+        }
+        return i;
+    };
+
+    /**
+     * @constructor
+     * @param {Sk.builtin.str} typecode
+     * @param {Object=} initialiser
+     * @extends Sk.builtin.object
+     */
+    mod.array = function array(typecode, initialiser) {
+        var tc;
+
+        if (!(this instanceof mod.array)) {
+            return new mod.array(typecode, initialiser);
+        }
+
+        Sk.builtin.pyCheckArgsLen("array", arguments.length, 1, 2);
+
+        tc = Sk.builtin.checkString(typecode) ? typecode.v : undefined;
+        if (!typecodes.hasOwnProperty(tc)) {
+            throw new Sk.builtin.ValueError("bad typecode (must be c, b, B, u, h, H, i, I, l, L, f or d)");
+        }
+
+        this.typecode = tc;
+        this.v = new typecodes[tc].storage(0);
+        this.$len = 0;
+        this.__class__ = mod.array;
 
-        $loc.__repr__ = new Sk.builtin.func(function (self) {
-            var typecodeJs = Sk.ffi.remapToJs(self.typecode);
-            var iterableJs = "";
-            if (Sk.ffi.remapToJs(self.internalIterable).length) {
-                if (Sk.ffi.remapToJs(self.typecode) == "c") {
-                    iterableJs = ", '" + Sk.ffi.remapToJs(self.internalIterable).join("") + "'";
+        if (initialiser !== undefined) {
+            if (Sk.builtin.checkString(initialiser)) {
+                if (typecodes[tc].kind === "char") {
+                    fromChars(this, initialiser.v);
                 } else {
-                    iterableJs = ", " + Sk.ffi.remapToJs(Sk.misceval.callsimArray(self.internalIterable.__repr__,  [self.internalIterable]));
+                    fromBytes(this, initialiser.v);
                 }
+            } else {
+                extendFrom(this, initialiser);
             }
+        }
 
-            return new Sk.builtin.str("array('" + typecodeJs + "'" + iterableJs + ")");
-        });
+        return this;
+    };
+
+    Sk.abstr.setUpInheritance("array", mod.array, Sk.builtin.object);
+    Sk.abstr.markUnhashable(mod.array);
+
+    // register the type like the builtin ones, so that it can be subclassed
+    mod.array.tp$mro = new Sk.builtin.tuple([mod.array]);
+    mod.array["$d"] = new Sk.builtin.dict([]);
+    mod.array["$d"].mp$ass_subscript(Sk.builtin.type.basesStr_, new Sk.builtin.tuple([Sk.builtin.object]));
+    mod.array["$d"].mp$ass_subscript(Sk.builtin.type.mroStr_, mod.array.tp$mro);
+
+    mod.array.prototype["$r"] = function () {
+        var i;
+        var bits = [];
+
+        if (this.$len === 0) {
+            return new Sk.builtin.str("array('" + this.typecode + "')");
+        }
+        if (typecodes[this.typecode].kind === "char") {
+            return new Sk.builtin.str("array('" + this.typecode + "', " +
+                (this.typecode === "u" && !Sk.__future__.unicode_literals ? "u" : "") +
+                Sk.misceval.objectRepr(new Sk.builtin.str(this.tounicode$())).v + ")");
+        }
+        for (i = 0; i < this.$len; i++) {
+            bits.push(Sk.misceval.objectRepr(box(this.typecode, this.v[i])).v);
+        }
+        return new Sk.builtin.str("array('" + this.typecode + "', [" + bits.join(", ") + "])");
+    };
+
+    mod.array.prototype.tounicode$ = function () {
+        var i;
+        var parts = [];
+        for (i = 0; i < this.$len; i += 8192) {
+            parts.push(String.fromCharCode.apply(null, this.v.subarray(i, Math.min(i + 8192, this.$len))));
+        }
+        return parts.join("");
+    };
+
+    mod.array.prototype.tp$getattr = function (name, canSuspend) {
+        var jsName = name.v !== undefined ? name.v : name;
+        if (jsName === "typecode") {
+            return new Sk.builtin.str(this.typecode);
+        } else if (jsName === "itemsize") {
+            return new Sk.builtin.int_(this.v.BYTES_PER_ELEMENT);
+        }
+        return Sk.builtin.object.prototype.GenericGetAttr.call(this, name, canSuspend);
+    };
+
+    // subclasses look their attributes up through the type instead
+    mod.array.prototype["typecode"] = Sk.misceval.callsimArray(Sk.builtins["property"], [
+        new Sk.builtin.func(function (self) {
+            return new Sk.builtin.str(self.typecode);
+        })
+    ]);
+    mod.array.prototype["itemsize"] = Sk.misceval.callsimArray(Sk.builtins["property"], [
+        new Sk.builtin.func(function (self) {
+            return new Sk.builtin.int_(self.v.BYTES_PER_ELEMENT);
+        })
+    ]);
+
+    mod.array.prototype.sq$length = function () {
+        return this.$len;
+    };
 
-        $loc.__str__ = $loc.__repr__;
+    mod.array.prototype.mp$subscript = function (index) {
+        var ret, sss;
+        var self = this;
 
-        $loc.__getattribute__ = new Sk.builtin.func(function (self, attr) {
-            return self.tp$getattr(attr);
+        if (Sk.misceval.isIndex(index)) {
+            return box(this.typecode, this.v[index$(this, index)]);
+        } else if (index instanceof Sk.builtin.slice) {
+            sss = index.slice_indices_(this.$len);
+            if (sss[2] === 1) {
+                return fromData(this.typecode, this.v.slice(sss[0], Math.max(sss[0], sss[1])));
+            }
+            ret = [];
+            index.sssiter$(this.$len, function (i) {
+                ret.push(self.v[i]);
+            });
+            return fromData(this.typecode, new this.v.constructor(ret));
+        }
+
+        throw new Sk.builtin.TypeError("array indices must be integers");
+    };
+
+    mod.array.prototype.mp$ass_subscript = function (index, value) {
+        var sss, items, i, k;
+        var self = this;
+
+        if (Sk.misceval.isIndex(index)) {
+            this.v[index$(this, index)] = unbox(this.typecode, value);
+            return;
+        }
+        if (!(index instanceof Sk.builtin.slice)) {
+            throw new Sk.builtin.TypeError("array indices must be integers");
+        }
+        if (!checkArray(value) || value.typecode !== this.typecode) {
+            throw new Sk.builtin.TypeError("can only assign array (not \"" + Sk.abstr.typeName(value) + "\") to array slice");
+        }
+
+        items = value.v.slice(0, value.$len);
+        sss = index.slice_indices_(this.$len);
+        if (sss[2] === 1) {
+            i = sss[0];
+            k = Math.max(sss[0], sss[1]);
+            this.splice$(i, k - i, items);
+            return;
+        }
+
+        k = 0;
+        index.sssiter$(this.$len, function () {
+            k++;
+        });
+        if (k !== items.length) {
+            throw new Sk.builtin.ValueError("attempt to assign array of size " + items.length + " to extended slice of size " + k);
+        }
+        k = 0;
+        index.sssiter$(this.$len, function (i) {
+            self.v[i] = items[k++];
         });
+    };
+
+    mod.array.prototype.mp$del_subscript = function (index) {
+        var sss, keep, i, j;
+
+        if (Sk.misceval.isIndex(index)) {
+            this.splice$(index$(this, index), 1);
+            return;
+        }
+        if (!(index instanceof Sk.builtin.slice)) {
+            throw new Sk.builtin.TypeError("array indices must be integers");
+        }
+
+        sss = index.slice_indices_(this.$len);
+        if (sss[2] === 1) {
+            this.splice$(sss[0], Math.max(0, sss[1] - sss[0]));
+            return;
+        }
 
-        $loc.append = new Sk.builtin.func(function (self, item) {
-            Sk.misceval.callsimArray(self.internalIterable.append, [self.internalIterable, item]);
-            return Sk.builtin.none.none$;
+        keep = new Uint8Array(this.$len);
+        index.sssiter$(this.$len, function (i) {
+            keep[i] = 1;
         });
+        for (i = 0, j = 0; i < this.$len; i++) {
+            if (!keep[i]) {
+                this.v[j++] = this.v[i];
+            }
+        }
+        this.$len = j;
+    };
+
+    mod.array.prototype["__len__"] = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("__len__", arguments.length, 1, 1);
+        return new Sk.builtin.int_(self.$len);
+    });
 
-        $loc.extend = new Sk.builtin.func(function(self, iterable) {
-            Sk.builtin.pyCheckArgsLen("__init__", arguments.length, 2, 2);
+    mod.array.prototype["__getitem__"] = new Sk.builtin.func(function (self, index) {
+        return mod.array.prototype.mp$subscript.call(self, index);
+    });
 
-            if (!Sk.builtin.checkIterable(iterable)) {
-                throw new Sk.builtin.TypeError("iteration over non-sequence");
+    mod.array.prototype["__setitem__"] = new Sk.builtin.func(function (self, index, value) {
+        mod.array.prototype.mp$ass_subscript.call(self, index, value);
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["__delitem__"] = new Sk.builtin.func(function (self, index) {
+        mod.array.prototype.mp$del_subscript.call(self, index);
+        return Sk.builtin.none.none$;
+    });
+
+    /**
+     * Replace count items at start with the typed array items (if given).
+     */
+    mod.array.prototype.splice$ = function (start, count, items) {
+        var n = items ? items.length : 0;
+        var newlen = this.$len - count + n;
+
+        reserve(this, newlen);
+        this.v.copyWithin(start + n, start + count, this.$len);
+        if (n) {
+            this.v.set(items, start);
+        }
+        this.$len = newlen;
+    };
+
+    mod.array.prototype.sq$contains = function (item) {
+        var i, v;
+        var kind = typecodes[this.typecode].kind;
+
+        if (kind === "char" && Sk.builtin.checkString(item) && item.v.length === 1) {
+            v = item.v.charCodeAt(0);
+        } else if (kind !== "char" && (item instanceof Sk.builtin.int_ || item instanceof Sk.builtin.float_)) {
+            v = Sk.builtin.asnum$(item);
+        }
+        if (typeof v === "number") {
+            // the stored values compare with the unboxed one as the boxed
+            // items would
+            for (i = 0; i < this.$len; i++) {
+                if (this.v[i] === v) {
+                    return true;
+                }
             }
+            return false;
+        }
+
+        for (i = 0; i < this.$len; i++) {
+            if (Sk.misceval.richCompareBool(box(this.typecode, this.v[i]), item, "Eq")) {
+                return true;
+            }
+        }
+        return false;
+    };
+
+    mod.array.prototype["__contains__"] = new Sk.builtin.func(function (self, item) {
+        Sk.builtin.pyCheckArgsLen("__contains__", arguments.length, 2, 2);
+        return new Sk.builtin.bool(mod.array.prototype.sq$contains.call(self, item));
+    });
+
+    mod.array.prototype.tp$iter = function () {
+        return new mod.array.iter_(this);
+    };
+
+    mod.array.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+        return new mod.array.iter_(self);
+    });
+
+    mod.array.prototype.nb$add = function (other) {
+        var data;
+        if (!checkArray(other)) {
+            return Sk.builtin.NotImplemented.NotImplemented$;
+        }
+        if (other.typecode !== this.typecode) {
+            throw new Sk.builtin.TypeError("bad argument type for built-in operation");
+        }
+        data = new this.v.constructor(this.$len + other.$len);
+        data.set(this.v.subarray(0, this.$len));
+        data.set(other.v.subarray(0, other.$len), this.$len);
+        return fromData(this.typecode, data);
+    };
+
+    mod.array.prototype.nb$inplace_add = function (other) {
+        if (!checkArray(other)) {
+            return Sk.builtin.NotImplemented.NotImplemented$;
+        }
+        if (other.typecode !== this.typecode) {
+            throw new Sk.builtin.TypeError("bad argument type for built-in operation");
+        }
+        extendFrom(this, other);
+        return this;
+    };
+
+    /**
+     * Repeat the first len items of data n times into a new typed array,
+     * doubling the copied block each step.
+     */
+    var repeat = function (data, len, n) {
+        var filled;
+        var ret = new data.constructor(len * n);
+        if (ret.length === 0) {
+            return ret;
+        }
+        ret.set(data.subarray(0, len));
+        for (filled = len; filled < ret.length; filled *= 2) {
+            ret.copyWithin(filled, 0, Math.min(filled, ret.length - filled));
+        }
+        return ret;
+    };
+
+    mod.array.prototype.nb$multiply = function (n) {
+        if (!Sk.misceval.isIndex(n)) {
+            return Sk.builtin.NotImplemented.NotImplemented$;
+        }
+        return fromData(this.typecode, repeat(this.v, this.$len, Math.max(0, Sk.misceval.asIndex(n))));
+    };
+    mod.array.prototype.nb$reflected_multiply = mod.array.prototype.nb$multiply;
 
-            for (iter = Sk.abstr.iter(iterable), item = iter.tp$iternext();
-                 item !== undefined;
-                 item = iter.tp$iternext()) {
+    mod.array.prototype.nb$inplace_multiply = function (n) {
+        if (!Sk.misceval.isIndex(n)) {
+            return Sk.builtin.NotImplemented.NotImplemented$;
+        }
+        this.v = repeat(this.v, this.$len, Math.max(0, Sk.misceval.asIndex(n)));
+        this.$len = this.v.length;
+        return this;
+    };
 
-                Sk.misceval.callsimArray(self.internalIterable.append, [self.internalIterable, item]);
+    mod.array.prototype.tp$richcompare = function (w, op) {
+        var i, a, b;
+        var n;
+
+        if (!checkArray(w)) {
+            if (op === "Eq") {
+                return false;
+            } else if (op === "NotEq") {
+                return true;
             }
-        });
+            return Sk.builtin.NotImplemented.NotImplemented$;
+        }
+
+        n = Math.min(this.$len, w.$len);
+        for (i = 0; i < n; i++) {
+            if (this.v[i] !== w.v[i]) {
+                break;
+            }
+        }
+        if (i < n) {
+            a = box(this.typecode, this.v[i]);
+            b = box(w.typecode, w.v[i]);
+            if (!Sk.misceval.richCompareBool(a, b, "Eq")) {
+                if (op === "Eq") {
+                    return false;
+                } else if (op === "NotEq") {
+                    return true;
+                }
+                return Sk.misceval.richCompareBool(a, b, op);
+            }
+        }
+
+        switch (op) {
+            case "Lt":
+                return this.$len < w.$len;
+            case "LtE":
+                return this.$len <= w.$len;
+            case "Eq":
+                return this.$len === w.$len;
+            case "NotEq":
+                return this.$len !== w.$len;
+            case "Gt":
+                return this.$len > w.$len;
+            case "GtE":
+                return this.$len >= w.$len;
+            default:
+                Sk.asserts.fail();
+        }
     };
 
-    mod.array = Sk.misceval.buildClass(mod, array, "array", []);
+    mod.array.prototype["append"] = new Sk.builtin.func(function (self, item) {
+        Sk.builtin.pyCheckArgsLen("append", arguments.length, 2, 2);
+        appendItem(self, item);
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["extend"] = new Sk.builtin.func(function (self, iterable) {
+        Sk.builtin.pyCheckArgsLen("extend", arguments.length, 2, 2);
+        extendFrom(self, iterable);
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["fromlist"] = new Sk.builtin.func(function (self, list) {
+        var tmp;
+        Sk.builtin.pyCheckArgsLen("fromlist", arguments.length, 2, 2);
+        if (!(list instanceof Sk.builtin.list)) {
+            throw new Sk.builtin.TypeError("arg must be list");
+        }
+        // all or nothing, as in CPython
+        tmp = new mod.array(new Sk.builtin.str(self.typecode), list);
+        extendFrom(self, tmp);
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["insert"] = new Sk.builtin.func(function (self, i, x) {
+        var v;
+        Sk.builtin.pyCheckArgsLen("insert", arguments.length, 3, 3);
+        i = Sk.misceval.asIndex(i);
+        if (i < 0) {
+            i = Math.max(0, i + self.$len);
+        }
+        i = Math.min(i, self.$len);
+        v = new self.v.constructor(1);
+        v[0] = unbox(self.typecode, x);
+        self.splice$(i, 0, v);
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["pop"] = new Sk.builtin.func(function (self, i) {
+        var ret;
+        Sk.builtin.pyCheckArgsLen("pop", arguments.length, 1, 2);
+        if (self.$len === 0) {
+            throw new Sk.builtin.IndexError("pop from empty array");
+        }
+        i = index$(self, i === undefined ? new Sk.builtin.int_(-1) : i);
+        ret = box(self.typecode, self.v[i]);
+        self.splice$(i, 1);
+        return ret;
+    });
+
+    mod.array.prototype["index"] = new Sk.builtin.func(function (self, x) {
+        var i;
+        Sk.builtin.pyCheckArgsLen("index", arguments.length, 2, 2);
+        for (i = 0; i < self.$len; i++) {
+            if (Sk.misceval.richCompareBool(box(self.typecode, self.v[i]), x, "Eq")) {
+                return new Sk.builtin.int_(i);
+            }
+        }
+        throw new Sk.builtin.ValueError("array.index(x): x not in list");
+    });
+
+    mod.array.prototype["count"] = new Sk.builtin.func(function (self, x) {
+        var i;
+        var count = 0;
+        Sk.builtin.pyCheckArgsLen("count", arguments.length, 2, 2);
+        for (i = 0; i < self.$len; i++) {
+            if (Sk.misceval.richCompareBool(box(self.typecode, self.v[i]), x, "Eq")) {
+                count++;
+            }
+        }
+        return new Sk.builtin.int_(count);
+    });
+
+    mod.array.prototype["remove"] = new Sk.builtin.func(function (self, x) {
+        var i;
+        Sk.builtin.pyCheckArgsLen("remove", arguments.length, 2, 2);
+        for (i = 0; i < self.$len; i++) {
+            if (Sk.misceval.richCompareBool(box(self.typecode, self.v[i]), x, "Eq")) {
+                self.splice$(i, 1);
+                return Sk.builtin.none.none$;
+            }
+        }
+        throw new Sk.builtin.ValueError("array.remove(x): x not in list");
+    });
+
+    mod.array.prototype["reverse"] = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("reverse", arguments.length, 1, 1);
+        self.v.subarray(0, self.$len).reverse();
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["byteswap"] = new Sk.builtin.func(function (self) {
+        var i, j, t;
+        var size = self.v.BYTES_PER_ELEMENT;
+        var bytes = new Uint8Array(self.v.buffer, self.v.byteOffset, self.$len * size);
+        Sk.builtin.pyCheckArgsLen("byteswap", arguments.length, 1, 1);
+        for (i = 0; i < bytes.length; i += size) {
+            for (j = 0; j < size / 2; j++) {
+                t = bytes[i + j];
+                bytes[i + j] = bytes[i + size - 1 - j];
+                bytes[i + size - 1 - j] = t;
+            }
+        }
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["buffer_info"] = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("buffer_info", arguments.length, 1, 1);
+        // There are no addresses in JS; report the byte offset into the
+        // backing ArrayBuffer instead.
+        return new Sk.builtin.tuple([new Sk.builtin.int_(self.v.byteOffset), new Sk.builtin.int_(self.$len)]);
+    });
+
+    mod.array.prototype["tolist"] = new Sk.builtin.func(function (self) {
+        var i;
+        var ret = [];
+        Sk.builtin.pyCheckArgsLen("tolist", arguments.length, 1, 1);
+        for (i = 0; i < self.$len; i++) {
+            ret.push(box(self.typecode, self.v[i]));
+        }
+        return new Sk.builtin.list(ret);
+    });
+
+    mod.array.prototype["tobytes"] = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("tobytes", arguments.length, 1, 1);
+        return new Sk.builtin.str(toBytes(self));
+    });
+    mod.array.prototype["tostring"] = mod.array.prototype["tobytes"];
+
+    mod.array.prototype["frombytes"] = new Sk.builtin.func(function (self, s) {
+        Sk.builtin.pyCheckArgsLen("frombytes", arguments.length, 2, 2);
+        if (!Sk.builtin.checkString(s)) {
+            throw new Sk.builtin.TypeError("frombytes() argument must be a string");
+        }
+        fromBytes(self, s.v);
+        return Sk.builtin.none.none$;
+    });
+    mod.array.prototype["fromstring"] = mod.array.prototype["frombytes"];
+
+    mod.array.prototype["tounicode"] = new Sk.builtin.func(function (self) {
+        Sk.builtin.pyCheckArgsLen("tounicode", arguments.length, 1, 1);
+        if (self.typecode !== "u") {
+            throw new Sk.builtin.ValueError("tounicode() may only be called on unicode type arrays");
+        }
+        return new Sk.builtin.str(self.tounicode$());
+    });
+
+    mod.array.prototype["fromunicode"] = new Sk.builtin.func(function (self, s) {
+        Sk.builtin.pyCheckArgsLen("fromunicode", arguments.length, 2, 2);
+        if (self.typecode !== "u") {
+            throw new Sk.builtin.ValueError("fromunicode() may only be called on unicode type arrays");
+        }
+        if (!Sk.builtin.checkString(s)) {
+            throw new Sk.builtin.TypeError("fromunicode() argument must be a string");
+        }
+        fromChars(self, s.v);
+        return Sk.builtin.none.none$;
+    });
+
+    mod.array.prototype["__copy__"] = new Sk.builtin.func(function (self) {
+        return fromData(self.typecode, self.v.slice(0, self.$len));
+    });
+
+    mod.array.prototype["__deepcopy__"] = new Sk.builtin.func(function (self, memo) {
+        return fromData(self.typecode, self.v.slice(0, self.$len));
+    });
+
+    /**
+     * Iterates over the stored values, boxing each one only as it is
+     * returned.
+     *
+     * @constructor
+     * @param {Object} arr
+     */
+    mod.array.iter_ = function (arr) {
+        if (!(this instanceof mod.array.iter_)) {
+            return new mod.array.iter_(arr);
+        }
+        this.$index = 0;
+        this.$obj = arr;
+        return this;
+    };
+
+    Sk.abstr.setUpInheritance("arrayiterator", mod.array.iter_, Sk.builtin.object);
+
+    mod.array.iter_.prototype.tp$iter = function () {
+        return this;
+    };
+
+    mod.array.iter_.prototype.tp$iternext = function () {
+        var arr = this.$obj;
+        if (this.$index >= arr.$len) {
+            return undefined;
+        }
+        return box(arr.typecode, arr.v[this.$index++]);
+    };
+
+    mod.array.iter_.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+        return self;
+    });
+
+    mod.array.iter_.prototype[Sk.__future__.dunder_next ? "__next__" : "next"] = new Sk.builtin.func(function (self) {
+        var ret = self.tp$iternext();
+        if (ret === undefined) {
+            throw new Sk.builtin.StopIteration();
+        }
+        return ret;
+    });
 
-    mod.__name__ = new Sk.builtin.str('array');
+    mod.ArrayType = mod.array;
+    mod.__name__ = new Sk.builtin.str("array");
 
     return mod;
 };
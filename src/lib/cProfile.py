@@ -1 +1,104 @@
-raise NotImplementedError("cProfile is not yet implemented in Skulpt")
+"""Python interface for the native profiler of Skulpt.
+
+Only functions compiled with the profiling option of Sk.configure are
+seen by the profiler; run the program with it on to profile it.  There
+is no file system to dump the statistics to, so run() and runctx() print
+them; use pstats.Stats or flamegraph_json() to keep them.
+"""
+
+import _lsprof
+
+__all__ = ["run", "runctx", "Profile"]
+
+
+def run(statement, sort=-1):
+    """Run statement in the namespace of __main__ and print its profile."""
+    prof = Profile()
+    try:
+        prof.run(statement)
+    finally:
+        prof.print_stats(sort)
+
+
+def runctx(statement, globals, locals, sort=-1):
+    """Run statement in the given globals and print its profile."""
+    prof = Profile()
+    try:
+        prof.runctx(statement, globals, locals)
+    finally:
+        prof.print_stats(sort)
+
+
+class Profile(object):
+    """Profile(), records the calls of profiled functions.
+
+    Use enable() and disable() around the code to profile, or runcall(),
+    run() or a with statement, then print_stats() or pstats.Stats.
+    """
+
+    def __init__(self):
+        self._prof = _lsprof.Profiler()
+        self.stats = {}
+
+    def enable(self):
+        self._prof.enable()
+
+    def disable(self):
+        self._prof.disable()
+
+    def clear(self):
+        self._prof.clear()
+
+    def getstats(self):
+        return self._prof.getstats()
+
+    def flamegraph_json(self):
+        """The call tree as JSON for flame graph tools (d3-flame-graph):
+        nested {"name", "value", "children"} objects, value in ms."""
+        return self._prof.flamegraph_json()
+
+    def create_stats(self):
+        self.disable()
+        self.snapshot_stats()
+
+    def snapshot_stats(self):
+        self.stats = {}
+        for func, nc, cc, tt, ct, calls in self.getstats():
+            callers = {}
+            for caller, cnc, ctt, cct in calls:
+                callers[caller] = (cnc, cnc, ctt, cct)
+            self.stats[func] = (cc, nc, tt, ct, callers)
+
+    def print_stats(self, sort=-1):
+        import pstats
+        pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
+
+    def run(self, cmd):
+        self.enable()
+        try:
+            _lsprof._exec(cmd)
+        finally:
+            self.disable()
+        return self
+
+    def runctx(self, cmd, globals, locals):
+        self.enable()
+        try:
+            _lsprof._exec(cmd, globals)
+        finally:
+            self.disable()
+        return self
+
+    def runcall(self, func, *args, **kw):
+        self.enable()
+        try:
+            return func(*args, **kw)
+        finally:
+            self.disable()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
@@ -261,6 +261,10 @@ var $builtinmodule = function (name) {
 
 
         // OrderedDict
+
+        // Entries are the dict's own bucket items ({lhs, rhs}), chained
+        // into a circular doubly-linked list through $prev/$next around the
+        // sentinel $root, so deletes and moves never search for the key.
         mod.OrderedDict = function OrderedDict(items)
         {
             if (!(this instanceof mod.OrderedDict))
@@ -268,7 +272,10 @@ var $builtinmodule = function (name) {
                 return new mod.OrderedDict(items);
             }
 
-            this.orderedkeys = [];
+            this.$root = {};
+            this.$root.$prev = this.$root.$next = this.$root;
+            // bumped whenever entries are added, removed or moved
+            this.$state = 0;
 
             Sk.abstr.superConstructor(mod.OrderedDict, this, items);
 
@@ -277,6 +284,32 @@ var $builtinmodule = function (name) {
 
         Sk.abstr.setUpInheritance("OrderedDict", mod.OrderedDict, Sk.builtin.dict);
 
+        var odLink = function (od, item, last) {
+            var root = od.$root;
+            if (last) {
+                item.$prev = root.$prev;
+                item.$next = root;
+            } else {
+                item.$prev = root;
+                item.$next = root.$next;
+            }
+            item.$prev.$next = item;
+            item.$next.$prev = item;
+            od.$state++;
+        };
+
+        var odUnlink = function (od, item) {
+            item.$prev.$next = item.$next;
+            item.$next.$prev = item.$prev;
+            item.$prev = item.$next = undefined;
+            od.$state++;
+        };
+
+        var odFind = function (od, key) {
+            var bucket = od.buckets[Sk.builtin.hash(key).v];
+            return bucket === undefined ? null : od.key$lookup(bucket, key);
+        };
+
         mod.OrderedDict.prototype['$r'] = function()
         {
             var v;
@@ -303,24 +336,59 @@ var $builtinmodule = function (name) {
 
         mod.OrderedDict.prototype.mp$ass_subscript = function(key, w)
         {
-            var idx = this.orderedkeys.indexOf(key);
-            if (idx == -1)
-            {
-                this.orderedkeys.push(key);
+            var k = Sk.builtin.hash(key);
+            var bucket = this.buckets[k.v];
+            var item;
+
+            if (bucket === undefined) {
+                bucket = {$hash: k, items: []};
+                this.buckets[k.v] = bucket;
+                this.$hashes = null;
+            } else {
+                item = this.key$lookup(bucket, key);
+                if (item) {
+                    item.rhs = w;
+                    return;
+                }
             }
 
-            return Sk.builtin.dict.prototype.mp$ass_subscript.call(this, key, w);
+            item = {lhs: key, rhs: w};
+            bucket.items.push(item);
+            this.size += 1;
+            this.$version++;
+            odLink(this, item, true);
         }
 
-        mod.OrderedDict.prototype.mp$del_subscript = function(key)
+        // the keys, values and items of an OrderedDict, and their views,
+        // follow the entry list
+        mod.OrderedDict.prototype.entries$start = function(it)
         {
-            var idx = this.orderedkeys.indexOf(key);
-            if (idx != -1)
-            {
-                this.orderedkeys.splice(idx, 1);
+            it.$node = this.$root.$next;
+            it.$state = this.$state;
+        }
+
+        mod.OrderedDict.prototype.entries$next = function(it)
+        {
+            var node = it.$node;
+            if (this.$state !== it.$state) {
+                throw new Sk.builtin.RuntimeError("OrderedDict mutated during iteration");
             }
+            if (node === this.$root) {
+                return undefined;
+            }
+            it.$node = node.$next;
+            return node;
+        }
 
-            return Sk.builtin.dict.prototype.mp$del_subscript.call(this, key);
+        // dict's mp$del_subscript and pop both remove entries through here
+        mod.OrderedDict.prototype.key$pop = function(bucket, key)
+        {
+            var item = Sk.builtin.dict.prototype.key$pop.call(this, bucket, key);
+            if (item !== undefined)
+            {
+                odUnlink(this, item);
+            }
+            return item;
         }
 
         mod.OrderedDict.prototype.__iter__ = new Sk.builtin.func(function (self) {
@@ -331,26 +399,63 @@ var $builtinmodule = function (name) {
 
         mod.OrderedDict.prototype.tp$iter = function()
         {
-            var ret;
-            ret =
-            {
-                tp$iter    : function () {
-                    return ret;
-                },
-                $obj       : this,
-                $index     : 0,
-                $keys      : this.orderedkeys.slice(0),
-                tp$iternext: function () {
-                    // todo; StopIteration
-                    if (ret.$index >= ret.$keys.length) {
-                        return undefined;
-                    }
-                    return ret.$keys[ret.$index++];
-                }
-            };
-            return ret;
+            return new mod.OrderedDict.iter_(this, false);
         }
 
+        mod.OrderedDict.prototype.__reversed__ = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("__reversed__", arguments.length, 0, 0, false, true);
+
+            return new mod.OrderedDict.iter_(self, true);
+        });
+
+        /**
+         * Walks the entry list directly; raises RuntimeError if the
+         * OrderedDict changes size or order underneath it.
+         *
+         * @constructor
+         */
+        mod.OrderedDict.iter_ = function (od, reversed)
+        {
+            if (!(this instanceof mod.OrderedDict.iter_)) {
+                return new mod.OrderedDict.iter_(od, reversed);
+            }
+            this.$obj = od;
+            this.$reversed = reversed;
+            this.$node = reversed ? od.$root.$prev : od.$root.$next;
+            this.$state = od.$state;
+            return this;
+        };
+
+        Sk.abstr.setUpInheritance("odict_iterator", mod.OrderedDict.iter_, Sk.builtin.object);
+
+        mod.OrderedDict.iter_.prototype.tp$iter = function () {
+            return this;
+        };
+
+        mod.OrderedDict.iter_.prototype.tp$iternext = function () {
+            var node = this.$node;
+            if (this.$obj.$state !== this.$state) {
+                throw new Sk.builtin.RuntimeError("OrderedDict mutated during iteration");
+            }
+            if (node === this.$obj.$root) {
+                return undefined;
+            }
+            this.$node = this.$reversed ? node.$prev : node.$next;
+            return node.lhs;
+        };
+
+        mod.OrderedDict.iter_.prototype.__iter__ = new Sk.builtin.func(function (self) {
+            return self;
+        });
+
+        mod.OrderedDict.iter_.prototype[Sk.__future__.dunder_next ? "__next__" : "next"] = new Sk.builtin.func(function (self) {
+            var ret = self.tp$iternext();
+            if (ret === undefined) {
+                throw new Sk.builtin.StopIteration();
+            }
+            return ret;
+        });
+
         mod.OrderedDict.prototype.ob$eq = function (other) {
             var l;
             var otherl;
@@ -429,49 +534,504 @@ var $builtinmodule = function (name) {
             return Sk.builtin.bool.false$;
         };
 
-        mod.OrderedDict.prototype["pop"] = new Sk.builtin.func(function (self, key, d) {
-            var s;
-            var idx;
+        mod.OrderedDict.prototype["clear"] = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen('clear', arguments.length, 1, 1);
 
-            Sk.builtin.pyCheckArgsLen('pop', arguments.length, 2, 3);
-
-            idx = self.orderedkeys.indexOf(key);
-            if (idx != -1)
-            {
-                self.orderedkeys.splice(idx, 1);
-            }
-
-            return Sk.misceval.callsimArray(Sk.builtin.dict.prototype["pop"], [self, key, d]);
+            self.buckets = {};
+            self.$hashes = null;
+            self.size = 0;
+            self.$version++;
+            self.$root.$prev = self.$root.$next = self.$root;
+            self.$state++;
+            return Sk.builtin.none.none$;
         });
 
-        mod.OrderedDict.prototype["popitem"] = new Sk.builtin.func(function (self, last) {
-            var key, val;
+        var _popitem = function (self, last) {
+            var item;
             var s;
 
             Sk.builtin.pyCheckArgsLen('popitem', arguments.length, 1, 2);
 
             // Empty dictionary
-            if (self.orderedkeys.length == 0)
+            if (self.size === 0)
             {
                 s = new Sk.builtin.str('dictionary is empty');
                 throw new Sk.builtin.KeyError(s.v);
             }
 
-            key = self.orderedkeys[0];
             if (last === undefined || Sk.misceval.isTrue(last))
             {
-                key = self.orderedkeys[self.orderedkeys.length - 1];
+                item = self.$root.$prev;
+            }
+            else
+            {
+                item = self.$root.$next;
             }
 
-            val = Sk.misceval.callsimArray(self["pop"], [self, key]);
-            return Sk.builtin.tuple([key, val]);
-        });
+            self.mp$del_subscript(item.lhs);
+            return new Sk.builtin.tuple([item.lhs, item.rhs]);
+        };
+        _popitem.co_varnames = ["self", "last"];
+        _popitem.$defaults = [Sk.builtin.bool.true$];
+        mod.OrderedDict.prototype["popitem"] = new Sk.builtin.func(_popitem);
+
+        var _move_to_end = function (self, key, last) {
+            var item;
+
+            Sk.builtin.pyCheckArgsLen('move_to_end', arguments.length, 2, 3);
+
+            item = odFind(self, key);
+            if (!item)
+            {
+                throw new Sk.builtin.KeyError(key);
+            }
+
+            odUnlink(self, item);
+            odLink(self, item, last === undefined || Sk.misceval.isTrue(last));
+            return Sk.builtin.none.none$;
+        };
+        _move_to_end.co_varnames = ["self", "key", "last"];
+        _move_to_end.$defaults = [Sk.builtin.bool.true$];
+        mod.OrderedDict.prototype["move_to_end"] = new Sk.builtin.func(_move_to_end);
 
         // deque
+
+        // Items live in a ring buffer whose capacity is a power of two, so
+        // both ends are O(1) and indexing is a mask away.
         mod.deque = function deque(iterable, maxlen) {
-            throw new Sk.builtin.NotImplementedError("deque is not implemented")
+            if (!(this instanceof mod.deque)) {
+                return new mod.deque(iterable, maxlen);
+            }
+
+            if (maxlen === undefined || maxlen === Sk.builtin.none.none$) {
+                this.maxlen = null;
+            } else {
+                if (!Sk.builtin.checkInt(maxlen)) {
+                    throw new Sk.builtin.TypeError("an integer is required");
+                }
+                this.maxlen = Sk.builtin.asnum$(maxlen);
+                if (this.maxlen < 0) {
+                    throw new Sk.builtin.ValueError("maxlen must be non-negative");
+                }
+            }
+
+            this.$buf = new Array(8);
+            this.$mask = 7;
+            this.$head = 0;
+            this.$size = 0;
+            // bumped on every mutation so iterators can detect it
+            this.$state = 0;
+            this.__class__ = mod.deque;
+
+            if (iterable !== undefined && iterable !== Sk.builtin.none.none$) {
+                this.extend$(iterable);
+            }
+
+            return this;
+        };
+
+        mod.deque.co_varnames = ["iterable", "maxlen"];
+        mod.deque.$defaults = [Sk.builtin.none.none$, Sk.builtin.none.none$];
+
+        Sk.abstr.setUpInheritance("deque", mod.deque, Sk.builtin.object);
+        Sk.abstr.markUnhashable(mod.deque);
+
+        mod.deque.prototype.grow$ = function () {
+            var i;
+            var cap = this.$buf.length;
+            var buf = new Array(cap * 2);
+
+            for (i = 0; i < this.$size; i++) {
+                buf[i] = this.$buf[(this.$head + i) & this.$mask];
+            }
+            this.$buf = buf;
+            this.$mask = cap * 2 - 1;
+            this.$head = 0;
+        };
+
+        mod.deque.prototype.push$ = function (x) {
+            if (this.$size === this.$buf.length) {
+                this.grow$();
+            }
+            this.$buf[(this.$head + this.$size) & this.$mask] = x;
+            this.$size++;
+        };
+
+        mod.deque.prototype.pushleft$ = function (x) {
+            if (this.$size === this.$buf.length) {
+                this.grow$();
+            }
+            this.$head = (this.$head - 1) & this.$mask;
+            this.$buf[this.$head] = x;
+            this.$size++;
+        };
+
+        mod.deque.prototype.pop$ = function () {
+            var idx = (this.$head + this.$size - 1) & this.$mask;
+            var x = this.$buf[idx];
+            this.$buf[idx] = undefined;
+            this.$size--;
+            return x;
+        };
+
+        mod.deque.prototype.popleft$ = function () {
+            var x = this.$buf[this.$head];
+            this.$buf[this.$head] = undefined;
+            this.$head = (this.$head + 1) & this.$mask;
+            this.$size--;
+            return x;
+        };
+
+        mod.deque.prototype.append$ = function (x) {
+            this.$state++;
+            if (this.maxlen !== null && this.$size >= this.maxlen) {
+                if (this.maxlen === 0) {
+                    return;
+                }
+                this.popleft$();
+            }
+            this.push$(x);
+        };
+
+        mod.deque.prototype.appendleft$ = function (x) {
+            this.$state++;
+            if (this.maxlen !== null && this.$size >= this.maxlen) {
+                if (this.maxlen === 0) {
+                    return;
+                }
+                this.pop$();
+            }
+            this.pushleft$(x);
+        };
+
+        mod.deque.prototype.extend$ = function (iterable, left) {
+            var it, item;
+
+            if (!Sk.builtin.checkIterable(iterable)) {
+                throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(iterable) + "' object is not iterable");
+            }
+            if (iterable === this) {
+                iterable = new Sk.builtin.list(this.toArray$());
+            }
+            for (it = Sk.abstr.iter(iterable), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
+                if (left) {
+                    this.appendleft$(item);
+                } else {
+                    this.append$(item);
+                }
+            }
         };
 
+        mod.deque.prototype.toArray$ = function () {
+            var i;
+            var ret = new Array(this.$size);
+            for (i = 0; i < this.$size; i++) {
+                ret[i] = this.$buf[(this.$head + i) & this.$mask];
+            }
+            return ret;
+        };
+
+        mod.deque.prototype.index$ = function (index) {
+            var i = Sk.misceval.asIndex(index);
+            if (i < 0) {
+                i = this.$size + i;
+            }
+            if (i < 0 || i >= this.$size) {
+                throw new Sk.builtin.IndexError("deque index out of range");
+            }
+            return i;
+        };
+
+        mod.deque.prototype.checkIndex$ = function (index) {
+            if (!Sk.misceval.isIndex(index)) {
+                throw new Sk.builtin.TypeError("sequence index must be integer, not '" + Sk.abstr.typeName(index) + "'");
+            }
+        };
+
+        /**
+         * Remove the item at position i (0 <= i < size), shifting whichever
+         * side of the ring is shorter.
+         */
+        mod.deque.prototype.remove$ = function (i) {
+            var j;
+            this.$state++;
+            if (i < this.$size / 2) {
+                for (j = i; j > 0; j--) {
+                    this.$buf[(this.$head + j) & this.$mask] = this.$buf[(this.$head + j - 1) & this.$mask];
+                }
+                this.popleft$();
+            } else {
+                for (j = i; j < this.$size - 1; j++) {
+                    this.$buf[(this.$head + j) & this.$mask] = this.$buf[(this.$head + j + 1) & this.$mask];
+                }
+                this.pop$();
+            }
+        };
+
+        mod.deque.prototype.tp$getattr = function (name, canSuspend) {
+            var jsName = name.v !== undefined ? name.v : name;
+            if (jsName === "maxlen") {
+                return this.maxlen === null ? Sk.builtin.none.none$ : new Sk.builtin.int_(this.maxlen);
+            }
+            return Sk.builtin.object.prototype.GenericGetAttr.call(this, name, canSuspend);
+        };
+
+        mod.deque.prototype["$r"] = function () {
+            var i;
+            var bits = [];
+            for (i = 0; i < this.$size; i++) {
+                bits.push(Sk.misceval.objectRepr(this.$buf[(this.$head + i) & this.$mask]).v);
+            }
+            return new Sk.builtin.str("deque([" + bits.join(", ") + "]" +
+                (this.maxlen === null ? "" : ", maxlen=" + this.maxlen) + ")");
+        };
+
+        mod.deque.prototype.sq$length = function () {
+            return this.$size;
+        };
+
+        mod.deque.prototype.sq$contains = function (item) {
+            var i;
+            for (i = 0; i < this.$size; i++) {
+                if (Sk.misceval.richCompareBool(this.$buf[(this.$head + i) & this.$mask], item, "Eq")) {
+                    return true;
+                }
+            }
+            return false;
+        };
+
+        mod.deque.prototype.mp$subscript = function (index) {
+            this.checkIndex$(index);
+            return this.$buf[(this.$head + this.index$(index)) & this.$mask];
+        };
+
+        mod.deque.prototype.mp$ass_subscript = function (index, value) {
+            this.checkIndex$(index);
+            this.$buf[(this.$head + this.index$(index)) & this.$mask] = value;
+        };
+
+        mod.deque.prototype.mp$del_subscript = function (index) {
+            this.checkIndex$(index);
+            this.remove$(this.index$(index));
+        };
+
+        mod.deque.prototype.tp$richcompare = function (w, op) {
+            if (!(w instanceof mod.deque)) {
+                if (op === "Eq") {
+                    return false;
+                } else if (op === "NotEq") {
+                    return true;
+                }
+                return Sk.builtin.NotImplemented.NotImplemented$;
+            }
+            return new Sk.builtin.list(this.toArray$()).tp$richcompare(new Sk.builtin.list(w.toArray$()), op);
+        };
+
+        mod.deque.prototype.nb$add = function (other) {
+            var ret;
+            if (!(other instanceof mod.deque)) {
+                throw new Sk.builtin.TypeError("can only concatenate deque (not \"" + Sk.abstr.typeName(other) + "\") to deque");
+            }
+            ret = new mod.deque(this, this.maxlen === null ? undefined : new Sk.builtin.int_(this.maxlen));
+            ret.extend$(other);
+            return ret;
+        };
+
+        mod.deque.prototype.nb$inplace_add = function (other) {
+            this.extend$(other);
+            return this;
+        };
+
+        mod.deque.prototype.tp$iter = function () {
+            return new mod.deque.iter_(this, false);
+        };
+
+        mod.deque.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+            return self.tp$iter();
+        });
+
+        mod.deque.prototype["__reversed__"] = new Sk.builtin.func(function (self) {
+            return new mod.deque.iter_(self, true);
+        });
+
+        mod.deque.prototype["append"] = new Sk.builtin.func(function (self, x) {
+            Sk.builtin.pyCheckArgsLen("append", arguments.length, 2, 2);
+            self.append$(x);
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["appendleft"] = new Sk.builtin.func(function (self, x) {
+            Sk.builtin.pyCheckArgsLen("appendleft", arguments.length, 2, 2);
+            self.appendleft$(x);
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["extend"] = new Sk.builtin.func(function (self, iterable) {
+            Sk.builtin.pyCheckArgsLen("extend", arguments.length, 2, 2);
+            self.extend$(iterable);
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["extendleft"] = new Sk.builtin.func(function (self, iterable) {
+            Sk.builtin.pyCheckArgsLen("extendleft", arguments.length, 2, 2);
+            self.extend$(iterable, true);
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["pop"] = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("pop", arguments.length, 1, 1);
+            if (self.$size === 0) {
+                throw new Sk.builtin.IndexError("pop from an empty deque");
+            }
+            self.$state++;
+            return self.pop$();
+        });
+
+        mod.deque.prototype["popleft"] = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("popleft", arguments.length, 1, 1);
+            if (self.$size === 0) {
+                throw new Sk.builtin.IndexError("pop from an empty deque");
+            }
+            self.$state++;
+            return self.popleft$();
+        });
+
+        mod.deque.prototype["clear"] = new Sk.builtin.func(function (self) {
+            Sk.builtin.pyCheckArgsLen("clear", arguments.length, 1, 1);
+            self.$state++;
+            self.$buf = new Array(8);
+            self.$mask = 7;
+            self.$head = 0;
+            self.$size = 0;
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["rotate"] = new Sk.builtin.func(function (self, n) {
+            var size = self.$size;
+            var k;
+
+            Sk.builtin.pyCheckArgsLen("rotate", arguments.length, 1, 2);
+            n = n === undefined ? 1 : Sk.misceval.asIndex(n);
+            if (size <= 1) {
+                return Sk.builtin.none.none$;
+            }
+            self.$state++;
+
+            // rotating right by n is rotating left by size - n; do the
+            // shorter of the two
+            n = ((n % size) + size) % size;
+            if (n === 0) {
+                return Sk.builtin.none.none$;
+            }
+            if (size === self.$buf.length) {
+                self.$head = (self.$head - n) & self.$mask;
+            } else if (n <= size / 2) {
+                for (k = 0; k < n; k++) {
+                    self.pushleft$(self.pop$());
+                }
+            } else {
+                for (k = 0; k < size - n; k++) {
+                    self.push$(self.popleft$());
+                }
+            }
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["reverse"] = new Sk.builtin.func(function (self) {
+            var i, j, a, b, t;
+            Sk.builtin.pyCheckArgsLen("reverse", arguments.length, 1, 1);
+            self.$state++;
+            for (i = 0, j = self.$size - 1; i < j; i++, j--) {
+                a = (self.$head + i) & self.$mask;
+                b = (self.$head + j) & self.$mask;
+                t = self.$buf[a];
+                self.$buf[a] = self.$buf[b];
+                self.$buf[b] = t;
+            }
+            return Sk.builtin.none.none$;
+        });
+
+        mod.deque.prototype["count"] = new Sk.builtin.func(function (self, x) {
+            var i;
+            var count = 0;
+            Sk.builtin.pyCheckArgsLen("count", arguments.length, 2, 2);
+            for (i = 0; i < self.$size; i++) {
+                if (Sk.misceval.richCompareBool(self.$buf[(self.$head + i) & self.$mask], x, "Eq")) {
+                    count++;
+                }
+            }
+            return new Sk.builtin.int_(count);
+        });
+
+        mod.deque.prototype["remove"] = new Sk.builtin.func(function (self, x) {
+            var i;
+            var state = self.$state;
+            Sk.builtin.pyCheckArgsLen("remove", arguments.length, 2, 2);
+            for (i = 0; i < self.$size; i++) {
+                if (Sk.misceval.richCompareBool(self.$buf[(self.$head + i) & self.$mask], x, "Eq")) {
+                    if (state !== self.$state) {
+                        throw new Sk.builtin.IndexError("deque mutated during remove().");
+                    }
+                    self.remove$(i);
+                    return Sk.builtin.none.none$;
+                }
+            }
+            throw new Sk.builtin.ValueError("deque.remove(x): x not in deque");
+        });
+
+        mod.deque.prototype["__copy__"] = new Sk.builtin.func(function (self) {
+            return new mod.deque(self, self.maxlen === null ? undefined : new Sk.builtin.int_(self.maxlen));
+        });
+        mod.deque.prototype["copy"] = mod.deque.prototype["__copy__"];
+
+        /**
+         * @constructor
+         * @param {Object} dq
+         * @param {boolean} reversed
+         */
+        mod.deque.iter_ = function (dq, reversed) {
+            if (!(this instanceof mod.deque.iter_)) {
+                return new mod.deque.iter_(dq, reversed);
+            }
+            this.$obj = dq;
+            this.$index = 0;
+            this.$reversed = reversed;
+            this.$state = dq.$state;
+            return this;
+        };
+
+        Sk.abstr.setUpInheritance("deque_iterator", mod.deque.iter_, Sk.builtin.object);
+
+        mod.deque.iter_.prototype.tp$iter = function () {
+            return this;
+        };
+
+        mod.deque.iter_.prototype.tp$iternext = function () {
+            var dq = this.$obj;
+            var i;
+            if (dq.$state !== this.$state) {
+                throw new Sk.builtin.RuntimeError("deque mutated during iteration");
+            }
+            if (this.$index >= dq.$size) {
+                return undefined;
+            }
+            i = this.$reversed ? dq.$size - 1 - this.$index : this.$index;
+            this.$index++;
+            return dq.$buf[(dq.$head + i) & dq.$mask];
+        };
+
+        mod.deque.iter_.prototype["__iter__"] = new Sk.builtin.func(function (self) {
+            return self;
+        });
+
+        mod.deque.iter_.prototype[Sk.__future__.dunder_next ? "__next__" : "next"] = new Sk.builtin.func(function (self) {
+            var ret = self.tp$iternext();
+            if (ret === undefined) {
+                throw new Sk.builtin.StopIteration();
+            }
+            return ret;
+        });
+
         // namedtuple
         mod.namedtuples = {};
         // should cover most things.  Does not:
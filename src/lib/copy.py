@@ -57,13 +57,48 @@ def _copy_inst(x):
     if hasattr(x, '__getstate__'):
         state = x.__getstate__()
     else:
-        state = x.__dict__
+        state = _getstate(x)
     if hasattr(y, '__setstate__'):
         y.__setstate__(state)
     else:
-        y.__dict__.update(state)
+        _setstate(y, state)
     return y
 
+def _slotnames(cls):
+    """The names of the __slots__ of cls and its bases, as attributes."""
+    names = []
+    for c in cls.__mro__:
+        slots = getattr(c, "__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = '_%s%s' % (c.__name__.lstrip('_'), name)
+            if name not in names:
+                names.append(name)
+    return names
+
+def _getstate(x):
+    state = getattr(x, "__dict__", None)
+    slotstate = {}
+    if hasattr(type(x), "__mro__"):
+        for name in _slotnames(type(x)):
+            if hasattr(x, name):
+                slotstate[name] = getattr(x, name)
+    if slotstate:
+        return (state, slotstate)
+    return state
+
+def _setstate(y, state):
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slotstate = state
+        for key, value in slotstate.items():
+            setattr(y, key, value)
+    if state is not None:
+        y.__dict__.update(state)
+
 d = _deepcopy_dispatch = {}
 
 def deepcopy(x, memo=None, _nil=[]):
@@ -198,12 +233,12 @@ def _deepcopy_inst(x, memo):
     if hasattr(x, '__getstate__'):
         state = x.__getstate__()
     else:
-        state = x.__dict__
+        state = _getstate(x)
     state = deepcopy(state, memo)
     if hasattr(y, '__setstate__'):
         y.__setstate__(state)
     else:
-        y.__dict__.update(state)
+        _setstate(y, state)
         return y
 d["InstanceType"] = _deepcopy_inst
 
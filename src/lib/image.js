@@ -211,7 +211,7 @@ $builtinmodule = function (name) {
                         self.lastx = x;
                         self.lasty = y;
                         if (self.delay > 0) {
-                            window.setTimeout(resolve, self.delay);
+                            Sk.timer.schedule(self.delay, resolve);
                         } else {
                             resolve();
                         }
@@ -355,9 +355,9 @@ $builtinmodule = function (name) {
                     ctx.putImageData(self.imagedata, ulx, uly);
 
                     if (self.delay > 0) {
-                        window.setTimeout(resolve, self.delay);
+                        Sk.timer.schedule(self.delay, resolve);
                     } else {
-                        window.setTimeout(resolve, 200);
+                        Sk.timer.schedule(200, resolve);
                     }
                 })
             };
@@ -1 +1,5 @@
-raise NotImplementedError("profile is not yet implemented in Skulpt")
+"""Skulpt has one profiler, see cProfile."""
+
+from cProfile import run, runctx, Profile
+
+__all__ = ["run", "runctx", "Profile"]
@@ -1 +1,260 @@
-raise NotImplementedError("pstats is not yet implemented in Skulpt")
+"""Sort and print the statistics of a cProfile.Profile."""
+
+import sys
+
+__all__ = ["Stats"]
+
+
+class Stats(object):
+    """Stats(profile, ..., stream=sys.stdout)
+
+    Collects the statistics of one or more profiles, which can then be
+    sorted with sort_stats() and printed with print_stats(),
+    print_callers() and print_callees().
+    """
+
+    # key: ((fields of the sort tuple, ascending?)..., description)
+    sort_arg_dict_default = {
+        "calls": (((1, -1),), "call count"),
+        "ncalls": (((1, -1),), "call count"),
+        "cumtime": (((3, -1),), "cumulative time"),
+        "cumulative": (((3, -1),), "cumulative time"),
+        "filename": (((4, 1),), "file name"),
+        "file": (((4, 1),), "file name"),
+        "module": (((4, 1),), "file name"),
+        "line": (((5, 1),), "line number"),
+        "name": (((6, 1),), "function name"),
+        "nfl": (((6, 1), (4, 1), (5, 1)), "name/file/line"),
+        "pcalls": (((0, -1),), "primitive call count"),
+        "stdname": (((7, 1),), "standard name"),
+        "time": (((2, -1),), "internal time"),
+        "tottime": (((2, -1),), "internal time"),
+    }
+
+    def __init__(self, *args, **kwds):
+        self.stream = kwds.get("stream", None) or sys.stdout
+        self.stats = {}
+        self.total_calls = 0
+        self.prim_calls = 0
+        self.total_tt = 0
+        self.top_level = set()
+        self.fcn_list = None
+        self.sort_type = None
+        self.all_callees = None
+        self.add(*args)
+
+    def add(self, *args):
+        for arg in args:
+            if isinstance(arg, Stats):
+                stats = arg.stats
+            else:
+                arg.create_stats()
+                stats = arg.stats
+            for func, (cc, nc, tt, ct, callers) in stats.items():
+                if func in self.stats:
+                    old_cc, old_nc, old_tt, old_ct, old_callers = self.stats[func]
+                    callers = add_callers(old_callers, callers)
+                    cc, nc, tt, ct = old_cc + cc, old_nc + nc, old_tt + tt, old_ct + ct
+                self.stats[func] = (cc, nc, tt, ct, callers)
+        self.get_top_level_stats()
+        self.fcn_list = None
+        self.all_callees = None
+        return self
+
+    def get_top_level_stats(self):
+        """Sum up the totals, and collect the functions no profiled
+        function called into top_level."""
+        self.total_calls = 0
+        self.prim_calls = 0
+        self.total_tt = 0
+        self.top_level = set()
+        for func, (cc, nc, tt, ct, callers) in self.stats.items():
+            self.total_calls += nc
+            self.prim_calls += cc
+            self.total_tt += tt
+            if not callers:
+                self.top_level.add(func)
+
+    def strip_dirs(self):
+        stats = {}
+        for func, (cc, nc, tt, ct, callers) in self.stats.items():
+            new_callers = {}
+            for caller, value in callers.items():
+                new_callers[func_strip_path(caller)] = value
+            stats[func_strip_path(func)] = (cc, nc, tt, ct, new_callers)
+        self.stats = stats
+        self.get_top_level_stats()
+        self.fcn_list = None
+        self.all_callees = None
+        return self
+
+    def sort_stats(self, *field):
+        if not field:
+            self.fcn_list = None
+            return self
+        if len(field) == 1 and isinstance(field[0], int):
+            # the old numeric arguments
+            field = {-1: ("stdname",), 0: ("calls",), 1: ("time",), 2: ("cumulative",)}[field[0]]
+
+        sort_tuple = ()
+        descriptions = []
+        for word in field:
+            if word not in self.sort_arg_dict_default:
+                raise KeyError("Unknown sort key: %s" % word)
+            keys, description = self.sort_arg_dict_default[word]
+            sort_tuple = sort_tuple + keys
+            descriptions.append(description)
+        self.sort_type = ", ".join(descriptions)
+
+        def key(func):
+            cc, nc, tt, ct, callers = self.stats[func]
+            values = (cc, nc, tt, ct, func[0], func[1], func[2], func_std_string(func))
+            ret = []
+            for index, direction in sort_tuple:
+                value = values[index]
+                if direction < 0:
+                    value = Reverse(value)
+                ret.append(value)
+            return tuple(ret)
+
+        self.fcn_list = sorted(self.stats.keys(), key=key)
+        return self
+
+    def reverse_order(self):
+        if self.fcn_list:
+            self.fcn_list.reverse()
+        return self
+
+    def get_sort_arg_defs(self):
+        return self.sort_arg_dict_default
+
+    def _select(self, restrictions):
+        if self.fcn_list:
+            selection = self.fcn_list[:]
+            msg = "   Ordered by: " + self.sort_type + "\n"
+        else:
+            selection = list(self.stats.keys())
+            msg = "   Random listing order was used\n"
+        for selector in restrictions:
+            old = len(selection)
+            if isinstance(selector, int):
+                selection = selection[:selector]
+            elif isinstance(selector, float) and 0.0 <= selector < 1.0:
+                selection = selection[:int(len(selection) * selector + 0.5)]
+            else:
+                selection = [func for func in selection if selector in func_std_string(func)]
+            if len(selection) != old:
+                msg += "   List reduced from %d to %d due to restriction <%s>\n" % (old, len(selection), repr(selector))
+        return msg, selection
+
+    def print_stats(self, *amount):
+        write = self.stream.write
+        if self.total_calls != self.prim_calls:
+            write("         %d function calls (%d primitive calls) in %.3f seconds\n\n"
+                  % (self.total_calls, self.prim_calls, self.total_tt))
+        else:
+            write("         %d function calls in %.3f seconds\n\n" % (self.total_calls, self.total_tt))
+        msg, selection = self._select(amount)
+        write(msg + "\n")
+        if selection:
+            write("   ncalls  tottime  percall  cumtime  percall filename:lineno(function)\n")
+            for func in selection:
+                self.print_line(func)
+            write("\n")
+        return self
+
+    def print_line(self, func):
+        cc, nc, tt, ct, callers = self.stats[func]
+        c = str(nc)
+        if nc != cc:
+            c = c + "/" + str(cc)
+        self.stream.write(c.rjust(9) + " " + f8(tt) + " " + f8(tt / nc if nc else 0) + " " +
+                          f8(ct) + " " + f8(ct / cc if cc else 0) + " " + func_std_string(func) + "\n")
+
+    def calc_callees(self):
+        if self.all_callees is not None:
+            return
+        self.all_callees = {}
+        for func, (cc, nc, tt, ct, callers) in self.stats.items():
+            if func not in self.all_callees:
+                self.all_callees[func] = {}
+            for caller, value in callers.items():
+                if caller not in self.all_callees:
+                    self.all_callees[caller] = {}
+                self.all_callees[caller][func] = value
+
+    def print_callers(self, *amount):
+        msg, selection = self._select(amount)
+        if selection:
+            self.stream.write(msg + "\n")
+            self.stream.write("Function".ljust(40) + "  was called by...\n")
+            for func in selection:
+                cc, nc, tt, ct, callers = self.stats[func]
+                self._print_call_line(func, "<-", callers)
+            self.stream.write("\n")
+        return self
+
+    def print_callees(self, *amount):
+        msg, selection = self._select(amount)
+        if selection:
+            self.calc_callees()
+            self.stream.write(msg + "\n")
+            self.stream.write("Function".ljust(40) + "  called...\n")
+            for func in selection:
+                self._print_call_line(func, "->", self.all_callees.get(func, {}))
+            self.stream.write("\n")
+        return self
+
+    def _print_call_line(self, func, arrow, calls):
+        write = self.stream.write
+        write(func_std_string(func).ljust(40) + " " + arrow)
+        if not calls:
+            write("\n")
+            return
+        first = True
+        for other in sorted(calls.keys()):
+            nc, cc, tt, ct = calls[other]
+            indent = " " if first else " " * 44
+            write("%s%s  %s  %s  %s\n" % (indent, str(nc).rjust(5), f8(tt), f8(ct), func_std_string(other)))
+            first = False
+
+
+class Reverse(object):
+    """Wraps a value to sort in descending order."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __gt__(self, other):
+        return other.value > self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def func_strip_path(func):
+    filename, line, name = func
+    return filename.split("/")[-1], line, name
+
+
+def func_std_string(func):
+    return "%s:%d(%s)" % func
+
+
+def add_callers(target, source):
+    new_callers = {}
+    for func, value in target.items():
+        new_callers[func] = value
+    for func, value in source.items():
+        if func in new_callers:
+            old = new_callers[func]
+            value = tuple([a + b for a, b in zip(value, old)])
+        new_callers[func] = value
+    return new_callers
+
+
+def f8(x):
+    return ("%8.3f" % x)
@@ -55,29 +55,17 @@ var $builtinmodule = function (name) {
      */    
     mod.pause = new Sk.builtin.func(function () {
         Sk.builtin.pyCheckArgsLen("pause", arguments.length, 0, 0);
-        var susp = new Sk.misceval.Suspension();
-        susp.resume = function () {
+        if (Sk.signals == null || !Sk.signals.addEventListener) {
+            console.warn('signal.pause() not supported');
+            Sk.misceval.print_('signal.pause() not supported');
+            // if signal has not been configured, just resume immediatelly
             return Sk.builtin.none.none$;
-        };
-        susp.data = {
-            type: "Sk.promise",
-            promise: new Promise(function (resolve, reject) {
-                if (Sk.signals != null && Sk.signals.addEventListener) {
-                    // Define handler here, in order to remove it later
-                    function handleSignal (signal) {
-                        Sk.signals.removeEventListener(handleSignal);
-                        resolve();
-                    }
-                    Sk.signals.addEventListener(handleSignal);
-                } else {
-                    console.warn('signal.pause() not supported');
-                    Sk.misceval.print_('signal.pause() not supported')
-                    // if signal has not been configured, just resume immediatelly
-                    resolve();
-                }
-            })
-        };
-        return susp;
+        }
+        // the signal comes through the timer service, with the wakeups
+        // that are due at the same time
+        return Sk.misceval.chain(Sk.misceval.promiseToSuspension(Sk.timer.nextSignal()), function () {
+            return Sk.builtin.none.none$;
+        });
     });
 
     mod.signal = new Sk.builtin.func(function () {
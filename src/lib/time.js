@@ -45,26 +45,39 @@ var $builtinmodule = function (name) {
         return true;
     }
 
+    // The clocks are those of Sk.timer, which Sk.configure({timeScale}) can
+    // fast-forward
     mod.time = new Sk.builtin.func(function () {
         Sk.builtin.pyCheckArgsLen("time", arguments.length, 0, 0);
-        var res = Date.now();
-        if (this.performance && this.performance.now)
-        {
-            res = res + performance.now() % 1;
-        }
-        return Sk.builtin.assk$(res / 1000, undefined);
+        return Sk.builtin.assk$(Sk.timer.wallNow() / 1000, undefined);
     });
 
-    // This is an experimental implementation of time.sleep(), using suspensions
+    mod.monotonic = new Sk.builtin.func(function () {
+        Sk.builtin.pyCheckArgsLen("monotonic", arguments.length, 0, 0);
+        return new Sk.builtin.float_(Sk.timer.now() / 1000);
+    });
+
+    // time.sleep(), using suspensions. A wakeup that comes late is made up
+    // for on the next sleep of the program (Sk.sleepDebt), so that a loop
+    // that sleeps to keep its pace does not drift. The time the program
+    // runs in between counts against the debt, so a sleep that comes after
+    // other work is not cut short.
     mod.sleep = new Sk.builtin.func(function(delay) {
+        var ms, debt;
+
         Sk.builtin.pyCheckArgsLen("sleep", arguments.length, 1, 1);
         Sk.builtin.pyCheckType("delay", "float", Sk.builtin.checkNumber(delay));
 
-        return new Sk.misceval.promiseToSuspension(new Promise(function(resolve) {
-            Sk.setTimeout(function() {
-                resolve(Sk.builtin.none.none$);
-            }, Sk.ffi.remapToJs(delay)*1000);
-        }));
+        ms = Sk.ffi.remapToJs(delay) * 1000;
+        if (ms < 0) {
+            throw new Sk.builtin.ValueError("sleep length must be non-negative");
+        }
+        debt = Math.min(Math.max(0, Sk.sleepDebt - (Sk.timer.now() - Sk.sleepResumed)), ms);
+        return Sk.misceval.chain(Sk.misceval.promiseToSuspension(Sk.timer.sleep(ms - debt)), function (at) {
+            Sk.sleepResumed = Sk.timer.now();
+            Sk.sleepDebt = Sk.sleepResumed - at;
+            return Sk.builtin.none.none$;
+        });
     });
 
     function padLeft(str, l, c) {
@@ -265,14 +278,7 @@ var $builtinmodule = function (name) {
     mod.accept2dyear = Sk.builtin.assk$(1, Sk.builtin.nmber.int$);
 
     mod.clock = new Sk.builtin.func(function() {
-        var res = 0.0;
-        if (this.performance && this.performance.now)
-        {
-            res = performance.now() / 1000;
-        } else {
-            res = new Date().getTime() / 1000;
-        }
-        return new Sk.builtin.float_(res);
+        return new Sk.builtin.float_(Sk.timer.now() / 1000);
     });
 
     function strftime_f(format, t) {
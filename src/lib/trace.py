@@ -1 +1,137 @@
-raise NotImplementedError("trace is not yet implemented in Skulpt")
+"""Count how many times each line of a program runs.
+
+Only counting is supported, and only code compiled with the lineCounts
+option of Sk.configure is counted; run the program with it on to use this
+module. Reports go to sys.stdout as Skulpt cannot write .cover files.
+
+    tracer = trace.Trace(count=1, trace=0)
+    tracer.run("main()")
+    tracer.results().write_results(show_missing=True, summary=True)
+"""
+
+import sys
+import _trace
+
+__all__ = ["Trace", "CoverageResults"]
+
+
+class CoverageResults(object):
+    def __init__(self, counts=None, calledfuncs=None, infile=None, callers=None, outfile=None):
+        self.counts = counts or {}
+        self.calledfuncs = calledfuncs or {}
+        self.callers = callers or {}
+        self.outfile = outfile
+
+    def update(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+
+    def json(self):
+        """All the line counts so far as JSON, see Sk.lineCountsJSON."""
+        return _trace.json()
+
+    def write_results(self, show_missing=True, summary=False, coverdir=None):
+        """Print each counted file the way the .cover files of CPython are
+        written: the count of each line that ran, and >>>>>> before the
+        lines that never did if show_missing."""
+        per_file = {}
+        for filename, lineno in self.counts:
+            if filename not in per_file:
+                per_file[filename] = {}
+            per_file[filename][lineno] = self.counts[(filename, lineno)]
+
+        sums = []
+        for filename in sorted(per_file.keys()):
+            source = _trace.source(filename)
+            if source is None:
+                continue
+            n_hits, n_lines = self.write_results_file(filename, source.split("\n"),
+                                                      _trace.lines(filename),
+                                                      per_file[filename], show_missing)
+            if n_lines:
+                sums.append((n_lines, int(100 * n_hits / n_lines), filename))
+
+        if summary and sums:
+            sys.stdout.write("lines   cov%   module   (path)\n")
+            for n_lines, percent, filename in sums:
+                modulename = filename.split("/")[-1]
+                if modulename.endswith(".py"):
+                    modulename = modulename[:-3]
+                sys.stdout.write("%5d   %3d%%   %s   (%s)\n" % (n_lines, percent, modulename, filename))
+
+    def write_results_file(self, path, lines, lnotab, lines_hit, show_missing=True):
+        write = sys.stdout.write
+        n_hits = 0
+        n_lines = 0
+        write("--- " + path + "\n")
+        for i in range(len(lines)):
+            lineno = i + 1
+            line = lines[i]
+            if lineno in lines_hit:
+                write("%5d: %s\n" % (lines_hit[lineno], line))
+                n_hits += 1
+                n_lines += 1
+            elif lineno in lnotab:
+                if show_missing:
+                    write(">>>>>> %s\n" % line)
+                else:
+                    write("       %s\n" % line)
+                n_lines += 1
+            else:
+                write("       %s\n" % line)
+        return n_hits, n_lines
+
+
+class Trace(object):
+    def __init__(self, count=1, trace=0, countfuncs=0, countcallers=0,
+                 ignoremods=(), ignoredirs=(), infile=None, outfile=None, timing=False):
+        if trace or countfuncs or countcallers:
+            raise NotImplementedError("only counting lines is supported in Skulpt")
+        if not _trace.enabled():
+            raise RuntimeError("line counts are not enabled, see the lineCounts option of Sk.configure")
+        self.ignoremods = ignoremods
+        self.ignoredirs = ignoredirs
+        self.outfile = outfile
+        self.counts = {}
+
+    def run(self, cmd):
+        self.runctx(cmd)
+
+    def runctx(self, cmd, globals=None, locals=None):
+        before = _trace.counts()
+        try:
+            _trace._exec(cmd, globals)
+        finally:
+            self._collect(before)
+
+    def runfunc(self, func, *args, **kw):
+        before = _trace.counts()
+        try:
+            return func(*args, **kw)
+        finally:
+            self._collect(before)
+
+    def _ignored(self, filename):
+        # the lines of this module run by runctx and runfunc are not the
+        # program's
+        if filename == __file__:
+            return True
+        modulename = filename.split("/")[-1]
+        if modulename.endswith(".py"):
+            modulename = modulename[:-3]
+        if modulename in self.ignoremods:
+            return True
+        for d in self.ignoredirs:
+            if filename.startswith(d):
+                return True
+        return False
+
+    def _collect(self, before):
+        after = _trace.counts()
+        for key, count in after.items():
+            count -= before.get(key, 0)
+            if count > 0 and not self._ignored(key[0]):
+                self.counts[key] = self.counts.get(key, 0) + count
+
+    def results(self):
+        return CoverageResults(dict(self.counts), outfile=self.outfile)
@@ -205,9 +205,9 @@ function generateTurtleModule(_target) {
             }
 
             return function(method) {
-                _frameRequestTimeout = window.setTimeout(
-                    method,
-                    delay || OPTIMAL_FRAME_RATE
+                _frameRequestTimeout = Sk.timer.schedule(
+                    delay || OPTIMAL_FRAME_RATE,
+                    method
                 );
                  return _frameRequestTimeout;
             };
@@ -1230,7 +1230,7 @@ function generateTurtleModule(_target) {
             }
 
             if (this._timer) {
-                window.clearTimeout(this._timer);
+                Sk.timer.cancel(this._timer);
                 this._timer = undefined;
             }
 
@@ -1563,12 +1563,12 @@ function generateTurtleModule(_target) {
 
         proto.$ontimer = function(method, interval) {
             if (this._timer) {
-                window.clearTimeout(this._timer);
+                Sk.timer.cancel(this._timer);
                 this._timer = undefined;
             }
 
             if (method && typeof interval === "number") {
-                this._timer = window.setTimeout(method, Math.max(0, interval|0));
+                this._timer = Sk.timer.schedule(Math.max(0, interval|0), method);
             }
         };
         proto.$ontimer.minArgs = 0;
@@ -1653,7 +1653,7 @@ function generateTurtleModule(_target) {
             _frameRequest = undefined;
         }
         if (_frameRequestTimeout) {
-            window.clearTimeout(_frameRequestTimeout);
+            Sk.timer.cancel(_frameRequestTimeout);
             _frameRequestTimeout = undefined;
         }
     }
@@ -1,28 +1,282 @@
 var $builtinmodule = function (name) {
     var request = {};
 
+    // GET responses kept by URL, oldest first, see Sk.urlCacheSize
+    var cache = new Map();
+
+
+    //~ Transports ..............................................................
+
+    // A transport is given {url, method, headers, body, timeout} and returns
+    // (a Promise of) {status, reason, url, headers, read}, where read()
+    // returns (a Promise of) the next chunk of the body, "" at the end.
+    // Sk.configure({urlTransport: ...}) replaces the default one below.
+
+    // Number of characters in the chunks of a data: URL
+    var CHUNK_SIZE = 65536;
+
+    // data: URLs are decoded here rather than fetched, so they work the same
+    // everywhere, without a network
+    var dataTransport = function (req) {
+        var comma = req.url.indexOf(",");
+        var meta, body, pos;
+
+        if (comma === -1) {
+            throw new Sk.builtin.IOError("<urlopen error malformed data URL>");
+        }
+        meta = req.url.substring(5, comma);
+        body = decodeURIComponent(req.url.substring(comma + 1));
+        if (/;base64$/.test(meta)) {
+            body = atob(body);
+            meta = meta.slice(0, -7);
+        }
+        pos = 0;
+        return {
+            status : 200,
+            reason : "OK",
+            url    : req.url,
+            headers: {"content-type": meta || "text/plain;charset=US-ASCII", "content-length": String(body.length)},
+            read   : function () {
+                var chunk = body.substr(pos, CHUNK_SIZE);
+                pos += chunk.length;
+                return chunk;
+            }
+        };
+    };
+
+    // fetch streams the body as it arrives, and reuses the connections of
+    // the browser (or Node) between requests
+    var fetchTransport = function (req) {
+        var init = {method: req.method, headers: req.headers};
+        var timer;
+
+        if (req.body !== null) {
+            init.body = req.body;
+        }
+        if (req.timeout !== null && typeof AbortController === "function") {
+            init.signal = (function () {
+                var controller = new AbortController();
+                timer = setTimeout(function () {
+                    controller.abort();
+                }, req.timeout);
+                return controller.signal;
+            })();
+        }
+
+        return fetch(req.url, init).then(function (resp) {
+            var headers = {};
+            var reader = resp.body ? resp.body.getReader() : null;
+            var decoder = new TextDecoder();
+            var done = reader === null;
+
+            var read = function () {
+                if (done) {
+                    clearTimeout(timer);
+                    return "";
+                }
+                return reader.read().then(function (r) {
+                    var text;
+                    if (r.done) {
+                        done = true;
+                        return decoder.decode();
+                    }
+                    text = decoder.decode(r.value, {stream: true});
+                    // a chunk that ends inside a character decodes to ""
+                    // until the rest of it arrives
+                    return text === "" ? read() : text;
+                });
+            };
+
+            resp.headers.forEach(function (value, key) {
+                headers[key] = value;
+            });
+            return {
+                status : resp.status,
+                reason : resp.statusText,
+                url    : resp.url || req.url,
+                headers: headers,
+                read   : read
+            };
+        });
+    };
+
+    var xhrTransport = function (req) {
+        return new Promise(function (resolve, reject) {
+            var xmlhttp = new XMLHttpRequest();
+            var key;
+
+            xmlhttp.addEventListener("load", function () {
+                var headers = {};
+                var sent = false;
+                xmlhttp.getAllResponseHeaders().split("\r\n").forEach(function (line) {
+                    var colon = line.indexOf(":");
+                    if (colon > 0) {
+                        headers[line.substring(0, colon).trim().toLowerCase()] = line.substring(colon + 1).trim();
+                    }
+                });
+                resolve({
+                    status : xmlhttp.status,
+                    reason : xmlhttp.statusText,
+                    url    : xmlhttp.responseURL || req.url,
+                    headers: headers,
+                    read   : function () {
+                        if (sent) {
+                            return "";
+                        }
+                        sent = true;
+                        return xmlhttp.responseText;
+                    }
+                });
+            });
+            xmlhttp.addEventListener("error", function () {
+                reject(new Error("network error"));
+            });
+            xmlhttp.addEventListener("timeout", function () {
+                reject(new Error("timed out"));
+            });
+
+            xmlhttp.open(req.method, req.url);
+            for (key in req.headers) {
+                if (req.headers.hasOwnProperty(key)) {
+                    xmlhttp.setRequestHeader(key, req.headers[key]);
+                }
+            }
+            if (req.timeout !== null) {
+                xmlhttp.timeout = req.timeout;
+            }
+            xmlhttp.send(req.body);
+        });
+    };
+
+    var urlError = function (e) {
+        if (e instanceof Sk.builtin.BaseException) {
+            return e;
+        }
+        return new Sk.builtin.IOError("<urlopen error " + (e.message || e) + ">");
+    };
+
+    // Suspends until promise settles, with the errors of the transport
+    // turned into IOError
+    var suspend = function (promise) {
+        return Sk.misceval.promiseToSuspension(promise.catch(function (e) {
+            throw urlError(e);
+        }));
+    };
+
+    var defaultTransport = function (req) {
+        if (/^data:/i.test(req.url)) {
+            return dataTransport(req);
+        } else if (typeof fetch === "function") {
+            return fetchTransport(req);
+        }
+        return xhrTransport(req);
+    };
+
 
     //~ Classes .................................................................
 
     // Response class
     //
-    // Response objects are returned by the request, get, post, etc.
-    // methods, allowing the user to access the response text, status
-    // code, and other information.
+    // Response objects are returned by urlopen. The body is read from the
+    // transport as the program asks for it, a chunk at a time, and only the
+    // part that was not read yet is kept.
+
+    /**
+     * Make sure the buffer of self holds n characters, or the rest of the
+     * body if it is shorter.
+     *
+     * @return {(undefined|Sk.misceval.Suspension)}
+     */
+    var fill = function (self, n) {
+        var chunk;
+
+        while (!self.eof$ && self.data$.length - self.pos$ < n) {
+            chunk = self.stream$.read();
+            if (chunk instanceof Promise) {
+                return Sk.misceval.chain(suspend(chunk), function (data) {
+                    append(self, data);
+                    return fill(self, n);
+                });
+            }
+            append(self, chunk);
+        }
+        return undefined;
+    };
+
+    var append = function (self, chunk) {
+        if (chunk === null || chunk === undefined || chunk.length === 0) {
+            self.eof$ = true;
+            if (self.cacheKey$ !== null) {
+                store(self.cacheKey$, {
+                    status : self.status$,
+                    reason : self.reason$,
+                    url    : self.url$,
+                    headers: self.headers$,
+                    body   : self.body$.join("")
+                });
+                self.body$ = null;
+            }
+            return;
+        }
+        if (self.body$ !== null) {
+            self.body$.push(chunk);
+        }
+        // drop what was read already
+        self.data$ = self.data$.substring(self.pos$) + chunk;
+        self.pos$ = 0;
+    };
+
+    // Read the next line, "" at the end. Returns the line or a Suspension.
+    var nextLine = function (self) {
+        // how far past pos$ there is no newline
+        var scanned = 0;
+
+        return (function scan () {
+            var idx, line, susp;
+
+            while (true) {
+                idx = self.data$.indexOf("\n", self.pos$ + scanned);
+                if (idx !== -1 || self.eof$) {
+                    break;
+                }
+                scanned = self.data$.length - self.pos$;
+                susp = fill(self, scanned + 1);
+                if (susp !== undefined) {
+                    return Sk.misceval.chain(susp, scan);
+                }
+            }
+
+            line = self.data$.substring(self.pos$, idx === -1 ? self.data$.length : idx + 1);
+            self.pos$ += line.length;
+            return line;
+        })();
+    };
+
+    var checkOpen = function (self) {
+        if (self.closed$) {
+            throw new Sk.builtin.ValueError("I/O operation on closed file");
+        }
+    };
 
     // ------------------------------------------------------------
     var response = function ($gbl, $loc) {
 
         // ------------------------------------------------------------
-        $loc.__init__ = new Sk.builtin.func(function (self, xhr) {
-            self.data$ = xhr.responseText;
-            self.lineList = self.data$.split("\n");
-            self.lineList = self.lineList.slice(0, -1);
-            for (var i = 0; i < self.lineList.length; i++) {
-                self.lineList[i] = self.lineList[i] + '\n';
-            }
-            self.currentLine = 0;
+        $loc.__init__ = new Sk.builtin.func(function (self, stream, cacheKey) {
+            self.stream$ = stream;
+            self.status$ = stream.status;
+            self.reason$ = stream.reason || "";
+            self.url$ = stream.url;
+            self.headers$ = stream.headers || {};
+            self.data$ = "";
             self.pos$ = 0;
+            self.eof$ = false;
+            self.closed$ = false;
+            // the body as it is read, to keep in the cache at the end
+            self.cacheKey$ = cacheKey || null;
+            self.body$ = self.cacheKey$ !== null ? [] : null;
+            Sk.abstr.sattr(self, new Sk.builtin.str("status"), new Sk.builtin.int_(self.status$));
+            Sk.abstr.sattr(self, new Sk.builtin.str("reason"), new Sk.builtin.str(self.reason$));
         });
 
 
@@ -34,114 +288,209 @@ var $builtinmodule = function (name) {
 
         // ------------------------------------------------------------
         $loc.__iter__ = new Sk.builtin.func(function (self) {
-            var allLines = self.lineList;
+            return self;
+        });
 
-            return Sk.builtin.makeGenerator(function () {
-                if (this.$index >= this.$lines.length) {
-                    return undefined;
+        $loc.next = $loc.__next__ = new Sk.builtin.func(function (self) {
+            checkOpen(self);
+            return Sk.misceval.chain(nextLine(self), function (line) {
+                if (line === "") {
+                    throw new Sk.builtin.StopIteration();
                 }
-                return new Sk.builtin.str(this.$lines[this.$index++]);
-            }, {
-                $obj  : self,
-                $index: 0,
-                $lines: allLines
+                return new Sk.builtin.str(line);
             });
         });
 
 
+        // ------------------------------------------------------------
+        $loc.__enter__ = new Sk.builtin.func(function (self) {
+            return self;
+        });
+
+        $loc.__exit__ = new Sk.builtin.func(function (self) {
+            self.closed$ = true;
+            return Sk.builtin.none.none$;
+        });
+
+        $loc.close = new Sk.builtin.func(function (self) {
+            self.closed$ = true;
+            return Sk.builtin.none.none$;
+        });
+
+
         // ------------------------------------------------------------
         $loc.read = new Sk.builtin.func(function (self, size) {
-            if (self.closed) {
-                throw new Sk.builtin.ValueError("I/O operation on closed file");
-            }
-            var len = self.data$.length;
-            if (size === undefined) {
-                size = len;
-            }
-            var ret = new Sk.builtin.str(self.data$.substr(self.pos$, size));
-            self.pos$ += size;
-            if (self.pos$ >= len) {
-                self.pos$ = len;
+            var n;
+
+            checkOpen(self);
+            n = size === undefined || size === Sk.builtin.none.none$ ? -1 : Sk.ffi.remapToJs(size);
+            if (n < 0) {
+                n = Infinity;
             }
-            return ret;
+            return Sk.misceval.chain(fill(self, n), function () {
+                var ret = self.data$.substr(self.pos$, n === Infinity ? undefined : n);
+                self.pos$ += ret.length;
+                return new Sk.builtin.str(ret);
+            });
         });
 
 
         // ------------------------------------------------------------
         $loc.readline = new Sk.builtin.func(function (self, size) {
-            var line = "";
-            if (self.currentLine < self.lineList.length) {
-                line = self.lineList[self.currentLine];
-                self.currentLine++;
-            }
-            return new Sk.builtin.str(line);
+            checkOpen(self);
+            return Sk.misceval.chain(nextLine(self), function (line) {
+                return new Sk.builtin.str(line);
+            });
         });
 
 
         // ------------------------------------------------------------
         $loc.readlines = new Sk.builtin.func(function (self, sizehint) {
             var arr = [];
-            for (var i = self.currentLine; i < self.lineList.length; i++) {
-                arr.push(new Sk.builtin.str(self.lineList[i]));
+
+            checkOpen(self);
+            return (function more (line) {
+                // lines already in the buffer are taken without a chain each
+                while (!(line instanceof Sk.misceval.Suspension)) {
+                    if (line === "") {
+                        return new Sk.builtin.list(arr);
+                    }
+                    if (line !== undefined) {
+                        arr.push(new Sk.builtin.str(line));
+                    }
+                    line = nextLine(self);
+                }
+                return Sk.misceval.chain(line, more);
+            })();
+        });
+
+
+        // ------------------------------------------------------------
+        $loc.geturl = new Sk.builtin.func(function (self) {
+            return new Sk.builtin.str(self.url$);
+        });
+
+        $loc.getcode = new Sk.builtin.func(function (self) {
+            return new Sk.builtin.int_(self.status$);
+        });
+
+        $loc.getheader = new Sk.builtin.func(function (self, name, dflt) {
+            var value = self.headers$[Sk.ffi.remapToJs(name).toLowerCase()];
+            if (value === undefined) {
+                return dflt === undefined ? Sk.builtin.none.none$ : dflt;
             }
-            return new Sk.builtin.list(arr);
+            return new Sk.builtin.str(value);
         });
 
+        $loc.getheaders = new Sk.builtin.func(function (self) {
+            var items = [];
+            var key;
+            for (key in self.headers$) {
+                if (self.headers$.hasOwnProperty(key)) {
+                    items.push(new Sk.builtin.tuple([new Sk.builtin.str(key), new Sk.builtin.str(self.headers$[key])]));
+                }
+            }
+            return new Sk.builtin.list(items);
+        });
     };
 
     request.Response =
         Sk.misceval.buildClass(request, response, 'Response', []);
 
 
+    //~ Cache ...................................................................
+
+    var store = function (key, entry) {
+        if (!(Sk.urlCacheSize > 0) || entry.status !== 200) {
+            return;
+        }
+        cache.delete(key);
+        cache.set(key, entry);
+        while (cache.size > Sk.urlCacheSize) {
+            cache.delete(cache.keys().next().value);
+        }
+    };
+
+    // a transport response that replays a cached one
+    var replay = function (entry) {
+        var sent = false;
+        return {
+            status : entry.status,
+            reason : entry.reason,
+            url    : entry.url,
+            headers: entry.headers,
+            read   : function () {
+                if (sent) {
+                    return "";
+                }
+                sent = true;
+                return entry.body;
+            }
+        };
+    };
+
+
     //~ Module functions ........................................................
 
     // ------------------------------------------------------------
     /**
-     * Constructs and sends a Request. Returns Response object.
-     *
-     * http://docs.python-requests.org/en/latest/api/#requests.request
+     * Opens url and returns a Response, from which the body is read as the
+     * program asks for it. The program is suspended while the request is
+     * made, so the page keeps running.
      *
-     * For now, this implementation doesn't actually construct a Request
-     * object; it just makes the request through jQuery.ajax and then
-     * constructs a Response.
+     * With data, the request is a POST of the (form encoded) data. timeout
+     * is in seconds.
      */
     request.urlopen = new Sk.builtin.func(function (url, data, timeout) {
-        var prom = new Promise(function(resolve, reject) {
-            var xmlhttp = new XMLHttpRequest();
+        var req, stream, entry, key, transport;
 
-            xmlhttp.addEventListener("loadend", function (e) {
-                resolve(Sk.misceval.callsimArray(request.Response, [xmlhttp]));
-            });
+        Sk.builtin.pyCheckArgsLen("urlopen", arguments.length, 1, 3);
+        if (!Sk.builtin.checkString(url)) {
+            throw new Sk.builtin.TypeError("url must be a string");
+        }
 
-            if (!data) {
-                xmlhttp.open("GET", url.v);
-                xmlhttp.send(null);
-            } else {
-                xmlhttp.open("POST", url.v);
-                xmlhttp.setRequestHeader("Content-type", "application/x-www-form-urlencoded");
-                xmlhttp.setRequestHeader("Content-length", data.v.length);
-                xmlhttp.send(data.v);
-            }
-        });
+        req = {
+            url    : url.v,
+            method : "GET",
+            headers: {},
+            body   : null,
+            timeout: null
+        };
+        if (data !== undefined && data !== Sk.builtin.none.none$) {
+            req.method = "POST";
+            req.headers["Content-Type"] = "application/x-www-form-urlencoded";
+            req.body = Sk.ffi.remapToJs(data);
+        }
+        if (timeout !== undefined && timeout !== Sk.builtin.none.none$) {
+            req.timeout = Sk.ffi.remapToJs(timeout) * 1000;
+        }
 
-        var susp = new Sk.misceval.Suspension();
+        if (req.method === "GET" && Sk.urlCacheSize > 0) {
+            key = req.url;
+            entry = cache.get(key);
+            if (entry !== undefined) {
+                // most recently used last
+                cache.delete(key);
+                cache.set(key, entry);
+                return Sk.misceval.callsimArray(request.Response, [replay(entry)]);
+            }
+        }
 
-        susp.resume = function() {
-            return resolution;
-        };
+        transport = Sk.urlTransport || defaultTransport;
+        try {
+            stream = transport(req);
+        } catch (e) {
+            throw urlError(e);
+        }
 
-        susp.data = {
-            type: "Sk.promise",
-            promise: prom.then(function(value) {
-                resolution = value;
-                return value;
-            }, function(err) {
-                resolution = "";
-                return err;
-            })
+        var open = function (s) {
+            return Sk.misceval.callsimArray(request.Response, key === undefined ? [s] : [s, key]);
         };
 
-        return susp;
+        if (stream instanceof Promise) {
+            return Sk.misceval.chain(suspend(stream), open);
+        }
+        return open(stream);
     });
 
 
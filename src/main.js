@@ -23,6 +23,7 @@ require("./fromcodepoint.js");
 require("./errors.js");
 require("./method.js");
 require("./misceval.js");
+require("./profiler.js");
 require("./seqtype.js");
 require("./list.js");
 require("./str.js");
@@ -57,8 +58,11 @@ require("./parser.js");
 require("../gen/astnodes.js");
 require("./ast.js");
 require("./symtable.js");
+require("./optimize.js");
 require("./compile.js");
 require("./import.js");
+require("./context.js");
+require("./timer.js");
 require("./timsort.js");
 require("./sorted.js");
 require("./typeobject.js");
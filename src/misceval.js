@@ -37,6 +37,28 @@ Sk.misceval.Suspension = function Suspension(resume, child, data) {
 };
 Sk.exportSymbol("Sk.misceval.Suspension", Sk.misceval.Suspension);
 
+/**
+ * The suspension of a frame of compiled code: scope is its function, and
+ * it suspended because child did. Resuming calls scope again (with the
+ * generator gen, if any), which picks up the frame the compiled code saved
+ * on the suspension.
+ *
+ * @param {Sk.misceval.Suspension} child
+ * @param {Function} scope
+ * @param {Object=} gen
+ */
+Sk.misceval.frameSuspension_ = function (child, scope, gen) {
+    var susp = new Sk.misceval.Suspension();
+    susp.child = child;
+    susp.data = child.data;
+    susp.optional = child.optional;
+    susp.resume = function () {
+        scope.$wakingSuspension = susp;
+        return gen === undefined ? scope() : scope(gen);
+    };
+    return susp;
+};
+
 /**
  *
  * Well this seems pretty obvious by the name what it should do..
@@ -170,15 +192,7 @@ Sk.misceval.arrayFromArguments = function (args) {
         return args;
     }
     arg = args[0];
-    if (arg instanceof Sk.builtin.set) {
-        // this is a Sk.builtin.set
-        arg = arg.tp$iter().$obj;
-    } else if (arg instanceof Sk.builtin.dict) {
-        // this is a Sk.builtin.list
-        arg = Sk.builtin.dict.prototype["keys"].func_code(arg);
-    }
 
-    // shouldn't else if here as the above may output lists to arg.
     if (arg instanceof Sk.builtin.list || arg instanceof Sk.builtin.tuple) {
         return arg.v;
     } else if (Sk.builtin.checkIterable(arg)) {
@@ -551,6 +565,28 @@ Sk.misceval.richCompareBool = function (v, w, op, canSuspend) {
 };
 Sk.exportSymbol("Sk.misceval.richCompareBool", Sk.misceval.richCompareBool);
 
+/**
+ * Membership test against a constant tuple whose elements all have the
+ * exact type keyType. The compiler hoists a set built from the tuple once,
+ * so a key of that same type is answered by a hash lookup; any other key
+ * falls back to searching the tuple, which keeps the comparison semantics
+ * of 'in' for subclasses, mixed numbers and unhashable values.
+ *
+ * @param {*} v the key
+ * @param {Sk.builtin.tuple} seq the constant tuple
+ * @param {Sk.builtin.set} lookup set of the elements of seq
+ * @param {Function} keyType exact type of every element of seq
+ * @param {boolean} negate true for 'not in'
+ * @param {boolean=} canSuspend
+ */
+Sk.misceval.constContains = function (v, seq, lookup, keyType, negate, canSuspend) {
+    if (v.constructor === keyType) {
+        return lookup.sq$contains(v) !== negate;
+    }
+    return Sk.misceval.richCompareBool(v, seq, negate ? "NotIn" : "In", canSuspend);
+};
+Sk.exportSymbol("Sk.misceval.constContains", Sk.misceval.constContains);
+
 Sk.misceval.objectRepr = function (v) {
     Sk.asserts.assert(v !== undefined, "trying to repr undefined");
     if ((v === null) || (v instanceof Sk.builtin.none)) {
@@ -692,6 +728,21 @@ Sk.misceval.print_ = function (x) {
 };
 Sk.exportSymbol("Sk.misceval.print_", Sk.misceval.print_);
 
+/**
+ * Show the value of an expression statement compiled in "single" mode, by
+ * calling sys.displayhook as the interactive interpreter does.
+ *
+ * @param {Object} value
+ * @param {boolean=} canSuspend
+ */
+Sk.misceval.displayhook = function (value, canSuspend) {
+    var r = Sk.misceval.chain(Sk.importModule("sys", false, canSuspend), function (sys) {
+        return Sk.misceval.callsimOrSuspendArray(sys["$d"]["displayhook"], [value]);
+    });
+    return canSuspend ? r : Sk.misceval.retryOptionalSuspensionOrThrow(r);
+};
+Sk.exportSymbol("Sk.misceval.displayhook", Sk.misceval.displayhook);
+
 /**
  * @param {string} name
  * @param {Object=} other generally globals
@@ -877,6 +928,10 @@ Sk.exportSymbol("Sk.misceval.callsimOrSuspend", Sk.misceval.callsimOrSuspend);
  */
 Sk.misceval.callsimOrSuspendArray = function (func, args) {
     var argarray = args ? args : [];
+    if (func instanceof Sk.builtin.func) {
+        // by far the most common callee, skip the checks of applyOrSuspend
+        return func.tp$call(argarray);
+    }
     return Sk.misceval.applyOrSuspend(func, undefined, undefined, undefined, argarray);
 };
 Sk.exportSymbol("Sk.misceval.callsimOrSuspendArray", Sk.misceval.callsimOrSuspendArray);
@@ -924,94 +979,145 @@ Sk.exportSymbol("Sk.misceval.apply", Sk.misceval.apply);
  * asyncToPromise() returns a Promise that will be resolved with the final
  * return value, or rejected with an exception if one is thrown.
  *
+ * Unhandled Sk.yield and Sk.delay suspensions are resumed straight away
+ * until the program has run for Sk.yieldSlice milliseconds, and only then
+ * is control handed back to the event loop, see Sk.misceval.schedulerStats.
+ *
+ * With a context, the program runs in that Sk.Context, and takes its turns
+ * from the Sk.Scheduler of the context if it has one, see context.js.
+ *
  * @param{function()} suspendablefn returns either a result or a Suspension
  * @param{Object=} suspHandlers an object map of suspension handlers
+ * @param{Sk.Context=} context the interpreter context to run in
  */
-Sk.misceval.asyncToPromise = function(suspendablefn, suspHandlers) {
+Sk.misceval.asyncToPromise = function(suspendablefn, suspHandlers, context) {
     return new Promise(function(resolve, reject) {
-        try {
-            var r = suspendablefn();
-
-            (function handleResponse (r) {
-                try {
-                    // jsh*nt insists these be defined outside the loop
-                    var resume = function() {
-                        try {
-                            handleResponse(r.resume());
-                        } catch (e) {
-                            reject(e);
-                        }
-                    };
-                    var resumeWithData = function resolved(x) {
-                        try {
-                            r.data["result"] = x;
-                            resume();
-                        } catch(e) {
-                            reject(e);
-                        }
-                    };
-                    var resumeWithError = function rejected(e) {
-                        try {
-                            r.data["error"] = e;
-                            resume();
-                        } catch(ex) {
-                            reject(ex);
-                        }
-                    };
-
-
-                    while (r instanceof Sk.misceval.Suspension) {
-
-                        var handler = suspHandlers && (suspHandlers[r.data["type"]] || suspHandlers["*"]);
+        var stats = Sk.misceval.schedulerStats;
+        var scheduler = context && context.scheduler;
+        var r; // the suspension being handled
+        var sliceStart;
+
+        // The handlers are shared by every suspension of this run, the
+        // suspension they resume is r.
+        var handleResponse = function (res) {
+            var handler, handlerPromise;
+            try {
+                r = res;
+                while (r instanceof Sk.misceval.Suspension) {
 
-                        if (handler) {
-                            var handlerPromise = handler(r);
-                            if (handlerPromise) {
-                                handlerPromise.then(handleResponse, reject);
-                                return;
-                            }
-                        }
+                    handler = suspHandlers && (suspHandlers[r.data["type"]] || suspHandlers["*"]);
 
-                        if (r.data["type"] == "Sk.promise") {
-                            r.data["promise"].then(resumeWithData, resumeWithError);
-                            return;
-
-                        } else if (r.data["type"] == "Sk.yield") {
-                            // Assumes all yields are optional, as Sk.setTimeout might
-                            // not be able to yield.
-                            //Sk.setTimeout(resume, 0);
-                            Sk.global["setImmediate"](resume);
+                    if (handler) {
+                        handlerPromise = handler(r);
+                        if (handlerPromise) {
+                            handlerPromise.then(handleLater, reject);
                             return;
+                        }
+                    }
 
-                        } else if (r.data["type"] == "Sk.delay") {
-                            //Sk.setTimeout(resume, 1);
-                            Sk.global["setImmediate"](resume);
-                            return;
+                    if (r.data["type"] == "Sk.promise") {
+                        r.data["promise"].then(resumeWithData, resumeWithError);
+                        return;
 
-                        } else if (r.optional) {
-                            // Unhandled optional suspensions just get
-                            // resumed immediately, and we go around the loop again.
+                    } else if (r.data["type"] == "Sk.yield" || r.data["type"] == "Sk.delay") {
+                        // Assumes all yields are optional, as Sk.setTimeout might
+                        // not be able to yield.
+                        stats["yields"]++;
+                        if (Date.now() - sliceStart < Sk.yieldSlice) {
+                            stats["resumed"]++;
                             r = r.resume();
-
                         } else {
-                            // Unhandled, non-optional suspension.
-                            throw new Sk.builtin.SuspensionError("Unhandled non-optional suspension of type '"+r.data["type"]+"'");
+                            stats["slices"]++;
+                            if (scheduler) {
+                                scheduler.defer(resume);
+                            } else {
+                                Sk.global["setImmediate"](resume);
+                            }
+                            return;
                         }
+
+                    } else if (r.optional) {
+                        // Unhandled optional suspensions just get
+                        // resumed immediately, and we go around the loop again.
+                        r = r.resume();
+
+                    } else {
+                        // Unhandled, non-optional suspension.
+                        throw new Sk.builtin.SuspensionError("Unhandled non-optional suspension of type '"+r.data["type"]+"'");
                     }
+                }
 
-                    resolve(r);
-                } catch(e) {
-                    reject(e);
+                resolve(r);
+            } catch(e) {
+                reject(e);
+            }
+        };
+        // runs fn, the program from where it stopped, in context
+        var run = function (fn, arg) {
+            sliceStart = Date.now();
+            if (context) {
+                context.enter();
+            }
+            try {
+                handleResponse(fn(arg));
+            } catch (e) {
+                reject(e);
+            } finally {
+                if (context) {
+                    context.exit();
                 }
-            })(r);
+            }
+        };
+        var identity = function (res) {
+            return res;
+        };
+        var handleLater = function (res) {
+            run(identity, res);
+        };
+        var resumeSuspension = function () {
+            return r.resume();
+        };
+        var resume = function () {
+            run(resumeSuspension);
+        };
+        var resumeWithData = function resolved(x) {
+            r.data["result"] = x;
+            if (scheduler) {
+                scheduler.defer(resume);
+            } else {
+                resume();
+            }
+        };
+        var resumeWithError = function rejected(e) {
+            r.data["error"] = e;
+            if (scheduler) {
+                scheduler.defer(resume);
+            } else {
+                resume();
+            }
+        };
 
-        } catch (e) {
-            reject(e);
-        }
+        stats["runs"]++;
+        run(suspendablefn);
     });
 };
 Sk.exportSymbol("Sk.misceval.asyncToPromise", Sk.misceval.asyncToPromise);
 
+/**
+ * How asyncToPromise has scheduled the programs it ran so far: the number
+ * of runs, of Sk.yield and Sk.delay suspensions (yields), of those resumed
+ * without leaving the current time slice (resumed) and of the times
+ * control went back to the event loop (slices). Set the counts to 0 to
+ * start over.
+ */
+Sk.misceval.schedulerStats = {
+    "runs": 0,
+    "yields": 0,
+    "resumed": 0,
+    "slices": 0
+};
+Sk.exportSymbol("Sk.misceval.schedulerStats", Sk.misceval.schedulerStats);
+
 Sk.misceval.applyAsync = function (suspHandlers, func, kwdict, varargseq, kws, args) {
     return Sk.misceval.asyncToPromise(function() {
         return Sk.misceval.applyOrSuspend(func, kwdict, varargseq, kws, args);
@@ -1285,21 +1391,24 @@ Sk.misceval.buildClass = function (globals, func, name, bases, cell) {
     locals.__module__ = globals["__name__"];
     var _name = new Sk.builtin.str(name);
     var _bases = new Sk.builtin.tuple(bases);
-    var _locals = [];
+    var _locals = new Sk.builtin.dict([]);
     var key;
 
-    // build array for python dict
+    // fill the class dict straight from the locals
     for (key in locals) {
         if (!locals.hasOwnProperty(key)) {
             //The current property key not a direct property of p
             continue;
         }
-        _locals.push(new Sk.builtin.str(key)); // push key
-        _locals.push(locals[key]); // push associated value
+        _locals.mp$ass_subscript(new Sk.builtin.str(key), locals[key]);
     }
-    _locals = new Sk.builtin.dict(_locals);
 
-    klass = Sk.misceval.callsimArray(meta, [_name, _bases, _locals]);
+    if (meta === Sk.builtin.type) {
+        // no need to go through the call machinery for type itself
+        klass = Sk.builtin.type(_name, _bases, _locals);
+    } else {
+        klass = Sk.misceval.callsimArray(meta, [_name, _bases, _locals]);
+    }
 
     return klass;
 };
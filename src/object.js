@@ -49,7 +49,30 @@ Sk.builtin.object.prototype.GenericGetAttr = function (pyName, canSuspend) {
     tp = this.ob$type;
     Sk.asserts.assert(tp !== undefined, "object has no ob$type!");
 
-    dict = this["$d"] || this.constructor["$d"];
+    if (this.$s) {
+        // compact instance of a user class, see Sk.builtin.type.makeShape_
+        if (jsName === "__dict__") {
+            dict = this["$d"];
+            if (dict !== undefined) {
+                return dict;
+            }
+        } else {
+            res = this.$shape.index[jsName];
+            if (res !== undefined && this.$s[res] !== undefined) {
+                return this.$s[res];
+            }
+        }
+        dict = undefined;
+    } else {
+        if (this.$slots) {
+            // the __slots__ of an instance with a dict, see Sk.builtin.type.makeShape_
+            res = this.$shape.index[jsName];
+            if (res !== undefined && this.$slots[res] !== undefined) {
+                return this.$slots[res];
+            }
+        }
+        dict = this["$d"] || this.constructor["$d"];
+    }
     //print("getattr", tp.tp$name, name);
 
     // todo; assert? force?
@@ -136,8 +159,6 @@ Sk.builtin.object.prototype.GenericSetAttr = function (pyName, value, canSuspend
 
     Sk.asserts.assert(tp !== undefined, "object has no ob$type!");
 
-    dict = this["$d"] || this.constructor["$d"];
-
     if (jsName == "__class__") {
         if (value.tp$mro === undefined || value.tp$name === undefined) {
             throw new Sk.builtin.TypeError(
@@ -159,6 +180,34 @@ Sk.builtin.object.prototype.GenericSetAttr = function (pyName, value, canSuspend
         }
     }
 
+    if (this.$s) {
+        // compact instance of a user class, see Sk.builtin.type.makeShape_
+        f = jsName === "__dict__" ? undefined : this.$shape.index[jsName];
+        if (f === undefined) {
+            if (this.$shape.slotsOnly) {
+                throw new Sk.builtin.AttributeError("'" + objname + "' object has no attribute '" + Sk.unfixReserved(jsName) + "'");
+            }
+            if (jsName !== "__dict__" && this.$shape.names.length < Sk.builtin.type.maxShapeSize_) {
+                f = this.$shape.names.length;
+                this.$shape.index[jsName] = f;
+                this.$shape.names.push(jsName);
+            }
+        }
+        if (f !== undefined) {
+            this.$s[f] = value;
+            return;
+        }
+        // no room left in the shape, move to a dict of our own
+    }
+
+    if (this.$slots && this.$shape.slots.indexOf(jsName) !== -1) {
+        // a __slots__ name of an instance with a dict
+        this.$slots[this.$shape.index[jsName]] = value;
+        return;
+    }
+
+    dict = this["$d"] || this.constructor["$d"];
+
     if (dict.mp$ass_subscript) {
         if (this instanceof Sk.builtin.object && !(this.ob$type.sk$klass) &&
             dict.mp$lookup(pyName) === undefined) {
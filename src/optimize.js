@@ -0,0 +1,345 @@
+/*
+ * AST optimizer.
+ *
+ * Sk.compile runs this between building the symbol table and generating
+ * code, so passes may rewrite or drop nodes freely without disturbing
+ * scoping: names, globals and generator-ness have already been decided.
+ *
+ * A pass is an object mapping AST node names to visitor functions. The
+ * tree is walked bottom-up, so a visitor sees its children already
+ * optimized. A visitor returns the node to use in place of the one it
+ * was given; a statement visitor may also return an array of statements
+ * to splice in, or null to drop the statement.
+ */
+
+/**
+ * Optimize a module AST in place.
+ *
+ * @param {Object} mod the module AST
+ * @param {string} filename
+ * @param {number} level optimization level, see Sk.configure
+ * @returns {Object} the optimized AST
+ */
+Sk.astOptimize = function (mod, filename, level) {
+    var i;
+    var pass;
+    var passes = Sk.astOptimize.passes;
+    for (i = 0; i < passes.length; i++) {
+        pass = passes[i];
+        if (level >= pass.level) {
+            mod = visitNode(pass, mod, {filename: filename, level: level});
+        }
+    }
+    return mod;
+};
+
+/**
+ * The registered passes, run in order. Each one has a minimum
+ * optimization level and a visitor per AST node name.
+ */
+Sk.astOptimize.passes = [];
+
+function isNode (v) {
+    return v !== null && typeof v === "object" && v._astname !== undefined;
+}
+
+function visitNode (pass, node, state) {
+    var fields = node._fields;
+    var name;
+    var value;
+    var visitor;
+    var i;
+
+    for (i = 0; i < fields.length; i += 2) {
+        name = fields[i];
+        value = node[name];
+        if (Array.isArray(value)) {
+            node[name] = visitList(pass, value, state);
+        } else if (isNode(value)) {
+            node[name] = visitNode(pass, value, state);
+        }
+    }
+
+    visitor = pass.visit[node._astname];
+    return visitor === undefined ? node : visitor(node, state);
+}
+
+function visitList (pass, list, state) {
+    var out = [];
+    var dropped = null;
+    var item;
+    var ret;
+    var i;
+
+    for (i = 0; i < list.length; i++) {
+        item = list[i];
+        if (!isNode(item)) {
+            out.push(item);
+            continue;
+        }
+        ret = visitNode(pass, item, state);
+        if (Array.isArray(ret)) {
+            out.push.apply(out, ret);
+            dropped = item;
+        } else if (ret !== null) {
+            out.push(ret);
+        } else {
+            dropped = item;
+        }
+    }
+
+    // a statement list must never end up empty, keep its place with a pass
+    if (out.length === 0 && dropped !== null) {
+        out.push(new Sk.astnodes.Pass(dropped.lineno, dropped.col_offset));
+    }
+
+    return out;
+}
+
+/**
+ * The Python value of a constant expression, or undefined.
+ */
+function constValue (node) {
+    switch (node.constructor) {
+        case Sk.astnodes.Num:
+            return typeof node.n === "number" ? undefined : node.n;
+        case Sk.astnodes.Str:
+            return node.s;
+        case Sk.astnodes.NameConstant:
+            return node.value;
+        default:
+            return undefined;
+    }
+}
+
+// Folded results bigger than these are left to be computed at runtime
+// rather than bloating the generated code, as CPython does.
+var MAX_STR_SIZE = 4096;
+var MAX_LONG_DIGITS = 40;
+
+/**
+ * An expression node for the folded value v, or undefined if v is not
+ * something the compiler can emit as a constant.
+ */
+function constNode (v, like) {
+    if (v instanceof Sk.builtin.bool || v === Sk.builtin.none.none$) {
+        return new Sk.astnodes.NameConstant(v, like.lineno, like.col_offset);
+    }
+    if (v instanceof Sk.builtin.str) {
+        if (v.v.length > MAX_STR_SIZE) {
+            return undefined;
+        }
+        return new Sk.astnodes.Str(v, like.lineno, like.col_offset);
+    }
+    if (v instanceof Sk.builtin.lng && v.tp$str().v.length > MAX_LONG_DIGITS) {
+        return undefined;
+    }
+    if (v instanceof Sk.builtin.int_ || v instanceof Sk.builtin.float_ ||
+        v instanceof Sk.builtin.lng || v instanceof Sk.builtin.complex) {
+        return new Sk.astnodes.Num(v, like.lineno, like.col_offset);
+    }
+    return undefined;
+}
+
+/**
+ * Whether l op r could produce a result too large to be worth folding,
+ * checked before computing it.
+ */
+function tooBig (l, r, op) {
+    var s;
+    var n;
+    if (op === "Mult" && (l instanceof Sk.builtin.str || r instanceof Sk.builtin.str)) {
+        s = l instanceof Sk.builtin.str ? l : r;
+        n = s === l ? r : l;
+        return n.constructor !== Sk.builtin.int_ || s.v.length * n.v > MAX_STR_SIZE;
+    }
+    if ((op === "Pow" || op === "LShift") && !(l instanceof Sk.builtin.float_)) {
+        return r.constructor !== Sk.builtin.int_ || r.v > 128;
+    }
+    return false;
+}
+
+/**
+ * Run fn, returning undefined if it raises; the error is then left to
+ * happen at runtime.
+ */
+function tryFold (fn) {
+    try {
+        return fn();
+    } catch (e) {
+        return undefined;
+    }
+}
+
+function isConstSeq (node) {
+    var i;
+    if (node.constructor !== Sk.astnodes.Tuple &&
+        node.constructor !== Sk.astnodes.List &&
+        node.constructor !== Sk.astnodes.Set) {
+        return false;
+    }
+    for (i = 0; i < node.elts.length; i++) {
+        if (constValue(node.elts[i]) === undefined) {
+            return false;
+        }
+    }
+    return true;
+}
+
+/**
+ * The exact builtin type shared by every element of a constant sequence,
+ * if it is one whose hash agrees with its equality (str or int).
+ */
+function uniformKeyType (elts) {
+    var type;
+    var i;
+    var v;
+    if (elts.length === 0) {
+        return undefined;
+    }
+    v = constValue(elts[0]);
+    type = v.constructor;
+    if (type !== Sk.builtin.str && type !== Sk.builtin.int_) {
+        return undefined;
+    }
+    for (i = 1; i < elts.length; i++) {
+        if (constValue(elts[i]).constructor !== type) {
+            return undefined;
+        }
+    }
+    return type;
+}
+
+/**
+ * Replace a constant list literal that is only ever iterated or searched
+ * with a tuple, which the compiler hoists instead of rebuilding.
+ */
+function constTuple (node) {
+    if (node.constructor === Sk.astnodes.List && isConstSeq(node)) {
+        return new Sk.astnodes.Tuple(node.elts, Sk.astnodes.Load, node.lineno, node.col_offset);
+    }
+    return node;
+}
+
+/**
+ * True, False or undefined for a constant test expression.
+ */
+function constTruth (node) {
+    var v = constValue(node);
+    return v === undefined ? undefined : Sk.misceval.isTrue(v);
+}
+
+// Constant folding, level 1.
+Sk.astOptimize.passes.push({
+    name : "fold",
+    level: 1,
+    visit: {
+        Name: function (node, state) {
+            if (node.id.v === "__debug__" && node.ctx === Sk.astnodes.Load) {
+                return new Sk.astnodes.NameConstant(state.level >= 2 ? Sk.builtin.bool.false$ : Sk.builtin.bool.true$,
+                    node.lineno, node.col_offset);
+            }
+            return node;
+        },
+        UnaryOp: function (node) {
+            var v = constValue(node.operand);
+            var op = node.op.prototype._astname;
+            if (v === undefined || (op !== "Not" && v === Sk.builtin.none.none$)) {
+                return node;
+            }
+            return constNode(tryFold(function () {
+                return Sk.abstr.numberUnaryOp(v, op);
+            }), node) || node;
+        },
+        BinOp: function (node) {
+            var l = constValue(node.left);
+            var r = constValue(node.right);
+            var op = node.op.prototype._astname;
+            if (l === undefined || r === undefined) {
+                return node;
+            }
+            // string formatting is not worth doing at compile time
+            if (op === "Mod" && l instanceof Sk.builtin.str) {
+                return node;
+            }
+            if (tooBig(l, r, op)) {
+                return node;
+            }
+            // folding uses the runtime operators, so Div follows the same
+            // Sk.__future__.division the generated code would
+            return constNode(tryFold(function () {
+                return Sk.abstr.numberBinOp(l, r, op);
+            }), node) || node;
+        },
+        Compare: function (node) {
+            var i;
+            var op;
+            var rhs;
+            for (i = 0; i < node.ops.length; i++) {
+                op = node.ops[i];
+                rhs = node.comparators[i];
+                if ((op === Sk.astnodes.In || op === Sk.astnodes.NotIn) && isConstSeq(rhs)) {
+                    // the compiler hoists the constant and, for a set or a
+                    // tuple whose elements all share one hashable type,
+                    // answers membership from a hoisted set
+                    rhs = constTuple(rhs);
+                    rhs.$lookup = true;
+                    if (rhs.constructor === Sk.astnodes.Tuple) {
+                        rhs.$keyType = uniformKeyType(rhs.elts);
+                    }
+                    node.comparators[i] = rhs;
+                }
+            }
+            return node;
+        },
+        For: function (node) {
+            node.iter = constTuple(node.iter);
+            return node;
+        },
+        comprehension: function (node) {
+            node.iter = constTuple(node.iter);
+            return node;
+        }
+    }
+});
+
+// Dead branch removal, level 1.
+Sk.astOptimize.passes.push({
+    name : "deadcode",
+    level: 1,
+    visit: {
+        If: function (node) {
+            var t = constTruth(node.test);
+            if (t === undefined) {
+                return node;
+            }
+            return t ? node.body : node.orelse;
+        },
+        While: function (node) {
+            if (constTruth(node.test) === false) {
+                return node.orelse;
+            }
+            return node;
+        },
+        IfExp: function (node) {
+            var t = constTruth(node.test);
+            if (t === undefined) {
+                return node;
+            }
+            return t ? node.body : node.orelse;
+        }
+    }
+});
+
+// Assertions are dropped at level 2, like python -O.
+Sk.astOptimize.passes.push({
+    name : "asserts",
+    level: 2,
+    visit: {
+        Assert: function (node) {
+            return null;
+        }
+    }
+});
+
+Sk.exportSymbol("Sk.astOptimize", Sk.astOptimize);
@@ -35,8 +35,78 @@ Parser.CO_FUTURE_DIVISON = 0x2000;
 Parser.CO_FUTURE_ABSOLUTE_IMPORT = 0x4000;
 Parser.CO_FUTURE_WITH_STATEMENT = 0x8000;
 
+/**
+ * LL(1) action table for one nonterminal of the grammar.
+ *
+ * The pgen DFAs list, for every state, the arcs leaving it; finding the
+ * arc for a token means walking those arcs and the first sets of any
+ * nonterminals on them. actions[state] caches the result of that walk
+ * as a map from token label to the arc to follow, built the first time
+ * the state is reached, so addtoken does a single lookup per step.
+ *
+ * @constructor
+ * @param {Object} grammar
+ * @param {number} sym
+ */
+function ParseTable (grammar, sym) {
+    var dfa = grammar.dfas[sym];
+    var states = dfa[0];
+    var arcs;
+    var s;
+
+    this.sym = sym;
+    this.states = states;
+    this.actions = new Array(states.length);
+    this.accepting = new Array(states.length);
+    this.acceptOnly = new Array(states.length);
+    for (s = 0; s < states.length; ++s) {
+        arcs = states[s];
+        this.accepting[s] = findInDfa(arcs, [0, s]);
+        // states[s] == [(0, s)]
+        this.acceptOnly[s] = arcs.length === 1 && arcs[0][0] === 0 && arcs[0][1] === s;
+    }
+}
+
+/**
+ * @param {Object} grammar
+ * @param {number} sym
+ * @returns {ParseTable}
+ */
+ParseTable.get = function (grammar, sym) {
+    var tables = grammar.$tables || (grammar.$tables = {});
+    return tables[sym] || (tables[sym] = new ParseTable(grammar, sym));
+};
+
+ParseTable.prototype.build = function (grammar, state) {
+    var map = {};
+    var arcs = this.states[state];
+    var a, i, t, k, newstate, push;
+
+    // the first arc that accepts a label wins, as in the arc walk
+    for (a = 0; a < arcs.length; ++a) {
+        i = arcs[a][0];
+        newstate = arcs[a][1];
+        t = grammar.labels[i][0];
+        if (t < 256) {
+            if (i !== 0 && map[i] === undefined) {
+                map[i] = {push: null, state: newstate};
+            }
+        } else {
+            push = null;
+            for (k in grammar.dfas[t][1]) {
+                if (map[k] === undefined) {
+                    push = push || ParseTable.get(grammar, t);
+                    map[k] = {push: push, state: newstate};
+                }
+            }
+        }
+    }
+
+    this.actions[state] = map;
+    return map;
+};
+
 Parser.prototype.setup = function (start) {
-    var stackentry;
     var newnode;
     start = start || this.grammar.start;
     //print("START:"+start);
@@ -48,13 +118,13 @@ Parser.prototype.setup = function (start) {
         context : null,
         children: []
     };
-    stackentry =
-    {
-        dfa  : this.grammar.dfas[start],
-        state: 0,
-        node : newnode
-    };
-    this.stack = [stackentry];
+    this.stack = [
+        {
+            table: ParseTable.get(this.grammar, start),
+            state: 0,
+            node : newnode
+        }
+    ];
     this.used_names = {};
 };
 
@@ -72,79 +142,47 @@ function findInDfa (a, obj) {
 // Add a token; return true if we're done
 Parser.prototype.addtoken = function (type, value, context) {
     var errline;
-    var itsfirst;
-    var itsdfa;
+    var table;
+    var actions;
+    var action;
     var state;
-    var v;
-    var t;
-    var newstate;
-    var i;
-    var a;
-    var arcs;
-    var first;
-    var states;
     var tp;
     var ilabel = this.classify(type, value, context);
     //print("ilabel:"+ilabel);
 
-    OUTERWHILE:
     while (true) {
         tp = this.stack[this.stack.length - 1];
-        states = tp.dfa[0];
-        first = tp.dfa[1];
-        arcs = states[tp.state];
-
-        // look for a state with this label
-        for (a = 0; a < arcs.length; ++a) {
-            i = arcs[a][0];
-            newstate = arcs[a][1];
-            t = this.grammar.labels[i][0];
-            v = this.grammar.labels[i][1];
-            if (ilabel === i) {
-                // look it up in the list of labels
-                Sk.asserts.assert(t < 256);
-                // shift a token; we're done with it
-                this.shift(type, value, newstate, context);
-                // pop while we are in an accept-only state
-                state = newstate;
-                //print("before:"+JSON.stringify(states[state]) + ":state:"+state+":"+JSON.stringify(states[state]));
-                /* jshint ignore:start */
-                while (states[state].length === 1
-                    && states[state][0][0] === 0
-                    && states[state][0][1] === state) {
-                    // states[state] == [(0, state)])
-                    this.pop();
-                    //print("in after pop:"+JSON.stringify(states[state]) + ":state:"+state+":"+JSON.stringify(states[state]));
-                    if (this.stack.length === 0) {
-                        // done!
-                        return true;
-                    }
-                    tp = this.stack[this.stack.length - 1];
-                    state = tp.state;
-                    states = tp.dfa[0];
-                    first = tp.dfa[1];
-                    //print(JSON.stringify(states), JSON.stringify(first));
-                    //print("bottom:"+JSON.stringify(states[state]) + ":state:"+state+":"+JSON.stringify(states[state]));
-                }
-                /* jshint ignore:end */
-                // done with this token
-                //print("DONE, return false");
-                return false;
-            } else if (t >= 256) {
-                itsdfa = this.grammar.dfas[t];
-                itsfirst = itsdfa[1];
-                if (itsfirst.hasOwnProperty(ilabel)) {
-                    // push a symbol
-                    this.push(t, this.grammar.dfas[t], newstate, context);
-                    continue OUTERWHILE;
+        table = tp.table;
+        actions = table.actions[tp.state] || table.build(this.grammar, tp.state);
+        action = actions[ilabel];
+
+        if (action !== undefined) {
+            if (action.push !== null) {
+                // push a symbol
+                this.push(action.push, action.state, context);
+                continue;
+            }
+
+            // shift a token; we're done with it
+            this.shift(type, value, action.state, context);
+            // pop while we are in an accept-only state
+            state = action.state;
+            while (table.acceptOnly[state]) {
+                this.pop();
+                if (this.stack.length === 0) {
+                    // done!
+                    return true;
                 }
+                tp = this.stack[this.stack.length - 1];
+                table = tp.table;
+                state = tp.state;
             }
+            // done with this token
+            return false;
         }
 
-        //print("findInDfa: " + JSON.stringify(arcs)+" vs. " + tp.state);
-        if (findInDfa(arcs, [0, tp.state])) {
+        if (table.accepting[tp.state]) {
             // an accepting state, pop it and try somethign else
-            //print("WAA");
             this.pop();
             if (this.stack.length === 0) {
                 throw new Sk.builtin.SyntaxError("too much input", this.filename);
@@ -176,6 +214,11 @@ Parser.prototype.classify = function (type, value, context) {
     }
     ilabel = this.grammar.tokens.hasOwnProperty(type) && this.grammar.tokens[type];
     if (!ilabel) {
+        if (type === Sk.token.tokens.T_ERRORTOKEN && (value === "'" || value === "\"" || value === "\\")) {
+            // an unterminated string or a stray line continuation: the
+            // characters are Python, the way they are used is not
+            throw new Sk.builtin.SyntaxError("bad input", this.filename, context[0][0], context);
+        }
         // throw new Sk.builtin.SyntaxError("bad token", type, value, context);
         // Questionable modification to put line number in position 2
         // like everywhere else and filename in position 1.
@@ -184,73 +227,57 @@ Parser.prototype.classify = function (type, value, context) {
     return ilabel;
 };
 
+// Most nonterminals end up with a single child (the long expression
+// chains), so a node's children start out as an exact-size literal
+// rather than an empty array that push would grow with spare capacity.
+function addChild (node, child) {
+    if (node.children.length === 0) {
+        node.children = [child];
+    } else {
+        node.children.push(child);
+    }
+}
+
 // shift a token
 Parser.prototype.shift = function (type, value, newstate, context) {
-    var dfa = this.stack[this.stack.length - 1].dfa;
-    var state = this.stack[this.stack.length - 1].state;
-    var node = this.stack[this.stack.length - 1].node;
+    var tp = this.stack[this.stack.length - 1];
     //print("context", context);
-    var newnode = {
+    addChild(tp.node, {
         type      : type,
         value     : value,
         lineno    : context[0][0],         // throwing away end here to match cpython
         col_offset: context[0][1],
         children  : null
-    };
-    if (newnode) {
-        node.children.push(newnode);
-    }
-    this.stack[this.stack.length - 1] = {
-        dfa  : dfa,
-        state: newstate,
-        node : node
-    };
+    });
+    tp.state = newstate;
 };
 
 // push a nonterminal
-Parser.prototype.push = function (type, newdfa, newstate, context) {
-    var dfa = this.stack[this.stack.length - 1].dfa;
-    var node = this.stack[this.stack.length - 1].node;
+Parser.prototype.push = function (table, newstate, context) {
     var newnode = {
-        type      : type,
+        type      : table.sym,
         value     : null,
         lineno    : context[0][0],      // throwing away end here to match cpython
         col_offset: context[0][1],
         children  : []
     };
-    this.stack[this.stack.length - 1] = {
-        dfa  : dfa,
-        state: newstate,
-        node : node
-    };
+    this.stack[this.stack.length - 1].state = newstate;
     this.stack.push({
-        dfa  : newdfa,
+        table: table,
         state: 0,
         node : newnode
     });
 };
 
-//var ac = 0;
-//var bc = 0;
-
 // pop a nonterminal
 Parser.prototype.pop = function () {
-    var node;
-    var pop = this.stack.pop();
-    var newnode = pop.node;
+    var newnode = this.stack.pop().node;
     //print("POP");
-    if (newnode) {
-        //print("A", ac++, newnode.type);
-        //print("stacklen:"+this.stack.length);
-        if (this.stack.length !== 0) {
-            //print("B", bc++);
-            node = this.stack[this.stack.length - 1].node;
-            node.children.push(newnode);
-        } else {
-            //print("C");
-            this.rootnode = newnode;
-            this.rootnode.used_names = this.used_names;
-        }
+    if (this.stack.length !== 0) {
+        addChild(this.stack[this.stack.length - 1].node, newnode);
+    } else {
+        this.rootnode = newnode;
+        this.rootnode.used_names = this.used_names;
     }
 };
 
@@ -270,66 +297,95 @@ function makeParser (filename, style) {
     // for closure's benefit
     if (style === "file_input") {
         p.setup(Sk.ParseTables.sym.file_input);
+    } else if (style === "single_input") {
+        p.setup(Sk.ParseTables.sym.single_input);
+    } else if (style === "eval_input") {
+        p.setup(Sk.ParseTables.sym.eval_input);
     } else {
         Sk.asserts.fail("todo;");
     }
     return p;
 }
 
-Sk.parse = function parse (filename, input) {
+/**
+ * @param {string} filename
+ * @param {string} input
+ * @param {string=} mode 'exec' (the default) for a module, 'single' for one
+ * interactive statement or 'eval' for an expression, as for Sk.compile
+ */
+Sk.parse = function parse (filename, input, mode) {
     var T_COMMENT = Sk.token.tokens.T_COMMENT;
     var T_NL = Sk.token.tokens.T_NL;
+    var T_NEWLINE = Sk.token.tokens.T_NEWLINE;
+    var T_DEDENT = Sk.token.tokens.T_DEDENT;
     var T_OP = Sk.token.tokens.T_OP;
     var T_ENDMARKER = Sk.token.tokens.T_ENDMARKER;
     var T_ENCODING = Sk.token.tokens.T_ENCODING;
 
+    var style = mode === "single" ? "single_input" : mode === "eval" ? "eval_input" : "file_input";
     var endmarker_seen = false;
-    var parser = makeParser(filename);
+    var done = false;
+    var parser = makeParser(filename, style);
 
     /**
-     * takes a string splits it on '\n' and returns a function that returns
-     * @param {Array<string>} input
+     * takes a string and returns a function that returns it one line at a
+     * time, each with a trailing '\n', scanning forward from the previous
+     * line instead of splitting the whole input up front
+     * @param {string} input
      * @returns {function(): string}
      */
     function readline(input) {
-        var lines = input.split("\n").reverse().map(function (l) { return l + "\n"; });
+        var pos = 0;
 
         return function() {
-            if (lines.length === 0) {
+            var nl, line;
+
+            if (pos > input.length) {
                 throw new Sk.builtin.Exception("EOF");
             }
 
-            return lines.pop();
+            nl = input.indexOf("\n", pos);
+            if (nl === -1) {
+                line = input.substring(pos) + "\n";
+                pos = input.length + 1;
+            } else {
+                line = input.substring(pos, nl + 1);
+                pos = nl + 1;
+            }
+
+            return line;
         };
     }
 
     Sk._tokenize(filename, readline(input), "utf-8", function (tokenInfo) {
-        var s_lineno = tokenInfo.start[0];
-        var s_column = tokenInfo.start[1];
         var type = null;
-        var prefix, lineno, column;
-
-        /* I don't know
-         if (s_lineno !== lineno && s_column !== column)
-         {
-         // todo; update prefix and line/col
-         }
-         */
-
-        if (tokenInfo.type === T_COMMENT || tokenInfo.type === T_NL || tokenInfo.type === T_ENCODING) {
-            prefix += tokenInfo.value;
-            lineno = tokenInfo.end[0];
-            column = tokenInfo.end[1];
-            if (tokenInfo.string[tokenInfo.string.length - 1] === "\n") {
-                lineno += 1;
-                column = 0;
-            }
-        } else {
+
+        var context;
+
+        // comments and non-logical newlines carry nothing for the grammar
+        if (tokenInfo.type !== T_COMMENT && tokenInfo.type !== T_NL && tokenInfo.type !== T_ENCODING) {
             if (tokenInfo.type === T_OP) {
                 type = Sk.OpMap[tokenInfo.string];
             }
-
-            parser.addtoken(type || tokenInfo.type, tokenInfo.string, [tokenInfo.start, tokenInfo.end, tokenInfo.line]);
+            context = [tokenInfo.start, tokenInfo.end, tokenInfo.line];
+
+            if (done) {
+                // a single statement is complete, only its trailing
+                // newlines and dedents may follow it
+                if (tokenInfo.type !== T_NEWLINE && tokenInfo.type !== T_DEDENT && tokenInfo.type !== T_ENDMARKER) {
+                    throw new Sk.builtin.SyntaxError("multiple statements found while compiling a single statement",
+                        filename, tokenInfo.start[0], context);
+                }
+            } else {
+                if (tokenInfo.type === T_ENDMARKER && style === "single_input") {
+                    // the blank line that ends an interactive compound
+                    // statement is the end of the input here
+                    done = parser.addtoken(T_NEWLINE, "", context);
+                }
+                if (!done) {
+                    done = parser.addtoken(type || tokenInfo.type, tokenInfo.string, context);
+                }
+            }
 
             if (tokenInfo.type === T_ENDMARKER) {
                 endmarker_seen = true;
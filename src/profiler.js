@@ -0,0 +1,268 @@
+/**
+ * @namespace Sk.profiler
+ *
+ * Deterministic profiler for Python functions, the core of the _lsprof
+ * module (and so of cProfile and pstats).
+ *
+ * With the profiling option of Sk.configure, the compiler passes the code
+ * of every function, lambda and generator it builds through
+ * Sk.profiler.wrap.  While a profile is enabled, the wrapper counts the
+ * calls and measures the time spent in the function (cumtime) and in the
+ * function less the functions it calls (tottime), with performance.now().
+ * Functions compiled without the option are not seen.
+ *
+ * Calls are recorded into a call tree as well as per function, which gives
+ * the callers of each function and can be exported for flame graphs.
+ * Time spent suspended (e.g. in time.sleep) is not counted.
+ */
+Sk.profiler = {};
+
+Sk.profiler.now = (typeof performance === "object" && typeof performance.now === "function") ?
+    function () {
+        return performance.now();
+    } :
+    function () {
+        return Date.now();
+    };
+
+/**
+ * The functions wrapped so far, by id.
+ */
+Sk.profiler.functions_ = [];
+
+/**
+ * The profile being recorded into, or null.
+ * @type {Sk.profiler.Profile}
+ */
+Sk.profiler.active = null;
+
+/**
+ * The data of one profile.
+ *
+ * @constructor
+ */
+Sk.profiler.Profile = function () {
+    this.clear();
+};
+
+Sk.profiler.Profile.prototype.clear = function () {
+    // per function, by id: {calls, primcalls, tottime, cumtime, depth}
+    this.stats = {};
+    // call tree, children by function id
+    this.root = Sk.profiler.newNode_(null, -1);
+    this.node = this.root;
+    this.stack = [];
+};
+
+Sk.profiler.newNode_ = function (parent, id) {
+    return {parent: parent, id: id, calls: 0, tottime: 0, cumtime: 0, children: {}};
+};
+
+/**
+ * Start recording into profile, stopping any other profile.
+ *
+ * @param {Sk.profiler.Profile} profile
+ */
+Sk.profiler.enable = function (profile) {
+    if (Sk.profiler.active !== null && Sk.profiler.active !== profile) {
+        Sk.profiler.disable();
+    }
+    Sk.profiler.active = profile;
+};
+
+/**
+ * Stop recording. The functions still running are accounted for up to now.
+ */
+Sk.profiler.disable = function () {
+    var profile = Sk.profiler.active;
+    if (profile === null) {
+        return;
+    }
+    while (profile.stack.length > 0) {
+        Sk.profiler.leave_(profile, profile.stack[profile.stack.length - 1]);
+    }
+    Sk.profiler.active = null;
+};
+
+Sk.profiler.enter_ = function (profile, fn, counted) {
+    var stats = profile.stats[fn.id];
+    var node = profile.node.children[fn.id];
+    var frame;
+
+    if (stats === undefined) {
+        stats = profile.stats[fn.id] = {calls: 0, primcalls: 0, tottime: 0, cumtime: 0, depth: 0};
+    }
+    if (node === undefined) {
+        node = profile.node.children[fn.id] = Sk.profiler.newNode_(profile.node, fn.id);
+    }
+    if (counted) {
+        stats.calls++;
+        node.calls++;
+        if (stats.depth === 0) {
+            stats.primcalls++;
+        }
+    }
+    stats.depth++;
+
+    frame = {stats: stats, node: node, start: Sk.profiler.now(), inner: 0};
+    profile.stack.push(frame);
+    profile.node = node;
+    return frame;
+};
+
+Sk.profiler.leave_ = function (profile, frame) {
+    var elapsed;
+    var stack = profile.stack;
+    var stats = frame.stats;
+    var parent;
+
+    // a frame already closed by disable
+    if (stack[stack.length - 1] !== frame) {
+        return;
+    }
+    stack.pop();
+
+    elapsed = Sk.profiler.now() - frame.start;
+    stats.tottime += elapsed - frame.inner;
+    frame.node.tottime += elapsed - frame.inner;
+    frame.node.cumtime += elapsed;
+    stats.depth--;
+    // recursive calls are part of the cumulative time of the outermost one
+    if (stats.depth === 0) {
+        stats.cumtime += elapsed;
+    }
+
+    parent = stack[stack.length - 1];
+    if (parent !== undefined) {
+        parent.inner += elapsed;
+    }
+    profile.node = frame.node.parent;
+};
+
+/**
+ * Wrap the code of a compiled function so its calls are recorded while a
+ * profile is enabled.
+ *
+ * @param {Function} code
+ * @param {string} name qualified name of the function
+ * @param {string} filename
+ * @param {number} lineno
+ * @returns {Function}
+ */
+Sk.profiler.wrap = function (code, name, filename, lineno) {
+    var fn = {id: Sk.profiler.functions_.length, name: name, filename: filename, lineno: lineno};
+    var wrapped;
+
+    Sk.profiler.functions_.push(fn);
+
+    wrapped = function () {
+        var profile = Sk.profiler.active;
+        var frame;
+        var ret;
+        if (profile === null) {
+            return code.apply(this, arguments);
+        }
+        // the compiled code resumes from a suspension by calling itself
+        // again, which is not another call
+        frame = Sk.profiler.enter_(profile, fn, wrapped.$wakingSuspension === undefined);
+        try {
+            ret = code.apply(this, arguments);
+        } finally {
+            Sk.profiler.leave_(profile, frame);
+        }
+        return ret;
+    };
+    return wrapped;
+};
+
+/**
+ * The statistics of a profile, one object per function called:
+ * {filename, lineno, name, calls, primcalls, tottime, cumtime, callers}
+ * with times in seconds. callers maps the index of each calling function in
+ * the returned array to {calls, tottime, cumtime} for the calls from it.
+ *
+ * @param {Sk.profiler.Profile} profile
+ * @returns {Array<Object>}
+ */
+Sk.profiler.getStats = function (profile) {
+    var ret = [];
+    var index = {};
+    var id;
+    var fn;
+    var s;
+
+    for (id in profile.stats) {
+        s = profile.stats[id];
+        if (s.calls === 0) {
+            continue;
+        }
+        fn = Sk.profiler.functions_[id];
+        index[id] = ret.length;
+        ret.push({
+            filename : fn.filename,
+            lineno   : fn.lineno,
+            name     : fn.name,
+            calls    : s.calls,
+            primcalls: s.primcalls,
+            tottime  : s.tottime / 1000,
+            cumtime  : s.cumtime / 1000,
+            callers  : {}
+        });
+    }
+
+    (function visit (node) {
+        var c;
+        var child;
+        var caller;
+        for (c in node.children) {
+            child = node.children[c];
+            if (node.id !== -1 && index[child.id] !== undefined && index[node.id] !== undefined) {
+                caller = ret[index[child.id]].callers[index[node.id]];
+                if (caller === undefined) {
+                    caller = ret[index[child.id]].callers[index[node.id]] = {calls: 0, tottime: 0, cumtime: 0};
+                }
+                caller.calls += child.calls;
+                caller.tottime += child.tottime / 1000;
+                caller.cumtime += child.cumtime / 1000;
+            }
+            visit(child);
+        }
+    })(profile.root);
+
+    return ret;
+};
+
+/**
+ * The call tree of a profile in the format of d3-flame-graph and similar
+ * tools: {name, value, children}, with the time spent in each call path as
+ * value, in milliseconds.
+ *
+ * @param {Sk.profiler.Profile} profile
+ * @returns {Object}
+ */
+Sk.profiler.flameGraph = function (profile) {
+    function convert (node) {
+        var fn = Sk.profiler.functions_[node.id];
+        var children = [];
+        var value = 0;
+        var c;
+        for (c in node.children) {
+            children.push(convert(node.children[c]));
+        }
+        if (fn === undefined) {
+            children.forEach(function (child) {
+                value += child.value;
+            });
+        } else {
+            value = node.cumtime;
+        }
+        return {
+            name    : fn === undefined ? "<root>" : fn.name + " (" + fn.filename + ":" + fn.lineno + ")",
+            value   : value,
+            children: children
+        };
+    }
+    return convert(profile.root);
+};
+
+Sk.exportSymbol("Sk.profiler", Sk.profiler);
@@ -1,169 +1,410 @@
 /**
+ * Sets and frozensets keep their elements in buckets by hash, as dict does
+ * with its keys, but hold the elements themselves rather than key/value
+ * entries. A bucket is removed when it empties. The hashes of the buckets
+ * are listed once in $hashes, until a bucket is added, for the iterators
+ * and pop to walk, and $version is bumped whenever an element is added or
+ * removed so the iterators can tell that the set changed underneath them.
+ *
  * @constructor
- * @param {Array.<Object>} S
+ * @param {Array.<Object>|Object=} S
  */
 Sk.builtin.set = function (S) {
-    var it, i;
-    var S_list;
     if (!(this instanceof Sk.builtin.set)) {
         Sk.builtin.pyCheckArgsLen("set", arguments.length, 0, 1);
         return new Sk.builtin.set(S);
     }
 
-
-    if (typeof(S) === "undefined") {
-        S = [];
-    }
-
     this.set_reset_();
-    S_list = new Sk.builtin.list(S);
-    // python sorts sets on init, but not thereafter.
-    // Skulpt seems to init a new set each time you add/remove something
-    //Sk.builtin.list.prototype['sort'].func_code(S);
-    for (it = Sk.abstr.iter(S_list), i = it.tp$iternext(); i !== undefined; i = it.tp$iternext()) {
-        Sk.builtin.set.prototype["add"].func_code(this, i);
+    if (S !== undefined) {
+        this.set$update(S);
     }
 
     this.__class__ = Sk.builtin.set;
-
-    this["v"] = this.v;
     return this;
 };
 Sk.abstr.setUpInheritance("set", Sk.builtin.set, Sk.builtin.object);
 Sk.abstr.markUnhashable(Sk.builtin.set);
 
+/**
+ * @constructor
+ * @param {Array.<Object>|Object=} S
+ */
+Sk.builtin.frozenset = function frozenset (S) {
+    if (!(this instanceof Sk.builtin.frozenset)) {
+        Sk.builtin.pyCheckArgsLen("frozenset", arguments.length, 0, 1);
+        if (S !== undefined && S.constructor === Sk.builtin.frozenset) {
+            // immutable, so there is nothing to copy
+            return S;
+        }
+        return new Sk.builtin.frozenset(S);
+    }
+
+    this.set_reset_();
+    if (S !== undefined) {
+        this.set$update(S);
+    }
+
+    this.__class__ = Sk.builtin.frozenset;
+    return this;
+};
+Sk.abstr.setUpInheritance("frozenset", Sk.builtin.frozenset, Sk.builtin.object);
+
+Sk.builtin.set.prototype.$hashes = null;
+Sk.builtin.set.prototype.$popIndex = 0;
+Sk.builtin.set.prototype.$version = 0;
+
+/**
+ * Whether o is a set or a frozenset.
+ */
+Sk.builtin.set.check$ = function (o) {
+    return o instanceof Sk.builtin.set || o instanceof Sk.builtin.frozenset;
+};
+
 Sk.builtin.set.prototype.set_reset_ = function () {
-    this.v = new Sk.builtin.dict([]);
+    this.buckets = {};
+    this.size = 0;
+    this.$hashes = null;
+    this.$version++;
 };
 
-Sk.builtin.set.prototype["$r"] = function () {
-    var it, i;
-    var ret = [];
-    for (it = Sk.abstr.iter(this), i = it.tp$iternext(); i !== undefined; i = it.tp$iternext()) {
-        ret.push(Sk.misceval.objectRepr(i).v);
+// a new empty set of the kind of this one, for the results of operations
+Sk.builtin.set.prototype.set$new = function () {
+    return new Sk.builtin.set();
+};
+
+Sk.builtin.set.prototype.set$hashes = function () {
+    if (this.$hashes === null) {
+        this.$hashes = Object.keys(this.buckets);
+        this.$popIndex = 0;
     }
+    return this.$hashes;
+};
 
-    if(Sk.__future__.set_repr) {
-        if (ret.length === 0) {
-            return new Sk.builtin.str("set()");
-        } else {
-            return new Sk.builtin.str("{" + ret.join(", ") + "}");
+Sk.builtin.set.prototype.set$find = function (items, key) {
+    var i;
+    for (i = 0; i < items.length; i++) {
+        if (items[i] === key || Sk.misceval.richCompareBool(items[i], key, "Eq")) {
+            return i;
         }
+    }
+    return -1;
+};
+
+/**
+ * Add key, whose hash is h, unless it is already there.
+ */
+Sk.builtin.set.prototype.set$addHashed = function (key, h) {
+    var bucket = this.buckets[h];
+    if (bucket === undefined) {
+        this.buckets[h] = {items: [key]};
+        this.$hashes = null;
+    } else if (this.set$find(bucket.items, key) === -1) {
+        bucket.items.push(key);
     } else {
-        return new Sk.builtin.str("set([" + ret.join(", ") + "])");
+        return;
     }
+    this.size++;
+    this.$version++;
 };
 
-Sk.builtin.set.prototype.ob$eq = function (other) {
+Sk.builtin.set.prototype.set$add = function (key) {
+    this.set$addHashed(key, Sk.builtin.hash(key).v);
+};
 
-    if (this === other) {
-        return Sk.builtin.bool.true$;
-    }
+Sk.builtin.set.prototype.set$containsHashed = function (key, h) {
+    var bucket = this.buckets[h];
+    return bucket !== undefined && this.set$find(bucket.items, key) !== -1;
+};
 
-    if (!(other instanceof Sk.builtin.set)) {
-        return Sk.builtin.bool.false$;
+/**
+ * Remove key, returning whether it was there.
+ */
+Sk.builtin.set.prototype.set$discard = function (key) {
+    var h = Sk.builtin.hash(key).v;
+    var bucket = this.buckets[h];
+    var i;
+    if (bucket === undefined) {
+        return false;
+    }
+    i = this.set$find(bucket.items, key);
+    if (i === -1) {
+        return false;
+    }
+    if (bucket.items.length === 1) {
+        delete this.buckets[h];
+    } else {
+        bucket.items.splice(i, 1);
     }
+    this.size--;
+    this.$version++;
+    return true;
+};
 
-    if (Sk.builtin.set.prototype.sq$length.call(this) !==
-        Sk.builtin.set.prototype.sq$length.call(other)) {
-        return Sk.builtin.bool.false$;
+// sets themselves are looked up as frozensets, as in "set() in s"
+Sk.builtin.set.key$ = function (key) {
+    if (key instanceof Sk.builtin.set) {
+        return new Sk.builtin.frozenset(key);
     }
+    return key;
+};
 
-    return this["issubset"].func_code(this, other);
+/**
+ * Replace the elements of this set with those of other, a set or
+ * frozenset, without hashing or comparing any of them.
+ */
+Sk.builtin.set.prototype.set$assign = function (other) {
+    var h;
+    var buckets = {};
+    for (h in other.buckets) {
+        buckets[h] = {items: other.buckets[h].items.slice()};
+    }
+    this.buckets = buckets;
+    this.size = other.size;
+    this.$hashes = null;
+    this.$version++;
 };
 
-Sk.builtin.set.prototype.ob$ne = function (other) {
+/**
+ * Add all the elements of S, an iterable or an array.
+ */
+Sk.builtin.set.prototype.set$update = function (S) {
+    var it, i, h, items;
 
-    if (this === other) {
-        return Sk.builtin.bool.false$;
+    if (Sk.builtin.set.check$(S)) {
+        if (this.size === 0) {
+            this.set$assign(S);
+            return;
+        }
+        for (h in S.buckets) {
+            items = S.buckets[h].items;
+            for (i = 0; i < items.length; i++) {
+                this.set$addHashed(items[i], h);
+            }
+        }
+    } else if (Object.prototype.toString.apply(S) === "[object Array]") {
+        for (i = 0; i < S.length; i++) {
+            this.set$add(S[i]);
+        }
+    } else if (Sk.builtin.checkIterable(S)) {
+        for (it = Sk.abstr.iter(S), i = it.tp$iternext(); i !== undefined; i = it.tp$iternext()) {
+            this.set$add(i);
+        }
+    } else {
+        throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(S) + "' object is not iterable");
     }
+};
 
-    if (!(other instanceof Sk.builtin.set)) {
-        return Sk.builtin.bool.true$;
+/**
+ * A new set, of the kind of this one, of the elements of both this and
+ * other. Only the smaller of the two is walked when other is a set.
+ */
+Sk.builtin.set.prototype.set$intersection = function (other) {
+    var small, large, h, i, items, it, x;
+    var ret = this.set$new();
+
+    if (Sk.builtin.set.check$(other)) {
+        small = this.size <= other.size ? this : other;
+        large = small === this ? other : this;
+        for (h in small.buckets) {
+            items = small.buckets[h].items;
+            for (i = 0; i < items.length; i++) {
+                if (large.set$containsHashed(items[i], h)) {
+                    ret.set$addHashed(items[i], h);
+                }
+            }
+        }
+    } else {
+        if (!Sk.builtin.checkIterable(other)) {
+            throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(other) + "' object is not iterable");
+        }
+        for (it = Sk.abstr.iter(other), x = it.tp$iternext(); x !== undefined; x = it.tp$iternext()) {
+            h = Sk.builtin.hash(x).v;
+            if (this.set$containsHashed(x, h)) {
+                ret.set$addHashed(x, h);
+            }
+        }
     }
+    return ret;
+};
 
-    if (Sk.builtin.set.prototype.sq$length.call(this) !==
-        Sk.builtin.set.prototype.sq$length.call(other)) {
-        return Sk.builtin.bool.true$;
+/**
+ * A new set, of the kind of this one, of the elements of this that are not
+ * in other.
+ */
+Sk.builtin.set.prototype.set$difference = function (other) {
+    var h, i, items;
+    var ret = this.set$new();
+
+    if (Sk.builtin.set.check$(other) && other.size >= this.size) {
+        // keep what is not in other
+        for (h in this.buckets) {
+            items = this.buckets[h].items;
+            for (i = 0; i < items.length; i++) {
+                if (!other.set$containsHashed(items[i], h)) {
+                    ret.set$addHashed(items[i], h);
+                }
+            }
+        }
+    } else {
+        // remove what is in other
+        ret.set$assign(this);
+        ret.set$discardAll(other);
     }
+    return ret;
+};
 
-    if (this["issubset"].func_code(this, other).v) {
-        return Sk.builtin.bool.false$;
-    } else {
-        return Sk.builtin.bool.true$;
+Sk.builtin.set.prototype.set$discardAll = function (other) {
+    var it, x;
+    if (other === this) {
+        this.set_reset_();
+        return;
+    }
+    if (!Sk.builtin.checkIterable(other)) {
+        throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(other) + "' object is not iterable");
+    }
+    for (it = Sk.abstr.iter(other), x = it.tp$iternext(); x !== undefined; x = it.tp$iternext()) {
+        this.set$discard(x);
     }
 };
 
-Sk.builtin.set.prototype.ob$lt = function (other) {
+Sk.builtin.set.prototype.set$symmetricUpdate = function (other) {
+    var h, i, items;
+    if (other === this) {
+        this.set_reset_();
+        return;
+    }
+    if (!Sk.builtin.set.check$(other)) {
+        other = new Sk.builtin.set(other);
+    }
+    for (h in other.buckets) {
+        items = other.buckets[h].items;
+        for (i = 0; i < items.length; i++) {
+            if (this.set$containsHashed(items[i], h)) {
+                this.set$discard(items[i]);
+            } else {
+                this.set$addHashed(items[i], h);
+            }
+        }
+    }
+};
 
-    if (this === other) {
-        return Sk.builtin.bool.false$;
+/**
+ * Whether every element of this is in other, a set or frozenset.
+ */
+Sk.builtin.set.prototype.set$isSubset = function (other) {
+    var h, i, items;
+    if (this.size > other.size) {
+        return false;
+    }
+    for (h in this.buckets) {
+        items = this.buckets[h].items;
+        for (i = 0; i < items.length; i++) {
+            if (!other.set$containsHashed(items[i], h)) {
+                return false;
+            }
+        }
     }
+    return true;
+};
 
-    if (Sk.builtin.set.prototype.sq$length.call(this) >=
-        Sk.builtin.set.prototype.sq$length.call(other)) {
-        return Sk.builtin.bool.false$;
+Sk.builtin.set.prototype["$r"] = function () {
+    var it, i;
+    var ret = [];
+    var name = Sk.abstr.typeName(this);
+    var frozen = this instanceof Sk.builtin.frozenset;
+
+    for (it = this.tp$iter(), i = it.tp$iternext(); i !== undefined; i = it.tp$iternext()) {
+        ret.push(Sk.misceval.objectRepr(i).v);
     }
 
-    return this["issubset"].func_code(this, other);
+    if (Sk.__future__.set_repr) {
+        if (ret.length === 0) {
+            return new Sk.builtin.str(name + "()");
+        } else if (frozen) {
+            return new Sk.builtin.str(name + "({" + ret.join(", ") + "})");
+        } else {
+            return new Sk.builtin.str("{" + ret.join(", ") + "}");
+        }
+    } else {
+        return new Sk.builtin.str(name + "([" + ret.join(", ") + "])");
+    }
 };
 
-Sk.builtin.set.prototype.ob$le = function (other) {
-
+Sk.builtin.set.prototype.ob$eq = function (other) {
     if (this === other) {
         return Sk.builtin.bool.true$;
     }
-
-    if (Sk.builtin.set.prototype.sq$length.call(this) >
-        Sk.builtin.set.prototype.sq$length.call(other)) {
-        return Sk.builtin.bool.false$;
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
     }
-
-    return this["issubset"].func_code(this, other);
+    return new Sk.builtin.bool(this.size === other.size && this.set$isSubset(other));
 };
 
-Sk.builtin.set.prototype.ob$gt = function (other) {
-
+Sk.builtin.set.prototype.ob$ne = function (other) {
     if (this === other) {
         return Sk.builtin.bool.false$;
     }
-
-    if (Sk.builtin.set.prototype.sq$length.call(this) <=
-        Sk.builtin.set.prototype.sq$length.call(other)) {
-        return Sk.builtin.bool.false$;
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
     }
-
-    return this["issuperset"].func_code(this, other);
+    return new Sk.builtin.bool(this.size !== other.size || !this.set$isSubset(other));
 };
 
-Sk.builtin.set.prototype.ob$ge = function (other) {
+Sk.builtin.set.prototype.ob$lt = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    return new Sk.builtin.bool(this.size < other.size && this.set$isSubset(other));
+};
 
-    if (this === other) {
-        return Sk.builtin.bool.true$;
+Sk.builtin.set.prototype.ob$le = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
     }
+    return new Sk.builtin.bool(this.set$isSubset(other));
+};
 
-    if (Sk.builtin.set.prototype.sq$length.call(this) <
-        Sk.builtin.set.prototype.sq$length.call(other)) {
-        return Sk.builtin.bool.false$;
+Sk.builtin.set.prototype.ob$gt = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
     }
+    return new Sk.builtin.bool(this.size > other.size && other.set$isSubset(this));
+};
 
-    return this["issuperset"].func_code(this, other);
+Sk.builtin.set.prototype.ob$ge = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    return new Sk.builtin.bool(other.set$isSubset(this));
 };
 
-Sk.builtin.set.prototype.nb$and = function(other){
-    return this["intersection"].func_code(this, other);
+Sk.builtin.set.prototype.nb$and = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    return this.set$intersection(other);
 };
 
-Sk.builtin.set.prototype.nb$or = function(other){
-    return this["union"].func_code(this, other);
+Sk.builtin.set.prototype.nb$or = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    return Sk.builtin.set.prototype["union"].func_code(this, other);
 };
 
-Sk.builtin.set.prototype.nb$xor = function(other){
-    return this["symmetric_difference"].func_code(this, other);
+Sk.builtin.set.prototype.nb$xor = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    return Sk.builtin.set.prototype["symmetric_difference"].func_code(this, other);
 };
 
-Sk.builtin.set.prototype.nb$subtract = function(other){
-    return this["difference"].func_code(this, other);
+Sk.builtin.set.prototype.nb$subtract = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    return this.set$difference(other);
 };
 
 Sk.builtin.set.prototype["__iter__"] = new Sk.builtin.func(function (self) {
@@ -176,26 +417,36 @@ Sk.builtin.set.prototype.tp$iter = function () {
 };
 
 Sk.builtin.set.prototype.sq$length = function () {
-    return this["v"].mp$length();
+    return this.size;
 };
 
-Sk.builtin.set.prototype.sq$contains = function(ob) {
-    return this["v"].sq$contains(ob);
+Sk.builtin.set.prototype.sq$contains = function (ob) {
+    var key = Sk.builtin.set.key$(ob);
+    return this.set$containsHashed(key, Sk.builtin.hash(key).v);
 };
 
 Sk.builtin.set.prototype["isdisjoint"] = new Sk.builtin.func(function (self, other) {
-    // requires all items in self to not be in other
-    var isIn;
-    var it, item;
+    var small, large, h, i, items, it, item;
 
     Sk.builtin.pyCheckArgsLen("isdisjoint", arguments.length, 2, 2);
+    if (Sk.builtin.set.check$(other)) {
+        small = self.size <= other.size ? self : other;
+        large = small === self ? other : self;
+        for (h in small.buckets) {
+            items = small.buckets[h].items;
+            for (i = 0; i < items.length; i++) {
+                if (large.set$containsHashed(items[i], h)) {
+                    return Sk.builtin.bool.false$;
+                }
+            }
+        }
+        return Sk.builtin.bool.true$;
+    }
     if (!Sk.builtin.checkIterable(other)) {
         throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(other) + "' object is not iterable");
     }
-
-    for (it = Sk.abstr.iter(self), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
-        isIn = Sk.abstr.sequenceContains(other, item);
-        if (isIn) {
+    for (it = Sk.abstr.iter(other), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
+        if (self.sq$contains(item)) {
             return Sk.builtin.bool.false$;
         }
     }
@@ -203,160 +454,141 @@ Sk.builtin.set.prototype["isdisjoint"] = new Sk.builtin.func(function (self, oth
 });
 
 Sk.builtin.set.prototype["issubset"] = new Sk.builtin.func(function (self, other) {
-    var isIn;
-    var it, item;
-    var selfLength, otherLength;
-
     Sk.builtin.pyCheckArgsLen("issubset", arguments.length, 2, 2);
-    if (!Sk.builtin.checkIterable(other)) {
-        throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(other) + "' object is not iterable");
+    if (!Sk.builtin.set.check$(other)) {
+        other = new Sk.builtin.set(other);
     }
+    return new Sk.builtin.bool(self.set$isSubset(other));
+});
 
-    selfLength = self.sq$length();
-    otherLength = other.sq$length();
+Sk.builtin.set.prototype["issuperset"] = new Sk.builtin.func(function (self, other) {
+    var it, item;
 
-    if (selfLength > otherLength) {
-        // every item in this set can't be in other if it's shorter!
-        return Sk.builtin.bool.false$;
+    Sk.builtin.pyCheckArgsLen("issuperset", arguments.length, 2, 2);
+    if (Sk.builtin.set.check$(other)) {
+        return new Sk.builtin.bool(other.set$isSubset(self));
+    }
+    if (!Sk.builtin.checkIterable(other)) {
+        throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(other) + "' object is not iterable");
     }
-    for (it = Sk.abstr.iter(self), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
-        isIn = Sk.abstr.sequenceContains(other, item);
-        if (!isIn) {
+    for (it = Sk.abstr.iter(other), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
+        if (!self.sq$contains(item)) {
             return Sk.builtin.bool.false$;
         }
     }
     return Sk.builtin.bool.true$;
 });
 
-Sk.builtin.set.prototype["issuperset"] = new Sk.builtin.func(function (self, other) {
-    Sk.builtin.pyCheckArgsLen("issuperset", arguments.length, 2, 2);
-    return Sk.builtin.set.prototype["issubset"].func_code(other, self);
-});
-
 Sk.builtin.set.prototype["union"] = new Sk.builtin.func(function (self) {
-    var S, i, new_args;
+    var S, i, other;
 
     Sk.builtin.pyCheckArgsLen("union", arguments.length, 1);
 
-    S = Sk.builtin.set.prototype["copy"].func_code(self);
-    new_args = [S];
-    for (i = 1; i < arguments.length; i++) {
-        new_args.push(arguments[i]);
+    S = self.set$new();
+    other = arguments[1];
+    if (arguments.length === 2 && Sk.builtin.set.check$(other) && other.size > self.size) {
+        // start from the larger set so only the smaller one is added
+        S.set$assign(other);
+        S.set$update(self);
+        return S;
     }
 
-    Sk.builtin.set.prototype["update"].func_code.apply(null, new_args);
+    S.set$assign(self);
+    for (i = 1; i < arguments.length; i++) {
+        S.set$update(arguments[i]);
+    }
     return S;
 });
 
 Sk.builtin.set.prototype["intersection"] = new Sk.builtin.func(function (self) {
-    var S, i, new_args;
+    var S, i;
 
     Sk.builtin.pyCheckArgsLen("intersection", arguments.length, 1);
 
-    S = Sk.builtin.set.prototype["copy"].func_code(self);
-    new_args = [S];
+    if (arguments.length === 1) {
+        S = self.set$new();
+        S.set$assign(self);
+        return S;
+    }
+    S = self;
     for (i = 1; i < arguments.length; i++) {
-        new_args.push(arguments[i]);
+        S = S.set$intersection(arguments[i]);
     }
-
-    Sk.builtin.set.prototype["intersection_update"].func_code.apply(null, new_args);
     return S;
 });
 
 Sk.builtin.set.prototype["difference"] = new Sk.builtin.func(function (self, other) {
-    var S, i, new_args;
+    var S, i;
 
-    Sk.builtin.pyCheckArgsLen("difference", arguments.length, 2);
+    Sk.builtin.pyCheckArgsLen("difference", arguments.length, 1);
 
-    S = Sk.builtin.set.prototype["copy"].func_code(self);
-    new_args = [S];
-    for (i = 1; i < arguments.length; i++) {
-        new_args.push(arguments[i]);
+    if (arguments.length === 1) {
+        S = self.set$new();
+        S.set$assign(self);
+        return S;
+    }
+    S = self.set$difference(arguments[1]);
+    for (i = 2; i < arguments.length; i++) {
+        S.set$discardAll(arguments[i]);
     }
-
-    Sk.builtin.set.prototype["difference_update"].func_code.apply(null, new_args);
     return S;
 });
 
 Sk.builtin.set.prototype["symmetric_difference"] = new Sk.builtin.func(function (self, other) {
-    var it, item, S;
+    var S;
 
     Sk.builtin.pyCheckArgsLen("symmetric_difference", arguments.length, 2, 2);
 
-    S = Sk.builtin.set.prototype["union"].func_code(self, other);
-    for (it = Sk.abstr.iter(S), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
-        if (Sk.abstr.sequenceContains(self, item) && Sk.abstr.sequenceContains(other, item)) {
-            Sk.builtin.set.prototype["discard"].func_code(S, item);
-        }
-    }
+    S = self.set$new();
+    S.set$assign(self);
+    S.set$symmetricUpdate(other);
     return S;
 });
 
 Sk.builtin.set.prototype["copy"] = new Sk.builtin.func(function (self) {
+    var S;
     Sk.builtin.pyCheckArgsLen("copy", arguments.length, 1, 1);
-    return new Sk.builtin.set(self);
+    S = self.set$new();
+    S.set$assign(self);
+    return S;
 });
 
 Sk.builtin.set.prototype["update"] = new Sk.builtin.func(function (self, other) {
-    var i, it, item, arg;
+    var i;
 
-    Sk.builtin.pyCheckArgsLen("update", arguments.length, 2);
+    Sk.builtin.pyCheckArgsLen("update", arguments.length, 1);
 
     for (i = 1; i < arguments.length; i++) {
-        arg = arguments[i];
-        if (!Sk.builtin.checkIterable(arg)) {
-            throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(arg) + "' object is not iterable");
-        }
-        for (it = Sk.abstr.iter(arg), item = it.tp$iternext();
-            item !== undefined;
-            item = it.tp$iternext()) {
-            Sk.builtin.set.prototype["add"].func_code(self, item);
-        }
+        self.set$update(arguments[i]);
     }
-
     return Sk.builtin.none.none$;
 });
 
 Sk.builtin.set.prototype["intersection_update"] = new Sk.builtin.func(function (self, other) {
-    var i, it, item;
+    var S, i;
+
+    Sk.builtin.pyCheckArgsLen("intersection_update", arguments.length, 1);
 
-    Sk.builtin.pyCheckArgsLen("intersection_update", arguments.length, 2);
+    S = self;
     for (i = 1; i < arguments.length; i++) {
-        if (!Sk.builtin.checkIterable(arguments[i])) {
-            throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(arguments[i]) +
-                                           "' object is not iterable");
-        }
+        S = S.set$intersection(arguments[i]);
     }
-
-    for (it = Sk.abstr.iter(self), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
-        for (i = 1; i < arguments.length; i++) {
-            if (!Sk.abstr.sequenceContains(arguments[i], item)) {
-                Sk.builtin.set.prototype["discard"].func_code(self, item);
-                break;
-            }
-        }
+    if (S !== self) {
+        self.buckets = S.buckets;
+        self.size = S.size;
+        self.$hashes = null;
+        self.$version++;
     }
     return Sk.builtin.none.none$;
 });
 
 Sk.builtin.set.prototype["difference_update"] = new Sk.builtin.func(function (self, other) {
-    var i, it, item;
+    var i;
 
-    Sk.builtin.pyCheckArgsLen("difference_update", arguments.length, 2);
-    for (i = 1; i < arguments.length; i++) {
-        if (!Sk.builtin.checkIterable(arguments[i])) {
-            throw new Sk.builtin.TypeError("'" + Sk.abstr.typeName(arguments[i]) +
-                                           "' object is not iterable");
-        }
-    }
+    Sk.builtin.pyCheckArgsLen("difference_update", arguments.length, 1);
 
-    for (it = Sk.abstr.iter(self), item = it.tp$iternext(); item !== undefined; item = it.tp$iternext()) {
-        for (i = 1; i < arguments.length; i++) {
-            if (Sk.abstr.sequenceContains(arguments[i], item)) {
-                Sk.builtin.set.prototype["discard"].func_code(self, item);
-                break;
-            }
-        }
+    for (i = 1; i < arguments.length; i++) {
+        self.set$discardAll(arguments[i]);
     }
     return Sk.builtin.none.none$;
 });
@@ -364,87 +596,175 @@ Sk.builtin.set.prototype["difference_update"] = new Sk.builtin.func(function (se
 Sk.builtin.set.prototype["symmetric_difference_update"] = new Sk.builtin.func(function (self, other) {
     Sk.builtin.pyCheckArgsLen("symmetric_difference_update", arguments.length, 2, 2);
 
-    var sd = Sk.builtin.set.prototype["symmetric_difference"].func_code(self, other);
-    self.set_reset_();
-    Sk.builtin.set.prototype["update"].func_code(self, sd);
+    self.set$symmetricUpdate(other);
     return Sk.builtin.none.none$;
 });
 
+Sk.builtin.set.prototype.nb$inplace_and = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    Sk.builtin.set.prototype["intersection_update"].func_code(this, other);
+    return this;
+};
+
+Sk.builtin.set.prototype.nb$inplace_or = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    this.set$update(other);
+    return this;
+};
+
+Sk.builtin.set.prototype.nb$inplace_xor = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    this.set$symmetricUpdate(other);
+    return this;
+};
+
+Sk.builtin.set.prototype.nb$inplace_subtract = function (other) {
+    if (!Sk.builtin.set.check$(other)) {
+        return Sk.builtin.NotImplemented.NotImplemented$;
+    }
+    this.set$discardAll(other);
+    return this;
+};
 
 Sk.builtin.set.prototype["add"] = new Sk.builtin.func(function (self, item) {
     Sk.builtin.pyCheckArgsLen("add", arguments.length, 2, 2);
 
-    self.v.mp$ass_subscript(item, true);
+    self.set$add(item);
     return Sk.builtin.none.none$;
 });
 
 Sk.builtin.set.prototype["discard"] = new Sk.builtin.func(function (self, item) {
     Sk.builtin.pyCheckArgsLen("discard", arguments.length, 2, 2);
 
-    Sk.builtin.dict.prototype["pop"].func_code(self.v, item,
-                                               Sk.builtin.none.none$);
+    self.set$discard(Sk.builtin.set.key$(item));
     return Sk.builtin.none.none$;
 });
 
+/**
+ * pop takes the first element in iteration order. Every bucket before
+ * $popIndex has been emptied, so repeated pops do not walk them again.
+ */
 Sk.builtin.set.prototype["pop"] = new Sk.builtin.func(function (self) {
-    var it, item;
+    var hashes, h, bucket, item;
 
     Sk.builtin.pyCheckArgsLen("pop", arguments.length, 1, 1);
 
-    if (self.sq$length() === 0) {
+    if (self.size === 0) {
         throw new Sk.builtin.KeyError("pop from an empty set");
     }
 
-    it = Sk.abstr.iter(self);
-    item = it.tp$iternext();
-    Sk.builtin.set.prototype["discard"].func_code(self, item);
+    hashes = self.set$hashes();
+    for (;;) {
+        h = hashes[self.$popIndex];
+        bucket = self.buckets[h];
+        if (bucket !== undefined) {
+            break;
+        }
+        self.$popIndex++;
+    }
+
+    item = bucket.items[0];
+    if (bucket.items.length === 1) {
+        delete self.buckets[h];
+        self.$popIndex++;
+    } else {
+        bucket.items.shift();
+    }
+    self.size--;
+    self.$version++;
     return item;
 });
 
 Sk.builtin.set.prototype["remove"] = new Sk.builtin.func(function (self, item) {
     Sk.builtin.pyCheckArgsLen("remove", arguments.length, 2, 2);
 
-    self.v.mp$del_subscript(item);
+    if (!self.set$discard(Sk.builtin.set.key$(item))) {
+        throw new Sk.builtin.KeyError(item);
+    }
+    return Sk.builtin.none.none$;
+});
+
+Sk.builtin.set.prototype["clear"] = new Sk.builtin.func(function (self) {
+    Sk.builtin.pyCheckArgsLen("clear", arguments.length, 1, 1);
+
+    self.set_reset_();
     return Sk.builtin.none.none$;
 });
 
+// frozenset shares everything with set but the methods that change it
+(function () {
+    var shared = ["$hashes", "$popIndex", "$version", "set_reset_", "set$hashes", "set$find",
+        "set$addHashed", "set$add", "set$containsHashed", "set$discard", "set$assign", "set$update",
+        "set$intersection", "set$difference", "set$discardAll", "set$symmetricUpdate", "set$isSubset",
+        "$r", "ob$eq", "ob$ne", "ob$lt", "ob$le", "ob$gt", "ob$ge", "nb$and", "nb$or", "nb$xor",
+        "nb$subtract", "__iter__", "tp$iter", "sq$length", "sq$contains", "isdisjoint", "issubset",
+        "issuperset", "union", "intersection", "difference", "symmetric_difference"];
+    var i;
+    for (i = 0; i < shared.length; i++) {
+        Sk.builtin.frozenset.prototype[shared[i]] = Sk.builtin.set.prototype[shared[i]];
+    }
+}());
+
+Sk.builtin.frozenset.prototype.set$new = function () {
+    return new Sk.builtin.frozenset();
+};
+
+Sk.builtin.frozenset.prototype["copy"] = new Sk.builtin.func(function (self) {
+    var S;
+    Sk.builtin.pyCheckArgsLen("copy", arguments.length, 1, 1);
+    if (self.constructor === Sk.builtin.frozenset) {
+        return self;
+    }
+    S = new Sk.builtin.frozenset();
+    S.set$assign(self);
+    return S;
+});
+
+/**
+ * The hash of CPython, which does not depend on the order of the elements.
+ * Sk.builtin.hash keeps it, frozensets being immutable.
+ */
+Sk.builtin.frozenset.prototype.tp$hash = function () {
+    var h, i, items, hx;
+    var hash = 0;
+    for (h in this.buckets) {
+        items = this.buckets[h].items;
+        for (i = 0; i < items.length; i++) {
+            hx = Sk.builtin.hash(items[i]).v;
+            hash ^= Math.imul((hx ^ 89869747) ^ (hx << 16), 3644798167 | 0);
+        }
+    }
+    hash ^= Math.imul(this.size + 1, 1927868237);
+    hash ^= (hash >> 11) ^ (hash >> 25);
+    hash = (Math.imul(hash, 69069) + 907133923) | 0;
+    if (hash === -1) {
+        hash = 590923713;
+    }
+    return new Sk.builtin.int_(hash);
+};
+
 Sk.exportSymbol("Sk.builtin.set", Sk.builtin.set);
+Sk.exportSymbol("Sk.builtin.frozenset", Sk.builtin.frozenset);
 
 /**
  * @constructor
  * @param {Object} obj
  */
 Sk.builtin.set_iter_ = function (obj) {
-    var allkeys, k, i, bucket, buckets;
     if (!(this instanceof Sk.builtin.set_iter_)) {
         return new Sk.builtin.set_iter_(obj);
     }
     this.$obj = obj;
-    this.tp$iter = this;
-    allkeys = [];
-    buckets = obj.v.buckets;
-    for (k in buckets) {
-        if (buckets.hasOwnProperty(k)) {
-            bucket = buckets[k];
-            if (bucket && bucket.$hash !== undefined && bucket.items !== undefined) {
-                // skip internal stuff. todo; merge pyobj and this
-                for (i = 0; i < bucket.items.length; i++) {
-                    allkeys.push(bucket.items[i].lhs);
-                }
-            }
-        }
-    }
+    this.$hashes = obj.set$hashes();
+    this.$bucket = 0;
     this.$index = 0;
-    this.$keys = allkeys;
-    this.tp$iternext = function () {
-        if (this.$index >= this.$keys.length) {
-            return undefined;
-        }
-        return this.$keys[this.$index++];
-    };
-    this.$r = function () {
-        return new Sk.builtin.str("setiterator");
-    };
+    this.$version = obj.$version;
     return this;
 };
 
@@ -452,6 +772,38 @@ Sk.abstr.setUpInheritance("setiterator", Sk.builtin.set_iter_, Sk.builtin.object
 
 Sk.builtin.set_iter_.prototype.__class__ = Sk.builtin.set_iter_;
 
+Sk.builtin.set_iter_.prototype.tp$iter = function () {
+    return this;
+};
+
+Sk.builtin.set_iter_.prototype.tp$iternext = function () {
+    var bucket;
+    var obj = this.$obj;
+    var hashes = this.$hashes;
+
+    if (obj === null) {
+        return undefined;
+    }
+    if (obj.$version !== this.$version) {
+        throw new Sk.builtin.RuntimeError("Set changed size during iteration");
+    }
+    while (this.$bucket < hashes.length) {
+        bucket = obj.buckets[hashes[this.$bucket]];
+        // buckets that emptied are gone
+        if (bucket !== undefined && this.$index < bucket.items.length) {
+            return bucket.items[this.$index++];
+        }
+        this.$bucket++;
+        this.$index = 0;
+    }
+    this.$obj = null;
+    return undefined;
+};
+
+Sk.builtin.set_iter_.prototype.$r = function () {
+    return new Sk.builtin.str("setiterator");
+};
+
 Sk.builtin.set_iter_.prototype.__iter__ = new Sk.builtin.func(function (self) {
     Sk.builtin.pyCheckArgsLen("__iter__", arguments.length, 0, 0, true, false);
     return self;
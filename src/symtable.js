@@ -1022,8 +1022,12 @@ Sk.symboltable = function (ast, filename) {
     ret.top = ret.cur;
 
     //print(Sk.astDump(ast));
-    for (i = 0; i < ast.body.length; ++i) {
-        ret.visitStmt(ast.body[i]);
+    if (ast.constructor === Sk.astnodes.Expression) {
+        ret.visitExpr(ast.body);
+    } else {
+        for (i = 0; i < ast.body.length; ++i) {
+            ret.visitStmt(ast.body[i]);
+        }
     }
 
     ret.exitBlock();
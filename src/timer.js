@@ -0,0 +1,282 @@
+/**
+ * The timer service: one monotonic clock and one queue of wakeups, shared
+ * by time.sleep, the frame pacing of turtle and image, and the delivery of
+ * signals, instead of a timeout and a Promise of their own for each.
+ *
+ * Wakeups are kept in a min-heap by deadline, and a single timeout is
+ * armed, for the earliest of them. Every wakeup that is due when it fires
+ * is run in that same turn of the event loop, so the many programs of a
+ * page that sleep at about the same time are woken together.
+ *
+ * The clock of the service is the one the programs see through time.time,
+ * time.monotonic and time.clock. Sk.configure({timeScale: s}) runs it 1/s
+ * times as fast as the real one, so a program that sleeps for a minute
+ * does so in a second with s = 1/60. With s = 0 the clock only moves on
+ * the sleeps: each wakeup runs as soon as nothing else is due, with the
+ * clock set forward to its deadline, as in a simulation.
+ */
+Sk.timer = {};
+
+Sk.timer.realNow_ = (typeof performance === "object" && typeof performance.now === "function") ?
+    function () {
+        return performance.now();
+    } : Date.now;
+
+// the clock read realBase_ (real) milliseconds when it read virtualBase_,
+// and has run 1/scale_ times as fast since
+Sk.timer.scale_ = 1;
+Sk.timer.realBase_ = Sk.timer.realNow_();
+Sk.timer.virtualBase_ = 0;
+// time.time() is now() + wallOffset_
+Sk.timer.wallOffset_ = Date.now() - Sk.timer.realBase_;
+
+// the wakeups, a binary heap ordered by deadline, then by when they were
+// scheduled
+Sk.timer.heap_ = [];
+Sk.timer.seq_ = 0;
+// when the armed timeout fires, in real milliseconds, Infinity if none is
+Sk.timer.armedAt_ = Number.POSITIVE_INFINITY;
+Sk.timer.armed_ = 0;
+
+/**
+ * How late the program that is running went on after its last time.sleep,
+ * in milliseconds of the clock, to be made up for on its next sleep.
+ */
+Sk.sleepDebt = 0;
+
+/**
+ * When, by the clock, the program that is running went on after its last
+ * time.sleep. The time it has run since pays off Sk.sleepDebt.
+ */
+Sk.sleepResumed = 0;
+
+/**
+ * How many wakeups the service has run, and how many timeouts it armed
+ * for them.
+ */
+Sk.timer.stats = {
+    "wakeups": 0,
+    "timeouts": 0
+};
+
+/**
+ * The time of the clock, in milliseconds. It never goes back.
+ *
+ * @return {number}
+ */
+Sk.timer.now = function () {
+    if (Sk.timer.scale_ === 0) {
+        return Sk.timer.virtualBase_;
+    }
+    return Sk.timer.virtualBase_ + (Sk.timer.realNow_() - Sk.timer.realBase_) / Sk.timer.scale_;
+};
+Sk.exportSymbol("Sk.timer.now", Sk.timer.now);
+
+/**
+ * The time of the clock since the epoch, in milliseconds, for time.time.
+ *
+ * @return {number}
+ */
+Sk.timer.wallNow = function () {
+    return Sk.timer.now() + Sk.timer.wallOffset_;
+};
+
+/**
+ * Sets how fast the clock runs, see Sk.configure. The clock goes on from
+ * where it was.
+ *
+ * @param {number} scale real milliseconds per millisecond of the clock
+ */
+Sk.timer.setScale = function (scale) {
+    var now = Sk.timer.now();
+    Sk.asserts.assert(typeof scale === "number" && scale >= 0, "timeScale must be a number >= 0");
+    Sk.timer.virtualBase_ = now;
+    Sk.timer.realBase_ = Sk.timer.realNow_();
+    Sk.timer.scale_ = scale;
+    // the armed timeout was for the old speed
+    Sk.timer.armedAt_ = Number.POSITIVE_INFINITY;
+    Sk.timer.arm_();
+};
+
+/**
+ * Calls fn once delay milliseconds of the clock have passed. Returns the
+ * wakeup, for Sk.timer.cancel.
+ *
+ * @param {number} delay
+ * @param {function()} fn
+ * @return {Object}
+ */
+Sk.timer.schedule = function (delay, fn) {
+    var entry = {
+        at : Sk.timer.now() + Math.max(0, delay || 0),
+        seq: Sk.timer.seq_++,
+        fn : fn
+    };
+    Sk.timer.push_(entry);
+    Sk.timer.arm_();
+    return entry;
+};
+Sk.exportSymbol("Sk.timer.schedule", Sk.timer.schedule);
+
+/**
+ * Stops a wakeup from Sk.timer.schedule being run, if it was not yet.
+ *
+ * @param {Object} entry
+ */
+Sk.timer.cancel = function (entry) {
+    if (entry) {
+        // it is dropped when it comes to the top of the heap
+        entry.fn = null;
+    }
+};
+Sk.exportSymbol("Sk.timer.cancel", Sk.timer.cancel);
+
+/**
+ * A Promise that resolves once delay milliseconds of the clock have passed,
+ * to the time they were up.
+ *
+ * @param {number} delay
+ * @return {Promise}
+ */
+Sk.timer.sleep = function (delay) {
+    return new Promise(function (resolve) {
+        var entry = Sk.timer.schedule(delay, function () {
+            resolve(entry.at);
+        });
+    });
+};
+Sk.exportSymbol("Sk.timer.sleep", Sk.timer.sleep);
+
+/**
+ * A Promise of the next signal sent through Sk.signals. The signal is
+ * delivered as a wakeup, with the other wakeups that are due.
+ *
+ * @return {Promise}
+ */
+Sk.timer.nextSignal = function () {
+    return new Promise(function (resolve) {
+        var handler = function (signal, data) {
+            Sk.signals.removeEventListener(handler);
+            Sk.timer.schedule(0, function () {
+                resolve(signal);
+            });
+        };
+        Sk.signals.addEventListener(handler);
+    });
+};
+
+Sk.timer.less_ = function (a, b) {
+    return a.at < b.at || (a.at === b.at && a.seq < b.seq);
+};
+
+Sk.timer.push_ = function (entry) {
+    var heap = Sk.timer.heap_;
+    var i = heap.length;
+    var parent;
+
+    heap.push(entry);
+    while (i > 0) {
+        parent = (i - 1) >> 1;
+        if (!Sk.timer.less_(entry, heap[parent])) {
+            break;
+        }
+        heap[i] = heap[parent];
+        i = parent;
+    }
+    heap[i] = entry;
+};
+
+Sk.timer.pop_ = function () {
+    var heap = Sk.timer.heap_;
+    var top = heap[0];
+    var last = heap.pop();
+    var i = 0;
+    var child;
+
+    if (heap.length > 0) {
+        while (true) {
+            child = 2 * i + 1;
+            if (child >= heap.length) {
+                break;
+            }
+            if (child + 1 < heap.length && Sk.timer.less_(heap[child + 1], heap[child])) {
+                child++;
+            }
+            if (!Sk.timer.less_(heap[child], last)) {
+                break;
+            }
+            heap[i] = heap[child];
+            i = child;
+        }
+        heap[i] = last;
+    }
+    return top;
+};
+
+// Makes sure a timeout is armed for the earliest wakeup. A timeout that was
+// armed for a later one is left to fire, and finds nothing to do.
+Sk.timer.arm_ = function () {
+    var heap = Sk.timer.heap_;
+    var wait, at, token;
+
+    while (heap.length > 0 && heap[0].fn === null) {
+        Sk.timer.pop_();
+    }
+    if (heap.length === 0) {
+        return;
+    }
+
+    wait = Math.max(0, Math.ceil((heap[0].at - Sk.timer.now()) * Sk.timer.scale_));
+    at = Sk.timer.realNow_() + wait;
+    if (at >= Sk.timer.armedAt_) {
+        return;
+    }
+    Sk.timer.armedAt_ = at;
+    token = ++Sk.timer.armed_;
+    Sk.timer.stats["timeouts"]++;
+    (Sk.setTimeout || setTimeout)(function () {
+        if (token === Sk.timer.armed_) {
+            Sk.timer.armedAt_ = Number.POSITIVE_INFINITY;
+        }
+        Sk.timer.fire_();
+    }, wait);
+};
+
+// Runs the wakeups that are due, then arms the timeout for the next one
+Sk.timer.fire_ = function () {
+    var heap = Sk.timer.heap_;
+    var due = [];
+    var now, entry, i;
+
+    while (heap.length > 0 && heap[0].fn === null) {
+        Sk.timer.pop_();
+    }
+    if (heap.length > 0 && Sk.timer.scale_ === 0 && heap[0].at > Sk.timer.virtualBase_) {
+        // the clock stands still until the next wakeup
+        Sk.timer.virtualBase_ = heap[0].at;
+    }
+
+    now = Sk.timer.now();
+    while (heap.length > 0 && heap[0].at <= now) {
+        entry = Sk.timer.pop_();
+        if (entry.fn !== null) {
+            due.push(entry);
+        }
+    }
+
+    i = 0;
+    try {
+        while (i < due.length) {
+            Sk.timer.stats["wakeups"]++;
+            entry = due[i++];
+            entry.fn.call(null);
+            entry.fn = null;
+        }
+    } finally {
+        // if one of them threw, the others run on the next timeout
+        for (; i < due.length; i++) {
+            Sk.timer.push_(due[i]);
+        }
+        Sk.timer.arm_();
+    }
+};
@@ -187,26 +187,64 @@ var PseudoExtras = group('\\\\\\r?\\n|$', Comment_, Triple);
 // For a given string prefix plus quotes, endpats maps it to a regex
 //  to match the remainder of that string. _prefix can be empty, for
 //  a normal single or triple quoted string (with no prefix).
+//  The regexes are compiled once, sticky, so they can be run at
+//  lastIndex against the whole line instead of a substring of it.
 var endpats = {}
 var prefixes = _all_string_prefixes();
+var SingleProg = sticky(Single);
+var DoubleProg = sticky(Double);
+var Single3Prog = sticky(Single3);
+var Double3Prog = sticky(Double3);
 for (let _prefix of prefixes) {
-    endpats[_prefix + "'"] = Single
-    endpats[_prefix + '"'] = Double
-    endpats[_prefix + "'''"] = Single3
-    endpats[_prefix + '"""'] = Double3
+    endpats[_prefix + "'"] = SingleProg
+    endpats[_prefix + '"'] = DoubleProg
+    endpats[_prefix + "'''"] = Single3Prog
+    endpats[_prefix + '"""'] = Double3Prog
+}
+
+/**
+ * compile one of the ^ anchored patterns above as a sticky regex
+ *
+ * @param {string} pattern
+ * @returns {RegExp}
+ */
+function sticky(pattern) {
+    return new RegExp(pattern.replace(/^\^/, ''), 'y');
 }
 
 // A set of all of the single and triple quoted string prefixes,
 //  including the opening quotes.
-let single_quoted = []
-let triple_quoted = []
+let single_quoted = {}
+let triple_quoted = {}
 for (let t of prefixes) {
-    single_quoted.push(t + '"');
-    single_quoted.push(t + "'");
-    triple_quoted.push(t + '"""');
-    triple_quoted.push(t + "'''");
+    single_quoted[t + '"'] = true;
+    single_quoted[t + "'"] = true;
+    triple_quoted[t + '"""'] = true;
+    triple_quoted[t + "'''"] = true;
 }
 
+// PseudoToken depends on the __future__ flags, so the compiled regex is
+// cached per pattern rather than rebuilt for every parse.
+var pseudoTokenCache = {};
+
+// Character classes for the hand-written name scanner in _tokenize.
+// Only ASCII is classified, anything else goes through the regexes.
+var CH_NAME_START = 1;
+var CH_NAME = 2;
+var CH_DIGIT = 4;
+var CH_QUOTE = 8;
+var charClass = new Uint8Array(128);
+(function () {
+    for (var c = 0; c < 128; c++) {
+        if ((c >= 65 && c <= 90) || (c >= 97 && c <= 122) || c === 95) {
+            charClass[c] = CH_NAME_START | CH_NAME;
+        } else if (c >= 48 && c <= 57) {
+            charClass[c] = CH_DIGIT | CH_NAME;
+        }
+    }
+    charClass[34] = charClass[39] = CH_QUOTE;
+})();
+
 var tabsize = 8
 
 /**
@@ -230,12 +268,15 @@ function _tokenize(filename, readline, encoding, yield_) {
     var Number_ = group(Imagnumber, Floatnumber, Intnumber);
     var PseudoToken = Whitespace + group(PseudoExtras, Number_, Funny, ContStr, Name);
 
-    const PseudoTokenRegexp = new RegExp(PseudoToken);
+    var PseudoTokenRegexp = pseudoTokenCache[PseudoToken];
+    if (PseudoTokenRegexp === undefined) {
+        PseudoTokenRegexp = pseudoTokenCache[PseudoToken] = new RegExp(PseudoToken, 'y');
+    }
 
     var lnum = 0,
         parenlev = 0,
         continued = 0,
-        numchars = '0123456789',
+        code = 0,
         contstr = '',
         needcont = 0,
         contline = null,
@@ -367,7 +408,28 @@ function _tokenize(filename, readline, encoding, yield_) {
                 capos = line.charAt(pos);
             }
 
-            pseudomatch = PseudoTokenRegexp.exec(line.substring(pos))
+            // Plain ASCII names are by far the most common token, so scan
+            // them directly. A name running into a quote may be a string
+            // prefix and one running into non-ASCII may continue as a
+            // unicode identifier, both are left to the regex.
+            code = line.charCodeAt(pos);
+            if (code < 128 && (charClass[code] & CH_NAME_START)) {
+                end = pos + 1;
+                code = line.charCodeAt(end);
+                while (code < 128 && (charClass[code] & CH_NAME)) {
+                    end += 1;
+                    code = line.charCodeAt(end);
+                }
+                if (!(code >= 128 || (charClass[code] & CH_QUOTE))) {
+                    yield_(new TokenInfo(tokens.T_NAME, line.substring(pos, end),
+                               [lnum, pos], [lnum, end], line));
+                    pos = end;
+                    continue;
+                }
+            }
+
+            PseudoTokenRegexp.lastIndex = pos;
+            pseudomatch = PseudoTokenRegexp.exec(line);
             if (pseudomatch) {                                // scan for tokens
                 var start = pos;
                 var end = start + pseudomatch[1].length;
@@ -381,7 +443,8 @@ function _tokenize(filename, readline, encoding, yield_) {
                 var token = line.substring(start, end);
                 var initial = line[start];
                 //console.log("token:",token, "initial:",initial, start, end);
-                if (contains(numchars, initial) ||                 // ordinary number
+                code = line.charCodeAt(start);
+                if ((code < 128 && (charClass[code] & CH_DIGIT)) ||  // ordinary number
                     (initial == '.' && token != '.' && token != '...')) {
                     yield_(new TokenInfo(tokens.T_NUMBER, token, spos, epos, line));
                 } else if (contains('\r\n', initial)) {
@@ -393,11 +456,12 @@ function _tokenize(filename, readline, encoding, yield_) {
                 } else if (initial == '#') {
                     //assert not token.endswith("\n")
                     yield_(new TokenInfo(tokens.T_COMMENT, token, spos, epos, line));
-                } else if (contains(triple_quoted, token)) {
-                    endprog = RegExp(endpats[token]);
-                    endmatch = endprog.exec(line.substring(pos));
+                } else if (triple_quoted[token] === true) {
+                    endprog = endpats[token];
+                    endprog.lastIndex = pos;
+                    endmatch = endprog.exec(line);
                     if (endmatch) {                       // all on one line
-                        pos = endmatch[0].length + pos;
+                        pos = endprog.lastIndex;
                         token = line.substring(start, pos);
                         yield_(new TokenInfo(tokens.T_STRING, token, spos, [lnum, pos], line));
                     } else {
@@ -416,9 +480,9 @@ function _tokenize(filename, readline, encoding, yield_) {
                 // Note that initial == token[:1].
                 // Also note that single quote checking must come after
                 //  triple quote checking (above).
-                } else if (contains(single_quoted, initial) ||
-                           contains(single_quoted, token.substring(0, 2)) ||
-                           contains(single_quoted, token.substring(0, 3))) {
+                } else if (single_quoted[initial] === true ||
+                           single_quoted[token.substring(0, 2)] === true ||
+                           single_quoted[token.substring(0, 3)] === true) {
                     if (token[token.length - 1] == '\n') {                // continued string
                         strstart = [lnum, start];
                         // Again, using the first 3 chars of the
@@ -427,9 +491,9 @@ function _tokenize(filename, readline, encoding, yield_) {
                         //  character. So it's really looking for
                         //  endpats["'"] or endpats['"'], by trying to
                         //  skip string prefix characters, if any.
-                        endprog = RegExp(endpats[initial] ||
-                                           endpats[token[1]] ||
-                                           endpats[token[2]]);
+                        endprog = endpats[initial] ||
+                                  endpats[token[1]] ||
+                                  endpats[token[2]];
                         contstr = line.substring(start);
                         needcont = 1;
                         contline = line;
@@ -438,7 +502,8 @@ function _tokenize(filename, readline, encoding, yield_) {
                         yield_(new TokenInfo(tokens.T_STRING, token, spos, epos, line));
                     }
 
-                } else if (isidentifier(initial)) {              // ordinary name
+                } else if (code < 128 ? (charClass[code] & CH_NAME_START) :
+                           isidentifier(initial)) {              // ordinary name
                     yield_(new TokenInfo(tokens.T_NAME, token, spos, epos, line));
                 } else if (initial == '\\') {                  // continued stmt
                     continued = 1
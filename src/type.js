@@ -51,7 +51,7 @@ Sk.dunderToSkulpt = {
     "__rdivmod__": "nb$reflected_divmod",
     "__pow__": "nb$power",
     "__rpow__": "nb$reflected_power",
-    "__contains__": "sq$contains",
+    "__contains__": ["sq$contains", 2],
     "__len__": ["sq$length", 1],
     "__get__": ["tp$descr_get", 3],
     "__set__": ["tp$descr_set", 3]
@@ -143,10 +143,18 @@ Sk.builtin.type = function (name, bases, dict) {
                 }
             }
 
-            this["$d"] = new Sk.builtin.dict([]);
-            this["$d"].mp$ass_subscript(new Sk.builtin.str("__dict__"), this["$d"]);
+            if (compact) {
+                // attributes live in the slots of the class shape until the
+                // instance needs a real __dict__, see Sk.builtin.type.makeShape_
+                this.$s = [];
+            } else {
+                this["$d"] = new Sk.builtin.dict([]);
+                this["$d"].mp$ass_subscript(Sk.builtin.str.$dict, this["$d"]);
+            }
         };
 
+        var compact = false;
+
         var _name = Sk.ffi.remapToJs(name); // unwrap name string to js for latter use
 
         var inheritsBuiltin = false;
@@ -278,7 +286,13 @@ Sk.builtin.type = function (name, bases, dict) {
         };
 
         klass.prototype.tp$setattr = function(pyName, data, canSuspend) {
-            var r, setf = Sk.builtin.object.prototype.GenericGetAttr.call(this, Sk.builtin.str.$setattr);
+            var r, setf = Sk.builtin.type.typeLookup(klass, Sk.builtin.str.$setattr);
+            if (setf === undefined || setf === Sk.builtin.object.prototype["__setattr__"]) {
+                // no __setattr__ of our own, skip the bound method and the call
+                return Sk.builtin.object.prototype.GenericSetAttr.call(this, pyName, data, canSuspend);
+            }
+
+            setf = Sk.builtin.object.prototype.GenericGetAttr.call(this, Sk.builtin.str.$setattr);
             if (setf !== undefined) {
                 var f = /** @type {?} */ (setf);
                 r = Sk.misceval.callsimOrSuspendArray(f, [pyName, data]);
@@ -293,6 +307,30 @@ Sk.builtin.type = function (name, bases, dict) {
             // Find __getattribute__ on this type if we can
             descr = Sk.builtin.type.typeLookup(klass, Sk.builtin.str.$getattribute);
 
+            if (descr === undefined || descr === Sk.builtin.object.prototype["__getattribute__"]) {
+                // the default __getattribute__, go straight to GenericGetAttr
+                try {
+                    r = Sk.builtin.object.prototype.GenericGetAttr.call(this, pyName, true);
+                } catch (e) {
+                    if (e instanceof Sk.builtin.AttributeError) {
+                        return undefined;
+                    }
+                    throw e;
+                }
+                if (r instanceof Sk.misceval.Suspension) {
+                    r = Sk.misceval.tryCatch(function () {
+                        return r;
+                    }, function (e) {
+                        if (e instanceof Sk.builtin.AttributeError) {
+                            return undefined;
+                        } else {
+                            throw e;
+                        }
+                    });
+                }
+                return canSuspend ? r : Sk.misceval.retryOptionalSuspensionOrThrow(r);
+            }
+
             if (descr !== undefined && descr !== null && descr.tp$descr_get !== undefined) {
                 getf = descr.tp$descr_get.call(descr, this, klass);
             }
@@ -407,6 +445,10 @@ Sk.builtin.type = function (name, bases, dict) {
             //print("mro result", Sk.builtin.repr(mro).v);
         }
 
+        if (builtin_bases.length === 0 || builtin_bases[0] === Sk.builtin.object) {
+            compact = Sk.builtin.type.makeShape_(klass, bases, dict);
+        }
+
         // fix for class attributes
         klass.tp$setattr = Sk.builtin.type.prototype.tp$setattr;
 
@@ -590,6 +632,147 @@ Sk.builtin.type.typeLookup = function (type, pyName) {
     return undefined;
 };
 
+/**
+ * The most attribute names the shape of a class takes. Setting any other
+ * attribute makes the instance fall back to a dict of its own.
+ */
+Sk.builtin.type.maxShapeSize_ = 32;
+
+/**
+ * Gives the instances of klass a compact layout. Rather than a dict each,
+ * an instance keeps its attributes in the array $s, at the position the
+ * shape of the class gives each name: {index: name -> position, names,
+ * slotsOnly}. Names are added to the shape as they are first set, so the
+ * attributes set in __init__ end up in fixed places.
+ *
+ * The names in __slots__ are in the shape from the start, and listed in
+ * its slots. When neither the class nor its bases have a __dict__ the
+ * shape is sealed (slotsOnly) and no other attributes can be set.
+ *
+ * Code that reads $d of an instance gets a dict made from the slots (see
+ * Sk.builtin.type.instanceDict_) and from then on that instance uses it.
+ * The values of its __slots__ stay out of that dict, in the array $slots.
+ *
+ * @return {boolean} whether the instances are compact
+ */
+Sk.builtin.type.makeShape_ = function (klass, bases, dict) {
+    var shape = {index: Object.create(null), names: [], slots: [], slotsOnly: false};
+    var slots = dict.mp$lookup(Sk.builtin.str.$slots);
+    var i, j, base, names, name, it, slot;
+
+    var addName = function (name) {
+        if (shape.index[name] === undefined) {
+            shape.index[name] = shape.names.length;
+            shape.names.push(name);
+        }
+    };
+
+    var addSlot = function (name) {
+        addName(name);
+        if (shape.slots.indexOf(name) === -1) {
+            shape.slots.push(name);
+        }
+    };
+
+    // __slots__ only means something for new style classes
+    if (!(klass.prototype instanceof Sk.builtin.object)) {
+        slots = undefined;
+    }
+
+    if (slots !== undefined) {
+        shape.slotsOnly = true;
+    }
+    for (i = 0; i < bases.v.length; i++) {
+        base = bases.v[i];
+        if (base === Sk.builtin.object) {
+            continue;
+        }
+        if (!base.prototype.hasOwnProperty("$shape")) {
+            shape.slotsOnly = false;
+            continue;
+        }
+        shape.slotsOnly = shape.slotsOnly && base.prototype.$shape.slotsOnly;
+        names = base.prototype.$shape.names;
+        for (j = 0; j < names.length; j++) {
+            addName(names[j]);
+        }
+        names = base.prototype.$shape.slots;
+        for (j = 0; j < names.length; j++) {
+            addSlot(names[j]);
+        }
+    }
+
+    if (slots !== undefined) {
+        if (Sk.builtin.checkString(slots)) {
+            slots = new Sk.builtin.tuple([slots]);
+        }
+        for (it = Sk.abstr.iter(slots), slot = it.tp$iternext(); slot !== undefined; slot = it.tp$iternext()) {
+            if (!Sk.builtin.checkString(slot)) {
+                throw new Sk.builtin.TypeError("__slots__ items must be strings, not '" + Sk.abstr.typeName(slot) + "'");
+            }
+            if (slot.v === "__dict__") {
+                shape.slotsOnly = false;
+                continue;
+            }
+            if (slot.v === "__weakref__") {
+                continue;
+            }
+            if (dict.mp$lookup(slot) !== undefined) {
+                throw new Sk.builtin.ValueError("'" + slot.v + "' in __slots__ conflicts with class variable");
+            }
+            // the name attribute access uses for it
+            name = Sk.mangleName(klass["__name__"], slot).v;
+            addSlot(Sk.fixReservedNames(Sk.fixReservedWords(name)));
+        }
+    }
+
+    klass.prototype.$shape = shape;
+    Object.defineProperty(klass.prototype, "$d", {
+        configurable: true,
+        get: function () {
+            return Sk.builtin.type.instanceDict_(this);
+        },
+        set: function (d) {
+            var s = this.$s;
+            var i;
+            Object.defineProperty(this, "$d", {value: d, writable: true, enumerable: true, configurable: true});
+            if (s && shape.slots.length) {
+                // the __slots__ keep their values out of the dict
+                this.$slots = [];
+                for (i = 0; i < shape.slots.length; i++) {
+                    this.$slots[shape.index[shape.slots[i]]] = s[shape.index[shape.slots[i]]];
+                }
+            }
+            this.$s = null;
+        }
+    });
+
+    return true;
+};
+
+/**
+ * The dict of a compact instance, undefined if it can't have one. The
+ * first call makes the dict from the slots, after which the instance
+ * keeps its attributes there, but for its __slots__.
+ */
+Sk.builtin.type.instanceDict_ = function (obj) {
+    var d, i, names;
+    if (!obj.$s || obj.$shape.slotsOnly) {
+        return undefined;
+    }
+
+    d = new Sk.builtin.dict([]);
+    d.mp$ass_subscript(Sk.builtin.str.$dict, d);
+    names = obj.$shape.names;
+    for (i = 0; i < names.length; i++) {
+        if (obj.$s[i] !== undefined && obj.$shape.slots.indexOf(names[i]) === -1) {
+            d.mp$ass_subscript(new Sk.builtin.str(names[i]), obj.$s[i]);
+        }
+    }
+    obj["$d"] = d;
+    return d;
+};
+
 Sk.builtin.type.mroMerge_ = function (seqs) {
     /*
      var tmp = [];
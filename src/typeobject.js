@@ -85,7 +85,23 @@ Sk.builtin.super_.prototype.tp$getattr = function (pyName, canSuspend) {
     tp = this.obj_type;
     Sk.asserts.assert(tp !== undefined, "object has no ob$type!");
 
-    dict = this.obj["$d"] || this.obj.constructor["$d"];
+    if (this.obj.$s) {
+        // compact instance, see Sk.builtin.type.makeShape_
+        res = this.obj.$shape.index[jsName];
+        if (res !== undefined && this.obj.$s[res] !== undefined) {
+            return this.obj.$s[res];
+        }
+        res = undefined;
+    } else {
+        if (this.obj.$slots) {
+            res = this.obj.$shape.index[jsName];
+            if (res !== undefined && this.obj.$slots[res] !== undefined) {
+                return this.obj.$slots[res];
+            }
+            res = undefined;
+        }
+        dict = this.obj["$d"] || this.obj.constructor["$d"];
+    }
 
     // todo; assert? force?
     if (dict) {
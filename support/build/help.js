@@ -14,6 +14,9 @@ var commands = {
     "run repl": "Open the REPL. You need to build Skulpt (either " + chalk.green("npm run build") + " or " + chalk.green("npm run devbuild") + ") first.",
     "test": "Run all tests. You need to build Skulpt (either " + chalk.green("npm run build") + " or " + chalk.green("npm run devbuild") + ") first.",
     "start <py2|py3> <pyfile>": "Run pyfile using either Python 2 (py2) or Python 3 (py3). You need to build Skulpt (either " + chalk.green("npm run build") + " or " + chalk.green("npm run devbuild") + ") first.",
+    "run tokbench [dir...]": "Report tokenizer throughput (tokens/s) over the .py files in the given directories, test/run by default. You need to build Skulpt (either " + chalk.green("npm run build") + " or " + chalk.green("npm run devbuild") + ") first.",
+    "run parsebench [dir...]": "Report parse and AST construction time, and the memory held by parse trees and ASTs, over the .py files in the given directories, test/run by default. Add --python3 to parse as Python 3. You need to build Skulpt (either " + chalk.green("npm run build") + " or " + chalk.green("npm run devbuild") + ") first.",
+    "run startbench": "Report the cold start time to the first print, over fresh node processes. Add --python3 to run as Python 3, --nosnapshot to ignore the startup snapshot of the internal helpers, --chunks to load the standard library as per-module chunks. You need to build Skulpt (either " + chalk.green("npm run build") + " or " + chalk.green("npm run devbuild") + ") first.",
     "run profile <py2|py3> <pyfile>": "Run pyfile using either Python 2 (py2) or Python 3 (py3) with the profiler on.  Will report the profiling results to the console. You need to build the optimized Skulpt (" + chalk.green("npm run build") + ") first."
 };
 
@@ -0,0 +1,45 @@
+const fs = require('fs');
+const path = require('path');
+const reqskulpt = require('../run/require-skulpt').requireSkulpt;
+
+/**
+ * Compile the internal Python helpers (the src/*.py files wrapped into
+ * Sk.internalPy) with the freshly built Skulpt, and add the generated code
+ * to the standard library file and to the manifest of the standard library
+ * chunks.  Sk.doOneTimeInitialization then runs that code instead of
+ * compiling the helpers again on every boot.
+ *
+ * The generated code depends on the __future__ flags and a few other
+ * settings (see Sk.compileSettings), so the helpers are compiled under the
+ * default settings for Python 2 and for Python 3; any other configuration
+ * falls back to compiling at runtime.
+ */
+const stdlibs = ["dist/skulpt-stdlib.js", "dist/stdlib/manifest.js"];
+const marker = "\nSk.builtinFiles.snapshot=";
+
+if (reqskulpt(false) === null) {
+    process.exit(1);
+}
+
+let internal = [Sk.python2, Sk.python3].map((future) => {
+    let files = {};
+
+    Sk.configure({__future__: future});
+    for (let file in Sk.internalPy.files) {
+        let name = path.basename(file, ".py");
+        files[file] = Sk.compile(Sk.internalPy.files[file], name + ".py", "exec", true);
+    }
+
+    return {settings: Sk.compileSettings(), files: files};
+});
+
+let snapshot = marker + JSON.stringify({build: Sk.build.date, internal: internal}) + ";";
+stdlibs.filter((file) => fs.existsSync(file)).forEach((file) => {
+    let contents = fs.readFileSync(file, 'utf8');
+    let previous = contents.indexOf(marker);
+    if (previous !== -1) {
+        contents = contents.substring(0, previous);
+    }
+    fs.writeFileSync(file, contents + snapshot, 'utf8');
+    console.log("Updated " + file + " with a snapshot of the internal helpers.");
+});
@@ -68,6 +68,101 @@ function buildJsonFile(name, dirs, exts, outfile, options) {
     console.log("Updated " + outfile + ".");
 }
 
+/**
+ * The top level modules a file imports, found by looking for import
+ * statements in Python and for Sk.importModule calls in Javascript.
+ */
+function findImports(ext, contents) {
+    let found = [];
+    let re, m;
+
+    if (ext == ".py") {
+        re = /^[ \t]*(?:from[ \t]+([\w.]+)[ \t]+import|import[ \t]+([\w., \t]+))/mg;
+        while ((m = re.exec(contents)) !== null) {
+            (m[1] ? [m[1]] : m[2].split(",")).forEach((name) => {
+                found.push(name.trim().split(/[ \t]/)[0].split(".")[0]);
+            });
+        }
+    } else {
+        re = /Sk\.(?:importModule|importModuleInternal_|builtin\.__import__)\(\s*"([\w.]+)"/g;
+        while ((m = re.exec(contents)) !== null) {
+            found.push(m[1].split(".")[0]);
+        }
+    }
+
+    return found.filter((name) => name !== "");
+}
+
+/**
+ * Write one chunk per top level module or package under dirs into outdir,
+ * plus a manifest (outdir/manifest.js) that Sk.builtinRead uses to load
+ * chunks on demand. The manifest starts with no files loaded, and maps
+ * every file to its chunk, every top level module name to its chunk, and
+ * every chunk to the chunks of the modules it imports, so that they can be
+ * fetched together.
+ */
+function buildChunks(dirs, outdir, options) {
+    let excludes = options.excludes || [];
+    let chunks = {};
+    let manifest = {files: {}, chunks: {}, modules: {}, deps: {}};
+
+    dirs.forEach((dir) => {
+        fs.readdirSync(dir).forEach((file) => {
+            let fullname = dir + '/' + file;
+            let ext = path.extname(file);
+            let stat = fs.statSync(fullname);
+            let modname, chunk;
+            let ret = {files: {}};
+
+            if (excludes.includes(fullname)) {
+                return;
+            }
+            if (stat.isDirectory()) {
+                processDirectories([fullname], true, [".js", ".py"], ret, false, excludes);
+                modname = file;
+            } else if (stat.isFile() && [".js", ".py"].includes(ext)) {
+                ret.files[fullname] = fs.readFileSync(fullname, 'utf8');
+                modname = path.basename(file, ext);
+            } else {
+                return;
+            }
+
+            chunk = path.basename(dir) + "/" + modname;
+            chunks[chunk] = Object.assign(chunks[chunk] || {}, ret.files);
+            if (manifest.modules[modname] === undefined) {
+                manifest.modules[modname] = chunk;
+            }
+        });
+    });
+
+    for (let chunk in chunks) {
+        let deps = [];
+        for (let file in chunks[chunk]) {
+            manifest.chunks[file] = chunk;
+            findImports(path.extname(file), chunks[chunk][file]).forEach((name) => {
+                let dep = manifest.modules[name];
+                if (dep !== undefined && dep !== chunk && !deps.includes(dep)) {
+                    deps.push(dep);
+                }
+            });
+        }
+        if (deps.length > 0) {
+            manifest.deps[chunk] = deps;
+        }
+
+        let outfile = outdir + "/" + chunk + ".js";
+        fs.mkdirSync(path.dirname(outfile), {recursive: true});
+        fs.writeFileSync(outfile, "Sk.builtinFilesLoaded(" + JSON.stringify(chunks[chunk]) + ");", 'utf8');
+    }
+
+    // the chunks are fetched relative to wherever the manifest was loaded from
+    let contents = "Sk.builtinFiles=" + JSON.stringify(manifest) + ";\n" +
+        "Sk.builtinFiles.base=typeof document!==\"undefined\"&&document.currentScript?" +
+        "document.currentScript.src.replace(/[^\\/]*$/,\"\"):typeof __dirname!==\"undefined\"?__dirname+\"/\":\"\";";
+    fs.writeFileSync(outdir + "/manifest.js", contents, 'utf8');
+    console.log("Updated " + outdir + " with " + Object.keys(chunks).length + " chunks.");
+}
+
 if (process.argv.includes("internal")) {
     buildJsonFile("internalPy", ["src"], [".py"], "src/internalpython.js");
 } else if (process.argv.includes("builtin")) {
@@ -82,6 +177,7 @@ if (process.argv.includes("internal")) {
     };
 
     buildJsonFile("builtinFiles", ["src/builtin", "src/lib"], [".js", ".py"], "dist/skulpt-stdlib.js", opts)
+    buildChunks(["src/builtin", "src/lib"], "dist/stdlib", opts);
 } else if (process.argv.includes("unit2")) {
     if (!fs.existsSync("support/tmp")) {
 	fs.mkdirSync("support/tmp");
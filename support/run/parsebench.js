@@ -0,0 +1,101 @@
+const fs = require('fs');
+const path = require('path');
+const program = require('commander');
+const chalk = require('chalk');
+const reqskulpt = require('./require-skulpt').requireSkulpt;
+
+// Parse every .py file under the given directories (test/run by default)
+// and report the time spent in Sk.parse and Sk.astFromParse, and how much
+// heap the parse trees and ASTs of the whole corpus hold on to.
+function bench (python3, opt, dirs, rounds) {
+    var skulpt = reqskulpt(opt);
+    if (skulpt === null) {
+        process.exit(1);
+    }
+
+    var sources = [];
+    dirs.forEach(function (dir) {
+        fs.readdirSync(dir).forEach(function (file) {
+            if (path.extname(file) === ".py") {
+                sources.push(fs.readFileSync(path.join(dir, file), "utf8"));
+            }
+        });
+    });
+
+    Sk.configure({__future__: python3 ? Sk.python3 : Sk.python2});
+
+    // a few files in the corpus are deliberately malformed
+    var inputs = sources.filter(function (src) {
+        try {
+            var p = Sk.parse("<bench>", src);
+            Sk.astFromParse(p.cst, "<bench>", p.flags);
+            return true;
+        } catch (e) {
+            return false;
+        }
+    });
+
+    function parse (src) {
+        return Sk.parse("<bench>", src);
+    }
+
+    function ast (p) {
+        return Sk.astFromParse(p.cst, "<bench>", p.flags);
+    }
+
+    // Each result is dropped straight away, as it is when compiling, so
+    // the timings are not skewed by the collector promoting a whole
+    // corpus worth of trees.
+    function time (items, fn) {
+        var r, i;
+        var start = process.hrtime();
+        for (r = 0; r < rounds; r++) {
+            for (i = 0; i < items.length; i++) {
+                fn(items[i]);
+            }
+        }
+        var elapsed = process.hrtime(start);
+        return (elapsed[0] * 1e3 + elapsed[1] / 1e6) / rounds;
+    }
+
+    // Heap held by the results for the whole corpus at once.
+    function heap (items, fn) {
+        if (!global.gc) {
+            return NaN;
+        }
+        global.gc();
+        var before = process.memoryUsage().heapUsed;
+        var keep = items.map(fn);
+        global.gc();
+        var used = process.memoryUsage().heapUsed - before;
+        keep.length = 0;
+        return used / (1024 * 1024);
+    }
+
+    // warm up the JIT before timing
+    var parsed = inputs.map(parse);
+    parsed.forEach(ast);
+
+    var parseMs = time(inputs, parse);
+    var astMs = time(parsed, ast);
+    parsed = null;
+    var cstMb = heap(inputs, parse);
+    var astMb = heap(inputs.map(parse), ast);
+
+    console.log(inputs.length + " files, " + rounds + " rounds");
+    console.log(chalk.green("parse: " + parseMs.toFixed(1) + " ms/round") +
+                (global.gc ? ", parse trees hold " + cstMb.toFixed(1) + " MiB" : ""));
+    console.log(chalk.green("ast:   " + astMs.toFixed(1) + " ms/round") +
+                (global.gc ? ", ASTs hold " + astMb.toFixed(1) + " MiB" : ""));
+    if (!global.gc) {
+        console.log("run node with --expose-gc to report memory");
+    }
+}
+
+program
+    .option('-o, --opt', 'use optimized skulpt')
+    .option('--python3', 'parse as Python 3')
+    .option('-r, --rounds <n>', 'number of timed rounds', parseInt, 20)
+    .parse(process.argv);
+
+bench(program.python3, program.opt, program.args.length ? program.args : ["test/run"], program.rounds);
@@ -0,0 +1,301 @@
+const os = require('os');
+const fs = require('fs');
+const {Worker, isMainThread, parentPort, workerData} = require('worker_threads');
+
+// A pool of worker threads, each with a Skulpt runtime of its own, that run
+// Python programs in parallel, e.g. to grade many submissions at once:
+//
+//     const pool = new Pool({size: 4, python3: true});
+//     pool.run(source, {execLimit: 5000, onOutput: (s) => ...}).then((r) => {
+//         // r.stdout, r.error (null if the program ran to the end), r.time
+//     });
+//     ...
+//     pool.close();
+//
+// Each worker keeps its runtime between programs, and with it a cache of the
+// code it compiled (the CACHE_SIZE sources used last), so the standard
+// library modules the programs import are compiled once per worker.  Every
+// program runs in its own Sk.Context.  execLimit (in ms) is the time the
+// program may run; a worker that is still on a program GRACE ms after that,
+// by the clock (e.g. stuck in Javascript that cannot be interrupted), is
+// replaced.  If a worker fails to start, the others would too, so the pool
+// fails the programs given to it instead of starting more.
+//
+// Loaded where Skulpt is, this module is also available as Sk.pool.
+
+// How long past its execLimit a program may keep a worker before the
+// worker is replaced.
+const GRACE = 2000;
+
+// How many compiled sources each worker keeps.
+const CACHE_SIZE = 500;
+
+class Pool {
+    constructor (options) {
+        options = options || {};
+        this.size = options.size || os.cpus().length;
+        this.python3 = !!options.python3;
+        this.opt = !!options.opt;
+        this.execLimit = options.execLimit || null;
+        this.workers = [];
+        this.idle = [];
+        this.queue = [];
+        this.jobs = new Map();
+        this.nextId = 1;
+        this.closed = false;
+        // why the workers could not start, if they could not
+        this.startError = null;
+        for (let i = 0; i < this.size; i++) {
+            this.startWorker();
+        }
+    }
+
+    startWorker () {
+        const worker = new Worker(__filename, {workerData: {python3: this.python3, opt: this.opt}});
+        worker.job = null;
+        worker.ready = false;
+        worker.on('message', (msg) => this.message(worker, msg));
+        worker.on('error', (err) => this.failed(worker, err));
+        worker.on('exit', () => {
+            if (!this.closed && this.workers.indexOf(worker) !== -1) {
+                this.failed(worker, new Error("worker stopped"));
+            }
+        });
+        this.workers.push(worker);
+        return worker;
+    }
+
+    // Runs source and returns a Promise of {stdout, error, time}: error is
+    // null if the program ran to the end, or the exception that stopped it
+    // as a string.  options are name (of the main module), syspath,
+    // sysargv, execLimit and onOutput, a function called with the output
+    // of the program as it is written.
+    run (source, options) {
+        options = options || {};
+        if (this.startError !== null) {
+            return Promise.reject(this.startError);
+        }
+        if (this.closed) {
+            return Promise.reject(new Error("the pool is closed"));
+        }
+        return new Promise((resolve, reject) => {
+            const execLimit = options.execLimit !== undefined ? options.execLimit : this.execLimit;
+            const job = {
+                msg: {
+                    id: this.nextId++,
+                    source: source,
+                    name: options.name || "<stdin>",
+                    syspath: options.syspath || [],
+                    sysargv: options.sysargv || [],
+                    execLimit: execLimit
+                },
+                stdout: "",
+                onOutput: options.onOutput,
+                resolve: resolve,
+                reject: reject,
+                timer: null
+            };
+            this.jobs.set(job.msg.id, job);
+            this.queue.push(job);
+            this.dispatch();
+        });
+    }
+
+    dispatch () {
+        while (this.queue.length > 0 && this.idle.length > 0) {
+            const worker = this.idle.shift();
+            const job = this.queue.shift();
+            worker.job = job;
+            if (job.msg.execLimit !== null) {
+                job.timer = setTimeout(() => this.stuck(worker), job.msg.execLimit + GRACE);
+            }
+            worker.postMessage(job.msg);
+        }
+    }
+
+    message (worker, msg) {
+        const job = worker.job;
+        if (msg.type === "ready") {
+            worker.ready = true;
+            this.idle.push(worker);
+            this.dispatch();
+        } else if (msg.type === "broken") {
+            this.failed(worker, new Error("a worker could not start: " + msg.error));
+        } else if (job === null) {
+            // the rest of a program the pool gave up on, see stuck
+            return;
+        } else if (msg.type === "output") {
+            job.stdout += msg.text;
+            if (job.onOutput) {
+                job.onOutput(msg.text);
+            }
+        } else if (msg.type === "done") {
+            this.finish(worker, {stdout: job.stdout, error: msg.error, time: msg.time});
+            this.idle.push(worker);
+            this.dispatch();
+        }
+    }
+
+    finish (worker, result) {
+        const job = worker.job;
+        if (job === null) {
+            return;
+        }
+        worker.job = null;
+        clearTimeout(job.timer);
+        this.jobs.delete(job.msg.id);
+        job.resolve(result);
+    }
+
+    // the worker is stuck in a program, replace it
+    stuck (worker) {
+        const job = worker.job;
+        this.finish(worker, {stdout: job.stdout, error: "TimeLimitError: " + "Program exceeded run time limit.",
+                             time: job.msg.execLimit + GRACE});
+        this.replace(worker);
+    }
+
+    failed (worker, err) {
+        const job = worker.job;
+        if (job !== null) {
+            worker.job = null;
+            clearTimeout(job.timer);
+            this.jobs.delete(job.msg.id);
+            job.reject(err);
+        }
+        if (!worker.ready) {
+            this.broken(err);
+            return;
+        }
+        this.replace(worker);
+    }
+
+    // a worker failed before it was ready; the others would fail the same
+    // way, so stop them all and fail the programs rather than start more
+    broken (err) {
+        if (this.startError !== null) {
+            return;
+        }
+        this.startError = err;
+        this.closed = true;
+        this.workers.forEach((w) => w.terminate());
+        this.workers = [];
+        this.idle = [];
+        this.queue.forEach((job) => {
+            this.jobs.delete(job.msg.id);
+            job.reject(err);
+        });
+        this.queue = [];
+    }
+
+    replace (worker) {
+        const i = this.workers.indexOf(worker);
+        if (i === -1) {
+            return;
+        }
+        this.workers.splice(i, 1);
+        worker.terminate();
+        if (!this.closed) {
+            this.startWorker();
+        }
+    }
+
+    // Stops the workers once the programs queued so far have run.
+    close () {
+        this.closed = true;
+        const stop = () => {
+            if (this.jobs.size > 0) {
+                setTimeout(stop, 10);
+                return;
+            }
+            this.workers.forEach((w) => w.terminate());
+            this.workers = [];
+        };
+        stop();
+    }
+}
+
+let defaultPool = null;
+
+// Runs source on a pool shared by the callers of this function, made on
+// the first call with the options given then.
+function run (source, options) {
+    if (defaultPool === null) {
+        defaultPool = new Pool(options);
+        defaultPool.workers.forEach((w) => w.unref());
+    }
+    return defaultPool.run(source, options);
+}
+
+function worker () {
+    const reqskulpt = require('./require-skulpt').requireSkulpt;
+    const cache = new Map();
+    let compile;
+
+    if (reqskulpt(workerData.opt, true) === null) {
+        process.exit(1);
+    }
+
+    Sk.configure({
+        read: (fname) => fs.readFileSync(fname, "utf8"),
+        __future__: workerData.python3 ? Sk.python3 : Sk.python2
+    });
+
+    // keep what this worker compiled, for the next programs
+    compile = Sk.compile;
+    Sk.compile = function (source, filename, mode, canSuspend) {
+        let key, co;
+        if (Sk.lineCounts) {
+            // the counts are set up as the code is compiled
+            return compile(source, filename, mode, canSuspend);
+        }
+        key = Sk.compileSettings() + "\n" + mode + "\n" + canSuspend + "\n" + filename + "\n" + source;
+        co = cache.get(key);
+        if (co === undefined) {
+            co = compile(source, filename, mode, canSuspend);
+            if (cache.size >= CACHE_SIZE) {
+                // a Map iterates in insertion order, drop the least
+                // recently used
+                cache.delete(cache.keys().next().value);
+            }
+        } else {
+            cache.delete(key);
+        }
+        cache.set(key, co);
+        return co;
+    };
+
+    const scheduler = new Sk.Scheduler({concurrency: 1});
+
+    parentPort.on('message', (msg) => {
+        const context = new Sk.Context({
+            output: (text) => parentPort.postMessage({type: "output", id: msg.id, text: String(text)}),
+            syspath: msg.syspath,
+            sysargv: msg.sysargv,
+            execLimit: msg.execLimit
+        });
+        const start = Date.now();
+        const done = (error) => {
+            parentPort.postMessage({type: "done", id: msg.id, error: error, time: Date.now() - start});
+        };
+
+        scheduler.spawn(context, () => {
+            return Sk.importMainWithBody(msg.name, false, msg.source, true);
+        }).then(() => done(null), (e) => done(e.toString()));
+    });
+
+    // compile the helpers Skulpt sets up for each program before the first one
+    scheduler.spawn(new Sk.Context({output: () => {}}), () => {
+        return Sk.importMainWithBody("<warmup>", false, "pass", true);
+    }).then(() => parentPort.postMessage({type: "ready"}), (e) => {
+        parentPort.postMessage({type: "broken", error: e.toString()});
+    });
+}
+
+module.exports = {Pool: Pool, run: run};
+
+if (!isMainThread && workerData && workerData.python3 !== undefined) {
+    worker();
+} else if (typeof Sk !== "undefined") {
+    Sk.pool = module.exports;
+}
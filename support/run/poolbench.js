@@ -0,0 +1,84 @@
+const os = require('os');
+const fs = require('fs');
+const path = require('path');
+const program = require('commander');
+const chalk = require('chalk');
+const Pool = require('./pool').Pool;
+
+// Measure the throughput of the worker pool: run every unit test of
+// test/unit (or test/unit3) on pools of 1, 2, 4, ... workers, up to the
+// number of cores, and report the programs run per second by each.
+function corpus (python3) {
+    var dir = python3 ? "test/unit3" : "test/unit";
+    return fs.readdirSync(dir).filter(function (f) {
+        return f.startsWith("test_") && path.extname(f) === ".py";
+    }).map(function (f) {
+        return {name: path.basename(f, ".py"), dir: dir, source: fs.readFileSync(path.join(dir, f), "utf8")};
+    });
+}
+
+function runAll (pool, programs) {
+    var failed = 0;
+    return Promise.all(programs.map(function (p) {
+        return pool.run(p.source, {name: p.name, syspath: [p.dir], execLimit: 60000}).then(function (r) {
+            if (r.error !== null) {
+                failed++;
+            }
+        });
+    })).then(function () {
+        return failed;
+    });
+}
+
+function bench (python3, opt, sizes, rounds) {
+    var programs = corpus(python3);
+    var results = [];
+
+    function next () {
+        var size = sizes.shift();
+        var pool, start;
+        if (size === undefined) {
+            console.log(programs.length * rounds + " programs per pool");
+            results.forEach(function (r) {
+                console.log(chalk.green(("" + r.size).padStart(3) + " workers: " + r.rate.toFixed(1) +
+                                        " programs/s (" + (r.rate / results[0].rate).toFixed(2) + "x)") +
+                            (r.failed ? chalk.red(", " + r.failed + " stopped with an exception") : ""));
+            });
+            return;
+        }
+        pool = new Pool({size: size, python3: python3, opt: opt});
+        // one program per worker first, so that starting the workers and
+        // compiling the unittest module is not measured
+        runAll(pool, programs.slice(0, size)).then(function () {
+            var all = [];
+            var i;
+            for (i = 0; i < rounds; i++) {
+                all = all.concat(programs);
+            }
+            start = Date.now();
+            return runAll(pool, all);
+        }).then(function (failed) {
+            var elapsed = (Date.now() - start) / 1000;
+            results.push({size: size, rate: programs.length * rounds / elapsed, failed: failed});
+            pool.close();
+            next();
+        });
+    }
+
+    next();
+}
+
+program
+    .option('-o, --opt', 'use optimized skulpt')
+    .option('--python3', 'run the Python 3 unit tests')
+    .option('-w, --workers <n>', 'largest pool to measure', parseInt, os.cpus().length)
+    .option('-r, --rounds <n>', 'times to run the corpus on each pool', parseInt, 1)
+    .parse(process.argv);
+
+var sizes = [];
+for (var size = 1; size < program.workers; size *= 2) {
+    sizes.push(size);
+}
+sizes.push(program.workers);
+
+bench(program.python3, program.opt, sizes, program.rounds);
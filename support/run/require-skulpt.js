@@ -1,12 +1,14 @@
 const chalk = require('chalk');
 
 module.exports = {
-    requireSkulpt: function (requireOptimized) {
+    requireSkulpt: function (requireOptimized, quiet) {
         var skulpt;
 
         try {
             skulpt = require("../../dist/skulpt.min.js");
-            console.log(chalk.green("Using skulpt.min.js"));
+            if (!quiet) {
+                console.log(chalk.green("Using skulpt.min.js"));
+            }
         } catch (err) {
             if (requireOptimized) {
                 skulpt = null;
@@ -14,7 +16,9 @@ module.exports = {
             } else {
                 try {
                     skulpt = require("../../dist/skulpt.js");
-                    console.log(chalk.blue("Using skulpt.js"));
+                    if (!quiet) {
+                        console.log(chalk.blue("Using skulpt.js"));
+                    }
                 } catch (err) {
                     skulpt = null;
                     console.log(chalk.red("No skulpt distribution, run 'npm run build' or 'npm run devbuild' first."));
@@ -0,0 +1,103 @@
+const child_process = require('child_process');
+const program = require('commander');
+const chalk = require('chalk');
+const reqskulpt = require('./require-skulpt').requireSkulpt;
+
+// Measure cold start: each run is a fresh node process that loads Skulpt
+// and the standard library and runs a program that prints one line.  The
+// time to that first print is what a page load or a serverless worker
+// pays before any user code does real work.
+function child (python3, opt, nosnapshot, chunks) {
+    var start = process.hrtime();
+    var loaded, printed;
+
+    function ms (t) {
+        return t[0] * 1e3 + t[1] / 1e6;
+    }
+
+    if (reqskulpt(opt) === null) {
+        process.exit(1);
+    }
+    if (chunks) {
+        require("../../dist/stdlib/manifest.js");
+        Sk.fetchBuiltinChunk = function (url) {
+            return Promise.resolve(require(url));
+        };
+    } else {
+        require("../../dist/skulpt-stdlib.js");
+    }
+    if (nosnapshot) {
+        delete Sk.builtinFiles.snapshot;
+    }
+    loaded = process.hrtime(start);
+
+    Sk.configure({
+        output: function () {
+            if (printed === undefined) {
+                printed = process.hrtime(start);
+            }
+        },
+        read: Sk.builtinRead,
+        __future__: python3 ? Sk.python3 : Sk.python2
+    });
+    Sk.misceval.asyncToPromise(function () {
+        return Sk.importMainWithBody("<stdin>", false, "print('hello')", true);
+    }).then(function () {
+        console.log(JSON.stringify({load: ms(loaded), print: ms(printed)}));
+    }, function (e) {
+        console.log(chalk.red(e.toString()));
+        process.exit(1);
+    });
+}
+
+function bench (python3, opt, nosnapshot, chunks, runs) {
+    var args = [__filename, "--child"];
+    var loads = [], prints = [];
+    var i, out, lines, r;
+
+    if (python3) {
+        args.push("--python3");
+    }
+    if (opt) {
+        args.push("--opt");
+    }
+    if (nosnapshot) {
+        args.push("--nosnapshot");
+    }
+    if (chunks) {
+        args.push("--chunks");
+    }
+
+    function median (a) {
+        a = a.slice().sort(function (x, y) { return x - y; });
+        return a[a.length >> 1];
+    }
+
+    for (i = 0; i < runs; i++) {
+        out = child_process.execFileSync(process.execPath, args, {encoding: "utf8"});
+        lines = out.trim().split("\n");
+        r = JSON.parse(lines[lines.length - 1]);
+        loads.push(r.load);
+        prints.push(r.print);
+    }
+
+    console.log(runs + " cold starts" + (chunks ? " loading the standard library as chunks" : "") +
+                (nosnapshot ? " without the startup snapshot" : ""));
+    console.log(chalk.green("load Skulpt:  " + median(loads).toFixed(1) + " ms (median)"));
+    console.log(chalk.green("first print:  " + median(prints).toFixed(1) + " ms (median)"));
+}
+
+program
+    .option('-o, --opt', 'use optimized skulpt')
+    .option('--python3', 'run as Python 3')
+    .option('--nosnapshot', 'ignore the snapshot in the standard library')
+    .option('--chunks', 'load the standard library as chunks, see Sk.builtinRead')
+    .option('-r, --runs <n>', 'number of cold starts', parseInt, 10)
+    .option('--child', 'run a single cold start (used internally)')
+    .parse(process.argv);
+
+if (program.child) {
+    child(program.python3, program.opt, program.nosnapshot, program.chunks);
+} else {
+    bench(program.python3, program.opt, program.nosnapshot, program.chunks, program.runs);
+}
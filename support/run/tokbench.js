@@ -0,0 +1,77 @@
+const fs = require('fs');
+const path = require('path');
+const program = require('commander');
+const chalk = require('chalk');
+const reqskulpt = require('./require-skulpt').requireSkulpt;
+
+// Tokenizes each of the sources once and returns the number of tokens.
+function countTokens (sources) {
+    var count = 0;
+    sources.forEach(function (src) {
+        var lines = src.split("\n");
+        var i = 0;
+        try {
+            Sk._tokenize("<bench>", function () {
+                if (i >= lines.length) {
+                    throw new Error("EOF");
+                }
+                return lines[i++] + "\n";
+            }, "utf-8", function () {
+                count++;
+            });
+        } catch (e) {
+            // a few files in the corpus are deliberately malformed
+        }
+    });
+    return count;
+}
+
+// Tokenize every .py file under the given directories (test/run by
+// default) a number of times and report the tokenizer throughput.
+function bench (opt, dirs, rounds) {
+    var skulpt = reqskulpt(opt);
+    if (skulpt === null) {
+        process.exit(1);
+    }
+
+    var sources = [];
+    var bytes = 0;
+    dirs.forEach(function (dir) {
+        fs.readdirSync(dir).forEach(function (file) {
+            if (path.extname(file) === ".py") {
+                var src = fs.readFileSync(path.join(dir, file), "utf8");
+                sources.push(src);
+                bytes += src.length;
+            }
+        });
+    });
+
+    Sk.configure({__future__: Sk.python3});
+
+    // warm up the JIT before timing
+    countTokens(sources);
+
+    var tokens = 0;
+    var start = process.hrtime();
+    for (var r = 0; r < rounds; r++) {
+        tokens += countTokens(sources);
+    }
+    var elapsed = process.hrtime(start);
+    var secs = elapsed[0] + elapsed[1] / 1e9;
+
+    console.log(sources.length + " files, " + bytes + " characters, " + rounds + " rounds");
+    console.log(chalk.green(Math.round(tokens / secs) + " tokens/s") +
+                ", " + Math.round(bytes * rounds / secs / 1024) + " KiB/s" +
+                ", " + (secs * 1000 / rounds).toFixed(1) + " ms/round");
+}
+
+module.exports = {countTokens: countTokens};
+
+if (require.main === module) {
+    program
+        .option('-o, --opt', 'use optimized skulpt')
+        .option('-r, --rounds <n>', 'number of timed rounds', parseInt, 20)
+        .parse(process.argv);
+
+    bench(program.opt, program.args.length ? program.args : ["test/run"], program.rounds);
+}
@@ -0,0 +1,57 @@
+const fs = require('fs');
+
+/**
+ * Configures Skulpt for Python 3 with the given options (read and output
+ * default to the file system and a buffer), runs source as the main
+ * module, and returns a Promise of what it printed.
+ */
+function run (source, options) {
+    var out = "";
+
+    Sk.configure(Object.assign({
+        read: (fname) => fs.readFileSync(fname, "utf8"),
+        output: (text) => {
+            out += text;
+        },
+        __future__: Sk.python3
+    }, options || {}));
+
+    return Sk.misceval.asyncToPromise(function () {
+        return Sk.importMainWithBody("<stdin>", false, source, true);
+    }).then(function () {
+        return out;
+    });
+}
+
+/**
+ * Runs source like run, and returns a Promise of the exception it raised,
+ * as a string. The Promise is rejected if it raised none.
+ */
+function runError (source, options) {
+    return run(source, options).then(function () {
+        throw new Error("no exception raised");
+    }, function (err) {
+        return err.toString();
+    });
+}
+
+/**
+ * Configures Skulpt back to Python 3 with the defaults of the options that
+ * stay set until they are given again, once promise settles, for tests
+ * that run with options the others should not see. Returns a Promise that
+ * settles the same way.
+ */
+function resetting (promise) {
+    var reset = function () {
+        Sk.configure({__future__: Sk.python3, urlCacheSize: 0, timeScale: 1});
+    };
+    return promise.then(function (r) {
+        reset();
+        return r;
+    }, function (e) {
+        reset();
+        throw e;
+    });
+}
+
+module.exports = {run: run, runError: runError, resetting: resetting};
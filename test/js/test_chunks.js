@@ -0,0 +1,124 @@
+const assert = require('assert');
+const fs = require('fs');
+const run = require('./helpers').run;
+const runError = require('./helpers').runError;
+
+// The chunks of a small standard library, and the files in them
+const chunkFiles = {
+    "lib/chunky": {
+        "src/lib/chunky/__init__.py": "from chunky.inner import value\nimport helper\n",
+        "src/lib/chunky/inner.py": "value = 42\n"
+    },
+    "lib/helper": {
+        "src/lib/helper.py": "name = 'helper'\n"
+    },
+    "lib/flaky": {
+        "src/lib/flaky.py": "ok = True\n"
+    }
+};
+
+// Runs source with Sk.builtinRead over a manifest of chunkFiles, with
+// Sk.fetchBuiltinChunk replaced by fetch, and restores the defaults after
+function withChunks (fetch, source) {
+    var saved = [Sk.builtinFiles, Sk.fetchBuiltinChunk, Sk.builtinChunks_];
+    var manifest = {
+        files  : {"src/builtin/sys.js": fs.readFileSync("src/builtin/sys.js", "utf8")},
+        chunks : {},
+        modules: {},
+        deps   : {"lib/chunky": ["lib/helper"]},
+        base   : "stdlib/"
+    };
+    var restore = function () {
+        Sk.builtinFiles = saved[0];
+        Sk.fetchBuiltinChunk = saved[1];
+        Sk.builtinChunks_ = saved[2];
+    };
+
+    Object.keys(chunkFiles).forEach(function (chunk) {
+        manifest.modules[chunk.split("/")[1]] = chunk;
+        Object.keys(chunkFiles[chunk]).forEach(function (file) {
+            manifest.chunks[file] = chunk;
+        });
+    });
+    // a module whose chunk is missing from the server
+    manifest.modules["gone"] = "lib/gone";
+    manifest.chunks["src/lib/gone.py"] = "lib/gone";
+
+    Sk.builtinFiles = manifest;
+    Sk.builtinChunks_ = {};
+    Sk.fetchBuiltinChunk = fetch;
+    return run(source, {read: Sk.builtinRead}).then(function (out) {
+        restore();
+        return out;
+    }, function (err) {
+        restore();
+        throw err;
+    });
+}
+
+// A fetch that serves chunkFiles after a delay, recording what it fetched
+function server (fetched) {
+    return function (url) {
+        var chunk = url.replace(/^stdlib\/|\.js$/g, "");
+        fetched.push(chunk);
+        return new Promise(function (resolve, reject) {
+            setTimeout(function () {
+                if (chunkFiles[chunk] === undefined) {
+                    reject(new Sk.builtin.ImportError("Could not load " + url));
+                    return;
+                }
+                Sk.builtinFilesLoaded(chunkFiles[chunk]);
+                resolve();
+            }, 1);
+        });
+    };
+}
+
+module.exports = {
+    loadChunk: function () {
+        var fetched = [];
+        return withChunks(server(fetched), "import chunky\nprint(chunky.value, chunky.helper.name)\n").then(function (out) {
+            assert.strictEqual(out, "42 helper\n");
+            // the chunk was prefetched along with its dependency, once each
+            assert.deepStrictEqual(fetched.slice().sort(), ["lib/chunky", "lib/helper"]);
+        });
+    },
+
+    missingChunk: function () {
+        var fetched = [];
+        return withChunks(server(fetched), [
+            "try:",
+            "    import gone",
+            "except ImportError as e:",
+            "    print('ImportError', e.args[0])",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, "ImportError Could not load stdlib/lib/gone.js\n");
+        });
+    },
+
+    retryChunk: function () {
+        var fetched = [];
+        var serve = server(fetched);
+        var failures = 1;
+        var flaky = function (url) {
+            if (failures > 0) {
+                failures--;
+                fetched.push("failed");
+                return Promise.reject(new Sk.builtin.ImportError("Could not load " + url));
+            }
+            return serve(url);
+        };
+        return withChunks(flaky, [
+            "try:",
+            "    import flaky",
+            "except ImportError:",
+            "    print('failed')",
+            "import flaky",
+            "print(flaky.ok)",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, "failed\nTrue\n");
+        });
+    }
+};
@@ -0,0 +1,117 @@
+const assert = require('assert');
+const fs = require('fs');
+
+// Configures the realm, which the contexts take their other options from
+function configure () {
+    Sk.configure({
+        read       : (fname) => fs.readFileSync(fname, "utf8"),
+        __future__ : Sk.python3
+    });
+}
+
+// A context of its own with an output buffer, in context.out
+function makeContext (options) {
+    var context = new Sk.Context(Object.assign({
+        output: function (text) {
+            context.out += text;
+        }
+    }, options || {}));
+    context.out = "";
+    return context;
+}
+
+function spawn (scheduler, context, source) {
+    return scheduler.spawn(context, function () {
+        return Sk.importMainWithBody("<stdin>", false, source, true);
+    });
+}
+
+// settles like Promise.all, but waits for every promise
+function settle (promises) {
+    return Promise.all(promises.map(function (p) {
+        return p.then(function (r) {
+            return {value: r};
+        }, function (e) {
+            return {error: e.toString()};
+        });
+    }));
+}
+
+// a program that takes a few turns, printing as it goes
+function counter (name) {
+    return [
+        "import sys",
+        "sys.modules['owner'] = '" + name + "'",
+        "n = 0",
+        "for i in range(4):",
+        "    print('" + name + "', i)",
+        "    for j in range(20000):",
+        "        n += j",
+        "print(sys.modules['owner'], __name__, n)",
+        ""
+    ].join("\n");
+}
+
+module.exports = {
+    isolated: function () {
+        configure();
+        var scheduler = new Sk.Scheduler({slice: 1});
+        var a = makeContext({yieldLimit: 1});
+        var b = makeContext({yieldLimit: 1});
+        return settle([spawn(scheduler, a, counter("a")), spawn(scheduler, b, counter("b"))]).then(function (r) {
+            assert.deepStrictEqual(r.map((x) => x.error), [undefined, undefined]);
+            // each program printed only into its own output, and saw only
+            // its own sys.modules
+            assert.strictEqual(a.out, "a 0\na 1\na 2\na 3\na __main__ 799960000\n");
+            assert.strictEqual(b.out, "b 0\nb 1\nb 2\nb 3\nb __main__ 799960000\n");
+            assert.strictEqual(a.state["sysmodules"].mp$lookup(new Sk.builtin.str("owner")).v, "a");
+            assert.strictEqual(b.state["sysmodules"].mp$lookup(new Sk.builtin.str("owner")).v, "b");
+            assert.strictEqual(scheduler.stats["finished"], 2);
+            // they took turns
+            assert.ok(scheduler.stats["turns"] > 2, scheduler.stats["turns"]);
+            assert.strictEqual(Sk.Context.current, null);
+        });
+    },
+
+    execLimit: function () {
+        configure();
+        var scheduler = new Sk.Scheduler({slice: 1});
+        var limited = makeContext({execLimit: 100, yieldLimit: 1});
+        var free = makeContext({execLimit: null, yieldLimit: 1});
+        return settle([
+            spawn(scheduler, limited, "while True:\n    pass\n"),
+            spawn(scheduler, free, [
+                "import time",
+                "start = time.time()",
+                "while time.time() - start < 0.3:",
+                "    pass",
+                "print(sum(range(100)))",
+                ""
+            ].join("\n"))
+        ]).then(function (r) {
+            // the limit of one context does not apply to the other, which
+            // computes for longer than it
+            assert.ok(/^TimeLimitError/.test(r[0].error), r[0].error);
+            assert.strictEqual(r[1].error, undefined);
+            assert.strictEqual(free.out, "4950\n");
+        });
+    },
+
+    error: function () {
+        configure();
+        var scheduler = new Sk.Scheduler({slice: 1, concurrency: 1});
+        var failing = makeContext({yieldLimit: 1});
+        var other = makeContext({yieldLimit: 1});
+        return settle([
+            spawn(scheduler, failing, "print('before')\nraise ValueError('boom')\n"),
+            spawn(scheduler, other, counter("other"))
+        ]).then(function (r) {
+            assert.ok(/^ValueError: boom/.test(r[0].error), r[0].error);
+            assert.strictEqual(failing.out, "before\n");
+            assert.strictEqual(r[1].error, undefined);
+            assert.strictEqual(other.out, "other 0\nother 1\nother 2\nother 3\nother __main__ 799960000\n");
+            assert.strictEqual(scheduler.stats["finished"], 2);
+            assert.strictEqual(Sk.Context.current, null);
+        });
+    }
+};
@@ -0,0 +1,133 @@
+const assert = require('assert');
+const fs = require('fs');
+const vm = require('vm');
+
+// debugger.js is a script for the page, which adds Sk.Debugger to Sk and
+// exports it through the Closure Library
+vm.runInThisContext("(function (Sk, goog) {" + fs.readFileSync("debugger/debugger.js", "utf8") + "\n})",
+    {filename: "debugger/debugger.js"})(Sk, {exportSymbol: function () {}});
+
+const source = [
+    "total = 0",
+    "for i in range(3):",
+    "    total += i; j = i",
+    "print(total)",
+    ""
+].join("\n");
+
+// Runs source under the debugger with breakpoint tables, after setup(dbg).
+// Returns a Promise of the [lineno, colno] Sk.breakpoints was asked about,
+// and of those it stopped at.
+function debug (setup) {
+    var dbg = new Sk.Debugger("<stdin>.py", null);
+    var calls = [];
+    var hits = [];
+    var out = "";
+
+    Sk.configure({
+        read             : function (fname) {
+            return fs.readFileSync(fname, "utf8");
+        },
+        output           : function (text) {
+            out += text;
+        },
+        __future__       : Sk.python3,
+        debugging        : true,
+        breakpointTables : true,
+        breakpoints      : function (filename, lineno, colno) {
+            var stop = dbg.check_breakpoints(filename, lineno, colno);
+            calls.push([lineno, colno]);
+            if (stop) {
+                hits.push([lineno, colno]);
+            }
+            return stop;
+        }
+    });
+    Sk.clearBreakpoints();
+    setup(dbg);
+
+    return Sk.misceval.asyncToPromise(function () {
+        return Sk.importMainWithBody("<stdin>", false, source, true);
+    }, {
+        "Sk.debug": function (susp) {
+            return Promise.resolve(susp.resume());
+        }
+    }).then(function () {
+        assert.strictEqual(out, "3\n");
+        return {calls: calls, hits: hits};
+    });
+}
+
+// a debugger whose breakpoints are per column, not per line
+function byColumn (dbg) {
+    dbg.generate_breakpoint_key = function (filename, lineno, colno) {
+        return filename + "-" + lineno + "-" + colno;
+    };
+}
+
+module.exports = {
+    hitAndMiss: function () {
+        return debug(function (dbg) {
+            dbg.add_breakpoint("<stdin>.py", 3, 4);
+            // nothing runs on line 5
+            dbg.add_breakpoint("<stdin>.py", 5, 0);
+        }).then(function (r) {
+            // only the line with a breakpoint that runs calls back
+            assert.deepStrictEqual(r.calls, [[3, 4], [3, 16], [3, 4], [3, 16], [3, 4], [3, 16]]);
+            assert.deepStrictEqual(r.hits, r.calls);
+        });
+    },
+
+    noBreakpoints: function () {
+        return debug(function () {}).then(function (r) {
+            assert.deepStrictEqual(r.calls, []);
+        });
+    },
+
+    disableOneColumn: function () {
+        return debug(function (dbg) {
+            byColumn(dbg);
+            dbg.add_breakpoint("<stdin>.py", 3, 4);
+            dbg.add_breakpoint("<stdin>.py", 3, 16);
+            dbg.disable_breakpoint("<stdin>.py", 3, 4);
+        }).then(function (r) {
+            // the line is still checked, for the breakpoint left on it
+            assert.deepStrictEqual(r.hits, [[3, 16], [3, 16], [3, 16]]);
+        });
+    },
+
+    clearOneColumn: function () {
+        return debug(function (dbg) {
+            byColumn(dbg);
+            dbg.add_breakpoint("<stdin>.py", 3, 4);
+            dbg.add_breakpoint("<stdin>.py", 3, 16);
+            assert.strictEqual(dbg.clear_breakpoint("<stdin>.py", 3, 16), null);
+        }).then(function (r) {
+            assert.deepStrictEqual(r.hits, [[3, 4], [3, 4], [3, 4]]);
+        });
+    },
+
+    clearLastBreakpoint: function () {
+        return debug(function (dbg) {
+            byColumn(dbg);
+            dbg.add_breakpoint("<stdin>.py", 3, 4);
+            dbg.add_breakpoint("<stdin>.py", 3, 16);
+            dbg.disable_breakpoint("<stdin>.py", 3, 4);
+            dbg.clear_breakpoint("<stdin>.py", 3, 16);
+        }).then(function (r) {
+            // no enabled breakpoint is left, so the line is not checked
+            assert.deepStrictEqual(r.calls, []);
+        });
+    },
+
+    temporaryBreakpoint: function () {
+        return debug(function (dbg) {
+            byColumn(dbg);
+            dbg.add_breakpoint("<stdin>.py", 3, 4, true);
+            dbg.add_breakpoint("<stdin>.py", 3, 16);
+        }).then(function (r) {
+            // the temporary one stops once, the other one every time
+            assert.deepStrictEqual(r.hits, [[3, 4], [3, 16], [3, 16], [3, 16]]);
+        });
+    }
+};
@@ -0,0 +1,123 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+
+// Runs source with the given views as builtins
+function withViews (views, source) {
+    Object.keys(views).forEach(function (name) {
+        Sk.builtins[name] = views[name];
+    });
+    return run(source).then(function (out) {
+        Object.keys(views).forEach(function (name) {
+            delete Sk.builtins[name];
+        });
+        return out;
+    }, function (err) {
+        Object.keys(views).forEach(function (name) {
+            delete Sk.builtins[name];
+        });
+        throw err;
+    });
+}
+
+module.exports = {
+    arrayView: function () {
+        var arr = [1, 2.5, "three", [4, 5], {six: 6}];
+        return withViews({arr: Sk.ffi.proxy(arr)}, [
+            "print(len(arr), arr[0], arr[1], arr[2], arr[-2][1], arr[4]['six'])",
+            "print(arr[1:3], 'three' in arr, 7 in arr)",
+            "print([isinstance(x, (int, float, str)) for x in arr])",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, [
+                "5 1 2.5 three 5 6",
+                "[2.5, 'three'] True False",
+                "[True, True, True, False, False]",
+                ""
+            ].join("\n"));
+        });
+    },
+
+    typedArrayView: function () {
+        var data = new Float64Array(1000);
+        data[3] = 1.5;
+        return withViews({data: Sk.ffi.proxy(data, {writable: true})}, [
+            "data[4] = 2",
+            "data[-1] = 3",
+            "print(data[3], data[4], sum(data))",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, "1.5 2.0 6.5\n");
+            assert.strictEqual(data[4], 2);
+            assert.strictEqual(data[999], 3);
+        });
+    },
+
+    objectView: function () {
+        var obj = {a: 1, b: {c: [1, 2]}};
+        return withViews({obj: Sk.ffi.proxy(obj, {writable: true})}, [
+            "print(sorted(obj.keys()), obj['b']['c'][1], obj.get('z', 0), 'a' in obj)",
+            "obj['d'] = 'new'",
+            "obj['b']['c'][0] = 10",
+            "del obj['a']",
+            "print(sorted(obj))",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, "['a', 'b'] 2 0 True\n['b', 'd']\n");
+            // the changes went through to the JS object
+            assert.deepStrictEqual(obj, {b: {c: [10, 2]}, d: "new"});
+        });
+    },
+
+    seesChangesFromJs: function () {
+        var arr = [1, 2];
+        var view = Sk.ffi.proxy(arr);
+        arr.push(3);
+        assert.strictEqual(view.sq$length(), 3);
+        assert.strictEqual(Sk.ffi.remapToJs(view.mp$subscript(new Sk.builtin.int_(2))), 3);
+    },
+
+    roundTrip: function () {
+        var arr = [1, [2, 3]];
+        var obj = {x: {y: 1}};
+        assert.strictEqual(Sk.ffi.remapToJs(Sk.ffi.proxy(arr)), arr);
+        assert.strictEqual(Sk.ffi.remapToJs(Sk.ffi.proxy(obj)), obj);
+        // a nested view maps back to the nested object, not a copy
+        assert.strictEqual(Sk.ffi.remapToJs(Sk.ffi.proxy(arr).mp$subscript(new Sk.builtin.int_(1))), arr[1]);
+        assert.strictEqual(Sk.ffi.remapToJs(Sk.ffi.proxy(obj).mp$subscript(new Sk.builtin.str("x"))), obj.x);
+        // copy: true makes Python objects instead
+        assert.ok(Sk.ffi.proxy(arr, {copy: true}) instanceof Sk.builtin.list);
+        assert.ok(Sk.ffi.proxy(obj, {copy: true}) instanceof Sk.builtin.dict);
+    },
+
+    readOnly: function () {
+        var arr = [1];
+        return withViews({arr: Sk.ffi.proxy(arr)}, "arr[0] = 2").then(function () {
+            throw new Error("no exception raised");
+        }, function (err) {
+            assert.ok(/^TypeError: 'jsarray' object is read-only/.test(err.toString()), err.toString());
+            assert.deepStrictEqual(arr, [1]);
+        });
+    },
+
+    unhashable: function () {
+        return withViews({arr: Sk.ffi.proxy([1]), obj: Sk.ffi.proxy({a: 1})}, [
+            "for v in (arr, obj):",
+            "    try:",
+            "        hash(v)",
+            "    except TypeError as e:",
+            "        print(e.args[0])",
+            "try:",
+            "    {obj: 1}",
+            "except TypeError as e:",
+            "    print(e.args[0])",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, [
+                "unhashable type: 'jsarray'",
+                "unhashable type: 'jsobject'",
+                "unhashable type: 'jsobject'",
+                ""
+            ].join("\n"));
+        });
+    }
+};
@@ -0,0 +1,99 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+const runError = require('./helpers').runError;
+
+// Files streamed through Sk.configure({readChunk}), in chunks of 4
+// characters, served straight away or as Promises.
+const files = {
+    "data.txt": "first line\nsecond\nthird line, no newline"
+};
+
+function readChunk (async, calls) {
+    return function (name, offset, size) {
+        var chunk;
+        calls.push([name, offset]);
+        if (files[name] === undefined) {
+            throw new Error("No such file or directory");
+        }
+        chunk = files[name].substr(offset, size);
+        return async ? new Promise((resolve) => setTimeout(() => resolve(chunk), 0)) : chunk;
+    };
+}
+
+function withChunks (fn) {
+    var chunkSize = Sk.builtin.file.chunkSize;
+    Sk.builtin.file.chunkSize = 4;
+    return Promise.resolve().then(fn).then(function (r) {
+        Sk.builtin.file.chunkSize = chunkSize;
+        return r;
+    }, function (e) {
+        Sk.builtin.file.chunkSize = chunkSize;
+        throw e;
+    });
+}
+
+const source = [
+    "f = open('data.txt')",
+    "print(repr(f.read(6)))",
+    "print(repr(f.readline()))",
+    "print(repr(f.readline()))",
+    "print(repr(f.read(7)), f.tell())",
+    "print(repr(f.read()))",
+    "print(repr(f.readline()))",
+    "f.seek(0)",
+    "print(len(f.readlines()))",
+    ""
+].join("\n");
+
+const expected = [
+    "'first '",
+    "'line\\n'",
+    "'second\\n'",
+    "'third l' 25",
+    "'ine, no newline'",
+    "''",
+    "3",
+    ""
+].join("\n");
+
+function streaming (async) {
+    var calls = [];
+    return withChunks(() => run(source, {readChunk: readChunk(async, calls)})).then(function (out) {
+        assert.strictEqual(out, expected);
+        // read in chunks, not all at once
+        assert.ok(calls.length > 10);
+        assert.deepStrictEqual(calls[0], ["data.txt", 0]);
+    });
+}
+
+function missing (async) {
+    return runError("open('missing.txt')\nprint('opened')", {readChunk: readChunk(async, [])}).then(function (err) {
+        assert.ok(/^IOError: No such file or directory: 'missing.txt'/.test(err), err);
+    });
+}
+
+// Sk.readChunk is used in browsers too, instead of the elements of the page
+function inBrowser () {
+    var saved = Sk.inBrowser;
+    Sk.inBrowser = true;
+    return streaming(true).then(function () {
+        Sk.inBrowser = saved;
+    }, function (e) {
+        Sk.inBrowser = saved;
+        throw e;
+    });
+}
+
+module.exports = {
+    streaming: () => streaming(false),
+    streamingInBrowser: inBrowser,
+    streamingAsync: () => streaming(true),
+    missing: () => missing(false),
+    missingAsync: () => missing(true),
+    missingCaught: function () {
+        return run("try:\n    open('missing.txt')\nexcept IOError:\n    print('IOError')\n",
+                   {readChunk: readChunk(false, [])}).then(function (out) {
+            assert.strictEqual(out, "IOError\n");
+        });
+    }
+};
@@ -0,0 +1,49 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+const runError = require('./helpers').runError;
+
+function settingsWith (execLimit) {
+    Sk.configure({execLimit: execLimit, __future__: Sk.python3});
+    return JSON.parse(Sk.compileSettings());
+}
+
+module.exports = {
+    compileSettings: function () {
+        try {
+            // the code that checks the limit is the same for every limit
+            // but null, which compiles no checks
+            assert.strictEqual(settingsWith(Number.POSITIVE_INFINITY).execLimit, true);
+            assert.strictEqual(settingsWith(5000).execLimit, true);
+            assert.strictEqual(settingsWith(null).execLimit, false);
+        } finally {
+            settingsWith(Number.POSITIVE_INFINITY);
+        }
+    },
+
+    setExecutionLimit: function () {
+        // an infinite limit can be lowered while the program runs
+        return runError([
+            "import sys",
+            "sys.setExecutionLimit(20)",
+            "while True:",
+            "    pass",
+            ""
+        ].join("\n"), {execLimit: Number.POSITIVE_INFINITY}).then(function (err) {
+            assert.ok(/^TimeLimitError/.test(err), err);
+        });
+    },
+
+    noLimit: function () {
+        return runError("import sys\nsys.setExecutionLimit(20)\n", {execLimit: null}).then(function (err) {
+            assert.ok(/^NotImplementedError: Execution limiting is not enabled/.test(err), err);
+            return run("print(sum(range(1000)))\n", {execLimit: null});
+        }).then(function (out) {
+            assert.strictEqual(out, "499500\n");
+        }).then(function () {
+            settingsWith(Number.POSITIVE_INFINITY);
+        }, function (err) {
+            settingsWith(Number.POSITIVE_INFINITY);
+            throw err;
+        });
+    }
+};
@@ -0,0 +1,34 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+
+const source = [
+    "print(__debug__)",
+    "d = __debug__",
+    "print(d, not __debug__)",
+    "try:",
+    "    assert False, 'checked'",
+    "except AssertionError as e:",
+    "    print(e.args[0])",
+    ""
+].join("\n");
+
+module.exports = {
+    debugLevel0: function () {
+        return run(source, {optimize: 0}).then(function (out) {
+            assert.strictEqual(out, "True\nTrue False\nchecked\n");
+        });
+    },
+
+    debugLevel1: function () {
+        return run(source, {optimize: 1}).then(function (out) {
+            assert.strictEqual(out, "True\nTrue False\nchecked\n");
+        });
+    },
+
+    debugLevel2: function () {
+        return run(source, {optimize: 2}).then(function (out) {
+            // the assert is dropped
+            assert.strictEqual(out, "False\nFalse True\n");
+        });
+    }
+};
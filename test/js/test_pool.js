@@ -0,0 +1,76 @@
+const assert = require('assert');
+const Pool = require('../../support/run/pool').Pool;
+
+module.exports = {
+    programs: function () {
+        var pool = new Pool({size: 2, python3: true});
+        var streamed = "";
+        return Promise.all([
+            pool.run("print('hello')\n", {onOutput: (text) => {
+                streamed += text;
+            }}),
+            pool.run("import math\nprint(math.factorial(10))\n"),
+            pool.run("import sys\nprint(sys.argv)\n", {sysargv: ["prog", "x"]}),
+            pool.run("print('start')\nraise ValueError('boom')\n"),
+            pool.run("while True:\n    pass\n", {execLimit: 100}),
+            pool.run("print(sum(range(10)))\n", {execLimit: 100})
+        ]).then(function (r) {
+            pool.close();
+            assert.deepStrictEqual(r.map((x) => x.stdout), [
+                "hello\n", "3628800\n", "['prog', 'x']\n", "start\n", "", "45\n"
+            ]);
+            assert.strictEqual(streamed, "hello\n");
+            assert.deepStrictEqual(r.slice(0, 3).map((x) => x.error), [null, null, null]);
+            assert.ok(/^ValueError: boom/.test(r[3].error), r[3].error);
+            // a program over its limit stops, and the next one on the
+            // worker runs as usual
+            assert.ok(/^TimeLimitError/.test(r[4].error), r[4].error);
+            assert.strictEqual(r[5].error, null);
+        }, function (err) {
+            pool.close();
+            throw err;
+        });
+    },
+
+    closed: function () {
+        var pool = new Pool({size: 1, python3: true});
+        pool.close();
+        return pool.run("print(1)\n").then(function () {
+            throw new Error("a closed pool ran a program");
+        }, function (err) {
+            assert.strictEqual(err.message, "the pool is closed");
+        });
+    },
+
+    lateMessages: function () {
+        var pool = new Pool({size: 1, python3: true});
+        var worker = {job: null, ready: true};
+        // what a worker the pool gave up on still sends is dropped
+        pool.message(worker, {type: "output", text: "late"});
+        pool.message(worker, {type: "done", error: null, time: 0});
+        assert.deepStrictEqual(pool.idle, []);
+        return pool.run("print(1)\n").then(function (r) {
+            pool.close();
+            assert.strictEqual(r.stdout, "1\n");
+        });
+    },
+
+    brokenStart: function () {
+        var pool = new Pool({size: 2, python3: true});
+        var queued = pool.run("print(1)\n");
+        // a worker that fails before it is ready is not restarted, the
+        // pool fails its programs instead
+        pool.failed(pool.workers[0], new Error("worker stopped"));
+        assert.deepStrictEqual(pool.workers, []);
+        return queued.then(function () {
+            throw new Error("a broken pool ran a program");
+        }, function (err) {
+            assert.strictEqual(err.message, "worker stopped");
+            return pool.run("print(2)\n");
+        }).then(function () {
+            throw new Error("a broken pool ran a program");
+        }, function (err) {
+            assert.strictEqual(err.message, "worker stopped");
+        });
+    }
+};
@@ -0,0 +1,52 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+const resetting = require('./helpers').resetting;
+
+// runs source compiled for profiling, then turns the option off again
+function profiled (source) {
+    return resetting(run(source, {profiling: true}));
+}
+
+module.exports = {
+    recursiveCalls: function () {
+        return profiled([
+            "import cProfile, pstats",
+            "def fact(n):",
+            "    return 1 if n < 2 else n * fact(n - 1)",
+            "def main():",
+            "    return fact(5) + fact(3)",
+            "p = cProfile.Profile()",
+            "p.runcall(main)",
+            "st = pstats.Stats(p).strip_dirs()",
+            "for func in sorted(st.stats):",
+            "    cc, nc, tt, ct, callers = st.stats[func]",
+            "    print(func[2], nc, cc, sorted((c[2], v[0]) for c, v in callers.items()))",
+            "print(sorted(f[2] for f in st.top_level))",
+            "print(st.total_calls, st.prim_calls)",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, [
+                "fact 8 2 [('fact', 6), ('main', 2)]",
+                "main 1 1 []",
+                // the profile sees its own disable, as in CPython
+                "Profile.disable 1 1 []",
+                "['Profile.disable', 'main']",
+                "10 4",
+                ""
+            ].join("\n"));
+        });
+    },
+
+    run: function () {
+        return profiled([
+            "import cProfile",
+            "def f():",
+            "    pass",
+            "cProfile.run('for i in range(3): f()', 'calls')",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.ok(/Ordered by: call count/.test(out), out);
+            assert.ok(/^\s+3\s.*:2\(f\)$/m.test(out), out);
+        });
+    }
+};
@@ -0,0 +1,129 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+
+const BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+
+// Decodes the mappings of a source map into, for each generated line, a
+// list of [generated column, source line, source column], all from 0
+function decode (mappings) {
+    var genLines = [];
+    var srcLine = 0;
+    var srcCol = 0;
+
+    mappings.split(";").forEach(function (line) {
+        var genCol = 0;
+        var segments = [];
+        if (line !== "") {
+            line.split(",").forEach(function (seg) {
+                var values = [];
+                var value = 0;
+                var shift = 0;
+                var i, digit;
+                for (i = 0; i < seg.length; i++) {
+                    digit = BASE64.indexOf(seg[i]);
+                    value += (digit & 31) << shift;
+                    shift += 5;
+                    if (!(digit & 32)) {
+                        values.push(value & 1 ? -(value >> 1) : value >> 1);
+                        value = 0;
+                        shift = 0;
+                    }
+                }
+                assert.strictEqual(values.length, 4, seg);
+                assert.strictEqual(values[1], 0);
+                genCol += values[0];
+                srcLine += values[2];
+                srcCol += values[3];
+                segments.push([genCol, srcLine, srcCol]);
+            });
+        }
+        genLines.push(segments);
+    });
+    return genLines;
+}
+
+// The [source line, source column] that generated position [line, col]
+// maps to, both from 0
+function lookup (genLines, line, col) {
+    var found;
+    genLines[line].forEach(function (seg) {
+        if (seg[0] <= col) {
+            found = [seg[1], seg[2]];
+        }
+    });
+    return found;
+}
+
+// The generated [line, col] of the first occurrence of text in code
+function position (code, text) {
+    var index = code.indexOf(text);
+    var before;
+    assert.ok(index >= 0, "no " + text + " in the generated code");
+    before = code.substring(0, index).split("\n");
+    return [before.length - 1, before[before.length - 1].length];
+}
+
+const source = [
+    "def outer():",
+    "    def inner(x):",
+    "        return x + 1",
+    "    return inner",
+    "",
+    "class K:",
+    "    def meth(self):",
+    "        y = outer()(41)",
+    "        return y",
+    "",
+    "print(K().meth())",
+    ""
+].join("\n");
+
+function compile () {
+    var ret;
+    Sk.configure({__future__: Sk.python3, sourceMaps: true});
+    try {
+        ret = Sk.compile(source, "sm.py", "exec", true);
+    } finally {
+        Sk.configure({__future__: Sk.python3});
+    }
+    return ret;
+}
+
+module.exports = {
+    positions: function () {
+        var ret = compile();
+        var map = ret.sourceMap;
+        var genLines = decode(map.mappings);
+
+        assert.strictEqual(map.version, 3);
+        assert.deepStrictEqual(map.sources, ["sm.py"]);
+        assert.deepStrictEqual(map.sourcesContent, [source]);
+        // the functions are named after their qualnames, and map to their def
+        assert.deepStrictEqual(lookup(genLines, ...position(ret.code, "function $outer$inner$(")), [1, 4]);
+        assert.deepStrictEqual(lookup(genLines, ...position(ret.code, "function $outer$(")), [0, 0]);
+        assert.deepStrictEqual(lookup(genLines, ...position(ret.code, "function $K$meth$(")), [6, 4]);
+        assert.deepStrictEqual(lookup(genLines, ...position(ret.code, "function $K$class_outer(")), [5, 0]);
+        assert.ok(ret.code.indexOf("\u0001") === -1);
+    },
+
+    noRedundantSegments: function () {
+        var ret = compile();
+        var lines = ret.sourceMap.mappings.split(";");
+        var genLines = decode(ret.sourceMap.mappings);
+        var i, j;
+
+        assert.strictEqual(genLines.length, ret.code.split("\n").length - 2);
+        for (i = 0; i < genLines.length; i++) {
+            for (j = 1; j < genLines[i].length; j++) {
+                assert.ok(genLines[i][j][0] > genLines[i][j - 1][0],
+                    "two segments at one column on line " + i + ": " + lines[i]);
+            }
+        }
+    },
+
+    runs: function () {
+        return run(source, {sourceMaps: true}).then(function (out) {
+            assert.strictEqual(out, "42\n");
+        });
+    }
+};
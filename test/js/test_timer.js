@@ -0,0 +1,184 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+const resetting = require('./helpers').resetting;
+
+// Runs fn with the clock at timeScale scale, then puts it back to real time
+function withScale (scale, fn) {
+    Sk.timer.setScale(scale);
+    return Promise.resolve().then(fn).then(function (r) {
+        Sk.timer.setScale(1);
+        return r;
+    }, function (e) {
+        Sk.timer.setScale(1);
+        throw e;
+    });
+}
+
+module.exports = {
+    timeScale: function () {
+        var start = Date.now();
+        return run([
+            "import time",
+            "t = time.monotonic()",
+            "time.sleep(1)",
+            "print(time.monotonic() - t >= 1)",
+            ""
+        ].join("\n"), {timeScale: 0.01}).then(function (out) {
+            Sk.configure({__future__: Sk.python3, timeScale: 1});
+            // a second of the clock took about ten real milliseconds
+            assert.strictEqual(out, "True\n");
+            assert.ok(Date.now() - start < 500, Date.now() - start);
+        });
+    },
+
+    timeScaleZero: function () {
+        var start = Date.now();
+        return withScale(0, function () {
+            var t = Sk.timer.now();
+            var seen = [];
+            var elapsed = function (at) {
+                return Math.round(at - t);
+            };
+            // the clock stands still but for jumping to each deadline
+            assert.strictEqual(Sk.timer.now(), t);
+            return Promise.all([
+                Sk.timer.sleep(60000).then(function (at) {
+                    seen.push([elapsed(at), elapsed(Sk.timer.now())]);
+                }),
+                Sk.timer.sleep(3600000).then(function (at) {
+                    seen.push([elapsed(at), elapsed(Sk.timer.now())]);
+                })
+            ]).then(function () {
+                assert.deepStrictEqual(seen, [[60000, 60000], [3600000, 3600000]]);
+                assert.ok(Date.now() - start < 500, Date.now() - start);
+            });
+        });
+    },
+
+    cancel: function () {
+        var ran = [];
+        return withScale(0, function () {
+            var a = Sk.timer.schedule(10, () => ran.push("a"));
+            Sk.timer.schedule(20, () => ran.push("b"));
+            Sk.timer.cancel(a);
+            // cancelling twice, or nothing, does no harm
+            Sk.timer.cancel(a);
+            Sk.timer.cancel(null);
+            return Sk.timer.sleep(30).then(function () {
+                assert.deepStrictEqual(ran, ["b"]);
+            });
+        });
+    },
+
+    heapOrder: function () {
+        var ran = [];
+        var expected = [];
+        var i, delay;
+        return withScale(0, function () {
+            var t = Sk.timer.now();
+            // a fixed pseudo-random sequence of delays, with repeats
+            for (i = 0, delay = 7; i < 300; i++) {
+                delay = (delay * 31 + 17) % 97;
+                expected.push([delay, i]);
+                Sk.timer.schedule(delay, ((i, delay) => () => ran.push([Math.round(Sk.timer.now() - t), i]))(i, delay));
+            }
+            // by deadline, then in the order they were scheduled
+            expected.sort((x, y) => x[0] - y[0] || x[1] - y[1]);
+            return Sk.timer.sleep(100).then(function () {
+                assert.deepStrictEqual(ran, expected);
+                assert.strictEqual(Sk.timer.heap_.length, 0);
+            });
+        });
+    },
+
+    coalesce: function () {
+        var timeouts = Sk.timer.stats["timeouts"];
+        var wakeups = Sk.timer.stats["wakeups"];
+        var turns = [];
+        var turn = 0;
+        var pending = false;
+        var i;
+        return withScale(0, function () {
+            // each wakeup notes the turn of the event loop it ran in
+            var note = function () {
+                turns.push(turn);
+                if (!pending) {
+                    pending = true;
+                    Promise.resolve().then(function () {
+                        turn++;
+                        pending = false;
+                    });
+                }
+            };
+            for (i = 0; i < 10; i++) {
+                Sk.timer.schedule(50, note);
+            }
+            Sk.timer.schedule(80, note);
+            return Sk.timer.sleep(80).then(function () {
+                // the ten due together ran in one turn, from one timeout
+                assert.deepStrictEqual(turns, [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]);
+                assert.strictEqual(Sk.timer.stats["wakeups"] - wakeups, 12);
+                assert.strictEqual(Sk.timer.stats["timeouts"] - timeouts, 2);
+            });
+        });
+    },
+
+    signalPause: function () {
+        var wakeups = Sk.timer.stats["wakeups"];
+        var out = "";
+        return run([
+            "import signal",
+            "print('waiting')",
+            "signal.pause()",
+            "print('woken')",
+            ""
+        ].join("\n"), {
+            signals: true,
+            output: function (text) {
+                out += text;
+                if (out === "waiting\n") {
+                    setImmediate(function () {
+                        Sk.signals.signal(2);
+                    });
+                }
+            }
+        }).then(function () {
+            Sk.configure({__future__: Sk.python3});
+            assert.strictEqual(out, "waiting\nwoken\n");
+            // the signal came as a wakeup of the timer
+            assert.strictEqual(Sk.timer.stats["wakeups"] - wakeups, 1);
+            assert.strictEqual(Sk.signals, null);
+        });
+    },
+
+    sleepDebt: function () {
+        var source = function (work) {
+            return [
+                "import time",
+                "t = time.monotonic()",
+                "while time.monotonic() - t < " + work + ":",
+                "    pass",
+                "t = time.monotonic()",
+                "time.sleep(0.1)",
+                "print(time.monotonic() - t)",
+                ""
+            ].join("\n");
+        };
+        var owe = function () {
+            // as if the last sleep of the program woke 300ms late, just now
+            Sk.sleepResumed = Sk.timer.now();
+            Sk.sleepDebt = 300;
+        };
+        owe();
+        return resetting(run(source(0))).then(function (out) {
+            // a sleep straight after makes up for it
+            assert.ok(parseFloat(out) < 0.05, out);
+            owe();
+            return resetting(run(source(0.5)));
+        }).then(function (out) {
+            // work in between pays the debt off, the sleep is not cut short
+            assert.ok(parseFloat(out) >= 0.1, out);
+            Sk.sleepDebt = 0;
+        });
+    }
+};
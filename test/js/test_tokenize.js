@@ -0,0 +1,40 @@
+const assert = require('assert');
+const countTokens = require('../../support/run/tokbench').countTokens;
+
+// Compiles source and returns the arguments of the SyntaxError it raises
+function syntaxError (source) {
+    try {
+        Sk.compile(source, "t.py", "exec", true);
+    } catch (e) {
+        assert.ok(e instanceof Sk.builtin.SyntaxError, String(e));
+        return [Sk.ffi.remapToJs(e.args.v[0]), Sk.ffi.remapToJs(e.args.v[2])];
+    }
+    throw new Error("no SyntaxError raised");
+}
+
+module.exports = {
+    errorMessages: function () {
+        Sk.configure({__future__: Sk.python3});
+        // characters that are no Python token
+        assert.deepStrictEqual(syntaxError("a = $b\n"), ["bad token", 1]);
+        assert.deepStrictEqual(syntaxError("x = 1\ny = 2 ?\n"), ["bad token", 2]);
+        // tokens that are used wrongly
+        assert.deepStrictEqual(syntaxError("x = 1\ny = 2 3\n"), ["bad input", 2]);
+        assert.deepStrictEqual(syntaxError("x = @\n"), ["bad input", 1]);
+        // unterminated strings and stray line continuations
+        assert.deepStrictEqual(syntaxError("s = 'abc\n"), ["bad input", 1]);
+        assert.deepStrictEqual(syntaxError("a = 1\n\ns = \"abc\n"), ["bad input", 3]);
+        assert.deepStrictEqual(syntaxError("x = 'a' 'b\n"), ["bad input", 1]);
+        assert.deepStrictEqual(syntaxError("x = rb'a\n"), ["bad input", 1]);
+        assert.deepStrictEqual(syntaxError("x = 1\na = b \\ c\n"), ["bad input", 2]);
+    },
+
+    tokbench: function () {
+        Sk.configure({__future__: Sk.python3});
+        // ENCODING, NAME, OP, NUMBER, NEWLINE, ENDMARKER
+        assert.strictEqual(countTokens(["x = 1"]), 6);
+        assert.strictEqual(countTokens(["x = 1", "x = 1"]), 12);
+        // the tokens up to a malformed one are counted, and it is no error
+        assert.ok(countTokens(["x = (1,\n"]) > 0);
+    }
+};
@@ -0,0 +1,62 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+const resetting = require('./helpers').resetting;
+
+// runs source compiled with line counts, then turns the option off again
+function counted (source) {
+    return resetting(run(source, {lineCounts: true}));
+}
+
+module.exports = {
+    runfunc: function () {
+        return counted([
+            "import trace",
+            "def f(n):",
+            "    t = 0",
+            "    for i in range(n):",
+            "        t += i",
+            "    return t",
+            "tr = trace.Trace()",
+            "print(tr.runfunc(f, 3))",
+            "print(sorted(tr.counts.items()))",
+            ""
+        ].join("\n")).then(function (out) {
+            // the lines of trace.py itself are left out
+            assert.strictEqual(out, "3\n[(('<stdin>.py', 3), 1), (('<stdin>.py', 4), 1), " +
+                "(('<stdin>.py', 5), 3), (('<stdin>.py', 6), 1)]\n");
+        });
+    },
+
+    runctx: function () {
+        return counted([
+            "import trace",
+            "def g():",
+            "    return 1",
+            "ns = {'g': g}",
+            "tr = trace.Trace()",
+            "tr.runctx('x = g()\\nx = g()\\n', ns)",
+            "print(ns['x'], sorted(tr.counts.items()))",
+            ""
+        ].join("\n")).then(function (out) {
+            assert.strictEqual(out, "1 [(('<stdin>.py', 3), 2), (('<string>', 1), 1), (('<string>', 2), 1)]\n");
+        });
+    },
+
+    reset: function () {
+        Sk.resetLineCounts();
+        return counted("x = 1\nif x:\n    y = 2\nelse:\n    y = 3\n").then(function () {
+            assert.deepStrictEqual(JSON.parse(Sk.lineCountsJSON())["<stdin>.py"],
+                {counts: {1: 1, 2: 1, 3: 1}, missing: [5]});
+            // a program with the same file name after a reset is counted
+            // on its own, and the first one's tables are gone
+            Sk.resetLineCounts();
+            assert.deepStrictEqual(Sk.lineCountFiles_, {});
+            return counted("for i in range(2):\n    pass\n");
+        }).then(function () {
+            assert.deepStrictEqual(JSON.parse(Sk.lineCountsJSON())["<stdin>.py"],
+                {counts: {1: 1, 2: 2}, missing: []});
+            assert.strictEqual(Sk.lineCountFiles_["<stdin>.py"].tables.length, 1);
+            Sk.resetLineCounts();
+        });
+    }
+};
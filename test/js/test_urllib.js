@@ -0,0 +1,111 @@
+const assert = require('assert');
+const run = require('./helpers').run;
+const runError = require('./helpers').runError;
+const resetting = require('./helpers').resetting;
+
+// A transport that answers every request with a body in the given chunks,
+// each read resolving a turn of the event loop later. The urls it was
+// asked for are in transport.urls.
+function chunked (chunks) {
+    var transport = function (req) {
+        var i = 0;
+        transport.urls.push(req.url);
+        return Promise.resolve({
+            status : 200,
+            reason : "OK",
+            url    : req.url,
+            headers: {"content-type": "text/plain"},
+            read   : function () {
+                return new Promise(function (resolve) {
+                    setImmediate(function () {
+                        resolve(i < chunks.length ? chunks[i++] : "");
+                    });
+                });
+            }
+        });
+    };
+    transport.urls = [];
+    return transport;
+}
+
+// runs source with options, then puts back the url options of the realm
+function runWith (runner, source, options) {
+    return resetting(runner(source, options));
+}
+
+module.exports = {
+    chunks: function () {
+        var transport = chunked(["first li", "ne\nsec", "ond line\n", "la", "st"]);
+        return runWith(run, [
+            "from urllib.request import urlopen",
+            "r = urlopen('http://example.com/a')",
+            "print(repr(r.read(3)))",
+            "print(repr(r.readline()))",
+            "print([line for line in r])",
+            "print(repr(r.read()))",
+            ""
+        ].join("\n"), {urlTransport: transport}).then(function (out) {
+            assert.strictEqual(out, [
+                "'fir'",
+                "'st line\\n'",
+                "['second line\\n', 'last']",
+                "''",
+                ""
+            ].join("\n"));
+            assert.deepStrictEqual(transport.urls, ["http://example.com/a"]);
+        });
+    },
+
+    cache: function () {
+        var transport = chunked(["bo", "dy"]);
+        return runWith(run, [
+            "from urllib.request import urlopen",
+            "def get(name):",
+            "    return urlopen('http://example.com/' + name).read()",
+            "print(get('a'), get('a'), get('b'))",
+            "get('a')",
+            "get('c')",
+            "get('a')",
+            "get('b')",
+            ""
+        ].join("\n"), {urlTransport: transport, urlCacheSize: 2}).then(function (out) {
+            assert.strictEqual(out, "body body body\n");
+            // a is answered from the cache while it is one of the two
+            // used last, b was dropped for c
+            assert.deepStrictEqual(transport.urls, [
+                "http://example.com/a", "http://example.com/b", "http://example.com/c", "http://example.com/b"
+            ]);
+        });
+    },
+
+    rejected: function () {
+        var refused = function () {
+            return Promise.reject(new Error("connection refused"));
+        };
+        var broken = function (req) {
+            return {
+                status : 200,
+                url    : req.url,
+                headers: {},
+                read   : function () {
+                    return Promise.reject(new Error("connection reset"));
+                }
+            };
+        };
+        return runWith(runError, "from urllib.request import urlopen\nurlopen('http://example.com/')\n",
+            {urlTransport: refused}).then(function (err) {
+            assert.ok(/^IOError: <urlopen error connection refused>/.test(err), err);
+            return runWith(run, [
+                "from urllib.request import urlopen",
+                "r = urlopen('http://example.com/')",
+                "try:",
+                "    r.read()",
+                "except IOError as e:",
+                "    print(e.args[0])",
+                ""
+            ].join("\n"), {urlTransport: broken});
+        }).then(function (out) {
+            assert.strictEqual(out, "<urlopen error connection reset>\n");
+        });
+    }
+};
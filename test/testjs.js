@@ -0,0 +1,68 @@
+const fs = require('fs');
+const path = require('path');
+const program = require('commander');
+const reqskulpt = require('../support/run/require-skulpt').requireSkulpt;
+
+// Runs the tests of the Javascript side of Skulpt, the ones that need to
+// configure it or call into it, which the Python unit tests cannot do.
+//
+// Each test/js/test_*.js file exports an object of test functions, which
+// either return or return a Promise; a test fails if it throws or the
+// Promise is rejected. Tests use Node's assert, and test/js/helpers.js to
+// run Python code.
+function test (opt, only) {
+    var dir = "test/js";
+    var tests = [];
+    var passed = 0;
+    var failed = 0;
+    var starttime;
+
+    var skulpt = reqskulpt(opt);
+    if (skulpt === null) {
+        process.exit(1);
+    }
+
+    fs.readdirSync(dir).forEach(function (file) {
+        var basename = path.basename(file, ".js");
+        var mod;
+        if (basename.startsWith("test_") && path.extname(file) === ".js" && (!only || only === basename)) {
+            mod = require(path.resolve(dir, file));
+            Object.keys(mod).forEach(function (name) {
+                tests.push([basename + "." + name, mod[name]]);
+            });
+        }
+    });
+
+    starttime = Date.now();
+
+    function runtest () {
+        var test = tests.shift();
+
+        if (test === undefined) {
+            console.log("Summary");
+            console.log("Passed: " + passed + " Failed: " + failed);
+            console.log("Total run time for all JS tests: " + ((Date.now() - starttime) / 1000).toString() + "s");
+            // the pool tests leave worker threads behind
+            process.exit(failed > 0 ? 1 : 0);
+        }
+
+        new Promise(function (resolve) {
+            resolve(test[1]());
+        }).then(function () {
+            passed += 1;
+        }, function (err) {
+            failed += 1;
+            console.log("FAILED: " + test[0]);
+            console.log(err && err.stack ? err.stack : String(err));
+        }).then(runtest);
+    }
+
+    runtest();
+}
+
+program
+    .option('-o, --opt', 'use optimized skulpt')
+    .option('-t, --test <name>', 'only run test/js/<name>.js')
+    .parse(process.argv);
+
+test(program.opt, program.test);
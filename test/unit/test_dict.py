@@ -207,5 +207,22 @@ class DictTest(unittest.TestCase):
         self.assertRaises(AttributeError, do_set)
         self.assertRaises(AttributeError, lambda: d.x)
 
+    def test_iter_and_view_methods(self):
+        d = {1: 2, 3: 4}
+        self.assertEqual(sorted(d.iterkeys()), [1, 3])
+        self.assertEqual(sorted(d.itervalues()), [2, 4])
+        self.assertEqual(sorted(d.iteritems()), [(1, 2), (3, 4)])
+        self.assertEqual(sorted(d.items()), [(1, 2), (3, 4)])
+        k = d.viewkeys()
+        d[5] = 6
+        self.assertEqual(len(k), 3)
+        self.assertEqual(k & set([1, 5, 7]), set([1, 5]))
+        self.assertIn((5, 6), d.viewitems())
+        self.assertIn(6, d.viewvalues())
+        def add():
+            for k in d.iterkeys():
+                d[k + 10] = 0
+        self.assertRaises(RuntimeError, add)
+
 if __name__ == '__main__':
     unittest.main()
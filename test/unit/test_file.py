@@ -40,6 +40,24 @@ class FileTests(unittest.TestCase):
 
         self.assertEqual("23",res)
 
+    def test_tell_follows_readline(self):
+        F = open("test/unit/file.txt")
+        header = F.readline()
+        self.assertEqual(F.tell(), len(header))
+        rest = F.read()
+        self.assertEqual(F.tell(), len(header) + len(rest))
+        F.seek(len(header))
+        self.assertEqual(F.readline(), rest.split("\n")[0] + "\n")
+        F.seek(-len(rest), 2)
+        self.assertEqual(F.read(), rest)
+
+    def test_readline_eof(self):
+        F = open("test/unit/file.txt")
+        lines = F.readlines()
+        self.assertEqual(F.readline(), "")
+        self.assertEqual(list(F), [])
+        F.seek(0)
+        self.assertEqual(list(F), lines)
 
 
 if __name__ == "__main__":
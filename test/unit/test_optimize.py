@@ -0,0 +1,36 @@
+""" Unit tests for the constant folding and dead code the compiler optimizes away """
+import unittest
+
+
+class FoldingTests(unittest.TestCase):
+
+    def test_division(self):
+        self.assertEqual(7 / 2, 3)
+        self.assertEqual(-7 / 2, -4)
+        self.assertEqual(7.0 / 2, 3.5)
+        self.assertEqual(7 // 2.0, 3.0)
+
+    def test_long(self):
+        self.assertEqual(2 ** 70, 1180591620717411303424L)
+        self.assertEqual(type(2 ** 70), long)
+
+    def test_membership(self):
+        x = 2
+        self.assertTrue(x in (1, 2, 3))
+        self.assertTrue(2L in (1, 2, 3))
+        self.assertTrue(u"a" in ("a", "b"))
+        self.assertTrue(x not in [4, 5])
+
+    def test_dead_branches(self):
+        if 0:
+            self.fail("dead branch ran")
+        n = 0
+        while 1:
+            n += 1
+            if n == 2:
+                break
+        self.assertEqual(n, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
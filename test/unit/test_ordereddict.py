@@ -104,23 +104,22 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(list(od.keys()), [t[0] for t in pairs])
         self.assertEqual(list(od.values()), [t[1] for t in pairs])
         self.assertEqual(list(od.items()), pairs)
-        # self.assertEqual(list(reversed(od)),
-        #                  [t[0] for t in reversed(pairs)])
+        self.assertEqual(list(reversed(od)),
+                         [t[0] for t in reversed(pairs)])
         # self.assertEqual(list(reversed(od.keys())),
         #                  [t[0] for t in reversed(pairs)])
         # self.assertEqual(list(reversed(od.values())),
         #                  [t[1] for t in reversed(pairs)])
         # self.assertEqual(list(reversed(od.items())), list(reversed(pairs)))
 
-    # def test_detect_deletion_during_iteration(self):
-    #     od = OrderedDict.fromkeys('abc')
-    #     it = iter(od)
-    #     key = next(it)
-    #     del od[key]
-    #     with self.assertRaises(Exception):
-    #         # Note, the exact exception raised is not guaranteed
-    #         # The only guarantee that the next() will not succeed
-    #         next(it)
+    def test_detect_deletion_during_iteration(self):
+        od = OrderedDict((k, None) for k in 'abc')
+        it = iter(od)
+        key = next(it)
+        del od[key]
+        # Note, the exact exception raised is not guaranteed
+        # The only guarantee that the next() will not succeed
+        self.assertRaises(Exception, next, it)
 
     def test_popitem(self):
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
@@ -128,8 +127,7 @@ class TestOrderedDict(unittest.TestCase):
         od = OrderedDict(pairs)
         while pairs:
             self.assertEqual(od.popitem(), pairs.pop())
-        #with self.assertRaises(KeyError):
-        #    od.popitem()
+        self.assertRaises(KeyError, od.popitem)
         self.assertEqual(len(od), 0)
 
     def test_pop(self):
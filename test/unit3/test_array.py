@@ -0,0 +1,159 @@
+""" Unit test for the array module"""
+import unittest
+from array import array
+
+
+class ArrayTests(unittest.TestCase):
+
+    def test_constructor(self):
+        a = array('i', [1, 2, 3])
+        self.assertEqual(a.typecode, 'i')
+        self.assertEqual(a.itemsize, 4)
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a.tolist(), [1, 2, 3])
+        self.assertEqual(array('d', range(3)).tolist(), [0.0, 1.0, 2.0])
+        self.assertEqual(array('c', 'abc').tolist(), ['a', 'b', 'c'])
+        self.assertRaises(ValueError, array, 'z')
+        self.assertRaises(TypeError, array, 'i', [1.5])
+        self.assertRaises(OverflowError, array, 'b', [128])
+        self.assertRaises(OverflowError, array, 'B', [-1])
+
+    def test_repr(self):
+        self.assertEqual(repr(array('i')), "array('i')")
+        self.assertEqual(repr(array('d', [1, 2])), "array('d', [1.0, 2.0])")
+        self.assertEqual(repr(array('u', 'hi')), "array('u', 'hi')")
+
+    def test_append_extend(self):
+        a = array('h')
+        for i in range(100):
+            a.append(i)
+        self.assertEqual(len(a), 100)
+        self.assertEqual(a[99], 99)
+        a.extend([100, 101])
+        a.extend(array('h', [102]))
+        self.assertEqual(a[-3:].tolist(), [100, 101, 102])
+        self.assertRaises(TypeError, a.extend, array('d', [1.0]))
+        a.fromlist([7, 8])
+        self.assertEqual(a[-1], 8)
+        self.assertRaises(TypeError, a.fromlist, [1, 'x'])
+        self.assertEqual(a[-1], 8)
+
+    def test_indexing(self):
+        a = array('i', range(10))
+        self.assertEqual(a[0], 0)
+        self.assertEqual(a[-1], 9)
+        self.assertRaises(IndexError, lambda: a[10])
+        a[0] = 42
+        self.assertEqual(a[0], 42)
+        self.assertEqual(a[2:5], array('i', [2, 3, 4]))
+        self.assertEqual(a[::3].tolist(), [42, 3, 6, 9])
+        self.assertEqual(a[::-1].tolist(), [9, 8, 7, 6, 5, 4, 3, 2, 1, 42])
+        a[1:3] = array('i', [7, 7, 7])
+        self.assertEqual(a[:5].tolist(), [42, 7, 7, 7, 3])
+        del a[1:4]
+        self.assertEqual(a[:3].tolist(), [42, 3, 4])
+        del a[0]
+        self.assertEqual(a[0], 3)
+        del a[::2]
+        self.assertEqual(a.tolist(), [4, 6, 8])
+
+    def test_list_methods(self):
+        a = array('i', [1, 2, 3, 2])
+        self.assertEqual(a.count(2), 2)
+        self.assertEqual(a.index(3), 2)
+        self.assertTrue(3 in a)
+        self.assertFalse(5 in a)
+        a.remove(2)
+        self.assertEqual(a.tolist(), [1, 3, 2])
+        a.insert(0, 9)
+        self.assertEqual(a.pop(), 2)
+        self.assertEqual(a.pop(0), 9)
+        a.reverse()
+        self.assertEqual(a.tolist(), [3, 1])
+        self.assertRaises(ValueError, a.remove, 10)
+
+    def test_concat_repeat(self):
+        a = array('d', [1.5, 2.5])
+        b = array('d', [3.5])
+        self.assertEqual((a + b).tolist(), [1.5, 2.5, 3.5])
+        self.assertEqual((a * 3).tolist(), [1.5, 2.5] * 3)
+        self.assertEqual((2 * b).tolist(), [3.5, 3.5])
+        self.assertEqual(len(a * 0), 0)
+        self.assertRaises(TypeError, lambda: a + array('i'))
+        a += b
+        self.assertEqual(len(a), 3)
+        a *= 2
+        self.assertEqual(a.tolist(), [1.5, 2.5, 3.5, 1.5, 2.5, 3.5])
+
+    def test_iteration(self):
+        total = 0
+        for x in array('f', [0.5, 0.25]):
+            total += x
+        self.assertEqual(total, 0.75)
+        self.assertEqual(list(array('b', [-1, 1])), [-1, 1])
+
+    def test_bytes(self):
+        a = array('H', [1, 258])
+        s = a.tobytes()
+        self.assertEqual(len(s), 4)
+        b = array('H')
+        b.frombytes(s)
+        self.assertEqual(a, b)
+        b.byteswap()
+        self.assertEqual(b.tolist(), [256, 513])
+        self.assertRaises(ValueError, b.frombytes, 'abc')
+        self.assertEqual(a.buffer_info()[1], 2)
+
+    def test_compare(self):
+        self.assertTrue(array('i', [1, 2]) == array('i', [1, 2]))
+        self.assertTrue(array('i', [1, 2]) != array('i', [1, 3]))
+        self.assertTrue(array('i', [1, 2]) < array('i', [1, 3]))
+        self.assertTrue(array('i', [1]) < array('i', [1, 0]))
+        self.assertTrue(array('i', [1, 2]) == array('d', [1, 2]))
+        self.assertFalse(array('i') == [])
+
+    def test_contains(self):
+        a = array('i', [1, 2])
+        self.assertTrue(1.0 in a)
+        self.assertTrue(True in a)
+        self.assertFalse(1.5 in a)
+        self.assertFalse('x' in a)
+        self.assertFalse(2 ** 40 in a)
+        self.assertTrue(2 in array('d', [2.0]))
+        self.assertFalse(0.1 in array('f', [0.1]))
+        self.assertTrue('b' in array('u', 'abc'))
+        self.assertFalse('bc' in array('u', 'abc'))
+
+    def test_subclass(self):
+        class A(array):
+            pass
+
+        class B(array):
+            def __init__(self, typecode, items):
+                self.label = 'b'
+
+            def total(self):
+                return sum(self)
+
+        a = A('i', [1, 2, 3])
+        self.assertTrue(isinstance(a, array))
+        self.assertEqual(type(a), A)
+        self.assertEqual(a.typecode, 'i')
+        self.assertEqual(a.itemsize, 4)
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a[0], 1)
+        self.assertEqual(a[1:], array('i', [2, 3]))
+        a.append(4)
+        a[0] = 10
+        del a[1]
+        self.assertEqual(list(a), [10, 3, 4])
+        self.assertTrue(3 in a)
+        self.assertEqual(repr(a), "array('i', [10, 3, 4])")
+        b = B('d', [1.5, 2.5])
+        self.assertEqual(b.total(), 4.0)
+        self.assertEqual(b.label, 'b')
+        self.assertEqual(b.tolist(), [1.5, 2.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -69,6 +69,31 @@ class ClosureTestCase(unittest.TestCase):
 
         self.assertEqual(adder(x=42), 84)
 
+    def test_closure_positional(self):
+        adder = make_adder()
+
+        self.assertEqual(adder(1), 43)
+        self.assertEqual(adder(2), 44)
+        self.assertRaises(TypeError, lambda: adder())
+        self.assertRaises(TypeError, lambda: adder(1, 2))
+        self.assertRaises(TypeError, lambda: adder(y=1))
+
+
+class PositionalTestCase(unittest.TestCase):
+    def test_exact_positional(self):
+        def f(a, b, c):
+            return (a, b, c)
+        def g(a, b=2, c=3):
+            return (a, b, c)
+
+        for i in range(3):
+            self.assertEqual(f(i, 1, 2), (i, 1, 2))
+            self.assertEqual(g(i), (i, 2, 3))
+            self.assertEqual(g(i, c=i), (i, 2, i))
+        self.assertRaises(TypeError, lambda: f(1, 2))
+        self.assertRaises(TypeError, lambda: f(1, 2, 3, 4))
+        self.assertRaises(TypeError, lambda: g(1, a=1))
+
 
 
 if __name__ == "__main__":
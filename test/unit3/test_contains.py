@@ -110,6 +110,16 @@ class TestContains(unittest.TestCase):
         self.assertIn(42, gen())
         self.assertNotIn(43, gen())
 
+    def test_suspending_contains(self):
+        class Sleepy(object):
+            def __contains__(self, x):
+                sleep(0.0001)
+                return x == 42
+
+        self.assertTrue(42 in Sleepy())
+        self.assertFalse(43 in Sleepy())
+        self.assertTrue(43 not in Sleepy())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,121 @@
+""" Unit test for collections.deque"""
+import unittest
+from collections import deque
+
+
+class DequeTests(unittest.TestCase):
+
+    def test_basic(self):
+        d = deque()
+        self.assertEqual(len(d), 0)
+        for i in range(100):
+            d.append(i)
+            d.appendleft(-i)
+        self.assertEqual(len(d), 200)
+        self.assertEqual(d[0], -99)
+        self.assertEqual(d[-1], 99)
+        self.assertEqual(d.pop(), 99)
+        self.assertEqual(d.popleft(), -99)
+        self.assertEqual(len(d), 198)
+        self.assertRaises(IndexError, deque().pop)
+        self.assertRaises(IndexError, deque().popleft)
+
+    def test_constructor(self):
+        self.assertEqual(list(deque('abc')), ['a', 'b', 'c'])
+        self.assertEqual(repr(deque([1, 2])), "deque([1, 2])")
+        self.assertEqual(repr(deque(range(5), 3)), "deque([2, 3, 4], maxlen=3)")
+        self.assertEqual(deque(maxlen=2).maxlen, 2)
+        self.assertEqual(deque().maxlen, None)
+        self.assertRaises(ValueError, deque, [], -1)
+        self.assertRaises(TypeError, deque, 1)
+
+    def test_maxlen(self):
+        d = deque(maxlen=3)
+        d.extend([1, 2, 3, 4])
+        self.assertEqual(list(d), [2, 3, 4])
+        d.appendleft(0)
+        self.assertEqual(list(d), [0, 2, 3])
+        d.extendleft([9, 8])
+        self.assertEqual(list(d), [8, 9, 0])
+        z = deque(maxlen=0)
+        z.append(1)
+        self.assertEqual(len(z), 0)
+
+    def test_extendleft(self):
+        d = deque([1])
+        d.extendleft([2, 3])
+        self.assertEqual(list(d), [3, 2, 1])
+        d.extend(d)
+        self.assertEqual(list(d), [3, 2, 1, 3, 2, 1])
+
+    def test_rotate(self):
+        d = deque(range(10))
+        d.rotate()
+        self.assertEqual(list(d), [9, 0, 1, 2, 3, 4, 5, 6, 7, 8])
+        d.rotate(-1)
+        self.assertEqual(list(d), list(range(10)))
+        d.rotate(7)
+        self.assertEqual(list(d), [3, 4, 5, 6, 7, 8, 9, 0, 1, 2])
+        d.rotate(-17)
+        self.assertEqual(list(d), list(range(10)))
+        full = deque(range(8))
+        full.rotate(3)
+        self.assertEqual(list(full), [5, 6, 7, 0, 1, 2, 3, 4])
+        deque().rotate(3)
+
+    def test_indexing(self):
+        d = deque(range(5))
+        d.rotate(2)
+        self.assertEqual(d[1], 4)
+        d[1] = 'x'
+        self.assertEqual(list(d), [3, 'x', 0, 1, 2])
+        del d[1]
+        del d[-2]
+        self.assertEqual(list(d), [3, 0, 2])
+        self.assertRaises(IndexError, lambda: d[3])
+        self.assertRaises(TypeError, lambda: d[0:1])
+
+    def test_methods(self):
+        d = deque([1, 2, 3, 2])
+        self.assertEqual(d.count(2), 2)
+        self.assertTrue(3 in d)
+        self.assertFalse(5 in d)
+        d.remove(2)
+        self.assertEqual(list(d), [1, 3, 2])
+        self.assertRaises(ValueError, d.remove, 7)
+        d.reverse()
+        self.assertEqual(list(d), [2, 3, 1])
+        self.assertEqual(list(reversed(d)), [1, 3, 2])
+        c = d.copy()
+        d.clear()
+        self.assertEqual(len(d), 0)
+        self.assertEqual(list(c), [2, 3, 1])
+
+    def test_compare(self):
+        self.assertEqual(deque([1, 2]), deque([1, 2]))
+        self.assertNotEqual(deque([1, 2]), deque([1, 3]))
+        self.assertTrue(deque([1, 2]) < deque([1, 3]))
+        self.assertNotEqual(deque([1]), [1])
+        self.assertEqual(list(deque([1]) + deque([2])), [1, 2])
+
+    def test_mutation_during_iteration(self):
+        d = deque([1, 2, 3])
+        def mutate():
+            for x in d:
+                d.append(x)
+        self.assertRaises(RuntimeError, mutate)
+
+    def test_bfs(self):
+        queue = deque([0])
+        seen = set([0])
+        while queue:
+            n = queue.popleft()
+            for m in (n * 2 + 1, n * 2 + 2):
+                if m < 5000 and m not in seen:
+                    seen.add(m)
+                    queue.append(m)
+        self.assertEqual(len(seen), 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -277,5 +277,63 @@ class DictTest(unittest.TestCase):
         s2 = { 2*y + x + 1 for x in (0,) for y in (1,) }
         self.assertEqual(s2, {3})
 
+    def test_views_are_live(self):
+        d = {1: 'a', 2: 'b'}
+        k, v, i = d.keys(), d.values(), d.items()
+        d[3] = 'c'
+        self.assertEqual(len(k), 3)
+        self.assertEqual(sorted(k), [1, 2, 3])
+        self.assertEqual(sorted(v), ['a', 'b', 'c'])
+        self.assertEqual(sorted(i), [(1, 'a'), (2, 'b'), (3, 'c')])
+        self.assertIn(3, k)
+        self.assertIn('c', v)
+        self.assertIn((3, 'c'), i)
+        self.assertNotIn((3, 'd'), i)
+        self.assertEqual(repr({1: 2}.keys()), 'dict_keys([1])')
+        self.assertEqual(repr({1: 2}.values()), 'dict_values([2])')
+        self.assertEqual(repr({1: 2}.items()), 'dict_items([(1, 2)])')
+
+    def test_view_set_operations(self):
+        k = {1: 'a', 2: 'b', 3: 'c'}.keys()
+        self.assertEqual(k & {2, 3, 4}, {2, 3})
+        self.assertEqual(k | [4], {1, 2, 3, 4})
+        self.assertEqual(k - {1}, {2, 3})
+        self.assertEqual(k ^ {3, 4}, {1, 2, 4})
+        self.assertEqual({3, 4} - k, {4})
+        self.assertEqual(k, {1, 2, 3})
+        self.assertEqual({1, 2, 3}, k)
+        self.assertTrue(k > {1})
+        self.assertTrue(k <= {1: 0, 2: 0, 3: 0}.keys())
+        self.assertTrue(k.isdisjoint([4, 5]))
+        i = {1: 'a', 2: 'b'}.items()
+        self.assertEqual(i & {(1, 'a'), (2, 'x')}, {(1, 'a')})
+        self.assertEqual(i - {(1, 'a')}, {(2, 'b')})
+
+    def test_mutation_during_iteration(self):
+        d = {1: 2, 3: 4}
+        def add():
+            for k in d:
+                d[k + 10] = 0
+        self.assertRaises(RuntimeError, add)
+        d = {1: 2, 3: 4}
+        def remove():
+            for k, v in d.items():
+                del d[k]
+        self.assertRaises(RuntimeError, remove)
+        # changing the values is fine
+        d = {1: 2, 3: 4}
+        for k in d:
+            d[k] = k
+        self.assertEqual(d, {1: 1, 3: 3})
+        d.clear()
+        self.assertEqual(list(d.items()), [])
+
+    def test_iterators(self):
+        d = {1: 2, 3: 4}
+        it = iter(d.values())
+        self.assertIn(next(it), [2, 4])
+        self.assertIn(next(it), [2, 4])
+        self.assertRaises(StopIteration, next, it)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,25 @@
+""" Unit test for sys.displayhook, used by the "single" compile mode"""
+import sys
+import unittest
+
+
+class DisplayhookTest(unittest.TestCase):
+    def test_none(self):
+        self.assertEqual(sys.displayhook(None), None)
+
+    def test_sets_underscore(self):
+        sys.displayhook(42)
+        self.assertEqual(_, 42)
+        sys.displayhook("spam")
+        self.assertEqual(_, "spam")
+
+    def test_args(self):
+        self.assertRaises(TypeError, sys.displayhook)
+        self.assertRaises(TypeError, sys.displayhook, 1, 2)
+
+    def test_dunder(self):
+        self.assertTrue(sys.__displayhook__ is sys.displayhook)
+
+
+if __name__ == "__main__":
+    unittest.main()
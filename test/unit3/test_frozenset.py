@@ -0,0 +1,46 @@
+""" Unit testing for frozenset"""
+import unittest
+
+class FrozenSetTests(unittest.TestCase):
+    def test_basic(self):
+        f = frozenset([1, 2, 3, 2])
+        self.assertEqual(len(f), 3)
+        self.assertIn(2, f)
+        self.assertEqual(f, set([1, 2, 3]))
+        self.assertEqual(set([1, 2, 3]), f)
+        self.assertEqual(frozenset(), frozenset([]))
+        self.assertIs(frozenset(f), f)
+        self.assertIs(f.copy(), f)
+        self.assertFalse(hasattr(f, "add"))
+        self.assertEqual(repr(frozenset([1])), "frozenset({1})")
+        self.assertEqual(repr(frozenset()), "frozenset()")
+
+    def test_hash(self):
+        a = frozenset([1, 2, 3])
+        b = frozenset([3, 2, 1])
+        self.assertEqual(hash(a), hash(b))
+        d = {a: "abc"}
+        self.assertEqual(d[b], "abc")
+        self.assertEqual(d[frozenset(range(1, 4))], "abc")
+        s = set([a])
+        self.assertIn(set([1, 2, 3]), s)
+        s.remove(set([1, 2, 3]))
+        self.assertEqual(len(s), 0)
+        self.assertRaises(TypeError, hash, set())
+
+    def test_operations(self):
+        f = frozenset([1, 2, 3])
+        s = set([2, 3, 4])
+        self.assertIsInstance(f | s, frozenset)
+        self.assertIsInstance(s | f, set)
+        self.assertEqual(f & s, frozenset([2, 3]))
+        self.assertEqual(f - s, frozenset([1]))
+        self.assertEqual(f ^ s, frozenset([1, 4]))
+        self.assertTrue(frozenset([1]) < f)
+        self.assertTrue(f.issuperset([1, 2]))
+        self.assertTrue(f.isdisjoint(s - f))
+        self.assertEqual(f.union([4], [5]), frozenset([1, 2, 3, 4, 5]))
+        self.assertEqual(f.intersection(s, [3]), frozenset([3]))
+
+if __name__ == '__main__':
+    unittest.main()
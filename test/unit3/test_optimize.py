@@ -0,0 +1,105 @@
+""" Unit tests for the constant folding and dead code the compiler optimizes away """
+import unittest
+
+
+y = 5
+
+
+class Unhashable:
+    __hash__ = None
+
+    def __eq__(self, other):
+        return other == 2
+
+
+class FoldingTests(unittest.TestCase):
+
+    def test_arithmetic(self):
+        self.assertEqual(2 ** 10, 1024)
+        self.assertEqual(-(3 - 5), 2)
+        self.assertEqual(7 // 2, 3)
+        self.assertEqual(7 / 2, 3.5)
+        self.assertEqual(1 << 4, 16)
+        self.assertEqual(2 ** 100, 1267650600228229401496703205376)
+        self.assertEqual(-0.0, 0.0)
+        self.assertEqual(str(-0.0), "-0.0")
+        self.assertEqual(not 0, True)
+        self.assertEqual(type(3 * 1.5), float)
+
+    def test_strings(self):
+        self.assertEqual("a" + "b", "ab")
+        self.assertEqual("ab" * 3, "ababab")
+        self.assertEqual(3 * "ab", "ababab")
+        self.assertEqual(len("x" * 10000), 10000)
+        self.assertEqual("%d apples" % 3, "3 apples")
+
+    def test_errors_left_to_runtime(self):
+        def div():
+            return 1 / 0
+        def add():
+            return "a" + 1
+        self.assertRaises(ZeroDivisionError, div)
+        self.assertRaises(TypeError, add)
+
+    def test_membership(self):
+        x = "b"
+        self.assertTrue(x in ("a", "b", "c"))
+        self.assertTrue(x in ["a", "b", "c"])
+        self.assertTrue(x in {"a", "b", "c"})
+        self.assertFalse(x not in ("a", "b", "c"))
+        self.assertTrue("d" not in ("a", "b", "c"))
+        self.assertTrue(2 in (1, 2, 3))
+        self.assertTrue(2.0 in (1, 2, 3))
+        self.assertTrue(True in (1, 2, 3))
+        self.assertFalse(None in (1, 2, 3))
+        self.assertTrue(Unhashable() in (1, 2, 3))
+        self.assertTrue([1] not in (1, 2, 3))
+        self.assertTrue(1 in (1, "a", None))
+        for i in range(3):
+            self.assertTrue(i in (0, 1, 2))
+
+    def test_constant_loops(self):
+        seen = []
+        for c in [1, 2, 3]:
+            seen.append(c)
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual([c * 2 for c in [1, 2]], [2, 4])
+        n = 0
+        while True:
+            n += 1
+            if n == 3:
+                break
+        self.assertEqual(n, 3)
+        while False:
+            n = 100
+        else:
+            n = -1
+        self.assertEqual(n, -1)
+
+    def test_dead_branches(self):
+        if False:
+            self.fail("dead branch ran")
+        if 0:
+            x = 1
+        else:
+            x = 2
+        self.assertEqual(x, 2)
+        self.assertEqual(1 if True else 2, 1)
+        self.assertEqual(1 if "" else 2, 2)
+
+    def test_dead_branch_keeps_scope(self):
+        # y is still local to f, so the global is not seen
+        def f():
+            if False:
+                y = 1
+            return y
+        self.assertRaises(Exception, f)
+
+    def test_debug(self):
+        self.assertTrue(__debug__)
+        if not __debug__:
+            self.fail("__debug__ is False at the default level")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -104,23 +104,22 @@ class TestOrderedDict(unittest.TestCase):
         self.assertEqual(list(od.keys()), [t[0] for t in pairs])
         self.assertEqual(list(od.values()), [t[1] for t in pairs])
         self.assertEqual(list(od.items()), pairs)
-        # self.assertEqual(list(reversed(od)),
-        #                  [t[0] for t in reversed(pairs)])
+        self.assertEqual(list(reversed(od)),
+                         [t[0] for t in reversed(pairs)])
         # self.assertEqual(list(reversed(od.keys())),
         #                  [t[0] for t in reversed(pairs)])
         # self.assertEqual(list(reversed(od.values())),
         #                  [t[1] for t in reversed(pairs)])
         # self.assertEqual(list(reversed(od.items())), list(reversed(pairs)))
 
-    # def test_detect_deletion_during_iteration(self):
-    #     od = OrderedDict.fromkeys('abc')
-    #     it = iter(od)
-    #     key = next(it)
-    #     del od[key]
-    #     with self.assertRaises(Exception):
-    #         # Note, the exact exception raised is not guaranteed
-    #         # The only guarantee that the next() will not succeed
-    #         next(it)
+    def test_detect_deletion_during_iteration(self):
+        od = OrderedDict((k, None) for k in 'abc')
+        it = iter(od)
+        key = next(it)
+        del od[key]
+        # Note, the exact exception raised is not guaranteed
+        # The only guarantee that the next() will not succeed
+        self.assertRaises(Exception, next, it)
 
     def test_popitem(self):
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
@@ -128,9 +127,12 @@ class TestOrderedDict(unittest.TestCase):
         od = OrderedDict(pairs)
         while pairs:
             self.assertEqual(od.popitem(), pairs.pop())
-        #with self.assertRaises(KeyError):
-        #    od.popitem()
+        self.assertRaises(KeyError, od.popitem)
         self.assertEqual(len(od), 0)
+        od = OrderedDict([('a', 1), ('b', 2), ('c', 3)])
+        self.assertEqual(od.popitem(last=False), ('a', 1))
+        self.assertEqual(od.popitem(last=True), ('c', 3))
+        self.assertEqual(list(od.items()), [('b', 2)])
 
     def test_pop(self):
         pairs = [('c', 1), ('b', 2), ('a', 3), ('d', 4), ('e', 5), ('f', 6)]
@@ -260,19 +262,22 @@ class TestOrderedDict(unittest.TestCase):
         od['a'] = 1
         self.assertEqual(list(od.items()), [('b', 2), ('a', 1)])
 
-    # def test_move_to_end(self):
-    #     od = OrderedDict.fromkeys('abcde')
-    #     self.assertEqual(list(od), list('abcde'))
-    #     od.move_to_end('c')
-    #     self.assertEqual(list(od), list('abdec'))
-    #     od.move_to_end('c', 0)
-    #     self.assertEqual(list(od), list('cabde'))
-    #     od.move_to_end('c', 0)
-    #     self.assertEqual(list(od), list('cabde'))
-    #     od.move_to_end('e')
-    #     self.assertEqual(list(od), list('cabde'))
-    #     with self.assertRaises(KeyError):
-    #         od.move_to_end('x')
+    def test_move_to_end(self):
+        od = OrderedDict((k, None) for k in 'abcde')
+        self.assertEqual(list(od), list('abcde'))
+        od.move_to_end('c')
+        self.assertEqual(list(od), list('abdec'))
+        od.move_to_end('c', 0)
+        self.assertEqual(list(od), list('cabde'))
+        od.move_to_end('c', 0)
+        self.assertEqual(list(od), list('cabde'))
+        od.move_to_end('e')
+        self.assertEqual(list(od), list('cabde'))
+        self.assertRaises(KeyError, od.move_to_end, 'x')
+        od.move_to_end('e', last=False)
+        self.assertEqual(list(od), list('ecabd'))
+        od.move_to_end(key='e', last=True)
+        self.assertEqual(list(od), list('cabde'))
 
     # def test_sizeof(self):
     #     # Wimpy test: Just verify the reported size is larger than a regular dict
@@ -0,0 +1,95 @@
+""" Unit tests for pstats and cProfile"""
+import cProfile
+import pstats
+import unittest
+
+
+class FakeProfile(object):
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class Output(object):
+    def __init__(self):
+        self.text = ""
+
+    def write(self, s):
+        self.text += s
+
+
+MAIN = ("/a/main.py", 1, "main")
+F = ("/a/main.py", 5, "f")
+G = ("/b/lib.py", 3, "g")
+
+
+def fake():
+    return FakeProfile({
+        MAIN: (1, 1, 0.5, 3.0, {}),
+        F: (2, 4, 1.0, 2.0, {MAIN: (4, 2, 1.0, 2.0)}),
+        G: (3, 3, 1.5, 1.5, {MAIN: (3, 3, 1.5, 1.5)}),
+    })
+
+
+class PstatsTest(unittest.TestCase):
+    def test_totals(self):
+        st = pstats.Stats(fake())
+        self.assertEqual(st.total_calls, 8)
+        self.assertEqual(st.prim_calls, 6)
+        self.assertEqual(st.total_tt, 3.0)
+
+    def test_sort(self):
+        st = pstats.Stats(fake())
+        self.assertEqual(st.sort_stats("cumulative").fcn_list, [MAIN, F, G])
+        self.assertEqual(st.sort_stats("tottime").fcn_list, [G, F, MAIN])
+        self.assertEqual(st.sort_stats("calls").fcn_list, [F, G, MAIN])
+        self.assertEqual(st.sort_stats("name").fcn_list, [F, G, MAIN])
+        self.assertEqual(st.sort_stats(2).fcn_list, [MAIN, F, G])
+        self.assertEqual(st.reverse_order().fcn_list, [G, F, MAIN])
+        self.assertRaises(KeyError, st.sort_stats, "spam")
+
+    def test_add(self):
+        st = pstats.Stats(fake(), fake())
+        self.assertEqual(st.stats[F][:4], (4, 8, 2.0, 4.0))
+        self.assertEqual(st.stats[F][4][MAIN], (8, 4, 2.0, 4.0))
+        self.assertEqual(st.total_calls, 16)
+
+    def test_top_level(self):
+        st = pstats.Stats(fake())
+        self.assertEqual(st.top_level, set([MAIN]))
+        self.assertEqual(st.strip_dirs().top_level, set([("main.py", 1, "main")]))
+
+    def test_strip_dirs(self):
+        st = pstats.Stats(fake()).strip_dirs()
+        self.assertTrue(("lib.py", 3, "g") in st.stats)
+        self.assertTrue(("main.py", 1, "main") in st.stats[("main.py", 5, "f")][4])
+
+    def test_print_stats(self):
+        out = Output()
+        pstats.Stats(fake(), stream=out).sort_stats("time").print_stats(2)
+        lines = out.text.split("\n")
+        self.assertEqual(lines[0].strip(), "8 function calls (6 primitive calls) in 3.000 seconds")
+        self.assertTrue("Ordered by: internal time" in out.text)
+        self.assertTrue("List reduced from 3 to 2" in out.text)
+        self.assertTrue("        3    1.500    0.500    1.500    0.500 /b/lib.py:3(g)" in lines)
+        self.assertTrue("      4/2    1.000    0.250    2.000    1.000 /a/main.py:5(f)" in lines)
+        self.assertFalse("(main)" in out.text)
+
+    def test_print_callers(self):
+        out = Output()
+        pstats.Stats(fake(), stream=out).sort_stats("name").print_callers("lib")
+        self.assertTrue("/b/lib.py:3(g)" in out.text)
+        self.assertTrue("/a/main.py:1(main)" in out.text)
+        self.assertFalse("(f)" in out.text)
+
+
+class ProfileTest(unittest.TestCase):
+    def test_not_compiled_for_profiling(self):
+        # the test suite does not run with the profiling option
+        self.assertRaises(RuntimeError, cProfile.Profile().enable)
+
+
+if __name__ == "__main__":
+    unittest.main()
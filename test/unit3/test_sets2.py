@@ -233,6 +233,46 @@ class SetTests(unittest.TestCase):
         self.assertTrue(a.pop() in b)
         self.assertEqual(len(a), 0)
 
+    def test_pop_all(self):
+        a = set(range(1000))
+        a.add(5000)
+        seen = set()
+        while a:
+            x = a.pop()
+            self.assertNotIn(x, a)
+            seen.add(x)
+        self.assertEqual(len(seen), 1001)
+        self.assertRaises(KeyError, a.pop)
+
+    def test_inplace_operators(self):
+        a = set([1, 2, 3])
+        b = a
+        a |= set([4])
+        a -= set([1])
+        a &= set([2, 3, 4, 5])
+        a ^= set([5])
+        self.assertIs(a, b)
+        self.assertEqual(a, set([2, 3, 4, 5]))
+        a.clear()
+        self.assertEqual(a, set())
+
+    def test_mixed_operands(self):
+        self.assertEqual(set([1, 2]).intersection([2, 3], (2,)), set([2]))
+        self.assertEqual(set([1, 2]).union([3], range(4, 5)), set([1, 2, 3, 4]))
+        self.assertEqual(set([1, 2, 3]).difference([1], [3]), set([2]))
+        self.assertRaises(TypeError, lambda: set([1]) | [2])
+        a = set([1, 2, 3])
+        a.intersection_update(a)
+        a.difference_update([2])
+        self.assertEqual(a, set([1, 3]))
+
+    def test_changed_during_iteration(self):
+        a = set([1, 2, 3])
+        def grow():
+            for x in a:
+                a.add(x + 10)
+        self.assertRaises(RuntimeError, grow)
+
 if __name__ == '__main__':
     unittest.main()
             
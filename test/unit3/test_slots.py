@@ -0,0 +1,141 @@
+""" Unit test for instance attributes, __dict__ and __slots__"""
+import unittest
+
+
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class SlotPoint(object):
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class SlotPoint3(SlotPoint):
+    __slots__ = "z"
+
+    def __init__(self, x, y, z):
+        SlotPoint.__init__(self, x, y)
+        self.z = z
+
+
+class SlotWithDict(object):
+    __slots__ = ["x", "__dict__"]
+
+
+class Private(object):
+    __slots__ = ["__secret"]
+
+    def __init__(self):
+        self.__secret = 42
+
+    def secret(self):
+        return self.__secret
+
+
+class SlotsTests(unittest.TestCase):
+    def test_attributes(self):
+        p = Point(1, 2)
+        self.assertEqual(p.x, 1)
+        self.assertEqual(p.y, 2)
+        p.x = 10
+        p.z = 3
+        self.assertEqual(p.x + p.y + p.z, 15)
+        q = Point(3, 4)
+        self.assertFalse(hasattr(q, "z"))
+        self.assertEqual(getattr(q, "z", None), None)
+        self.assertRaises(AttributeError, lambda: q.z)
+
+    def test_dict(self):
+        p = Point(1, 2)
+        self.assertEqual(p.__dict__["x"], 1)
+        self.assertEqual(p.__dict__["y"], 2)
+        p.z = 3
+        self.assertEqual(p.__dict__["z"], 3)
+        p.__dict__["w"] = 4
+        self.assertEqual(p.w, 4)
+        p.x = 5
+        self.assertEqual(p.__dict__["x"], 5)
+
+    def test_many_attributes(self):
+        p = Point(1, 2)
+        for i in range(100):
+            setattr(p, "a" + str(i), i)
+        self.assertEqual(p.a99, 99)
+        self.assertEqual(p.x, 1)
+        self.assertEqual(p.__dict__["a50"], 50)
+        q = Point(5, 6)
+        q.a0 = 7
+        self.assertEqual(q.a0 + q.x, 12)
+
+    def test_slots(self):
+        p = SlotPoint(1, 2)
+        self.assertEqual(p.x + p.y, 3)
+        p.y = 5
+        self.assertEqual(p.y, 5)
+        self.assertFalse(hasattr(p, "__dict__"))
+        self.assertRaises(AttributeError, setattr, p, "z", 3)
+        q = SlotPoint.__new__(SlotPoint)
+        self.assertRaises(AttributeError, lambda: q.x)
+
+    def test_slots_inherited(self):
+        p = SlotPoint3(1, 2, 3)
+        self.assertEqual(p.x + p.y + p.z, 6)
+        self.assertFalse(hasattr(p, "__dict__"))
+        self.assertRaises(AttributeError, setattr, p, "w", 4)
+
+        class Sub(SlotPoint):
+            pass
+        s = Sub(1, 2)
+        s.w = 4
+        self.assertEqual(s.__dict__["w"], 4)
+
+    def test_slots_with_dict(self):
+        s = SlotWithDict()
+        s.x = 1
+        s.y = 2
+        self.assertEqual(s.__dict__["y"], 2)
+        self.assertEqual(s.x + s.y, 3)
+
+    def test_slots_out_of_dict(self):
+        s = SlotWithDict()
+        s.x = 1
+        s.y = 2
+        self.assertFalse("x" in s.__dict__)
+        s.x = 5
+        self.assertEqual(s.x, 5)
+        self.assertFalse("x" in s.__dict__)
+
+        class Sub(SlotPoint):
+            pass
+        p = Sub(1, 2)
+        p.w = 3
+        d = p.__dict__
+        p.y = 4
+        self.assertEqual(p.x + p.y + p.w, 8)
+        self.assertFalse("x" in d or "y" in d)
+        self.assertEqual(d["w"], 3)
+
+    def test_dir(self):
+        p = SlotPoint3(1, 2, 3)
+        for name in ("x", "y", "z"):
+            self.assertTrue(name in dir(p))
+            self.assertTrue(name in dir(SlotPoint3))
+        self.assertTrue("_Private__secret" in dir(Private()))
+        self.assertFalse("__dict__" in dir(SlotWithDict()))
+
+    def test_private_slot(self):
+        self.assertEqual(Private().secret(), 42)
+
+    def test_bad_slots(self):
+        self.assertRaises(TypeError, type, "A", (object,), {"__slots__": [1]})
+        self.assertRaises(ValueError, type, "B", (object,), {"__slots__": ["x"], "x": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
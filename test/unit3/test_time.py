@@ -98,6 +98,17 @@ class TimeTestCase(unittest.TestCase):
         self.assertEqual([x*2 for x in gen.generator()], [0, 2, 4, 6, 8, 10, 12, 14, 16, 18])
         self.assertEqual([x*2 for x in gen.sleeping_generator()], [0, 2, 4, 6, 8, 10, 12, 14, 16, 18])
 
+    def test_sleep_clock(self):
+        t0 = time.time()
+        m0 = time.monotonic()
+        for i in range(5):
+            time.sleep(0.01)
+        m1 = time.monotonic()
+        self.assertTrue(m1 - m0 > 0.03)
+        self.assertTrue(time.time() - t0 > 0.03)
+        self.assertTrue(time.monotonic() >= m1)
+        self.assertRaises(ValueError, time.sleep, -1)
+
     def test_strftime(self):
         self.assertEqual(time.strftime("%b %d %Y %H:%M:%S", time.localtime(3661 + time.timezone)), "Jan 01 1970 01:01:01");
 
@@ -0,0 +1,22 @@
+""" Unit tests for the trace module"""
+import trace
+import unittest
+
+
+class TraceTest(unittest.TestCase):
+    def test_not_compiled_for_line_counts(self):
+        # the test suite does not run with the lineCounts option
+        self.assertRaises(RuntimeError, trace.Trace)
+
+    def test_unsupported(self):
+        self.assertRaises(NotImplementedError, trace.Trace, 1, 1)
+        self.assertRaises(NotImplementedError, trace.Trace, 1, 0, 1)
+
+    def test_update(self):
+        r = trace.CoverageResults({("a.py", 1): 2, ("a.py", 2): 1})
+        r.update(trace.CoverageResults({("a.py", 2): 3, ("b.py", 1): 1}))
+        self.assertEqual(r.counts, {("a.py", 1): 2, ("a.py", 2): 4, ("b.py", 1): 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
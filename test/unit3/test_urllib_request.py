@@ -0,0 +1,38 @@
+""" Unit test for urllib.request, on data: URLs, which need no network"""
+import unittest
+from urllib.request import urlopen
+
+
+class UrlopenTests(unittest.TestCase):
+    def test_read(self):
+        f = urlopen("data:text/plain,hello%0Aworld%0Alast")
+        self.assertEqual(f.status, 200)
+        self.assertEqual(f.getcode(), 200)
+        self.assertEqual(f.getheader("Content-Type"), "text/plain")
+        self.assertEqual(f.read(3), "hel")
+        self.assertEqual(f.readline(), "lo\n")
+        self.assertEqual(f.read(), "world\nlast")
+        self.assertEqual(f.read(), "")
+        self.assertEqual(f.readline(), "")
+
+    def test_lines(self):
+        f = urlopen("data:,a%0Ab%0A%0Ac")
+        self.assertEqual(f.readlines(), ["a\n", "b\n", "\n", "c"])
+        with urlopen("data:;base64,YQpiCmM=") as f:
+            self.assertEqual([line for line in f], ["a\n", "b\n", "c"])
+        self.assertRaises(ValueError, f.read)
+
+    def test_long(self):
+        f = urlopen("data:," + "0123456789%0A" * 20000)
+        self.assertEqual(f.readline(), "0123456789\n")
+        self.assertEqual(len(f.readlines()), 19999)
+        f = urlopen("data:," + "x" * 100000)
+        self.assertEqual(len(f.read(70000)), 70000)
+        self.assertEqual(len(f.read()), 30000)
+
+    def test_error(self):
+        self.assertRaises(IOError, urlopen, "data:no-comma")
+
+
+if __name__ == '__main__':
+    unittest.main()
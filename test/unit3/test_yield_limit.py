@@ -0,0 +1,42 @@
+""" Unit test for programs that run with a yield limit"""
+import sys
+import unittest
+
+
+def total(n):
+    t = 0
+    for i in range(n):
+        t += i
+    return t
+
+
+def fib(n):
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+
+class YieldLimitTests(unittest.TestCase):
+    def setUp(self):
+        self.limit = getattr(sys, "getYieldLimit", lambda: None)()
+        if self.limit is not None:
+            sys.setYieldLimit(0)
+
+    def tearDown(self):
+        if self.limit is not None:
+            sys.setYieldLimit(self.limit)
+
+    def test_loop(self):
+        self.assertEqual(total(200000), 19999900000)
+
+    def test_nested_calls(self):
+        x = total(100000) + fib(18)
+        self.assertEqual(x, 4999950000 + 2584)
+        self.assertEqual([total(i) for i in range(5000, 5003)], [12497500, 12502500, 12507501])
+
+    def test_expressions(self):
+        x = total(50000) > 0 and (total(60000) if fib(15) == 610 else 0)
+        self.assertEqual(x, 1799970000)
+        self.assertTrue(total(1000) < total(20000) < total(30000))
+
+
+if __name__ == '__main__':
+    unittest.main()